@@ -0,0 +1,50 @@
+"""Add content-addressed attachment blob storage
+
+Revision ID: add_attachment_blobs
+Revises: add_is_skill_notes
+Create Date: 2026-02-20
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_attachment_blobs"
+down_revision: str | None = "add_is_skill_notes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add attachment_blobs table and content_hash column on attachment_metadata.
+
+    Existing attachments keep their per-attachment files (content_hash stays NULL);
+    only newly stored attachments are deduplicated into blobs.
+    """
+    op.create_table(
+        "attachment_blobs",
+        sa.Column("content_hash", sa.String(64), primary_key=True),
+        sa.Column("storage_path", sa.Text(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+    op.add_column(
+        "attachment_metadata",
+        sa.Column("content_hash", sa.String(64), nullable=True),
+    )
+    op.create_index(
+        "idx_attachment_content_hash", "attachment_metadata", ["content_hash"]
+    )
+
+
+def downgrade() -> None:
+    """Remove attachment blob storage."""
+    op.drop_index("idx_attachment_content_hash", "attachment_metadata")
+    op.drop_column("attachment_metadata", "content_hash")
+    op.drop_table("attachment_blobs")
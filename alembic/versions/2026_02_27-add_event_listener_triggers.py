@@ -0,0 +1,83 @@
+"""Add event_listener_triggers junction table
+
+Revision ID: add_event_listener_triggers
+Revises: add_attachment_blobs
+Create Date: 2026-02-27
+
+"""
+
+import json
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_event_listener_triggers"
+down_revision: str | None = "add_attachment_blobs"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create event_listener_triggers and backfill it from recent_events.
+
+    recent_events only holds a couple of days of history, so the backfill reads
+    the triggered_listener_ids JSON in Python rather than with dialect-specific
+    JSON functions.
+    """
+    triggers_table = op.create_table(
+        "event_listener_triggers",
+        sa.Column(
+            "event_id",
+            sa.Integer(),
+            sa.ForeignKey("recent_events.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("listener_id", sa.Integer(), primary_key=True),
+        sa.Column("timestamp", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "idx_listener_triggers_listener_time",
+        "event_listener_triggers",
+        ["listener_id", "timestamp"],
+    )
+    op.create_index("idx_recent_events_time_id", "recent_events", ["timestamp", "id"])
+
+    recent_events = sa.table(
+        "recent_events",
+        sa.column("id", sa.Integer()),
+        sa.column("triggered_listener_ids", sa.JSON()),
+        sa.column("timestamp", sa.DateTime(timezone=True)),
+    )
+    rows = op.get_bind().execute(
+        sa.select(
+            recent_events.c.id,
+            recent_events.c.triggered_listener_ids,
+            recent_events.c.timestamp,
+        ).where(recent_events.c.triggered_listener_ids.isnot(None))
+    )
+
+    triggers = []
+    for event_id, raw_listener_ids, timestamp in rows:
+        listener_ids = (
+            json.loads(raw_listener_ids)
+            if isinstance(raw_listener_ids, str)
+            else raw_listener_ids
+        )
+        for listener_id in set(listener_ids or []):
+            triggers.append({
+                "event_id": event_id,
+                "listener_id": listener_id,
+                "timestamp": timestamp,
+            })
+    if triggers:
+        op.bulk_insert(triggers_table, triggers)
+
+
+def downgrade() -> None:
+    """Drop event_listener_triggers."""
+    op.drop_index("idx_recent_events_time_id", "recent_events")
+    op.drop_index("idx_listener_triggers_listener_time", "event_listener_triggers")
+    op.drop_table("event_listener_triggers")
@@ -0,0 +1,142 @@
+"""Add conversation_summaries table
+
+Revision ID: add_conversation_summaries
+Revises: add_event_listener_triggers
+Create Date: 2026-03-06
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_conversation_summaries"
+down_revision: str | None = "add_event_listener_triggers"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PREVIEW_LENGTH = 100
+
+
+def upgrade() -> None:
+    """Create conversation_summaries and backfill it from message_history.
+
+    Mirrors MessageHistoryRepository.rebuild_conversation_summaries: one row per
+    conversation counting user/assistant messages, with the newest such message
+    that has content as the preview.
+    """
+    op.create_table(
+        "conversation_summaries",
+        sa.Column("conversation_id", sa.String(255), primary_key=True),
+        sa.Column("interface_type", sa.String(50), nullable=False),
+        sa.Column("message_count", sa.Integer(), nullable=False),
+        sa.Column("last_message_id", sa.Integer(), nullable=True),
+        sa.Column("last_message", sa.Text(), nullable=True),
+        sa.Column("last_timestamp", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_conversation_summaries_interface_type",
+        "conversation_summaries",
+        ["interface_type"],
+    )
+    op.create_index(
+        "idx_conversation_summaries_last_ts",
+        "conversation_summaries",
+        ["last_timestamp", "conversation_id"],
+    )
+
+    mh = sa.table(
+        "message_history",
+        sa.column("internal_id", sa.Integer()),
+        sa.column("interface_type", sa.String()),
+        sa.column("conversation_id", sa.String()),
+        sa.column("timestamp", sa.DateTime(timezone=True)),
+        sa.column("role", sa.String()),
+        sa.column("content", sa.Text()),
+    )
+    summaries = sa.table(
+        "conversation_summaries",
+        sa.column("conversation_id", sa.String()),
+        sa.column("interface_type", sa.String()),
+        sa.column("message_count", sa.Integer()),
+        sa.column("last_message_id", sa.Integer()),
+        sa.column("last_message", sa.Text()),
+        sa.column("last_timestamp", sa.DateTime(timezone=True)),
+    )
+
+    counted = mh.c.role.in_(["user", "assistant"])
+    with_content = sa.and_(counted, mh.c.content.isnot(None))
+    counts = (
+        sa
+        .select(
+            mh.c.conversation_id,
+            sa.func.count(mh.c.internal_id).label("message_count"),
+            sa.func.max(mh.c.interface_type).label("interface_type"),
+        )
+        .where(counted)
+        .group_by(mh.c.conversation_id)
+        .subquery()
+    )
+    latest_ts = (
+        sa
+        .select(
+            mh.c.conversation_id,
+            sa.func.max(mh.c.timestamp).label("max_timestamp"),
+        )
+        .where(with_content)
+        .group_by(mh.c.conversation_id)
+        .subquery()
+    )
+    latest_id = (
+        sa
+        .select(
+            mh.c.conversation_id,
+            sa.func.max(mh.c.internal_id).label("max_id"),
+        )
+        .join(
+            latest_ts,
+            sa.and_(
+                mh.c.conversation_id == latest_ts.c.conversation_id,
+                mh.c.timestamp == latest_ts.c.max_timestamp,
+            ),
+        )
+        .where(with_content)
+        .group_by(mh.c.conversation_id)
+        .subquery()
+    )
+    last = mh.alias("last_message")
+    backfill = sa.select(
+        counts.c.conversation_id,
+        sa.func.coalesce(last.c.interface_type, counts.c.interface_type),
+        counts.c.message_count,
+        last.c.internal_id,
+        sa.func.substr(last.c.content, 1, PREVIEW_LENGTH),
+        last.c.timestamp,
+    ).select_from(
+        counts.outerjoin(
+            latest_id, counts.c.conversation_id == latest_id.c.conversation_id
+        ).outerjoin(last, last.c.internal_id == latest_id.c.max_id)
+    )
+    op.execute(
+        summaries.insert().from_select(
+            [
+                "conversation_id",
+                "interface_type",
+                "message_count",
+                "last_message_id",
+                "last_message",
+                "last_timestamp",
+            ],
+            backfill,
+        )
+    )
+
+
+def downgrade() -> None:
+    """Drop conversation_summaries."""
+    op.drop_index("idx_conversation_summaries_last_ts", "conversation_summaries")
+    op.drop_index("ix_conversation_summaries_interface_type", "conversation_summaries")
+    op.drop_table("conversation_summaries")
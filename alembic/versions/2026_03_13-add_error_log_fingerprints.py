@@ -0,0 +1,42 @@
+"""Add fingerprint and occurrence tracking to error_logs
+
+Revision ID: add_error_log_fingerprints
+Revises: add_conversation_summaries
+Create Date: 2026-03-13
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_error_log_fingerprints"
+down_revision: str | None = "add_conversation_summaries"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add fingerprint, occurrence_count and last_seen columns."""
+    op.add_column("error_logs", sa.Column("fingerprint", sa.String(64), nullable=True))
+    op.add_column(
+        "error_logs",
+        sa.Column("occurrence_count", sa.Integer(), nullable=False, server_default="1"),
+    )
+    op.add_column(
+        "error_logs",
+        sa.Column("last_seen", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_error_logs_fingerprint", "error_logs", ["fingerprint"])
+
+
+def downgrade() -> None:
+    """Remove error log fingerprint columns."""
+    op.drop_index("ix_error_logs_fingerprint", "error_logs")
+    with op.batch_alter_table("error_logs") as batch_op:
+        batch_op.drop_column("last_seen")
+        batch_op.drop_column("occurrence_count")
+        batch_op.drop_column("fingerprint")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Load-test API token authentication with and without the verification cache.
+
+Runs concurrent token-authenticated lookups through AuthService against a
+throwaway SQLite database and reports requests per second, plus the worst
+event-loop stall seen while they run (a proxy for how much SSE streams and chat
+responses in the same process would be held up).
+
+Usage:
+    python scripts/benchmark_api_token_auth.py --requests 200 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+from fastapi import Request
+
+from family_assistant.storage import api_tokens as api_tokens_storage
+from family_assistant.storage.base import (
+    create_engine_with_sqlite_optimizations,
+    metadata,
+)
+from family_assistant.storage.context import DatabaseContext
+from family_assistant.web.auth import AuthService, pwd_context
+
+TOKEN_PREFIX = "benchmrk"
+TOKEN_SECRET = "benchmark-secret-value"
+
+
+async def _measure_loop_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """Return the longest delay observed between scheduled wakeups."""
+    worst = 0.0
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - expected)
+    return worst
+
+
+async def _run(
+    auth_service: AuthService, requests: int, concurrency: int
+) -> tuple[float, float]:
+    """Authenticate `requests` times and return (requests/second, max loop lag)."""
+    header = f"Bearer {TOKEN_PREFIX}{TOKEN_SECRET}"
+    request = Request({"type": "http", "headers": []})
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one() -> None:
+        async with semaphore:
+            user = await auth_service.get_user_from_api_token(header, request)
+            assert user is not None
+
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(_measure_loop_lag(stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(_one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    return requests / elapsed, await lag_task
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Load-test API token authentication with and without the verification cache"
+    )
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine_with_sqlite_optimizations(
+            f"sqlite+aiosqlite:///{Path(tmp_dir) / 'bench.db'}"
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+        async with DatabaseContext(engine) as db_context:
+            await api_tokens_storage.add_api_token(
+                db_context=db_context,
+                user_identifier="bench@example.com",
+                name="benchmark",
+                hashed_token=pwd_context.hash(TOKEN_SECRET),
+                prefix=TOKEN_PREFIX,
+                created_at=datetime.now(UTC),
+            )
+
+        modes = (
+            ("verify every request", 0.0),
+            ("cached", 60.0),
+        )
+        try:
+            for label, ttl in modes:
+                auth_service = AuthService(engine, api_token_cache_ttl=ttl)
+                rps, lag = await _run(auth_service, args.requests, args.concurrency)
+                print(
+                    f"{label:>22}: {rps:8.1f} req/s, max loop lag {lag * 1000:7.1f} ms"
+                )
+        finally:
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
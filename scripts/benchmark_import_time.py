@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Measure how long the core packages take to import in a fresh interpreter.
+
+Each module is imported in a new ``python -X importtime`` subprocess, so nothing
+is shared between runs, and the median cumulative import time is reported. The
+script also lists which heavy, on-demand dependencies were loaded: provider
+SDKs, the MCP SDK, Alembic and the libraries behind individual tools. These are
+only meant to be imported once they are used. With ``--check`` the script exits
+non-zero if any of them were imported, so it can guard against regressions.
+
+Usage:
+    python scripts/benchmark_import_time.py --repeat 5 --check
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+DEFAULT_MODULES = [
+    "family_assistant.llm",
+    "family_assistant.tools",
+    "family_assistant.storage",
+    "family_assistant.embeddings",
+]
+
+# Dependencies that must not be imported just by importing the modules above
+DEFERRED_MODULES = [
+    "litellm",
+    "openai",
+    "anthropic",
+    "google.genai",
+    "mcp",
+    "alembic",
+    "yt_dlp",
+    "vl_convert",
+    "rebrowser_playwright.async_api",
+    "sentence_transformers",
+]
+
+
+def _import_once(module: str) -> tuple[float, set[str]]:
+    """Import `module` in a fresh interpreter.
+
+    Returns its cumulative import time in milliseconds and the deferred
+    modules that got loaded along the way.
+    """
+    probe = (
+        f"import sys, {module}; "
+        f"print('deferred:', *[m for m in {DEFERRED_MODULES!r} if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = next(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[2].strip() == module
+    )
+    # Modules may log to stdout on import, so only the tagged line is parsed
+    deferred_line = next(
+        line for line in result.stdout.splitlines() if line.startswith("deferred:")
+    )
+    return cumulative_us / 1000, set(deferred_line.split()[1:])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure how long the core packages take to import in a fresh interpreter"
+    )
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with status 1 if any deferred dependency was imported",
+    )
+    args = parser.parse_args()
+
+    leaked: dict[str, set[str]] = {}
+    for module in args.modules:
+        timings = []
+        loaded: set[str] = set()
+        for _ in range(args.repeat):
+            elapsed_ms, deferred = _import_once(module)
+            timings.append(elapsed_ms)
+            loaded |= deferred
+        print(
+            f"{module:>30}: median {statistics.median(timings):8.1f} ms,"
+            f" min {min(timings):8.1f} ms"
+            f" ({', '.join(sorted(loaded)) or 'no deferred dependencies'})"
+        )
+        if loaded:
+            leaked[module] = loaded
+
+    if args.check and leaked:
+        for module, deferred in leaked.items():
+            print(
+                f"{module} imports {', '.join(sorted(deferred))} eagerly",
+                file=sys.stderr,
+            )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
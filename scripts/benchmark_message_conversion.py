@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Measure provider message conversion over a growing tool-loop history.
+
+Builds a conversation history and simulates a tool loop that appends an
+assistant tool call and an image-bearing tool result on each iteration, converting the whole
+history for the Anthropic and OpenAI clients every time. Compares converting
+from scratch on every iteration with the per-message conversion cache.
+
+Usage:
+    python scripts/benchmark_message_conversion.py --history 100 --iterations 10
+"""
+
+import argparse
+import base64
+import time
+from collections.abc import Callable
+
+from family_assistant.llm.messages import (
+    AssistantMessage,
+    ImageUrlContentPart,
+    LLMMessage,
+    SystemMessage,
+    TextContentPart,
+    ToolMessage,
+    UserMessage,
+    message_to_json_dict,
+)
+from family_assistant.llm.providers.anthropic_client import AnthropicClient
+from family_assistant.llm.providers.openai_client import OpenAIClient
+from family_assistant.llm.tool_call import ToolCallFunction, ToolCallItem
+from family_assistant.tools.types import ToolAttachment
+
+IMAGE_BYTES = b"\x89PNG" * 20_000
+IMAGE_URL = "data:image/png;base64," + base64.b64encode(IMAGE_BYTES).decode()
+
+
+def _build_history(size: int) -> list[LLMMessage]:
+    history: list[LLMMessage] = [SystemMessage(content="You are helpful. " * 50)]
+    for i in range(size - 1):
+        if i % 10 == 0:
+            history.append(
+                UserMessage(
+                    content=[
+                        TextContentPart(type="text", text=f"Look at picture {i}"),
+                        ImageUrlContentPart(
+                            type="image_url", image_url={"url": IMAGE_URL}
+                        ),
+                    ]
+                )
+            )
+        elif i % 2:
+            history.append(AssistantMessage(content=f"Reply {i} " * 20))
+        else:
+            history.append(UserMessage(content=f"Question {i} " * 20))
+    return history
+
+
+def _tool_turn(i: int) -> list[LLMMessage]:
+    call_id = f"call_{i}"
+    return [
+        AssistantMessage(
+            content=None,
+            tool_calls=[
+                ToolCallItem(
+                    id=call_id,
+                    type="function",
+                    function=ToolCallFunction(name="lookup", arguments='{"q": 1}'),
+                )
+            ],
+        ),
+        ToolMessage(
+            tool_call_id=call_id,
+            name="lookup",
+            content="result " * 50,
+            _attachments=[ToolAttachment(mime_type="image/png", content=IMAGE_BYTES)],
+        ),
+    ]
+
+
+def _time_loop(
+    history: list[LLMMessage],
+    iterations: int,
+    convert: Callable[[list[LLMMessage]], object],
+) -> float:
+    """Return milliseconds spent converting across one tool loop."""
+    messages = list(history)
+    elapsed = 0.0
+    for i in range(iterations):
+        started = time.perf_counter()
+        convert(messages)
+        elapsed += time.perf_counter() - started
+        messages.extend(_tool_turn(i))
+    return elapsed * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure provider message conversion over a growing tool-loop history"
+    )
+    parser.add_argument("--history", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    history = _build_history(args.history)
+    anthropic = AnthropicClient(api_key="benchmark", model="claude-sonnet-4-5")
+    openai = OpenAIClient(api_key="benchmark", model="gpt-4o")
+
+    def anthropic_full(messages: list[LLMMessage]) -> object:
+        processed = anthropic._process_tool_messages(messages)
+        return anthropic._convert_messages_to_anthropic_format(processed)
+
+    def openai_full(messages: list[LLMMessage]) -> object:
+        return [
+            message_to_json_dict(msg) for msg in openai._process_tool_messages(messages)
+        ]
+
+    def openai_cached(messages: list[LLMMessage]) -> object:
+        return openai._message_conversion_cache.convert(
+            messages,
+            lambda batch: [
+                message_to_json_dict(msg)
+                for msg in openai._process_tool_messages(batch)
+            ],
+        )
+
+    for label, convert in (
+        ("anthropic, full", anthropic_full),
+        ("anthropic, cached", anthropic._convert_messages_incrementally),
+        ("openai, full", openai_full),
+        ("openai, cached", openai_cached),
+    ):
+        total = _time_loop(history, args.iterations, convert)
+        print(f"{label:>18}: {total:8.2f} ms per {args.iterations}-iteration loop")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Compare per-request latency of writer and read-only DatabaseContexts.
+
+Runs the same read (listing notes, as the notes context provider and the notes
+page do) through a regular DatabaseContext, which wraps every request in
+BEGIN/COMMIT on the single writer connection, and through a read-only context,
+which runs in autocommit mode on the SQLite reader connections. Reports mean and
+p95 latency per request, sequentially and under concurrency.
+
+Usage:
+    python scripts/benchmark_readonly_db_context.py --requests 500 --concurrency 8
+    python scripts/benchmark_readonly_db_context.py --database-url postgresql+asyncpg://...
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from family_assistant.storage.base import (
+    create_engine_with_sqlite_optimizations,
+    metadata,
+)
+from family_assistant.storage.context import DatabaseContext
+
+
+async def _read_notes(engine: AsyncEngine, readonly: bool) -> float:
+    """Run one request-sized read and return its latency in seconds."""
+    started = time.perf_counter()
+    async with DatabaseContext(engine, readonly=readonly) as db_context:
+        notes = await db_context.notes.get_all(visibility_grants=None)
+        assert notes
+    return time.perf_counter() - started
+
+
+async def _run(
+    engine: AsyncEngine, readonly: bool, requests: int, concurrency: int
+) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one() -> float:
+        async with semaphore:
+            return await _read_notes(engine, readonly)
+
+    # Warm up the pool so connection setup isn't counted
+    await asyncio.gather(*(_one() for _ in range(concurrency)))
+    return await asyncio.gather(*(_one() for _ in range(requests)))
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    print(
+        f"{label:>32}: mean {statistics.mean(latencies) * 1000:7.3f} ms,"
+        f" p95 {p95 * 1000:7.3f} ms"
+    )
+
+
+async def _benchmark(engine: AsyncEngine, args: argparse.Namespace) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+    async with DatabaseContext(engine) as db_context:
+        for i in range(args.notes):
+            await db_context.notes.add_or_update(
+                title=f"Benchmark note {i}", content="x" * 200
+            )
+
+    for concurrency in (1, args.concurrency):
+        for label, readonly in (("writer transaction", False), ("read-only", True)):
+            latencies = await _run(engine, readonly, args.requests, concurrency)
+            _report(f"{label} (concurrency {concurrency})", latencies)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare per-request latency of writer and read-only DatabaseContexts"
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--notes", type=int, default=20)
+    parser.add_argument(
+        "--database-url",
+        help="Benchmark an existing empty database instead of a temporary SQLite file",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = (
+            args.database_url or f"sqlite+aiosqlite:///{Path(tmp_dir) / 'bench.db'}"
+        )
+        engine = create_engine_with_sqlite_optimizations(database_url)
+        try:
+            await _benchmark(engine, args)
+        finally:
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Measure LocalToolsProvider's per-call dispatch overhead.
+
+Registers a trivial tool alongside the full set of built-in tool definitions
+and times execute_tool() with the precompiled dispatch table against the same
+call with the table cleared before every call, which reproduces the previous
+per-call signature inspection and type-hint resolution. Also times
+get_tool_definitions(), which used to deep-copy and re-translate every schema
+on each turn.
+
+Usage:
+    python scripts/benchmark_tool_dispatch.py --calls 5000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from unittest.mock import MagicMock
+
+from family_assistant.storage.context import DatabaseContext
+from family_assistant.tools import AVAILABLE_FUNCTIONS, TOOLS_DEFINITION
+from family_assistant.tools.infrastructure import (
+    LocalToolsProvider,
+    translate_attachment_schemas_for_llm,
+)
+from family_assistant.tools.types import ToolDefinition, ToolExecutionContext
+
+
+async def noop_tool(value: int, exec_context: ToolExecutionContext) -> str:
+    return str(value)
+
+
+NOOP_DEFINITION: ToolDefinition = {
+    "type": "function",
+    "function": {
+        "name": "noop_tool",
+        "description": "Returns its argument",
+        "parameters": {
+            "type": "object",
+            "properties": {"value": {"type": "integer"}},
+            "required": ["value"],
+        },
+    },
+}
+
+
+async def _time_calls(
+    provider: LocalToolsProvider,
+    context: ToolExecutionContext,
+    calls: int,
+    precompiled: bool,
+) -> float:
+    """Return mean microseconds per execute_tool() call."""
+    started = time.perf_counter()
+    for i in range(calls):
+        if not precompiled:
+            provider._dispatch.clear()
+        await provider.execute_tool("noop_tool", {"value": i}, context)
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+async def _time_definitions(provider: LocalToolsProvider, turns: int) -> float:
+    started = time.perf_counter()
+    for _ in range(turns):
+        await provider.get_tool_definitions()
+    return (time.perf_counter() - started) / turns * 1e6
+
+
+def _time_translation(definitions: list[ToolDefinition], turns: int) -> float:
+    started = time.perf_counter()
+    for _ in range(turns):
+        translate_attachment_schemas_for_llm(definitions)
+    return (time.perf_counter() - started) / turns * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure LocalToolsProvider's per-call dispatch overhead"
+    )
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--turns", type=int, default=500)
+    args = parser.parse_args()
+
+    # Per-call info logging would dominate the measurement
+    logging.disable(logging.INFO)
+
+    definitions = [*TOOLS_DEFINITION, NOOP_DEFINITION]
+    provider = LocalToolsProvider(
+        definitions=definitions,
+        implementations={**AVAILABLE_FUNCTIONS, "noop_tool": noop_tool},
+    )
+    context = ToolExecutionContext(
+        conversation_id="benchmark",
+        user_name="benchmark",
+        interface_type="test",
+        timezone_str="UTC",
+        turn_id=None,
+        db_context=MagicMock(spec=DatabaseContext),
+        processing_service=None,
+        clock=None,
+        home_assistant_client=None,
+        event_sources=None,
+        attachment_registry=None,
+        camera_backend=None,
+    )
+
+    print(f"{len(definitions)} tool definitions registered")
+    per_call_fresh = await _time_calls(provider, context, args.calls, False)
+    per_call = await _time_calls(provider, context, args.calls, True)
+    print(f"{'execute_tool, inspect per call':>34}: {per_call_fresh:8.1f} us/call")
+    print(f"{'execute_tool, precompiled':>34}: {per_call:8.1f} us/call")
+
+    per_turn_translate = _time_translation(definitions, args.turns)
+    per_turn = await _time_definitions(provider, args.turns)
+    print(f"{'get_tool_definitions, translate':>34}: {per_turn_translate:8.1f} us/turn")
+    print(f"{'get_tool_definitions, precompiled':>34}: {per_turn:8.1f} us/turn")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
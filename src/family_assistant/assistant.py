@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import copy
+import importlib.metadata
 import logging
 import os
 import sys
@@ -12,7 +13,6 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
-import httpx
 import uvicorn
 
 # Import Embedding interface/clients
@@ -57,7 +57,9 @@ from family_assistant.storage.context import (
 )
 from family_assistant.task_worker import (
     TaskWorker,
+    handle_attachment_cleanup,
     handle_llm_callback,
+    handle_rebuild_conversation_summaries,
     handle_reindex_document,
     handle_script_execution,
     handle_system_error_log_cleanup,
@@ -82,9 +84,15 @@ from family_assistant.tools import (
     MCPToolsProvider,
     _scan_user_docs,
 )
+from family_assistant.tools.data_visualization import shutdown_chart_renders
 from family_assistant.tools.worker import reconcile_stale_tasks
+from family_assistant.utils.http_clients import (
+    HttpClientRegistry,
+    set_http_client_registry,
+)
 from family_assistant.utils.logging_handler import setup_error_logging
 from family_assistant.utils.scraping import PlaywrightScraper
+from family_assistant.utils.startup_timing import StartupTimings
 from family_assistant.web.app_creator import configure_app_auth, create_app
 from family_assistant.web.message_notifier import MessageNotifier
 
@@ -93,13 +101,15 @@ from .telegram.service import TelegramService
 if TYPE_CHECKING:
     import socket
 
+    import httpx
     from fastapi import FastAPI
     from sqlalchemy.ext.asyncio import AsyncEngine
 
+    from family_assistant.config_models import ServiceProfile
     from family_assistant.llm import LLMInterface
     from family_assistant.services.attachment_registry import AttachmentRegistry
     from family_assistant.tools.types import CalendarConfig as CalendarConfigDict
-    from family_assistant.tools.types import ToolExecutionContext
+    from family_assistant.tools.types import ToolDefinition, ToolExecutionContext
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +121,56 @@ def _calendar_config_to_dict(
     return cast("CalendarConfigDict", pydantic_config.model_dump(exclude_none=True))
 
 
+def _playwright_version() -> str | None:
+    """Version of the installed Playwright distribution, if any.
+
+    The runtime dependency is rebrowser-playwright; upstream playwright is only
+    installed for development, pinned to the same version.
+    """
+    for distribution in ("rebrowser-playwright", "playwright"):
+        try:
+            return importlib.metadata.version(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+    return None
+
+
+def _playwright_install_marker() -> Path | None:
+    """Marker file recording that Chromium is installed for this Playwright version.
+
+    Each Playwright release pins its browser builds, so the package version
+    identifies the browser version. The marker lives inside the browsers
+    directory and disappears with it. Returns None when the location cannot be
+    determined, in which case the check always runs.
+    """
+    playwright_version = _playwright_version()
+    if playwright_version is None:
+        return None
+    browsers_path = os.environ.get("PLAYWRIGHT_BROWSERS_PATH")
+    if browsers_path == "0":
+        # Browsers are installed inside the playwright package itself
+        return None
+    if browsers_path:
+        browsers_dir = Path(browsers_path)
+    elif sys.platform == "darwin":
+        browsers_dir = Path.home() / "Library" / "Caches" / "ms-playwright"
+    elif sys.platform == "linux":
+        browsers_dir = Path.home() / ".cache" / "ms-playwright"
+    else:
+        return None
+    return browsers_dir / f".family-assistant-chromium-{playwright_version}"
+
+
+def _record_playwright_install(marker: Path | None) -> None:
+    if marker is None:
+        return
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+    except OSError as e:
+        logger.debug(f"Could not record Playwright browser check at {marker}: {e}")
+
+
 # Helper function (can be moved to utils if used elsewhere)
 def deep_merge_dicts(base_dict: dict, merge_dict: dict) -> dict:
     """Deeply merges merge_dict into base_dict."""
@@ -190,6 +250,7 @@ class Assistant:
 
         # Initialize all instance attributes
         self.fastapi_app: FastAPI | None = None
+        self.http_clients: HttpClientRegistry | None = None
         self.shared_httpx_client: httpx.AsyncClient | None = None
         self.embedding_generator: EmbeddingGenerator | None = None
         self.processing_services_registry: dict[str, ProcessingService] = {}
@@ -216,11 +277,14 @@ class Assistant:
         # Logging handler
         self.error_logging_handler = None
 
+        # Populated by setup_dependencies
+        self.startup_timings = StartupTimings()
+
     async def _get_db_context_for_provider(self) -> DatabaseContext:
-        """Provides database context for context providers."""
+        """Provides a read-only database context for context providers."""
         if not self.database_engine:
             raise RuntimeError("Database engine not initialized")
-        return get_db_context(self.database_engine)
+        return get_db_context(self.database_engine, readonly=True)
 
     def _get_db_context_for_telegram(self) -> DatabaseContext:
         """Provides database context for Telegram service."""
@@ -234,8 +298,22 @@ class Assistant:
             raise RuntimeError("Database engine not initialized")
         return get_db_context(self.database_engine)
 
+    def _get_readonly_db_context_for_events(self) -> DatabaseContext:
+        """Provides a read-only database context for event listener lookups."""
+        if not self.database_engine:
+            raise RuntimeError("Database engine not initialized")
+        return get_db_context(self.database_engine, readonly=True)
+
     async def _ensure_playwright_browsers_installed(self) -> None:
-        """Ensure Playwright browsers are installed, install if missing."""
+        """Ensure Playwright browsers are installed, install if missing.
+
+        A successful check is recorded per Playwright version, so later boots
+        skip the subprocess entirely.
+        """
+        marker = _playwright_install_marker()
+        if marker is not None and marker.exists():
+            logger.debug(f"Playwright browsers already verified ({marker.name})")
+            return
         try:
             # Check if browsers are installed by trying to get the path
             dry_run_process = await asyncio.create_subprocess_exec(
@@ -295,6 +373,7 @@ class Assistant:
 
                 if install_process.returncode == 0:
                     logger.info("Playwright chromium browser installed successfully")
+                    _record_playwright_install(marker)
                 else:
                     install_error_output = (install_stderr or b"").decode().strip()
                     logger.warning(
@@ -303,14 +382,35 @@ class Assistant:
                     )
             else:
                 logger.debug("Playwright browsers already installed")
+                _record_playwright_install(marker)
         except Exception as e:  # noqa: BLE001
             logger.warning(f"Could not check/install Playwright browsers: {e}")
 
-    async def setup_dependencies(self) -> None:
-        """Initializes and wires up all core application components."""
-        # Ensure Playwright browsers are installed as a failsafe
-        await self._ensure_playwright_browsers_installed()
+    async def _check_playwright_browsers(self) -> None:
+        with self.startup_timings.phase("playwright_check"):
+            await self._ensure_playwright_browsers_installed()
 
+    async def setup_dependencies(self) -> None:
+        """Initializes and wires up all core application components.
+
+        Independent work overlaps: the Playwright browser check runs in the
+        background, MCP servers are connected while the database is initialized,
+        and service profiles are built concurrently. How long each phase took is
+        logged and kept in ``startup_timings`` for the health endpoint.
+        """
+        self.startup_timings = StartupTimings()
+        # Ensure Playwright browsers are installed as a failsafe; nothing during
+        # setup launches a browser, so the check need not block it
+        playwright_check = asyncio.create_task(self._check_playwright_browsers())
+        try:
+            await self._setup_components()
+        except BaseException:
+            playwright_check.cancel()
+            raise
+        await playwright_check
+        self.startup_timings.finish()
+
+    async def _setup_components(self) -> None:
         logger.info(f"Using model: {self.config.model}")
 
         # Create FastAPI app instance
@@ -319,6 +419,7 @@ class Assistant:
 
         # Store config in FastAPI app state for access by routes
         self.fastapi_app.state.config = self.config
+        self.fastapi_app.state.startup_timings = self.startup_timings
         logger.info("Stored configuration in FastAPI app state.")
 
         # Create MessageNotifier for live message updates
@@ -333,8 +434,12 @@ class Assistant:
         self.fastapi_app.state.chat_interfaces = {}
         logger.info("Chat interfaces registry initialized")
 
-        self.shared_httpx_client = httpx.AsyncClient()
-        logger.info("Shared httpx.AsyncClient created.")
+        # Pooled HTTP clients shared by calendar, weather, scraping and push
+        self.http_clients = HttpClientRegistry()
+        set_http_client_registry(self.http_clients)
+        self.fastapi_app.state.http_clients = self.http_clients
+        self.shared_httpx_client = self.http_clients.get_client()
+        logger.info("Shared HTTP client registry created.")
 
         # Check if Telegram is enabled
         self.telegram_enabled = self.config.telegram_enabled
@@ -396,80 +501,6 @@ class Assistant:
         )
         self.fastapi_app.state.embedding_generator = self.embedding_generator
 
-        # Create database engine
-        # Use injected engine if provided, otherwise create from config
-        if self._injected_database_engine:
-            self.database_engine = self._injected_database_engine
-            logger.info("Using injected database engine")
-        else:
-            database_url = self.config.database_url
-            self.database_engine = create_engine_with_sqlite_optimizations(database_url)
-            logger.info(f"Database engine created for URL: {database_url}")
-
-            # Initialize database only when we create our own engine
-            await init_db(self.database_engine)
-            async with get_db_context(self.database_engine) as db_ctx:
-                await db_ctx.init_vector_db()
-
-        # Store engine in FastAPI app state for web dependencies
-        self.fastapi_app.state.database_engine = self.database_engine
-
-        # Configure authentication with the database engine
-        configure_app_auth(self.fastapi_app, self.database_engine)
-        logger.info("Authentication configured with database engine")
-
-        # Initialize AttachmentRegistry (consolidates file storage and database metadata)
-        # Must come after database engine initialization
-        # Prefer chat_attachment_storage_path, fall back to attachment_config.storage_path
-        attachment_storage_path = (
-            self.config.chat_attachment_storage_path
-            or self.config.attachment_config.storage_path
-        )
-        attachment_config = self.config.attachment_config
-
-        # Import locally to avoid circular imports
-        from family_assistant.services.attachment_registry import (  # noqa: PLC0415
-            AttachmentRegistry,
-        )
-
-        self.attachment_registry = AttachmentRegistry(
-            storage_path=attachment_storage_path,
-            db_engine=self.database_engine,
-            config=attachment_config.model_dump(),
-        )
-
-        # Store in FastAPI app state for web access
-        self.fastapi_app.state.attachment_registry = self.attachment_registry
-        logger.info(
-            f"AttachmentRegistry initialized with path: {attachment_storage_path}"
-        )
-
-        # Initialize PushNotificationService
-        vapid_private_key = self.config.pwa_config.vapid_private_key
-        vapid_contact_email = self.config.pwa_config.vapid_contact_email
-
-        self.push_notification_service = PushNotificationService(
-            vapid_private_key=vapid_private_key,
-            vapid_contact_email=vapid_contact_email,
-        )
-
-        # Store in app.state for lifespan to retrieve
-        self.fastapi_app.state.push_notification_service = (
-            self.push_notification_service
-        )
-        logger.info(
-            f"PushNotificationService initialized (enabled={self.push_notification_service.enabled})"
-        )
-
-        # Setup error logging to database if enabled
-        error_logging_enabled = self.config.logging.database_errors.enabled
-        # Also check environment variable to disable for testing
-        if error_logging_enabled and not os.environ.get(
-            "FAMILY_ASSISTANT_DISABLE_DB_ERROR_LOGGING"
-        ):
-            self.error_logging_handler = setup_error_logging(self.database_engine)
-            logger.info("Database error logging handler initialized")
-
         resolved_profiles = self.config.service_profiles
         default_service_profile_id = self.config.default_service_profile_id
 
@@ -569,8 +600,78 @@ class Assistant:
             providers=[root_local_provider, root_mcp_provider]
         )
 
-        # Initialize and store for UI/API access
-        await self.root_tools_provider.get_tool_definitions()
+        # Connecting to MCP servers and migrating the database are independent;
+        # the task group cancels tool discovery if database setup fails
+        try:
+            async with asyncio.TaskGroup() as startup_group:
+                database_task = startup_group.create_task(self._setup_database())
+                startup_group.create_task(self._discover_tools())
+        except ExceptionGroup as eg:
+            # Surface the failure itself, as sequential setup would
+            raise eg.exceptions[0]  # noqa: B904 - keep the setup error's own cause
+        database_engine = database_task.result()
+
+        # Store engine in FastAPI app state for web dependencies
+        self.fastapi_app.state.database_engine = database_engine
+
+        # Configure authentication with the database engine
+        configure_app_auth(self.fastapi_app, database_engine)
+        logger.info("Authentication configured with database engine")
+
+        # Initialize AttachmentRegistry (consolidates file storage and database metadata)
+        # Must come after database engine initialization
+        # Prefer chat_attachment_storage_path, fall back to attachment_config.storage_path
+        attachment_storage_path = (
+            self.config.chat_attachment_storage_path
+            or self.config.attachment_config.storage_path
+        )
+        attachment_config = self.config.attachment_config
+
+        # Import locally to avoid circular imports
+        from family_assistant.services.attachment_registry import (  # noqa: PLC0415
+            AttachmentRegistry,
+        )
+
+        self.attachment_registry = AttachmentRegistry(
+            storage_path=attachment_storage_path,
+            db_engine=database_engine,
+            config=attachment_config.model_dump(),
+        )
+
+        # Store in FastAPI app state for web access
+        self.fastapi_app.state.attachment_registry = self.attachment_registry
+        logger.info(
+            f"AttachmentRegistry initialized with path: {attachment_storage_path}"
+        )
+
+        # Initialize PushNotificationService
+        vapid_private_key = self.config.pwa_config.vapid_private_key
+        vapid_contact_email = self.config.pwa_config.vapid_contact_email
+
+        self.push_notification_service = PushNotificationService(
+            vapid_private_key=vapid_private_key,
+            vapid_contact_email=vapid_contact_email,
+            http_client=self.shared_httpx_client,
+        )
+
+        # Store in app.state for lifespan to retrieve
+        self.fastapi_app.state.push_notification_service = (
+            self.push_notification_service
+        )
+        logger.info(
+            f"PushNotificationService initialized (enabled={self.push_notification_service.enabled})"
+        )
+
+        # Setup error logging to database if enabled
+        error_logging_enabled = self.config.logging.database_errors.enabled
+        # Also check environment variable to disable for testing
+        if error_logging_enabled and not os.environ.get(
+            "FAMILY_ASSISTANT_DISABLE_DB_ERROR_LOGGING"
+        ):
+            self.error_logging_handler = setup_error_logging(database_engine)
+            logger.info("Database error logging handler initialized")
+
+        # Store for UI/API access
         self.fastapi_app.state.tools_provider = self.root_tools_provider
         self.fastapi_app.state.tool_definitions = (
             await self.root_tools_provider.get_tool_definitions()
@@ -587,8 +688,226 @@ class Assistant:
             all_skills.extend(load_skills_from_directory(user_dir))
         note_registry = NoteRegistry(all_skills) if all_skills else None
 
-        for profile_conf in resolved_profiles:
-            profile_id = profile_conf.id
+        with self.startup_timings.phase("service_profiles"):
+            profile_services = await asyncio.gather(
+                *(
+                    self._setup_profile(
+                        profile_conf,
+                        base_local_tools_definition=base_local_tools_definition,
+                        formatted_doc_list_for_tool_desc=formatted_doc_list_for_tool_desc,
+                        root_mcp_provider=root_mcp_provider,
+                        note_registry=note_registry,
+                    )
+                    for profile_conf in resolved_profiles
+                )
+            )
+        for profile_conf, service in zip(
+            resolved_profiles, profile_services, strict=True
+        ):
+            self.processing_services_registry[profile_conf.id] = service
+
+        if not self.processing_services_registry:
+            logger.critical("No processing service profiles initialized.")
+            raise SystemExit("No processing service profiles initialized.")
+
+        for service_instance in self.processing_services_registry.values():
+            service_instance.set_processing_services_registry(
+                self.processing_services_registry
+            )
+
+        self.fastapi_app.state.processing_services = self.processing_services_registry
+
+        self.default_processing_service = self.processing_services_registry.get(
+            default_service_profile_id
+        )
+        if not self.default_processing_service:
+            logger.warning(
+                f"Default service profile ID '{default_service_profile_id}' not found. Falling back to first available."
+            )
+            default_service_profile_id = next(
+                iter(self.processing_services_registry.keys())
+            )
+            self.default_processing_service = self.processing_services_registry[
+                default_service_profile_id
+            ]
+
+        self.fastapi_app.state.processing_service = self.default_processing_service
+        self.fastapi_app.state.llm_client = self.default_processing_service.llm_client
+        # Note: tools_provider and tool_definitions are already set to root provider above
+        logger.info(
+            f"Default processing service set to profile ID: '{default_service_profile_id}'."
+        )
+
+        scraper_config = self.config.scraper_config
+        self.scraper_instance = PlaywrightScraper(
+            max_concurrent_pages=scraper_config.max_concurrent_pages,
+            context_max_uses=scraper_config.context_max_uses,
+            context_max_heap_mb=scraper_config.context_max_heap_mb,
+            blocked_resource_types=scraper_config.blocked_resource_types,
+        )
+        self.fastapi_app.state.scraper = self.scraper_instance
+
+        pipeline_config = self.config.indexing_pipeline_config.model_dump()
+        if not pipeline_config.get("processors"):
+            logger.warning("No processors in 'indexing_pipeline_config'.")
+
+        self.document_indexer = DocumentIndexer(
+            pipeline_config=pipeline_config,
+            llm_client=self.default_processing_service.llm_client,
+            embedding_generator=self.embedding_generator,
+            scraper=self.scraper_instance,
+        )
+        self.email_indexer = EmailIndexer(pipeline=self.document_indexer.pipeline)
+        self.notes_indexer = NotesIndexer(pipeline=self.document_indexer.pipeline)
+        logger.info("DocumentIndexer, EmailIndexer, and NotesIndexer initialized.")
+
+        # Instantiate TelegramService in setup_dependencies but don't start polling yet
+        if not self.default_processing_service:  # Should be set by now
+            raise RuntimeError(
+                "Default processing service not available for TelegramService setup."
+            )
+
+        # Only initialize Telegram service if enabled
+        if self.telegram_enabled:
+            assert self.database_engine is not None, (
+                "Database engine must be initialized before creating TelegramService"
+            )
+            # telegram_token is verified earlier when telegram_enabled is True
+            assert self.config.telegram_token is not None
+            self.telegram_service = TelegramService(
+                telegram_token=self.config.telegram_token,
+                allowed_user_ids=self.config.allowed_user_ids,
+                developer_chat_id=self.config.developer_chat_id,
+                processing_service=self.default_processing_service,
+                processing_services_registry=self.processing_services_registry,
+                app_config=self.config,
+                attachment_registry=self.attachment_registry,
+                get_db_context_func=self._get_db_context_for_telegram,
+                fastapi_app=self.fastapi_app,  # Pass FastAPI app for chat_interfaces access
+                # use_batching argument removed
+            )
+            self.fastapi_app.state.telegram_service = self.telegram_service
+            # Register telegram chat interface in the registry
+            self.fastapi_app.state.chat_interfaces["telegram"] = (
+                self.telegram_service.chat_interface
+            )
+            logger.info(
+                "TelegramService instantiated and stored in FastAPI app state during setup_dependencies."
+            )
+        else:
+            self.telegram_service = None
+            self.fastapi_app.state.telegram_service = None
+            logger.info("Telegram service disabled (telegram_enabled=False)")
+
+        # Initialize event system if enabled
+        event_config = self.config.event_system
+        if event_config.enabled:
+            event_sources = {}  # Dict, not list
+
+            # Create Home Assistant event sources for unique HA instances
+            if event_config.sources.home_assistant.enabled:
+                # Get unique HA clients (use cache keys which represent unique instances)
+                unique_clients = {}
+                for key, ha_client in self.home_assistant_clients.items():
+                    # Cache keys contain "..." and represent unique HA instances
+                    if "..." in str(key):
+                        unique_clients[key] = ha_client
+
+                # Create one event source per unique HA instance
+                for idx, (key, ha_client) in enumerate(unique_clients.items()):
+                    logger.info(f"Creating HomeAssistantSource for HA instance: {key}")
+                    ha_source = HomeAssistantSource(client=ha_client)
+                    # Use a simple numeric suffix if we have multiple HA instances
+                    source_key = (
+                        "home_assistant" if idx == 0 else f"home_assistant_{idx}"
+                    )
+                    event_sources[source_key] = ha_source
+
+            # Always add indexing source since it's needed for document indexing events
+            self.indexing_source = IndexingSource()
+            event_sources["indexing"] = self.indexing_source
+            logger.info("Created IndexingSource for document indexing events")
+
+            # Add webhook source if enabled
+            if event_config.sources.webhook.enabled:
+                self.webhook_source = WebhookEventSource()
+                event_sources["webhook"] = self.webhook_source
+                self.fastapi_app.state.webhook_source = self.webhook_source
+                logger.info("Created WebhookEventSource for incoming webhooks")
+            else:
+                self.webhook_source = None
+
+            if event_sources:
+                sample_interval_hours = event_config.storage.sample_interval_hours
+
+                assert self.database_engine is not None, (
+                    "Database engine must be initialized before creating EventProcessor"
+                )
+                self.event_processor = EventProcessor(
+                    sources=event_sources,
+                    sample_interval_hours=sample_interval_hours,
+                    config=event_config.model_dump(),  # Convert to dict for backward compatibility
+                    get_db_context_func=self._get_db_context_for_events,
+                    get_readonly_db_context_func=self._get_readonly_db_context_for_events,
+                    # db_context will be created internally if not provided
+                )
+                logger.info(
+                    f"Event processor initialized with {len(event_sources)} sources"
+                )
+            else:
+                logger.info("Event system enabled but no event sources configured")
+
+    async def _setup_database(self) -> AsyncEngine:
+        """Creates (or adopts the injected) database engine and initializes the schema.
+
+        Returns:
+            The engine, which is also stored as ``self.database_engine``.
+        """
+        with self.startup_timings.phase("database"):
+            # Use injected engine if provided, otherwise create from config
+            if self._injected_database_engine:
+                self.database_engine = self._injected_database_engine
+                logger.info("Using injected database engine")
+            else:
+                database_url = self.config.database_url
+                pool_config = self.config.database_pool
+                self.database_engine = create_engine_with_sqlite_optimizations(
+                    database_url,
+                    pool_size=pool_config.pool_size,
+                    max_overflow=pool_config.max_overflow,
+                    pool_timeout=pool_config.pool_timeout_seconds,
+                    pool_recycle=pool_config.pool_recycle_seconds,
+                    pool_pre_ping=pool_config.pool_pre_ping,
+                    sqlite_readers=pool_config.sqlite_readers,
+                )
+                logger.info(f"Database engine created for URL: {database_url}")
+
+                # Initialize database only when we create our own engine
+                await init_db(self.database_engine)
+                async with get_db_context(self.database_engine) as db_ctx:
+                    await db_ctx.init_vector_db()
+            return self.database_engine
+
+    async def _discover_tools(self) -> None:
+        """Initializes the root tools provider, connecting to all MCP servers."""
+        with self.startup_timings.phase("tool_discovery"):
+            await self.root_tools_provider.get_tool_definitions()
+
+    async def _setup_profile(
+        self,
+        profile_conf: ServiceProfile,
+        *,
+        base_local_tools_definition: list[ToolDefinition],
+        formatted_doc_list_for_tool_desc: str,
+        root_mcp_provider: MCPToolsProvider,
+        note_registry: NoteRegistry | None,
+    ) -> ProcessingService:
+        """Builds the ProcessingService for one service profile.
+
+        Profiles are independent of each other, so they are set up concurrently.
+        """
+        profile_id = profile_conf.id
+        with self.startup_timings.phase(f"profile:{profile_id}"):
             logger.info(
                 f"Initializing ProcessingService for profile ID: '{profile_id}'"
             )
@@ -915,151 +1234,7 @@ class Assistant:
                             f"Failed to create camera backend for profile '{profile_id}'"
                         )
 
-            self.processing_services_registry[profile_id] = processing_service_instance
-
-        if not self.processing_services_registry:
-            logger.critical("No processing service profiles initialized.")
-            raise SystemExit("No processing service profiles initialized.")
-
-        for service_instance in self.processing_services_registry.values():
-            service_instance.set_processing_services_registry(
-                self.processing_services_registry
-            )
-
-        self.fastapi_app.state.processing_services = self.processing_services_registry
-
-        self.default_processing_service = self.processing_services_registry.get(
-            default_service_profile_id
-        )
-        if not self.default_processing_service:
-            logger.warning(
-                f"Default service profile ID '{default_service_profile_id}' not found. Falling back to first available."
-            )
-            default_service_profile_id = next(
-                iter(self.processing_services_registry.keys())
-            )
-            self.default_processing_service = self.processing_services_registry[
-                default_service_profile_id
-            ]
-
-        self.fastapi_app.state.processing_service = self.default_processing_service
-        self.fastapi_app.state.llm_client = self.default_processing_service.llm_client
-        # Note: tools_provider and tool_definitions are already set to root provider above
-        logger.info(
-            f"Default processing service set to profile ID: '{default_service_profile_id}'."
-        )
-
-        self.scraper_instance = PlaywrightScraper()
-        self.fastapi_app.state.scraper = self.scraper_instance
-
-        pipeline_config = self.config.indexing_pipeline_config.model_dump()
-        if not pipeline_config.get("processors"):
-            logger.warning("No processors in 'indexing_pipeline_config'.")
-
-        self.document_indexer = DocumentIndexer(
-            pipeline_config=pipeline_config,
-            llm_client=self.default_processing_service.llm_client,
-            embedding_generator=self.embedding_generator,
-            scraper=self.scraper_instance,
-        )
-        self.email_indexer = EmailIndexer(pipeline=self.document_indexer.pipeline)
-        self.notes_indexer = NotesIndexer(pipeline=self.document_indexer.pipeline)
-        logger.info("DocumentIndexer, EmailIndexer, and NotesIndexer initialized.")
-
-        # Instantiate TelegramService in setup_dependencies but don't start polling yet
-        if not self.default_processing_service:  # Should be set by now
-            raise RuntimeError(
-                "Default processing service not available for TelegramService setup."
-            )
-
-        # Only initialize Telegram service if enabled
-        if self.telegram_enabled:
-            assert self.database_engine is not None, (
-                "Database engine must be initialized before creating TelegramService"
-            )
-            # telegram_token is verified earlier when telegram_enabled is True
-            assert self.config.telegram_token is not None
-            self.telegram_service = TelegramService(
-                telegram_token=self.config.telegram_token,
-                allowed_user_ids=self.config.allowed_user_ids,
-                developer_chat_id=self.config.developer_chat_id,
-                processing_service=self.default_processing_service,
-                processing_services_registry=self.processing_services_registry,
-                app_config=self.config,
-                attachment_registry=self.attachment_registry,
-                get_db_context_func=self._get_db_context_for_telegram,
-                fastapi_app=self.fastapi_app,  # Pass FastAPI app for chat_interfaces access
-                # use_batching argument removed
-            )
-            self.fastapi_app.state.telegram_service = self.telegram_service
-            # Register telegram chat interface in the registry
-            self.fastapi_app.state.chat_interfaces["telegram"] = (
-                self.telegram_service.chat_interface
-            )
-            logger.info(
-                "TelegramService instantiated and stored in FastAPI app state during setup_dependencies."
-            )
-        else:
-            self.telegram_service = None
-            self.fastapi_app.state.telegram_service = None
-            logger.info("Telegram service disabled (telegram_enabled=False)")
-
-        # Initialize event system if enabled
-        event_config = self.config.event_system
-        if event_config.enabled:
-            event_sources = {}  # Dict, not list
-
-            # Create Home Assistant event sources for unique HA instances
-            if event_config.sources.home_assistant.enabled:
-                # Get unique HA clients (use cache keys which represent unique instances)
-                unique_clients = {}
-                for key, ha_client in self.home_assistant_clients.items():
-                    # Cache keys contain "..." and represent unique HA instances
-                    if "..." in str(key):
-                        unique_clients[key] = ha_client
-
-                # Create one event source per unique HA instance
-                for idx, (key, ha_client) in enumerate(unique_clients.items()):
-                    logger.info(f"Creating HomeAssistantSource for HA instance: {key}")
-                    ha_source = HomeAssistantSource(client=ha_client)
-                    # Use a simple numeric suffix if we have multiple HA instances
-                    source_key = (
-                        "home_assistant" if idx == 0 else f"home_assistant_{idx}"
-                    )
-                    event_sources[source_key] = ha_source
-
-            # Always add indexing source since it's needed for document indexing events
-            self.indexing_source = IndexingSource()
-            event_sources["indexing"] = self.indexing_source
-            logger.info("Created IndexingSource for document indexing events")
-
-            # Add webhook source if enabled
-            if event_config.sources.webhook.enabled:
-                self.webhook_source = WebhookEventSource()
-                event_sources["webhook"] = self.webhook_source
-                self.fastapi_app.state.webhook_source = self.webhook_source
-                logger.info("Created WebhookEventSource for incoming webhooks")
-            else:
-                self.webhook_source = None
-
-            if event_sources:
-                sample_interval_hours = event_config.storage.sample_interval_hours
-
-                assert self.database_engine is not None, (
-                    "Database engine must be initialized before creating EventProcessor"
-                )
-                self.event_processor = EventProcessor(
-                    sources=event_sources,
-                    sample_interval_hours=sample_interval_hours,
-                    config=event_config.model_dump(),  # Convert to dict for backward compatibility
-                    get_db_context_func=self._get_db_context_for_events,
-                    # db_context will be created internally if not provided
-                )
-                logger.info(
-                    f"Event processor initialized with {len(event_sources)} sources"
-                )
-            else:
-                logger.info("Event system enabled but no event sources configured")
+            return processing_service_instance
 
     async def start_services(self) -> None:
         """Starts all long-running services and waits for shutdown."""
@@ -1152,6 +1327,12 @@ class Assistant:
         self.task_worker_instance.register_task_handler(
             "system_error_log_cleanup", handle_system_error_log_cleanup
         )
+        self.task_worker_instance.register_task_handler(
+            "attachment_cleanup", handle_attachment_cleanup
+        )
+        self.task_worker_instance.register_task_handler(
+            "rebuild_conversation_summaries", handle_rebuild_conversation_summaries
+        )
         self.task_worker_instance.register_task_handler(
             "script_execution", handle_script_execution
         )
@@ -1305,6 +1486,22 @@ class Assistant:
                     # If task already exists, this is fine - just log it
                     logger.info(f"System error log cleanup task setup: {e}")
 
+                # Upsert the attachment garbage collection task
+                try:
+                    await db_ctx.tasks.enqueue(
+                        task_id="system_attachment_cleanup_daily",
+                        task_type="attachment_cleanup",
+                        payload={},
+                        scheduled_at=next_3am_utc,
+                        recurrence_rule="FREQ=DAILY;BYHOUR=3;BYMINUTE=0",
+                        max_retries_override=5,
+                    )
+                    logger.info(
+                        f"Attachment cleanup task scheduled for {next_3am_local} ({timezone_str})"
+                    )
+                except Exception as e:
+                    logger.info(f"Attachment cleanup task setup: {e}")
+
                 # Upsert the worker task cleanup task
                 try:
                     await db_ctx.tasks.enqueue(
@@ -1462,12 +1659,24 @@ class Assistant:
             )
             await self.default_processing_service.tools_provider.close()
 
-        if self.shared_httpx_client:
-            await self.shared_httpx_client.aclose()
-            logger.info("Shared httpx client closed.")
+        if self.push_notification_service:
+            await self.push_notification_service.close()
+
+        if self.scraper_instance:
+            await self.scraper_instance.aclose()
+
+        if self.http_clients:
+            await self.http_clients.aclose()
+            set_http_client_registry(None)
+            self.shared_httpx_client = None
+
+        if self.attachment_registry:
+            self.attachment_registry.derivatives.shutdown()
+        shutdown_chart_renders()
 
         # Close the error logging handler if it exists
         if self.error_logging_handler:
+            await self.error_logging_handler.wait_for_pending_logs()
             self.error_logging_handler.close()
             logging.getLogger().removeHandler(self.error_logging_handler)
             logger.info("Error logging handler closed.")
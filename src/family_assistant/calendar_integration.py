@@ -4,7 +4,6 @@ from datetime import date, datetime, time, timedelta  # Added time
 from typing import TYPE_CHECKING, Any, cast
 from zoneinfo import ZoneInfo  # Import ZoneInfo
 
-import caldav
 import httpx  # Import httpx
 import vobject
 from caldav.lib.error import (  # Reverted to original-like import path
@@ -13,8 +12,11 @@ from caldav.lib.error import (  # Reverted to original-like import path
 )
 
 from family_assistant.utils.clock import Clock, SystemClock
+from family_assistant.utils.http_clients import get_http_client_registry
 
 if TYPE_CHECKING:
+    import caldav
+
     from family_assistant.tools.types import CalendarConfig, CalendarEvent
 
 logger = logging.getLogger(__name__)
@@ -203,6 +205,8 @@ def parse_event(
 
 # --- Core Fetching Functions ---
 
+ICAL_FETCH_TIMEOUT_SECONDS = 30.0
+
 
 async def _fetch_ical_events_async(
     ical_urls: list[str],
@@ -210,58 +214,58 @@ async def _fetch_ical_events_async(
 ) -> list["CalendarEvent"]:
     """Asynchronously fetches and parses events from a list of iCal URLs."""
     all_events: list[CalendarEvent] = []
-    async with httpx.AsyncClient(timeout=30.0) as client:  # Increased timeout
-        fetch_tasks: list[asyncio.Task[httpx.Response]] = []
-        for url_item in ical_urls:
-            logger.info(f"Fetching iCal data from: {url_item}")
-            # client.get returns a coroutine, ensure it's wrapped in a task for gather if not already
-            fetch_tasks.append(asyncio.create_task(client.get(url_item)))
-
-        # `results` will be a list of httpx.Response objects or exceptions
-        results: list[httpx.Response | BaseException] = await asyncio.gather(
-            *fetch_tasks, return_exceptions=True
+    client = get_http_client_registry().get_client()
+    fetch_tasks: list[asyncio.Task[httpx.Response]] = []
+    for url_item in ical_urls:
+        logger.info(f"Fetching iCal data from: {url_item}")
+        # client.get returns a coroutine, ensure it's wrapped in a task for gather if not already
+        fetch_tasks.append(
+            asyncio.create_task(
+                client.get(url_item, timeout=ICAL_FETCH_TIMEOUT_SECONDS)
+            )
         )
 
-        for i, result in enumerate(results):
-            url = ical_urls[i]  # Assuming ical_urls maps directly to fetch_tasks
-            if isinstance(result, httpx.Response):
-                if result.status_code != 200:
-                    logger.error(
-                        f"Failed to fetch iCal URL {url}: Status {result.status_code}"
-                    )
-                    continue
-                try:
-                    ical_data = result.text
-                    logger.debug(
-                        f"Parsing iCal data from {url} (first 500 chars):\n{ical_data[:500]}..."
-                    )
-                    # Use vobject to parse the fetched data
-                    components = vobject.readComponents(ical_data)  # type: ignore[attr-defined]
-                    count = 0
-                    for component in components:  # component is vobject.base.Component
-                        if component.name.upper() == "VEVENT":  # type: ignore[union-attr]
-                            parsed = parse_event(
-                                component.serialize(),  # type: ignore[union-attr]
-                                timezone_str=timezone_str,  # Pass timezone here
-                            )  # Reuse existing parser
-                            if parsed:
-                                all_events.append(parsed)
-                                count += 1
-                    logger.info(f"Parsed {count} events from iCal URL: {url}")
-                except Exception as e:
-                    logger.error(
-                        f"Error parsing iCal data from {url}: {e}", exc_info=True
-                    )
-            elif isinstance(result, Exception):
+    # `results` will be a list of httpx.Response objects or exceptions
+    results: list[httpx.Response | BaseException] = await asyncio.gather(
+        *fetch_tasks, return_exceptions=True
+    )
+
+    for i, result in enumerate(results):
+        url = ical_urls[i]  # Assuming ical_urls maps directly to fetch_tasks
+        if isinstance(result, httpx.Response):
+            if result.status_code != 200:
                 logger.error(
-                    f"Error fetching iCal URL {url}: {result}", exc_info=result
+                    f"Failed to fetch iCal URL {url}: Status {result.status_code}"
                 )
-                # continue is implicit as this is an elif block
-            else:
-                # This case should ideally not be reached if gather behaves as expected
-                logger.error(
-                    f"Unexpected type in results for {url}: {type(result)}. Skipping."
+                continue
+            try:
+                ical_data = result.text
+                logger.debug(
+                    f"Parsing iCal data from {url} (first 500 chars):\n{ical_data[:500]}..."
                 )
+                # Use vobject to parse the fetched data
+                components = vobject.readComponents(ical_data)  # type: ignore[attr-defined]
+                count = 0
+                for component in components:  # component is vobject.base.Component
+                    if component.name.upper() == "VEVENT":  # type: ignore[union-attr]
+                        parsed = parse_event(
+                            component.serialize(),  # type: ignore[union-attr]
+                            timezone_str=timezone_str,  # Pass timezone here
+                        )  # Reuse existing parser
+                        if parsed:
+                            all_events.append(parsed)
+                            count += 1
+                logger.info(f"Parsed {count} events from iCal URL: {url}")
+            except Exception as e:
+                logger.error(f"Error parsing iCal data from {url}: {e}", exc_info=True)
+        elif isinstance(result, Exception):
+            logger.error(f"Error fetching iCal URL {url}: {result}", exc_info=result)
+            # continue is implicit as this is an elif block
+        else:
+            # This case should ideally not be reached if gather behaves as expected
+            logger.error(
+                f"Unexpected type in results for {url}: {type(result)}. Skipping."
+            )
 
     logger.info(
         f"Fetched and parsed {len(all_events)} total events from {len(ical_urls)} iCal URL(s)."
@@ -330,9 +334,9 @@ def _fetch_caldav_events_sync(
         )
         return []
 
-    # Initialize one client with the determined client_url (server base or inferred)
+    # Reuse the pooled client for the determined client_url (server base or inferred)
     try:
-        client = caldav.DAVClient(
+        client = get_http_client_registry().get_dav_client(
             url=client_url,  # Use the determined base URL for the client
             username=username,
             password=password,
@@ -767,38 +771,36 @@ async def fetch_event_details_for_confirmation(
     # Synchronous fetch function
     def fetch_sync() -> "CalendarEvent | None":
         try:
-            with caldav.DAVClient(
+            client = get_http_client_registry().get_dav_client(
                 url=client_url_to_use,
                 username=username,
                 password=password,
                 timeout=30,
-            ) as client:
-                target_calendar_obj: caldav.objects.Calendar = client.calendar(
-                    url=calendar_url
-                )
-                if not target_calendar_obj:
-                    logger.error(f"Could not get calendar object for {calendar_url}")
-                    return None
+            )
+            target_calendar_obj: caldav.objects.Calendar = client.calendar(
+                url=calendar_url
+            )
+            if not target_calendar_obj:
+                logger.error(f"Could not get calendar object for {calendar_url}")
+                return None
 
-                logger.debug(
-                    f"Fetching event with UID {uid} from {target_calendar_obj.url}"
-                )
-                event_resource: caldav.objects.Event = target_calendar_obj.event_by_uid(
-                    uid
-                )  # type: ignore
+            logger.debug(
+                f"Fetching event with UID {uid} from {target_calendar_obj.url}"
+            )
+            event_resource: caldav.objects.Event = target_calendar_obj.event_by_uid(uid)  # type: ignore
 
-                event_data_str: str = event_resource.data  # type: ignore
-                # Use UTC as default timezone for confirmation display
-                parsed_event = parse_event(event_data_str, timezone_str="UTC")
+            event_data_str: str = event_resource.data  # type: ignore
+            # Use UTC as default timezone for confirmation display
+            parsed_event = parse_event(event_data_str, timezone_str="UTC")
 
-                if parsed_event:
-                    logger.info(
-                        f"Successfully fetched event details for UID {uid}: {parsed_event.get('summary', 'No Title')}"
-                    )
-                    return parsed_event
-                else:
-                    logger.warning(f"Failed to parse event data for UID {uid}")
-                    return None
+            if parsed_event:
+                logger.info(
+                    f"Successfully fetched event details for UID {uid}: {parsed_event.get('summary', 'No Title')}"
+                )
+                return parsed_event
+            else:
+                logger.warning(f"Failed to parse event data for UID {uid}")
+                return None
 
         except NotFoundError:
             logger.warning(f"Event with UID {uid} not found in calendar {calendar_url}")
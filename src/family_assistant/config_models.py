@@ -131,6 +131,8 @@ class ToolsConfig(BaseModel):
     confirm_tools: list[str] = Field(default_factory=list)
     mcp_initialization_timeout_seconds: int = 60
     confirmation_timeout_seconds: float = 3600.0
+    # Start side-effect free tools while the LLM is still streaming its response
+    speculative_tool_execution: bool = False
 
 
 class ServiceProfile(BaseModel):
@@ -384,6 +386,8 @@ class AttachmentConfig(BaseModel):
     large_tool_result_threshold_kb: int = (
         100  # Auto-convert to attachment if > this size (in KiB)
     )
+    derivative_cache_max_bytes: int = 268435456  # 256MB of cached data URIs/resizes
+    derivative_workers: int = 2  # Threads computing attachment derivatives
     allowed_mime_types: list[str] = Field(
         default_factory=lambda: [
             "image/jpeg",
@@ -410,6 +414,32 @@ class AttachmentConfig(BaseModel):
     )
 
 
+class DatabasePoolConfig(BaseModel):
+    """Database connection pool settings."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    pool_size: int = 5  # Connections kept open for the main event loop
+    max_overflow: int = 10  # Extra connections allowed under load
+    pool_timeout_seconds: float = 30.0  # Wait for a free connection before failing
+    pool_recycle_seconds: int = 1800  # Reconnect connections older than this
+    pool_pre_ping: bool = True  # Check connections are alive on checkout
+    sqlite_readers: int = 4  # Query-only SQLite connections for read-only contexts
+
+
+class ScraperConfig(BaseModel):
+    """Web scraper browser pool configuration."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    max_concurrent_pages: int = 4  # Pages rendered at once in the shared browser
+    context_max_uses: int = 25  # Recycle a browser context after this many pages
+    context_max_heap_mb: int = 256  # Recycle a context whose JS heap grows past this
+    blocked_resource_types: list[str] = Field(
+        default_factory=lambda: ["image", "font", "media"]
+    )
+
+
 class EventStorageConfig(BaseModel):
     """Event system storage configuration."""
 
@@ -705,10 +735,12 @@ class AppConfig(BaseSettings):
 
     # Storage paths
     database_url: str = "sqlite+aiosqlite:///family_assistant.db"
+    database_pool: DatabasePoolConfig = Field(default_factory=DatabasePoolConfig)
     server_url: str = "http://localhost:8000"
     document_storage_path: str = "/mnt/data/files"
     attachment_storage_path: str = "/mnt/data/mailbox/attachments"
     mailbox_raw_dir: str | None = None  # Directory for saving raw email requests
+    mailbox_raw_compress: bool = False  # Gzip raw email requests as they are saved
     chat_attachment_storage_path: str | None = (
         None  # Falls back to attachment_config.storage_path
     )
@@ -741,6 +773,7 @@ class AppConfig(BaseSettings):
         default_factory=IndexingPipelineConfig
     )
     attachment_config: AttachmentConfig = Field(default_factory=AttachmentConfig)
+    scraper_config: ScraperConfig = Field(default_factory=ScraperConfig)
     event_system: EventSystemConfig = Field(default_factory=EventSystemConfig)
     message_batching_config: MessageBatchingConfig = Field(
         default_factory=MessageBatchingConfig
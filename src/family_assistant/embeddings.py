@@ -4,42 +4,22 @@ Module defining the interface and implementations for generating text embeddings
 
 import asyncio
 import hashlib
+import importlib.util
 import logging
 import math
 import re
+import threading
 from dataclasses import dataclass
-from typing import Any, Protocol, runtime_checkable
-
-from litellm import aembedding
-from litellm.exceptions import (
-    APIConnectionError,
-    APIError,
-    RateLimitError,
-    ServiceUnavailableError,
-    Timeout,
+from typing import Any, Protocol, cast, runtime_checkable
+
+# sentence-transformers (and the torch stack beneath it) is optional and slow to
+# import, so only its presence is checked here; it is imported when a local
+# model is first loaded
+SENTENCE_TRANSFORMERS_AVAILABLE: bool = (
+    importlib.util.find_spec("sentence_transformers") is not None
+    and importlib.util.find_spec("numpy") is not None
 )
 
-# Declare module/class variables that will be conditionally populated
-
-_SentenceTransformer_cls: Any | None = None
-_np_module: Any | None = None
-SENTENCE_TRANSFORMERS_AVAILABLE: bool  # Will be set in the try/except block
-
-# Import sentence-transformers if available, otherwise skip the class definition
-try:
-    # sentence-transformers returns numpy arrays or torch tensors, need numpy for conversion
-    import numpy  # pyright: ignore[reportMissingTypeStubs]
-    from sentence_transformers import (  # pyright: ignore[reportMissingTypeStubs, reportMissingImports]
-        SentenceTransformer as ActualSentenceTransformer,
-    )
-
-    _np_module = numpy
-    _SentenceTransformer_cls = ActualSentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
-    # _SentenceTransformer_cls and _np_module remain None as initialized
-
 logger = logging.getLogger(__name__)
 
 
@@ -110,6 +90,16 @@ class LiteLLMEmbeddingGenerator:
         logger.debug(
             f"Calling LiteLLM embedding model {self.model_name} for {len(texts)} texts."
         )
+        # litellm takes seconds to import; only processes that embed pay for it
+        from litellm import aembedding  # noqa: PLC0415
+        from litellm.exceptions import (  # noqa: PLC0415
+            APIConnectionError,
+            APIError,
+            RateLimitError,
+            ServiceUnavailableError,
+            Timeout,
+        )
+
         try:
             # Combine fixed kwargs with per-call args
             call_kwargs = {
@@ -268,7 +258,6 @@ class SentenceTransformerEmbeddingGenerator:
     """
 
     _model_name: str  # Instance variable for the model name/path
-    model: Any  # Instance variable for the loaded SentenceTransformer model
     # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
     model_kwargs: dict[str, Any]  # Instance variable for model kwargs
 
@@ -287,7 +276,7 @@ class SentenceTransformerEmbeddingGenerator:
 
         Raises:
             ImportError: If the sentence-transformers library is not installed.
-            ValueError: If model_name_or_path is empty or model loading fails.
+            ValueError: If model_name_or_path is empty.
         """
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
             raise ImportError(
@@ -298,32 +287,53 @@ class SentenceTransformerEmbeddingGenerator:
             raise ValueError("SentenceTransformer model name or path cannot be empty.")
 
         self._model_name = model_name_or_path
+        self._device = device
         self.model_kwargs = kwargs  # type: ignore[assignment]
+        # Loading takes seconds and a lot of memory, so it is deferred until the
+        # first embedding is requested rather than slowing down startup
+        self._model: Any = None
+        self._model_lock = threading.Lock()
+
+    @property
+    def model(self) -> Any:  # noqa: ANN401  # SentenceTransformer is an optional dependency
+        """The SentenceTransformer model, loaded on first access.
+
+        Raises:
+            ValueError: If model loading fails.
+        """
+        with self._model_lock:
+            if self._model is None:
+                self._model = self._load_model()
+            return self._model
+
+    def _load_model(self) -> Any:  # noqa: ANN401  # SentenceTransformer is an optional dependency
         try:
             logger.info(
-                f"Loading SentenceTransformer model: {model_name_or_path} on device: {device or 'auto'}"
+                f"Loading SentenceTransformer model: {self._model_name} on device: {self._device or 'auto'}"
             )
-            if (
-                _SentenceTransformer_cls is None
-            ):  # Should not happen if SENTENCE_TRANSFORMERS_AVAILABLE is True
-                raise RuntimeError(
-                    "SentenceTransformer class is None, though library was reported as available."
-                )
-            self.model = _SentenceTransformer_cls(
-                model_name_or_path, device=device, **self.model_kwargs
+            from sentence_transformers import (  # noqa: PLC0415  # pyright: ignore[reportMissingImports]
+                SentenceTransformer,
+            )
+
+            model = SentenceTransformer(
+                self._model_name, device=self._device, **self.model_kwargs
             )
             logger.info(
-                f"SentenceTransformer model {model_name_or_path} loaded successfully."
+                f"SentenceTransformer model {self._model_name} loaded successfully."
             )
+            return model
         except Exception as e:
             logger.error(
-                f"Failed to load SentenceTransformer model '{model_name_or_path}': {e}",
+                f"Failed to load SentenceTransformer model '{self._model_name}': {e}",
                 exc_info=True,
             )
             raise ValueError(
-                f"Could not load SentenceTransformer model '{model_name_or_path}'"
+                f"Could not load SentenceTransformer model '{self._model_name}'"
             ) from e
 
+    def _encode(self, texts: list[str]) -> Any:  # noqa: ANN401  # numpy array or tensor
+        return self.model.encode(texts)
+
     @property
     def model_name(self) -> str:
         """The identifier of the embedding model being used."""
@@ -355,15 +365,15 @@ class SentenceTransformerEmbeddingGenerator:
         )
         try:
             loop = asyncio.get_running_loop()
-            embeddings_np = await loop.run_in_executor(None, self.model.encode, texts)
+            # Also loads the model on first use, off the event loop
+            embeddings_np = await loop.run_in_executor(None, self._encode, texts)
 
-            if (
-                _np_module is None
-            ):  # Should not happen if SENTENCE_TRANSFORMERS_AVAILABLE
-                raise RuntimeError(
-                    "Numpy module is None, though library was reported as available."
-                )
-            embeddings_list = [_np_module.array(arr).tolist() for arr in embeddings_np]
+            import numpy  # noqa: PLC0415  # pyright: ignore[reportMissingTypeStubs]
+
+            embeddings_list = cast(
+                "list[list[float]]",
+                [numpy.array(arr).tolist() for arr in embeddings_np],
+            )
 
             logger.debug(
                 f"SentenceTransformer generated {len(embeddings_list)} embeddings."
@@ -36,6 +36,7 @@ class EventProcessor:
         # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
         config: dict[str, Any] | None = None,
         get_db_context_func: Callable[[], DatabaseContext] | None = None,
+        get_readonly_db_context_func: Callable[[], DatabaseContext] | None = None,
     ) -> None:
         """
         Initialize event processor.
@@ -46,6 +47,9 @@ class EventProcessor:
             sample_interval_hours: Hours between storing event samples
             config: Optional configuration for script execution
             get_db_context_func: Function to get database context with engine
+            get_readonly_db_context_func: Function to get a read-only database
+                context for listener cache refreshes. Defaults to
+                get_db_context_func.
         """
         self.sources = sources
         self.event_storage = EventStorage(
@@ -53,6 +57,9 @@ class EventProcessor:
         )
         self._db_context = db_context  # Store for tests
         self.get_db_context_func = get_db_context_func
+        self.get_readonly_db_context_func = (
+            get_readonly_db_context_func or get_db_context_func
+        )
         # Cache listeners by source_id for efficient lookup
         self._listener_cache: dict[str, list[dict]] = {}
         self._cache_refresh_interval = 60  # Refresh from DB every minute
@@ -212,8 +219,8 @@ class EventProcessor:
 
         if self._db_context:
             result = await self._db_context.fetch_all(query)
-        elif self.get_db_context_func:
-            async with self.get_db_context_func() as db_ctx:
+        elif self.get_readonly_db_context_func:
+            async with self.get_readonly_db_context_func() as db_ctx:
                 result = await db_ctx.fetch_all(query)
         else:
             raise RuntimeError(
@@ -13,6 +13,7 @@ from family_assistant.embeddings import EmbeddingGenerator  # Added
 from family_assistant.indexing.pipeline import (
     IndexableContent,
     IndexingPipeline,
+    PipelineRunResult,
 )
 
 # Import all necessary processor types
@@ -35,7 +36,10 @@ from family_assistant.indexing.processors.network_processors import (
 )
 from family_assistant.indexing.processors.text_processors import TextChunker  # Added
 from family_assistant.llm import LLMInterface  # Added
-from family_assistant.storage.vector import get_document_by_id
+from family_assistant.storage.vector import (
+    get_document_by_id,
+    update_document_metadata_in_db,
+)
 from family_assistant.tools import ToolExecutionContext
 
 if TYPE_CHECKING:
@@ -43,6 +47,7 @@ if TYPE_CHECKING:
         Document,  # Assuming Document is defined/exported here
     )
     from family_assistant.indexing.types import IndexableContentMetadata
+    from family_assistant.storage.context import DatabaseContext
 from family_assistant.utils.scraping import Scraper  # Added
 
 logger = logging.getLogger(__name__)
@@ -349,7 +354,7 @@ class DocumentIndexer:
             # Pass the list of items directly to the pipeline's run method.
             # The pipeline's run method will determine how to handle initial_content_ref from this list.
             conforming_document = cast("Document", original_document_record)
-            await self.pipeline.run(
+            run_result = await self.pipeline.run_with_timings(
                 initial_items=initial_items,
                 original_document=conforming_document,
                 context=exec_context,
@@ -370,9 +375,40 @@ class DocumentIndexer:
         logger.info(
             f"Indexing pipeline successfully initiated for document {document_id}."
         )
+        await self._record_stage_timings(db_context, document_id, run_result)
         # Task completion is handled by the worker loop.
         # The temporary file (if file_ref was used) is expected to be handled
         # by the pipeline processors or a subsequent cleanup mechanism (Phase 4).
 
+    async def _record_stage_timings(
+        self,
+        db_context: "DatabaseContext",
+        document_id: int,
+        run_result: PipelineRunResult,
+    ) -> None:
+        """Stores the pipeline's per-stage timings in the document's metadata."""
+        timings = {
+            "total_seconds": round(run_result.total_seconds, 3),
+            "stages": [
+                {
+                    "processor": timing.processor,
+                    "seconds": round(timing.seconds, 3),
+                    "items_in": timing.items_in,
+                    "items_out": timing.items_out,
+                }
+                for timing in run_result.stage_timings
+            ],
+        }
+        try:
+            await update_document_metadata_in_db(
+                db_context, document_id, {"indexing_timings": timings}
+            )
+        except SQLAlchemyError:
+            # Timings are diagnostic only; indexing itself succeeded
+            logger.warning(
+                f"Could not record indexing timings for document {document_id}.",
+                exc_info=True,
+            )
+
 
 __all__ = ["DocumentIndexer"]
@@ -4,9 +4,11 @@ Defines the structure of content flowing through the pipeline and the interface
 for content processors, and the pipeline orchestrator.
 """
 
+import asyncio
 import logging  # Added
+import time
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Protocol
+from typing import TYPE_CHECKING, Any, Final, Protocol
 
 from family_assistant.indexing.types import IndexableContentMetadata
 
@@ -16,6 +18,32 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)  # Added
 
+# Items buffered between two stages before the upstream stage waits
+DEFAULT_STAGE_QUEUE_SIZE = 32
+
+# Marks the end of a stage's output in the queue to the next stage
+_END_OF_STAGE: Final = object()
+
+
+@dataclass
+class StageTiming:
+    """Timing of one processor during a pipeline run."""
+
+    processor: str
+    items_in: int = 0
+    items_out: int = 0
+    seconds: float = 0.0
+    """Time from the processor starting on its first item to finishing its last."""
+
+
+@dataclass
+class PipelineRunResult:
+    """Items and per-stage timings from a pipeline run."""
+
+    items: list["IndexableContent"]
+    stage_timings: list[StageTiming]
+    total_seconds: float
+
 
 @dataclass
 class IndexableContent:
@@ -46,6 +74,19 @@ class IndexableContent:
 class ContentProcessor(Protocol):
     """
     Defines the contract for a stage in the document indexing pipeline.
+
+    By default a stage receives every item produced by the previous stage in a
+    single `process` call. Processors whose items are independent of each other
+    can opt in to item-parallel execution with these optional attributes:
+
+    - ``item_parallel`` (bool): `process` is called with one item at a time, for
+      up to ``max_concurrency`` items concurrently, as soon as each item arrives
+      from the previous stage. Such processors must not use
+      ``context.db_context``, which is not safe for concurrent use.
+    - ``max_concurrency`` (int): Limit on concurrent `process` calls.
+    - ``passes_items_through`` (bool): Every input item is returned unchanged
+      along with any new items. The pipeline then forwards each input item to the
+      next stage immediately rather than after the processor finishes with it.
     """
 
     @property
@@ -139,7 +180,7 @@ class IndexingPipeline:
         context: "ToolExecutionContext",
     ) -> list[IndexableContent]:
         """
-        Runs the initial list of IndexableContent items through all configured processors sequentially.
+        Runs the initial list of IndexableContent items through all configured processors.
 
         Args:
             initial_items: The first list of IndexableContent items to process. # Changed
@@ -153,19 +194,37 @@ class IndexingPipeline:
             by any processor. Embedding tasks are dispatched by specialized
             processors within the pipeline, not by the pipeline orchestrator itself.
         """
-        items_for_next_stage: list[IndexableContent] = (
-            initial_items  # Changed initialization
+        result = await self.run_with_timings(
+            initial_items=initial_items,
+            original_document=original_document,
+            context=context,
         )
+        return result.items
+
+    async def run_with_timings(
+        self,
+        initial_items: list[IndexableContent],
+        original_document: "Document",
+        context: "ToolExecutionContext",
+    ) -> PipelineRunResult:
+        """
+        Runs the pipeline like `run`, also reporting how long each stage took.
 
-        for _processor in self.processors:
-            if not items_for_next_stage:  # No more items to process
-                break
+        Stages run as concurrent tasks connected by bounded queues, so an
+        item-parallel stage starts on an item as soon as the previous stage
+        produces it. Stages that take whole lists still see all of their input
+        in a single `process` call, after the previous stage has finished.
+        """
+        document_title = original_document.title if original_document else "Unknown"
+        started = time.monotonic()
 
         if not self.processors:
             logger.warning(
-                f"IndexingPipeline for document '{original_document.title if original_document else 'Unknown'}' has no processors configured. Returning initial items."
+                f"IndexingPipeline for document '{document_title}' has no processors configured. Returning initial items."
+            )
+            return PipelineRunResult(
+                items=initial_items, stage_timings=[], total_seconds=0.0
             )
-            return items_for_next_stage
 
         # Determine the single "initial_content_ref" to be passed to all processors.
         # This should ideally be the very first IndexableContent created for the document.
@@ -175,45 +234,199 @@ class IndexingPipeline:
         )
 
         logger.info(
-            f"Starting IndexingPipeline for document '{original_document.title if original_document else 'Unknown'}' with {len(items_for_next_stage)} initial item(s) and {len(self.processors)} processor(s)."
+            f"Starting IndexingPipeline for document '{document_title}' with {len(initial_items)} initial item(s) and {len(self.processors)} processor(s)."
         )
 
-        for processor in self.processors:
-            if not items_for_next_stage:
-                logger.info(
-                    f"No items left to process before processor '{processor.name}' for document '{original_document.title if original_document else 'Unknown'}'. Ending pipeline early."
-                )
-                break
+        queue_size = self.config.get("stage_queue_size", DEFAULT_STAGE_QUEUE_SIZE)
+        queues: list[asyncio.Queue[Any]] = [
+            asyncio.Queue(maxsize=queue_size) for _ in range(len(self.processors) + 1)
+        ]
+        timings = [StageTiming(processor=p.name) for p in self.processors]
+        final_items: list[IndexableContent] = []
+
+        async def feed() -> None:
+            for item in initial_items:
+                await queues[0].put(item)
+            await queues[0].put(_END_OF_STAGE)
+
+        async def collect() -> None:
+            while (item := await queues[-1].get()) is not _END_OF_STAGE:
+                final_items.append(item)
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(feed())
+                for index, processor in enumerate(self.processors):
+                    task_group.create_task(
+                        self._run_stage(
+                            processor,
+                            inbox=queues[index],
+                            outbox=queues[index + 1],
+                            timing=timings[index],
+                            original_document=original_document,
+                            initial_content_ref=initial_content_ref_for_processors,
+                            context=context,
+                        )
+                    )
+                task_group.create_task(collect())
+        except ExceptionGroup as eg:
+            # Surface the first stage failure, as a sequential run would
+            raise eg.exceptions[0]  # noqa: B904 - keep the stage error's own cause
 
-            logger.debug(
-                f"Running processor '{processor.name}' with {len(items_for_next_stage)} item(s) for document '{original_document.title if original_document else 'Unknown'}'."
-            )
-            try:
-                # Each processor returns the list of items to be passed to the next one.
-                # Specialized processors (e.g., for dispatching embeddings) will handle
-                # task enqueuing internally using the provided context.
-                items_for_next_stage = await processor.process(
-                    current_items=items_for_next_stage,
-                    original_document=original_document,
-                    initial_content_ref=initial_content_ref_for_processors,  # Pass determined ref
-                    context=context,
-                )
-                logger.debug(
-                    f"Processor '{processor.name}' produced {len(items_for_next_stage)} item(s) for the next stage for document '{original_document.title if original_document else 'Unknown'}'."
+        total_seconds = time.monotonic() - started
+        logger.info(
+            f"IndexingPipeline run completed for document '{document_title}' in {total_seconds:.3f}s "
+            f"({', '.join(f'{t.processor}: {t.seconds:.3f}s' for t in timings)}). "
+            f"Returning {len(final_items)} item(s) that completed all stages."
+        )
+        return PipelineRunResult(
+            items=final_items, stage_timings=timings, total_seconds=total_seconds
+        )
+
+    async def _run_stage(
+        self,
+        processor: ContentProcessor,
+        inbox: "asyncio.Queue[Any]",
+        outbox: "asyncio.Queue[Any]",
+        timing: StageTiming,
+        original_document: "Document",
+        initial_content_ref: IndexableContent | None,
+        context: "ToolExecutionContext",
+    ) -> None:
+        """Runs one processor, forwarding its output to the next stage."""
+        document_title = original_document.title if original_document else "Unknown"
+        try:
+            if getattr(processor, "item_parallel", False) is True:
+                await self._run_item_parallel_stage(
+                    processor,
+                    inbox,
+                    outbox,
+                    timing,
+                    original_document,
+                    initial_content_ref,
+                    context,
                 )
-            except Exception as e:
-                logger.error(
-                    f"Error in processor '{processor.name}' for document '{original_document.title if original_document else 'Unknown'}': {e}",
-                    exc_info=True,
+            else:
+                await self._run_batch_stage(
+                    processor,
+                    inbox,
+                    outbox,
+                    timing,
+                    original_document,
+                    initial_content_ref,
+                    context,
                 )
-                # Depending on desired error handling (e.g., continue with next processor or stop)
-                # For now, re-raise to indicate a failure in this pipeline run for this document.
-                raise RuntimeError(
-                    f"Processor '{processor.name}' failed during execution for document '{original_document.title if original_document else 'Unknown'}'."
-                ) from e
+        except Exception as e:
+            if isinstance(e, ExceptionGroup):
+                e = e.exceptions[0]
+            logger.error(
+                f"Error in processor '{processor.name}' for document '{document_title}': {e}",
+                exc_info=e,
+            )
+            # Re-raise to indicate a failure in this pipeline run for this document.
+            raise RuntimeError(
+                f"Processor '{processor.name}' failed during execution for document '{document_title}'."
+            ) from e
+        await outbox.put(_END_OF_STAGE)
 
-        logger.info(
-            f"IndexingPipeline run completed for document '{original_document.title if original_document else 'Unknown'}'. "
-            f"Returning {len(items_for_next_stage)} item(s) that completed all stages."
+    async def _run_batch_stage(
+        self,
+        processor: ContentProcessor,
+        inbox: "asyncio.Queue[Any]",
+        outbox: "asyncio.Queue[Any]",
+        timing: StageTiming,
+        original_document: "Document",
+        initial_content_ref: IndexableContent | None,
+        context: "ToolExecutionContext",
+    ) -> None:
+        current_items: list[IndexableContent] = []
+        while (item := await inbox.get()) is not _END_OF_STAGE:
+            current_items.append(item)
+        timing.items_in = len(current_items)
+        if not current_items:
+            logger.info(
+                f"No items left to process before processor '{processor.name}'. Skipping it."
+            )
+            return
+
+        logger.debug(
+            f"Running processor '{processor.name}' with {len(current_items)} item(s)."
+        )
+        started = time.monotonic()
+        # Specialized processors (e.g., for dispatching embeddings) will handle
+        # task enqueuing internally using the provided context.
+        output_items = await processor.process(
+            current_items=current_items,
+            original_document=original_document,
+            initial_content_ref=initial_content_ref,
+            context=context,
         )
-        return items_for_next_stage
+        timing.seconds = time.monotonic() - started
+        timing.items_out = len(output_items)
+        logger.debug(
+            f"Processor '{processor.name}' produced {len(output_items)} item(s) for the next stage."
+        )
+        for output_item in output_items:
+            await outbox.put(output_item)
+
+    async def _run_item_parallel_stage(
+        self,
+        processor: ContentProcessor,
+        inbox: "asyncio.Queue[Any]",
+        outbox: "asyncio.Queue[Any]",
+        timing: StageTiming,
+        original_document: "Document",
+        initial_content_ref: IndexableContent | None,
+        context: "ToolExecutionContext",
+    ) -> None:
+        passes_items_through = getattr(processor, "passes_items_through", False) is True
+        # Released once an item's output has been forwarded, which also bounds
+        # the results buffered while waiting for an earlier, slower item
+        slots = asyncio.Semaphore(max(1, getattr(processor, "max_concurrency", 1)))
+        # (input item, its task) in input order; None after the last item
+        in_flight: asyncio.Queue[
+            tuple[IndexableContent, asyncio.Task[list[IndexableContent]]] | None
+        ] = asyncio.Queue()
+        started: float | None = None
+
+        async def forward(item: IndexableContent) -> None:
+            timing.items_out += 1
+            await outbox.put(item)
+
+        async def start_items(task_group: asyncio.TaskGroup) -> None:
+            nonlocal started
+            while (item := await inbox.get()) is not _END_OF_STAGE:
+                timing.items_in += 1
+                await slots.acquire()
+                if started is None:
+                    started = time.monotonic()
+                if passes_items_through:
+                    await forward(item)
+                task = task_group.create_task(
+                    processor.process(
+                        current_items=[item],
+                        original_document=original_document,
+                        initial_content_ref=initial_content_ref,
+                        context=context,
+                    )
+                )
+                in_flight.put_nowait((item, task))
+            in_flight.put_nowait(None)
+
+        async def forward_results() -> None:
+            # Results are forwarded in input order
+            while (entry := await in_flight.get()) is not None:
+                item, task = entry
+                try:
+                    for output_item in await task:
+                        if passes_items_through and output_item is item:
+                            continue
+                        await forward(output_item)
+                finally:
+                    slots.release()
+
+        async with asyncio.TaskGroup() as task_group:
+            task_group.create_task(start_items(task_group))
+            task_group.create_task(forward_results())
+        if started is not None:
+            timing.seconds = time.monotonic() - started
@@ -14,13 +14,22 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Concurrent LLM calls per processor when the pipeline runs it item-parallel
+DEFAULT_LLM_MAX_CONCURRENCY = 4
+
 
 class LLMIntelligenceProcessor(ContentProcessor):
     """
     A content processor that uses an LLM to extract structured information
     (e.g., summary, categories, specific fields) from content.
+
+    Each item is sent to the LLM independently, so the pipeline runs this
+    processor item-parallel; original items are always passed through.
     """
 
+    item_parallel = True
+    passes_items_through = True
+
     def __init__(
         self,
         llm_client: LLMInterface,
@@ -33,6 +42,7 @@ class LLMIntelligenceProcessor(ContentProcessor):
         ],  # List of embedding_types this processor should act upon
         tool_name: str = "extract_information",  # Name for the tool the LLM will call
         max_content_length: int | None = None,  # Applies to purely textual content
+        max_concurrency: int = DEFAULT_LLM_MAX_CONCURRENCY,
     ) -> None:
         self.llm_client = llm_client
         self.system_prompt_template = system_prompt_template
@@ -43,6 +53,7 @@ class LLMIntelligenceProcessor(ContentProcessor):
         )  # Use a set for faster lookups
         self.tool_name = tool_name
         self.max_content_length = max_content_length
+        self.max_concurrency = max_concurrency
 
         if not self.input_content_types:
             raise ValueError("input_content_types cannot be empty.")
@@ -267,6 +278,7 @@ class LLMSummaryGeneratorProcessor(LLMIntelligenceProcessor):
         # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
         output_schema: dict[str, Any] = DEFAULT_SUMMARY_OUTPUT_SCHEMA,
         tool_name: str = "extract_summary",
+        max_concurrency: int = DEFAULT_LLM_MAX_CONCURRENCY,
     ) -> None:
         """
         Initializes the LLMSummaryGeneratorProcessor.
@@ -281,6 +293,7 @@ class LLMSummaryGeneratorProcessor(LLMIntelligenceProcessor):
             system_prompt_template: The system prompt template for the LLM.
             output_schema: The JSON schema for the LLM function call.
             tool_name: The name for the tool the LLM will call.
+            max_concurrency: Maximum concurrent LLM calls when run item-parallel.
         """
         super().__init__(
             llm_client=llm_client,
@@ -290,6 +303,7 @@ class LLMSummaryGeneratorProcessor(LLMIntelligenceProcessor):
             input_content_types=input_content_types,
             tool_name=tool_name,
             max_content_length=max_content_length,
+            max_concurrency=max_concurrency,
         )
         logger.info(
             f"LLMSummaryGeneratorProcessor initialized for target_embedding_type '{target_embedding_type}' on input types: {input_content_types}"
@@ -353,6 +367,7 @@ class LLMPrimaryLinkExtractorProcessor(LLMIntelligenceProcessor):
         # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
         output_schema: dict[str, Any] = DEFAULT_PRIMARY_LINK_OUTPUT_SCHEMA,
         tool_name: str = DEFAULT_PRIMARY_LINK_TOOL_NAME,
+        max_concurrency: int = DEFAULT_LLM_MAX_CONCURRENCY,
     ) -> None:
         """
         Initializes the LLMPrimaryLinkExtractorProcessor.
@@ -367,6 +382,7 @@ class LLMPrimaryLinkExtractorProcessor(LLMIntelligenceProcessor):
             system_prompt_template: The system prompt template for the LLM.
             output_schema: The JSON schema for the LLM function call.
             tool_name: The name for the tool the LLM will call.
+            max_concurrency: Maximum concurrent LLM calls when run item-parallel.
         """
         super().__init__(
             llm_client=llm_client,
@@ -376,6 +392,7 @@ class LLMPrimaryLinkExtractorProcessor(LLMIntelligenceProcessor):
             input_content_types=input_content_types,
             tool_name=tool_name,
             max_content_length=max_content_length,
+            max_concurrency=max_concurrency,
         )
         logger.info(
             f"LLMPrimaryLinkExtractorProcessor initialized for target_embedding_type '{target_embedding_type}' on input types: {input_content_types}"
@@ -27,6 +27,8 @@ class WebFetcherProcessorConfig:
     process_embedding_types: list[str] = field(
         default_factory=lambda: ["extracted_link", "raw_url"]
     )
+    max_concurrency: int = 4
+    """Maximum concurrent fetches when the pipeline runs the processor item-parallel."""
     # Add other configs like timeouts if needed.
 
 
@@ -34,8 +36,11 @@ class WebFetcherProcessor:
     """
     A content processor that fetches content from URLs found in IndexableContent items.
     It uses a Scraper instance to perform the fetching and initial processing.
+    URLs are fetched independently, so the pipeline runs it item-parallel.
     """
 
+    item_parallel = True
+
     def __init__(
         self, scraper: Scraper, config: WebFetcherProcessorConfig | None = None
     ) -> None:
@@ -55,6 +60,10 @@ class WebFetcherProcessor:
         """Unique identifier for the processor."""
         return "web_fetcher_processor"
 
+    @property
+    def max_concurrency(self) -> int:
+        return self.config.max_concurrency
+
     async def process(
         self,
         current_items: list["IndexableContent"],
@@ -2,38 +2,24 @@
 Module defining the interface and implementations for interacting with Large Language Models (LLMs).
 """
 
-import asyncio
 import base64
-import copy  # For deep copying tool definitions
-import io
+import functools
 import json
 import logging
 import os
 import re
-import time
-import uuid
 from collections.abc import AsyncIterator, Mapping, Sequence
 from dataclasses import asdict, dataclass, field  # Added asdict
-from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
 import aiofiles  # type: ignore[import-untyped] # For async file operations
-import litellm  # Import litellm
 from genson import SchemaBuilder  # For JSON schema generation
-from litellm import acompletion
-from litellm.exceptions import (
-    APIConnectionError,
-    APIError,
-    BadRequestError,
-    RateLimitError,
-    ServiceUnavailableError,
-    Timeout,
-)
 from pydantic import BaseModel, ValidationError
 
 from family_assistant.tools.types import ToolDefinition
 
 from .base import InvalidRequestError, StructuredOutputError
+from .conversion_cache import MessageConversionCache
 from .factory import LLMClientFactory
 from .google_types import GeminiProviderMetadata
 from .messages import (
@@ -47,23 +33,13 @@ from .messages import (
     message_to_json_dict,
     tool_result_to_llm_message,
 )
-from .request_buffer import LLMRequestRecord, get_request_buffer
 from .tool_call import ToolCallFunction, ToolCallItem
 
 # Import for multimodal tool results
 if TYPE_CHECKING:
     from family_assistant.tools.types import ToolAttachment
 
-# Removed ChatCompletionToolParam as it's causing ImportError and not explicitly used
-
-if TYPE_CHECKING:
-    from litellm import Message  # Add import for litellm.Message
-    from litellm.types.files import (
-        FileResponse,  # type: ignore[attr-defined] # Changed import path
-    )
-    from litellm.types.utils import (
-        ModelResponse,  # Import ModelResponse for type hinting
-    )
+    from .providers.litellm_client import LiteLLMClient
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +63,12 @@ class BaseLLMClient:
 
     model: str  # Subclasses must set this attribute
 
+    @functools.cached_property
+    # ast-grep-ignore: no-dict-any - Provider-specific converted message types
+    def _message_conversion_cache(self) -> MessageConversionCache[Any]:
+        """Provider-format messages reused across calls, e.g. tool-loop iterations."""
+        return MessageConversionCache()
+
     def _supports_multimodal_tools(self) -> bool:
         """Check if this LLM client supports multimodal tool responses natively"""
         # Default implementation - override in subclasses
@@ -437,19 +419,6 @@ class BaseLLMClient:
         )
 
 
-# --- Conditionally Enable LiteLLM Debug Logging ---
-LITELLM_DEBUG_ENABLED = os.getenv("LITELLM_DEBUG", "false").lower() in {
-    "true",
-    "1",
-    "yes",
-}
-if LITELLM_DEBUG_ENABLED:
-    litellm.set_verbose = True  # type: ignore[reportPrivateImportUsage]
-    logger.info(
-        "Enabled LiteLLM verbose logging (set_verbose = True) because LITELLM_DEBUG is set."
-    )
-# --- End Debug Logging Control ---
-
 # --- Debug LLM Messages Control ---
 DEBUG_LLM_MESSAGES_ENABLED = os.getenv("DEBUG_LLM_MESSAGES", "false").lower() in {
     "true",
@@ -720,60 +689,6 @@ class LLMStreamEvent:
     metadata: dict[str, Any] | None = None  # Additional event metadata
 
 
-# ast-grep-ignore: no-dict-any - Return type intentionally untyped; deep-copies and strips fields for litellm
-def _sanitize_tools_for_litellm(tools: list[ToolDefinition]) -> list[dict[str, Any]]:
-    """
-    Removes unsupported 'format' fields from string parameters in tool definitions
-    before sending them to LiteLLM/OpenAI, which only supports 'enum' and 'date-time'.
-
-    Args:
-        tools: A list of tool definitions in OpenAI dictionary format.
-
-    Returns:
-        A new list of sanitized tool definitions.
-    """
-    # Create a deep copy to avoid modifying the original list in place
-    sanitized_tools = copy.deepcopy(tools)
-
-    for tool_dict in sanitized_tools:
-        func_def = tool_dict.get("function", {})
-        params = func_def.get("parameters", {})
-        properties = params.get("properties", {})
-        tool_name = func_def.get("name", "unknown_tool")  # For logging context
-
-        if not isinstance(properties, dict):
-            logger.warning(
-                f"Sanitizing tool '{tool_name}': Non-dict 'properties' found. Skipping property sanitization for this tool."
-            )
-            continue
-
-        props_to_delete_format = []
-        for param_name, param_details in properties.items():
-            if isinstance(param_details, dict):
-                param_type = param_details.get("type")
-                param_format = param_details.get("format")
-
-                if (
-                    param_type == "string"
-                    and param_format
-                    and param_format not in {"enum", "date-time"}
-                ):
-                    logger.warning(
-                        f"Sanitizing tool '{tool_name}': Removing unsupported format '{param_format}' from string parameter '{param_name}' for LiteLLM compatibility."
-                    )
-                    props_to_delete_format.append(param_name)
-
-        for param_name in props_to_delete_format:
-            if (
-                param_name in properties
-                and isinstance(properties[param_name], dict)
-                and "format" in properties[param_name]
-            ):
-                del properties[param_name]["format"]
-
-    return cast("list[dict[str, Any]]", sanitized_tools)
-
-
 class LLMInterface(Protocol):
     """Protocol defining the interface for interacting with an LLM."""
 
@@ -878,1259 +793,6 @@ class LLMInterface(Protocol):
         ...
 
 
-class LiteLLMClient(BaseLLMClient):
-    """LLM client implementation using the LiteLLM library."""
-
-    def __init__(
-        self,
-        model: str,
-        # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
-        model_parameters: dict[str, dict[str, Any]] | None = None,  # Corrected type
-        fallback_model_id: str | None = None,
-        # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
-        fallback_model_parameters: dict[str, dict[str, Any]]
-        | None = None,  # Corrected type
-        # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
-        **kwargs: dict[str, Any],
-    ) -> None:
-        """
-        Initializes the LiteLLM client.
-
-        Args:
-            model: The identifier of the primary model to use.
-            model_parameters: Parameters specific to the primary model (pattern -> params_dict).
-            fallback_model_id: Optional identifier for a fallback model.
-            fallback_model_parameters: Optional parameters for the fallback model (pattern -> params_dict).
-            **kwargs: Default keyword arguments for litellm.acompletion.
-        """
-        if not model:
-            raise ValueError("LLM model identifier cannot be empty.")
-        self.model = model
-        self.default_kwargs = kwargs
-        # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
-        self.model_parameters: dict[str, dict[str, Any]] = (
-            model_parameters or {}
-        )  # Ensure correct type for self
-        self.fallback_model_id = fallback_model_id
-        # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
-        self.fallback_model_parameters: dict[str, dict[str, Any]] = (
-            fallback_model_parameters or {}
-        )  # Ensure correct type for self
-        logger.info(
-            f"LiteLLMClient initialized for primary model: {self.model} "
-            f"with default kwargs: {self.default_kwargs}, "
-            f"model-specific parameters: {self.model_parameters}. "
-            f"Fallback model: {self.fallback_model_id}, "
-            f"fallback params: {self.fallback_model_parameters}"
-        )
-
-    def _supports_multimodal_tools(self) -> bool:
-        """Check if model supports multimodal tool responses"""
-        return self.model.startswith("claude")
-
-    def _process_tool_messages(
-        self,
-        messages: list[LLMMessage],
-    ) -> list[LLMMessage]:
-        """Process messages, using native support when available"""
-        if not self._supports_multimodal_tools():
-            return super()._process_tool_messages(messages)
-
-        # Claude supports multimodal natively
-        processed: list[LLMMessage] = []
-        for original_msg in messages:
-            if (
-                isinstance(original_msg, ToolMessage)
-                and original_msg.transient_attachments
-            ):
-                attachments = original_msg.transient_attachments
-                # Convert to Claude's format
-                # ast-grep-ignore: no-dict-any - LiteLLM SDK requires dict format for message content
-                content: list[dict[str, Any]] = [
-                    {"type": "text", "text": original_msg.content},
-                ]
-                injection_msgs: list[LLMMessage] = []
-                for attachment in attachments:
-                    if attachment.content and attachment.mime_type.startswith("image/"):
-                        # Use helper method for base64 encoding
-                        b64_data = attachment.get_content_as_base64()
-                        if b64_data:
-                            content.append({
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": attachment.mime_type,
-                                    "data": b64_data,
-                                },
-                            })
-                    elif (
-                        attachment.content and attachment.mime_type == "application/pdf"
-                    ):
-                        # Claude supports PDFs via document format
-                        b64_data = attachment.get_content_as_base64()
-                        if b64_data:
-                            content.append({
-                                "type": "document",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": attachment.mime_type,
-                                    "data": b64_data,
-                                },
-                            })
-                    elif attachment.content or attachment.file_path:
-                        # Unsupported attachment type or file-path-only attachment - log warning and fall back to base class behavior
-                        if attachment.content:
-                            logger.warning(
-                                f"Unsupported attachment type {attachment.mime_type} for Claude model, falling back to text description"
-                            )
-                        else:
-                            logger.warning(
-                                f"File-path-only attachment {attachment.file_path} for Claude model, falling back to text description"
-                            )
-                        # Update the text content to indicate file content follows in next message
-                        content[0]["text"] += "\n[File content in following message]"
-                        # Fall back to base class injection method
-                        injection_msg = self.create_attachment_injection(attachment)
-                        injection_msgs.append(injection_msg)
-                # Create a new ToolMessage with the multimodal content and no attachments
-                updated_msg = original_msg.model_copy(
-                    update={
-                        "content": content,
-                        "transient_attachments": None,
-                    }
-                )
-                processed.append(updated_msg)
-                # Add injection messages after the tool message if needed
-                if injection_msgs:
-                    processed.extend(injection_msgs)
-            else:
-                processed.append(original_msg)
-        return processed
-
-    async def _attempt_completion(
-        self,
-        model_id: str,
-        messages: list[LLMMessage],
-        tools: list[ToolDefinition] | None,
-        tool_choice: str | None,
-        # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
-        specific_model_params: dict[str, dict[str, Any]],  # Corrected type
-    ) -> LLMOutput:
-        """Internal method to make a single attempt at LLM completion.
-
-        Args:
-            model_id: The model identifier to use.
-            messages: List of typed LLMMessage objects.
-            tools: Optional list of tool definitions.
-            tool_choice: Tool choice setting.
-            specific_model_params: Model-specific parameters.
-        """
-        # Process tool attachments before sending
-        messages = self._process_tool_messages(messages)
-
-        completion_params = self.default_kwargs.copy()
-
-        # Find and merge model-specific parameters from config for the current model_id
-        reasoning_params_config = None
-        # specific_model_params is the dict of (pattern -> params_dict) for the current model type
-        current_model_config_params = specific_model_params
-
-        for (
-            pattern,
-            params,
-        ) in current_model_config_params.items():  # params is dict[str, Any]
-            matched = False
-            if pattern.endswith("-"):
-                if model_id.startswith(pattern[:-1]):
-                    matched = True
-            elif model_id == pattern:
-                matched = True
-
-            if matched:
-                logger.debug(
-                    f"Applying parameters for model '{model_id}' using pattern '{pattern}': {params}"
-                )
-                params_to_merge = params.copy()
-                if "reasoning" in params_to_merge and isinstance(
-                    params_to_merge["reasoning"], dict
-                ):
-                    reasoning_params_config = params_to_merge.pop("reasoning")
-                completion_params.update(params_to_merge)
-                break
-
-        if model_id.startswith("openrouter/") and reasoning_params_config:
-            completion_params["reasoning"] = reasoning_params_config
-            logger.debug(
-                f"Adding 'reasoning' parameter for OpenRouter model '{model_id}': {reasoning_params_config}"
-            )
-
-        # Convert to dicts for SDK/API calls (using message_to_json_dict for full serialization)
-        message_dicts = [message_to_json_dict(msg) for msg in messages]
-
-        # LiteLLM automatically drops unsupported parameters, so we pass them all.
-        if DEBUG_LLM_MESSAGES_ENABLED:
-            logger.info(
-                f"LLM Request to {model_id}:\n"
-                f"{_format_serialized_messages_for_debug(message_dicts, tools, tool_choice)}"
-            )
-
-        # Prepare for request recording
-        request_id = str(uuid.uuid4())[:8]
-        start_time = time.monotonic()
-        request_timestamp = datetime.now(UTC)
-
-        try:
-            if tools:
-                sanitized_tools_arg = _sanitize_tools_for_litellm(tools)
-                logger.debug(
-                    f"Calling LiteLLM model {model_id} with {len(message_dicts)} messages. "
-                    f"Tools provided. Tool choice: {tool_choice}. Filtered params: {json.dumps(completion_params, default=str)}"
-                )
-                response = await acompletion(
-                    model=model_id,
-                    messages=message_dicts,
-                    tools=sanitized_tools_arg,
-                    tool_choice=tool_choice,
-                    stream=False,
-                    **completion_params,  # type: ignore[reportArgumentType]
-                )
-                response = cast("ModelResponse", response)
-            else:
-                logger.debug(
-                    f"Calling LiteLLM model {model_id} with {len(message_dicts)} messages. "
-                    f"No tools provided. Filtered params: {json.dumps(completion_params, default=str)}"
-                )
-                _response_obj = await acompletion(
-                    model=model_id,
-                    messages=message_dicts,
-                    stream=False,
-                    **completion_params,  # type: ignore[reportArgumentType]
-                )
-                response = cast("ModelResponse", _response_obj)
-        except Exception as e:
-            # Record failed request
-            duration_ms = (time.monotonic() - start_time) * 1000
-            try:
-                get_request_buffer().add(
-                    LLMRequestRecord(
-                        timestamp=request_timestamp,
-                        request_id=request_id,
-                        model_id=model_id,
-                        messages=message_dicts,
-                        tools=tools,
-                        tool_choice=tool_choice,
-                        response=None,
-                        duration_ms=duration_ms,
-                        error=str(e),
-                    )
-                )
-            except Exception as record_err:
-                logger.debug(f"Failed to record LLM request error: {record_err}")
-            raise
-
-        response_message: Message | None = None
-        if response.choices:
-            response_message = response.choices[0].message  # type: ignore[attr-defined]
-
-        if not response_message:
-            logger.warning(
-                f"LiteLLM response structure unexpected or empty for model {model_id}: {response}"
-            )
-            raise APIError(
-                message="Received empty or unexpected response from LiteLLM.",
-                llm_provider="litellm",
-                model=model_id,
-                status_code=500,
-            )
-
-        content = response_message.get("content")
-        raw_tool_calls = response_message.get("tool_calls")
-        reasoning_info = None
-        if hasattr(response, "usage") and response.usage:  # type: ignore[attr-defined]
-            try:
-                reasoning_info = response.usage.model_dump(mode="json")  # type: ignore[attr-defined]
-            except Exception as usage_err:
-                logger.warning(
-                    f"Could not serialize response.usage for model {model_id}: {usage_err}"
-                )  # type: ignore[attr-defined]
-
-        tool_calls_list = []
-        if raw_tool_calls:
-            for tc_obj in raw_tool_calls:
-                func_name: str | None = None
-                func_args: str | None = None
-                if hasattr(tc_obj, "function") and tc_obj.function:
-                    if hasattr(tc_obj.function, "name"):
-                        func_name = tc_obj.function.name
-                    if hasattr(tc_obj.function, "arguments"):
-                        func_args = tc_obj.function.arguments
-                else:
-                    logger.warning(
-                        f"ToolCall object for model {model_id} is missing function attribute or it's None: {tc_obj}"
-                    )
-
-                if not func_name or func_args is None:
-                    logger.warning(
-                        f"ToolCall's function object for model {model_id} is missing name or arguments: name='{func_name}', args_present={func_args is not None}."
-                    )
-                    tool_call_function = ToolCallFunction(
-                        name=func_name or "malformed_function_in_llm_output",
-                        arguments=func_args or "{}",
-                    )
-                else:
-                    tool_call_function = ToolCallFunction(
-                        name=func_name, arguments=func_args
-                    )
-
-                tc_id = tc_obj.id if hasattr(tc_obj, "id") else None
-                tc_type = tc_obj.type if hasattr(tc_obj, "type") else None
-                if not tc_id or not tc_type:
-                    logger.error(
-                        f"ToolCall item from LLM model {model_id} missing id ('{tc_id}') or type ('{tc_type}'). Skipping."
-                    )
-                    continue
-                tool_calls_list.append(
-                    ToolCallItem(id=tc_id, type=tc_type, function=tool_call_function)
-                )
-
-        logger.debug(
-            f"LiteLLM response received from model {model_id}. Content: {bool(content)}. Tool Calls: {len(tool_calls_list)}. Reasoning: {bool(reasoning_info)}"
-        )
-        llm_output = LLMOutput(
-            content=content,  # type: ignore
-            tool_calls=tool_calls_list if tool_calls_list else None,
-            reasoning_info=reasoning_info,
-        )
-
-        # Record successful request
-        duration_ms = (time.monotonic() - start_time) * 1000
-        try:
-            get_request_buffer().add(
-                LLMRequestRecord(
-                    timestamp=request_timestamp,
-                    request_id=request_id,
-                    model_id=model_id,
-                    messages=message_dicts,
-                    tools=tools,
-                    tool_choice=tool_choice,
-                    response=asdict(llm_output),
-                    duration_ms=duration_ms,
-                    error=None,
-                )
-            )
-        except Exception as record_err:
-            logger.debug(f"Failed to record LLM request: {record_err}")
-
-        return llm_output
-
-    async def generate_response(
-        self,
-        messages: Sequence[LLMMessage],
-        tools: list[ToolDefinition] | None = None,
-        tool_choice: str | None = "auto",
-    ) -> LLMOutput:
-        """Generates a response using LiteLLM, with one retry on primary model and fallback."""
-        # Validate user input before processing
-        self._validate_user_input(messages)
-
-        # Keep messages as typed objects throughout processing
-        message_list = list(messages)
-
-        retriable_errors = (
-            APIConnectionError,
-            Timeout,
-            RateLimitError,
-            ServiceUnavailableError,
-            BadRequestError,
-        )
-        last_exception: Exception | None = None
-
-        # Attempt 1: Primary model
-        try:
-            logger.info(f"Attempt 1: Primary model ({self.model})")
-            return await self._attempt_completion(
-                model_id=self.model,
-                messages=message_list,
-                tools=tools,
-                tool_choice=tool_choice,
-                specific_model_params=self.model_parameters,
-            )
-        except retriable_errors as e:
-            logger.warning(
-                f"Attempt 1 (Primary model {self.model}) failed with retriable error: {e}. Retrying primary model."
-            )
-            last_exception = e
-        except APIError as e:  # Non-retriable APIError (but not BadRequestError)
-            logger.warning(
-                f"Attempt 1 (Primary model {self.model}) failed with APIError: {e}. Proceeding to fallback."
-            )
-            last_exception = e
-        except Exception as e:
-            logger.error(
-                f"Attempt 1 (Primary model {self.model}) failed with unexpected error: {e}",
-                exc_info=True,
-            )
-            last_exception = e  # Store for potential re-raise if fallback also fails or isn't attempted
-            # For truly unexpected errors, we might still want to try fallback if configured.
-
-        # Attempt 2: Retry Primary model (if Attempt 1 was a retriable error)
-        if isinstance(last_exception, retriable_errors):
-            try:
-                logger.info(f"Attempt 2: Retrying primary model ({self.model})")
-                return await self._attempt_completion(
-                    model_id=self.model,
-                    messages=message_list,
-                    tools=tools,
-                    tool_choice=tool_choice,
-                    specific_model_params=self.model_parameters,
-                )
-            except retriable_errors as e:
-                logger.warning(
-                    f"Attempt 2 (Retry Primary model {self.model}) failed with retriable error: {e}. Proceeding to fallback."
-                )
-                last_exception = e
-            except APIError as e:  # Non-retriable APIError on retry
-                logger.warning(
-                    f"Attempt 2 (Retry Primary model {self.model}) failed with APIError: {e}. Proceeding to fallback."
-                )
-                last_exception = e
-            except Exception as e:
-                logger.error(
-                    f"Attempt 2 (Retry Primary model {self.model}) failed with unexpected error: {e}",
-                    exc_info=True,
-                )
-                last_exception = e
-
-        # Attempt 3: Fallback model
-        actual_fallback_model_id = self.fallback_model_id or "openai/gpt-5.2"
-        if actual_fallback_model_id == self.model:
-            logger.warning(
-                f"Fallback model '{actual_fallback_model_id}' is the same as the primary model '{self.model}'. Skipping fallback."
-            )
-            if last_exception:
-                raise last_exception
-            # This case should ideally not happen if logic is correct, means no error but no success.
-            raise APIError(
-                message="All attempts failed without a specific error to raise.",
-                llm_provider="litellm",
-                model=self.model,
-                status_code=500,
-            )
-
-        if last_exception:  # Ensure we only fallback if there was a prior failure
-            logger.info(f"Attempt 3: Fallback model ({actual_fallback_model_id})")
-            try:
-                return await self._attempt_completion(
-                    model_id=actual_fallback_model_id,
-                    messages=message_list,
-                    tools=tools,
-                    tool_choice=tool_choice,
-                    specific_model_params=self.fallback_model_parameters,
-                )
-            except Exception as e:
-                logger.error(
-                    f"Attempt 3 (Fallback model {actual_fallback_model_id}) also failed: {e}",
-                    exc_info=True,
-                )
-                # Fallthrough to raise last_exception from primary model attempts,
-                # or this new one if last_exception was None (though it shouldn't be here).
-                last_exception = e
-
-        # If all attempts failed, raise the last significant exception
-        if last_exception:
-            logger.error(
-                f"All LLM attempts failed. Raising last recorded exception: {last_exception}"
-            )
-            raise last_exception
-        else:
-            # Should not be reached if logic is correct, but as a safeguard:
-            logger.error(
-                "All LLM attempts failed without a specific exception captured."
-            )
-            raise APIError(
-                message="All LLM attempts failed without a specific exception.",
-                llm_provider="litellm",
-                model=self.model,  # Or some generic indicator
-                status_code=500,
-            )
-
-    async def format_user_message_with_file(
-        self,
-        prompt_text: str | None,
-        file_path: str | None,
-        mime_type: str | None,
-        max_text_length: int | None,
-        # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
-    ) -> dict[str, Any]:
-        # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
-        user_content_parts: list[dict[str, Any]] = []
-        actual_prompt_text = prompt_text or "Process the provided file."
-
-        if file_path and mime_type:
-            # Attempt Gemini File API if applicable
-            if self.model.startswith("gemini/"):
-                try:
-                    logger.info(
-                        f"Attempting to upload file to Gemini: {file_path} ({mime_type})"
-                    )
-                    if not os.getenv("GEMINI_API_KEY"):
-                        raise ValueError(
-                            "GEMINI_API_KEY not found in environment for Gemini file upload."
-                        )
-
-                    async with aiofiles.open(file_path, "rb") as f_bytes_io:
-                        file_bytes_content = await f_bytes_io.read()
-
-                    loop = asyncio.get_running_loop()
-                    # Use litellm.file_upload for more generic provider support
-                    gemini_api_key = os.getenv("GEMINI_API_KEY")
-                    if not gemini_api_key:  # Redundant check, but good practice
-                        raise ValueError("GEMINI_API_KEY is required.")
-
-                    gemini_file_obj: FileResponse = await loop.run_in_executor(
-                        None,  # Default ThreadPoolExecutor
-                        litellm.file_upload,  # type: ignore[attr-defined] # pylint: disable=no-member # Corrected path to file_upload
-                        io.BytesIO(file_bytes_content),  # file (BinaryIO)
-                        os.path.basename(file_path),  # file_name
-                        "gemini",  # custom_llm_provider
-                        gemini_api_key,  # api_key
-                        # model argument is optional for file_upload, let gemini provider handle
-                    )
-                    logger.info(f"File uploaded to Gemini, ID: {gemini_file_obj.id}")
-                    user_content_parts.append({
-                        "type": "text",
-                        "text": actual_prompt_text,
-                    })
-                    user_content_parts.append({
-                        "type": "file",
-                        "file": {
-                            "file_id": gemini_file_obj.id,
-                            "filename": os.path.basename(
-                                file_path
-                            ),  # Consistent filename
-                            "format": mime_type,  # Use provided mime_type
-                        },
-                    })
-                except Exception as e:
-                    logger.error(
-                        f"Failed to upload file to Gemini or construct message: {e}. Falling back to base64/text.",
-                        exc_info=True,
-                    )
-                    user_content_parts = []  # Ensure fallback if Gemini fails
-
-            # Fallback or non-Gemini model file handling
-            if (
-                not user_content_parts
-            ):  # Only if Gemini part didn't populate or wasn't attempted
-                if mime_type.startswith("image/"):
-                    try:
-                        async with aiofiles.open(file_path, "rb") as f:
-                            image_bytes = await f.read()
-                        encoded_image = base64.b64encode(image_bytes).decode("utf-8")
-                        image_url = f"data:{mime_type};base64,{encoded_image}"
-                        user_content_parts.append({
-                            "type": "text",
-                            "text": actual_prompt_text,
-                        })
-                        user_content_parts.append({
-                            "type": "image_url",
-                            "image_url": {"url": image_url},
-                        })
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to read/encode image {file_path}: {e}",
-                            exc_info=True,
-                        )
-                        user_content_parts.append({
-                            "type": "text",
-                            "text": actual_prompt_text,
-                        })  # Fallback to text
-                elif mime_type.startswith("text/"):
-                    try:
-                        async with (
-                            aiofiles.open(file_path, encoding="utf-8") as f
-                        ):  # Changed from "r" to "rb" for consistency, but text files should be "r"
-                            file_text_content = await f.read()
-                        combined_text = f"{actual_prompt_text}\n\n--- File Content ---\n{file_text_content}"
-                        if max_text_length and len(combined_text) > max_text_length:
-                            logger.info(
-                                f"Truncating combined text from {len(combined_text)} to {max_text_length} chars."
-                            )
-                            combined_text = combined_text[:max_text_length]
-                        user_content_parts.append({
-                            "type": "text",
-                            "text": combined_text,
-                        })
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to read text file {file_path}: {e}", exc_info=True
-                        )
-                        user_content_parts.append({
-                            "type": "text",
-                            "text": actual_prompt_text,
-                        })  # Fallback to text
-                else:  # Other file types
-                    logger.warning(
-                        f"File type {mime_type} for {file_path} not specifically handled for image/text. "
-                        "Attempting generic base64 data URI."
-                    )
-                    try:
-                        async with aiofiles.open(file_path, "rb") as f_bytes_io:
-                            file_bytes = await f_bytes_io.read()
-                        encoded_file_data = base64.b64encode(file_bytes).decode("utf-8")
-                        file_data_uri = f"data:{mime_type};base64,{encoded_file_data}"
-                        user_content_parts.append({
-                            "type": "text",
-                            "text": actual_prompt_text,
-                        })
-                        user_content_parts.append({
-                            "type": "file",
-                            "file": {"file_data": file_data_uri},
-                        })
-                        logger.info(
-                            f"Prepared generic file {file_path} as base64 data URI for LLM."
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to read/encode generic file {file_path} as base64: {e}",
-                            exc_info=True,
-                        )
-                        user_content_parts.append({
-                            "type": "text",
-                            "text": actual_prompt_text,
-                        })  # Fallback to text
-
-        elif prompt_text:  # Only text prompt provided
-            text_to_send = prompt_text
-            if max_text_length and len(text_to_send) > max_text_length:
-                logger.info(
-                    f"Truncating prompt text from {len(text_to_send)} to {max_text_length} chars."
-                )
-                text_to_send = text_to_send[:max_text_length]
-            user_content_parts.append({"type": "text", "text": text_to_send})
-        else:
-            logger.error(
-                "format_user_message_with_file called with no file and no prompt text."
-            )
-            raise ValueError("Cannot format user message with no input (file or text).")
-
-        # Determine final content structure for the user message
-        # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
-        final_user_content: str | list[dict[str, Any]]
-        if len(user_content_parts) == 1 and user_content_parts[0]["type"] == "text":
-            final_user_content = user_content_parts[0]["text"]
-        else:
-            final_user_content = user_content_parts
-
-        return {"role": "user", "content": final_user_content}
-
-    def generate_response_stream(
-        self,
-        messages: Sequence[LLMMessage],
-        tools: list[ToolDefinition] | None = None,
-        tool_choice: str | None = "auto",
-    ) -> AsyncIterator[LLMStreamEvent]:
-        """Generate streaming response using LiteLLM, with one retry on primary model and fallback."""
-        # Validate user input before processing
-        self._validate_user_input(messages)
-        return self._generate_response_stream(messages, tools, tool_choice)
-
-    async def _attempt_streaming_completion(
-        self,
-        model_id: str,
-        messages: Sequence[LLMMessage],
-        tools: list[ToolDefinition] | None,
-        tool_choice: str | None,
-        # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
-        specific_model_params: dict[str, dict[str, Any]],
-    ) -> AsyncIterator[LLMStreamEvent]:
-        """Internal async generator for streaming responses (single attempt)."""
-
-        def _safe_get_attr(obj: object, name: str) -> object | None:
-            """Get attribute or dict key safely."""
-            if isinstance(obj, dict):
-                return obj.get(name)
-            return getattr(obj, name, None)
-
-        def _extract_text_from_content(content: object) -> str | None:
-            """Extract concatenated text from mixed streaming payloads."""
-            if isinstance(content, str):
-                return content
-            if isinstance(content, list):
-                parts: list[str] = []
-                for part in content:
-                    text_val: Any = None
-                    if isinstance(part, dict):
-                        text_val = part.get("text") or part.get("content")
-                    else:
-                        text_val = getattr(part, "text", None)
-                        if not isinstance(text_val, str):
-                            value_attr = getattr(text_val, "value", None)
-                            if isinstance(value_attr, str):
-                                text_val = value_attr
-                        if not isinstance(text_val, str):
-                            content_attr = getattr(part, "content", None)
-                            if isinstance(content_attr, str):
-                                text_val = content_attr
-                    if isinstance(text_val, str):
-                        parts.append(text_val)
-                if parts:
-                    return "".join(parts)
-            return None
-
-        # Process tool attachments with typed messages
-        processed_messages = self._process_tool_messages(list(messages))
-
-        # Convert to dicts only at SDK boundary
-        message_dicts = [message_to_json_dict(msg) for msg in processed_messages]
-
-        # Use default kwargs as base
-        completion_params = self.default_kwargs.copy()
-
-        # Apply model-specific parameters
-        for pattern, params in specific_model_params.items():
-            matched = False
-            if pattern.endswith("-"):
-                if model_id.startswith(pattern[:-1]):
-                    matched = True
-            elif model_id == pattern:
-                matched = True
-
-            if matched:
-                logger.debug(
-                    f"Applying streaming parameters for model '{model_id}' using pattern '{pattern}': {params}"
-                )
-                params_to_merge = params.copy()
-                if "reasoning" in params_to_merge:
-                    params_to_merge.pop("reasoning")  # Not supported in streaming
-                completion_params.update(params_to_merge)
-                break
-
-        # Prepare streaming parameters
-        stream_params = {
-            "model": model_id,
-            "messages": message_dicts,
-            "stream": True,  # Enable streaming
-            **completion_params,
-        }
-
-        # Add tools if provided
-        if tools:
-            sanitized_tools = _sanitize_tools_for_litellm(tools)
-            stream_params["tools"] = sanitized_tools
-            stream_params["tool_choice"] = tool_choice
-
-        if DEBUG_LLM_MESSAGES_ENABLED:
-            logger.info(
-                f"LLM Streaming Request to {model_id}:\n"
-                f"{_format_serialized_messages_for_debug(message_dicts, tools, tool_choice)}"
-            )
-
-        logger.debug(
-            f"Starting streaming response from LiteLLM model {model_id} "
-            f"with {len(message_dicts)} messages. Tools: {bool(tools)}"
-        )
-
-        # Make streaming API call
-        stream = await acompletion(**stream_params)
-
-        # Track current tool calls being built
-        # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
-        current_tool_calls: dict[int, dict[str, Any]] = {}
-        chunk: Any | None = None
-        last_chunk_with_usage: Any | None = None
-        content_emitted = False
-
-        async for chunk in stream:  # type: ignore[misc]
-            if not chunk or not chunk.choices:
-                continue
-
-            try:
-                logger.debug(
-                    "Raw streaming chunk choice dump: %s",
-                    chunk.choices[0].model_dump()
-                    if hasattr(chunk.choices[0], "model_dump")
-                    else chunk.choices[0],
-                )
-            except Exception:
-                logger.debug("Could not dump streaming chunk choice", exc_info=True)
-
-            delta = chunk.choices[0].delta
-            if not delta:
-                continue
-
-            last_chunk_with_usage = chunk
-
-            logger.debug("Streaming delta payload: %s (type=%s)", delta, type(delta))
-
-            # Extract content
-            delta_content = _safe_get_attr(delta, "content")
-            if delta_content is None:
-                logger.debug(
-                    "Delta content missing; available attributes: %s",
-                    {
-                        attr: getattr(delta, attr)
-                        for attr in dir(delta)
-                        if not attr.startswith("_")
-                    },
-                )
-
-            text_chunk: str | None = _extract_text_from_content(delta_content)
-
-            # Some SDKs wrap content under delta.message["content"]
-            if not text_chunk:
-                message_obj = _safe_get_attr(delta, "message")
-                if message_obj is not None:
-                    msg_content = _safe_get_attr(message_obj, "content")
-                    text_chunk = _extract_text_from_content(msg_content)
-
-            if not text_chunk and delta_content is not None:
-                # Fallback: coerce non-string content to string if present
-                text_chunk = str(delta_content)
-
-            if text_chunk:
-                logger.debug("Streaming content chunk: %s", text_chunk)
-                yield LLMStreamEvent(type="content", content=text_chunk)
-                content_emitted = True
-
-            # Extract tool calls
-            raw_tool_calls = _safe_get_attr(delta, "tool_calls")
-            tool_calls_delta = (
-                raw_tool_calls if isinstance(raw_tool_calls, list) else []
-            )
-
-            for tc_delta in tool_calls_delta:
-                raw_idx = _safe_get_attr(tc_delta, "index")
-                if isinstance(raw_idx, int):
-                    idx = raw_idx
-                else:
-                    logger.warning(
-                        "Tool call delta missing index attribute, defaulting to 0. "
-                        "This may cause issues with multiple tool calls."
-                    )
-                    idx = 0
-                tc_id = _safe_get_attr(tc_delta, "id")
-                tc_type = _safe_get_attr(tc_delta, "type") or "function"
-                func_name = ""
-                func_args = ""
-                function_delta = _safe_get_attr(tc_delta, "function")
-                if function_delta:
-                    func_name_attr = _safe_get_attr(function_delta, "name")
-                    func_args_attr = _safe_get_attr(function_delta, "arguments")
-                    if isinstance(func_name_attr, str):
-                        func_name = func_name_attr
-                    if isinstance(func_args_attr, str):
-                        func_args = func_args_attr
-                    elif func_args_attr is not None:
-                        try:
-                            func_args = json.dumps(func_args_attr)
-                        except Exception:  # pragma: no cover - best effort fallback
-                            func_args = str(func_args_attr)
-
-                if idx not in current_tool_calls:
-                    current_tool_calls[idx] = {
-                        "id": tc_id,
-                        "type": tc_type,
-                        "function": {"name": "", "arguments": ""},
-                    }
-
-                tc_data = current_tool_calls[idx]
-                if tc_id:
-                    tc_data["id"] = tc_id
-                if tc_type:
-                    tc_data["type"] = tc_type
-                if func_name:
-                    tc_data["function"]["name"] = func_name
-                if func_args:
-                    tc_data["function"]["arguments"] += func_args
-
-        # Emit any remaining tool calls
-        for tc_data in current_tool_calls.values():
-            if tc_data["id"] and tc_data["function"]["name"]:
-                tool_call = ToolCallItem(
-                    id=tc_data["id"],
-                    type=tc_data["type"],
-                    function=ToolCallFunction(
-                        name=tc_data["function"]["name"],
-                        arguments=tc_data["function"]["arguments"] or "{}",
-                    ),
-                )
-                yield LLMStreamEvent(
-                    type="tool_call",
-                    tool_call=tool_call,
-                    tool_call_id=tc_data["id"],
-                )
-
-        # If we never emitted content (e.g., provider returned only a terminal chunk),
-        # fall back to a non-streaming completion to preserve expected behaviour.
-        if not content_emitted:
-            try:
-                fallback_output = await self._attempt_completion(
-                    model_id=model_id,
-                    messages=list(messages),
-                    tools=tools,
-                    tool_choice=tool_choice,
-                    specific_model_params=specific_model_params,
-                )
-                if fallback_output.content:
-                    yield LLMStreamEvent(
-                        type="content", content=fallback_output.content
-                    )
-                    content_emitted = True
-                if fallback_output.tool_calls:
-                    for tc in fallback_output.tool_calls:
-                        yield LLMStreamEvent(
-                            type="tool_call",
-                            tool_call=tc,
-                            tool_call_id=tc.id,
-                        )
-                if fallback_output.reasoning_info:
-                    yield LLMStreamEvent(
-                        type="done",
-                        metadata={"reasoning_info": fallback_output.reasoning_info},
-                    )
-                    return
-            except Exception as exc:  # pragma: no cover - best effort fallback
-                logger.debug("Fallback non-streaming completion failed: %s", exc)
-
-        # Extract usage info if available
-        metadata: StreamingMetadata = {}
-        if (
-            last_chunk_with_usage
-            and hasattr(last_chunk_with_usage, "usage")
-            and last_chunk_with_usage.usage
-        ):
-            try:
-                metadata["reasoning_info"] = last_chunk_with_usage.usage.model_dump(
-                    mode="json"
-                )
-            except Exception as e:
-                logger.warning(
-                    f"Could not serialize streaming usage data: {e}", exc_info=False
-                )
-
-        # Signal completion
-        yield LLMStreamEvent(type="done", metadata=metadata)
-
-    async def _generate_response_stream(
-        self,
-        messages: Sequence[LLMMessage],
-        tools: list[ToolDefinition] | None = None,
-        tool_choice: str | None = "auto",
-    ) -> AsyncIterator[LLMStreamEvent]:
-        """Internal async generator for streaming responses with retry/fallback logic."""
-
-        retriable_errors = (
-            APIConnectionError,
-            Timeout,
-            RateLimitError,
-            ServiceUnavailableError,
-            BadRequestError,
-        )
-        last_exception: Exception | None = None
-        has_yielded_content = False
-
-        # Attempt 1: Primary model
-        try:
-            logger.info(f"Attempt 1: Primary model ({self.model}) (Streaming)")
-            async for event in self._attempt_streaming_completion(
-                model_id=self.model,
-                messages=messages,
-                tools=tools,
-                tool_choice=tool_choice,
-                specific_model_params=self.model_parameters,
-            ):
-                if event.type in {"content", "tool_call", "done"}:
-                    has_yielded_content = True
-                yield event
-            return
-        except retriable_errors as e:
-            if has_yielded_content:
-                logger.error(
-                    f"Attempt 1 (Primary model {self.model}) failed mid-stream with retriable error: {e}. Cannot retry as content already yielded."
-                )
-                yield LLMStreamEvent(
-                    type="error",
-                    error=str(e),
-                    metadata={"error_id": str(e.__class__.__name__)},
-                )
-                return
-            logger.warning(
-                f"Attempt 1 (Primary model {self.model}) failed with retriable error: {e}. Retrying primary model."
-            )
-            last_exception = e
-        except APIError as e:  # Non-retriable APIError (but not BadRequestError)
-            if has_yielded_content:
-                logger.error(
-                    f"Attempt 1 (Primary model {self.model}) failed mid-stream with APIError: {e}. Cannot fallback."
-                )
-                yield LLMStreamEvent(
-                    type="error",
-                    error=str(e),
-                    metadata={"error_id": str(e.__class__.__name__)},
-                )
-                return
-            logger.warning(
-                f"Attempt 1 (Primary model {self.model}) failed with APIError: {e}. Proceeding to fallback."
-            )
-            last_exception = e
-        except Exception as e:
-            if has_yielded_content:
-                logger.error(
-                    f"Attempt 1 (Primary model {self.model}) failed mid-stream with unexpected error: {e}. Cannot fallback."
-                )
-                yield LLMStreamEvent(
-                    type="error",
-                    error=str(e),
-                    metadata={"error_id": str(e.__class__.__name__)},
-                )
-                return
-            logger.error(
-                f"Attempt 1 (Primary model {self.model}) failed with unexpected error: {e}",
-                exc_info=True,
-            )
-            last_exception = e
-
-        # Attempt 2: Retry Primary model (if Attempt 1 was a retriable error)
-        if isinstance(last_exception, retriable_errors):
-            try:
-                logger.info(
-                    f"Attempt 2: Retrying primary model ({self.model}) (Streaming)"
-                )
-                async for event in self._attempt_streaming_completion(
-                    model_id=self.model,
-                    messages=messages,
-                    tools=tools,
-                    tool_choice=tool_choice,
-                    specific_model_params=self.model_parameters,
-                ):
-                    if event.type in {"content", "tool_call", "done"}:
-                        has_yielded_content = True
-                    yield event
-                return
-            except retriable_errors as e:
-                if has_yielded_content:
-                    logger.error(
-                        "Attempt 2 (Retry Primary) failed mid-stream. Cannot fallback."
-                    )
-                    yield LLMStreamEvent(
-                        type="error",
-                        error=str(e),
-                        metadata={"error_id": str(e.__class__.__name__)},
-                    )
-                    return
-                logger.warning(
-                    f"Attempt 2 (Retry Primary model {self.model}) failed with retriable error: {e}. Proceeding to fallback."
-                )
-                last_exception = e
-            except APIError as e:
-                if has_yielded_content:
-                    logger.error(
-                        "Attempt 2 (Retry Primary) failed mid-stream. Cannot fallback."
-                    )
-                    yield LLMStreamEvent(
-                        type="error",
-                        error=str(e),
-                        metadata={"error_id": str(e.__class__.__name__)},
-                    )
-                    return
-                logger.warning(
-                    f"Attempt 2 (Retry Primary model {self.model}) failed with APIError: {e}. Proceeding to fallback."
-                )
-                last_exception = e
-            except Exception as e:
-                if has_yielded_content:
-                    logger.error(
-                        "Attempt 2 (Retry Primary) failed mid-stream. Cannot fallback."
-                    )
-                    yield LLMStreamEvent(
-                        type="error",
-                        error=str(e),
-                        metadata={"error_id": str(e.__class__.__name__)},
-                    )
-                    return
-                logger.error(
-                    f"Attempt 2 (Retry Primary model {self.model}) failed with unexpected error: {e}",
-                    exc_info=True,
-                )
-                last_exception = e
-
-        # Attempt 3: Fallback model
-        actual_fallback_model_id = self.fallback_model_id or "openai/gpt-5.2"
-        if actual_fallback_model_id == self.model:
-            logger.warning(
-                f"Fallback model '{actual_fallback_model_id}' is the same as the primary model '{self.model}'. Skipping fallback."
-            )
-            if last_exception:
-                yield LLMStreamEvent(
-                    type="error",
-                    error=str(last_exception),
-                    metadata={"error_id": str(last_exception.__class__.__name__)},
-                )
-            return
-
-        if last_exception:
-            logger.info(
-                f"Attempt 3: Fallback model ({actual_fallback_model_id}) (Streaming)"
-            )
-            try:
-                async for event in self._attempt_streaming_completion(
-                    model_id=actual_fallback_model_id,
-                    messages=messages,
-                    tools=tools,
-                    tool_choice=tool_choice,
-                    specific_model_params=self.fallback_model_parameters,
-                ):
-                    # No need to track content yielded here, as we are the last attempt
-                    yield event
-                return
-            except Exception as e:
-                logger.error(
-                    f"Attempt 3 (Fallback model {actual_fallback_model_id}) also failed: {e}",
-                    exc_info=True,
-                )
-                last_exception = e
-
-        # If all attempts failed
-        if last_exception:
-            yield LLMStreamEvent(
-                type="error",
-                error=str(last_exception),
-                metadata={"error_id": str(last_exception.__class__.__name__)},
-            )
-
-    async def generate_structured(
-        self,
-        messages: Sequence[LLMMessage],
-        response_model: type[T],
-        max_retries: int = 2,
-    ) -> T:
-        """
-        Generate a structured response using LiteLLM's native response_format support.
-
-        LiteLLM automatically translates response_format to the appropriate provider
-        format (OpenAI JSON schema, Anthropic tool use, etc.).
-
-        Args:
-            messages: Conversation messages
-            response_model: Pydantic model class defining the expected response schema
-            max_retries: Maximum number of retry attempts on validation failure
-
-        Returns:
-            Instance of response_model populated with the LLM's response
-
-        Raises:
-            StructuredOutputError: If response cannot be parsed/validated after retries
-        """
-        # Convert messages to dict format for LiteLLM
-        messages_list = list(messages)
-        messages_list = self._process_tool_messages(messages_list)
-        message_dicts = [message_to_json_dict(msg) for msg in messages_list]
-
-        last_error: Exception | None = None
-        raw_response: str | None = None
-
-        for attempt in range(max_retries + 1):
-            try:
-                # Use LiteLLM's native response_format with Pydantic model
-                # LiteLLM automatically handles conversion to provider-specific format
-                completion_params = self.default_kwargs.copy()
-
-                response_obj = await acompletion(
-                    model=self.model,
-                    messages=message_dicts,
-                    response_format=response_model,
-                    **completion_params,  # type: ignore[reportArgumentType] # LiteLLM accepts dynamic kwargs
-                )
-                response = cast("ModelResponse", response_obj)
-
-                # Extract the response content
-                # type: ignore needed - LiteLLM's ModelResponse type hints don't fully reflect
-                # that non-streaming responses have .message on choices
-                if not response.choices or not response.choices[0].message:  # type: ignore[attr-defined]
-                    raise ValueError("LLM returned empty response")
-
-                message = response.choices[0].message  # type: ignore[attr-defined]
-                content = message.content
-
-                if not content:
-                    raise ValueError("LLM returned empty content")
-
-                raw_response = content
-
-                # LiteLLM should return valid JSON, but we still validate with Pydantic
-                return response_model.model_validate_json(content)
-
-            except ValidationError as e:
-                last_error = e
-                logger.warning(
-                    f"Structured output validation failed (attempt {attempt + 1}/{max_retries + 1}): {e}"
-                )
-
-                if attempt < max_retries:
-                    # Add error feedback for retry
-                    message_dicts.append({
-                        "role": "assistant",
-                        "content": raw_response or "",
-                    })
-                    message_dicts.append({
-                        "role": "user",
-                        "content": (
-                            f"Your response was not valid JSON matching the required schema. "
-                            f"Error: {e}\n\n"
-                            f"Please try again with valid JSON."
-                        ),
-                    })
-
-            except json.JSONDecodeError as e:
-                last_error = e
-                logger.warning(
-                    f"Structured output JSON parsing failed (attempt {attempt + 1}/{max_retries + 1}): {e}"
-                )
-
-                if attempt < max_retries:
-                    message_dicts.append({
-                        "role": "assistant",
-                        "content": raw_response or "",
-                    })
-                    message_dicts.append({
-                        "role": "user",
-                        "content": (
-                            f"Your response was not valid JSON. "
-                            f"Parse error: {e}\n\n"
-                            f"Please respond with valid JSON only."
-                        ),
-                    })
-
-            except (
-                APIConnectionError,
-                APIError,
-                BadRequestError,
-                RateLimitError,
-                ServiceUnavailableError,
-                Timeout,
-            ) as e:
-                # For provider errors, don't retry at this level
-                # (the caller can use RetryingLLMClient for that)
-                last_error = e
-                logger.error(f"LLM provider error in structured output generation: {e}")
-                break
-
-            except Exception as e:
-                last_error = e
-                logger.error(f"Unexpected error in structured output generation: {e}")
-                break
-
-        # All retries exhausted
-        raise StructuredOutputError(
-            message=f"Failed to generate valid structured output after {max_retries + 1} attempts",
-            provider=self.model.split("/")[0],
-            model=self.model,
-            raw_response=raw_response,
-            validation_error=last_error,
-        )
-
-
 class RecordingLLMClient:
     """
     An LLM client wrapper that records interactions (inputs and outputs)
@@ -2623,3 +1285,13 @@ __all__ = [
     "UserMessage",
     "StructuredOutputError",
 ]
+
+
+def __getattr__(name: str) -> object:
+    # LiteLLMClient is resolved on first access so that importing this package
+    # (which every tool and message type does) does not import litellm
+    if name == "LiteLLMClient":
+        from .providers.litellm_client import LiteLLMClient  # noqa: PLC0415
+
+        return LiteLLMClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
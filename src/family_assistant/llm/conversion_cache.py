@@ -0,0 +1,107 @@
+"""Per-message memoization of provider-format message conversion.
+
+Each iteration of the tool loop sends the whole conversation again, with only
+a few messages appended since the last call. MessageConversionCache lets a
+client convert each message once and reuse the result while the same message
+object is sent again.
+"""
+
+import operator
+import weakref
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from family_assistant.llm.messages import LLMMessage
+
+
+@dataclass
+class _CacheEntry[T]:
+    ref: weakref.ref[LLMMessage]
+    # The message's field values when it was converted, compared by identity
+    fields: tuple[object, ...]
+    # List-valued fields and their lengths, to catch in-place appends
+    list_lengths: tuple[tuple[list[object], int], ...]
+    converted: list[T]
+
+    def matches(self, message: LLMMessage, fields: tuple[object, ...]) -> bool:
+        return (
+            self.ref() is message
+            and len(fields) == len(self.fields)
+            and all(map(operator.is_, fields, self.fields))
+            and all(len(value) == length for value, length in self.list_lengths)
+        )
+
+
+class MessageConversionCache[T]:
+    """Caches the converted form of messages, keyed by message identity.
+
+    Entries are dropped when their message is garbage collected. A message whose
+    fields were reassigned, or whose list fields changed length, since it was
+    converted is converted again. Each client owns its own cache, so cached
+    values are specific to one provider.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, _CacheEntry[T]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def convert(
+        self,
+        messages: Sequence[LLMMessage],
+        convert: Callable[[list[LLMMessage]], list[T]],
+    ) -> list[T]:
+        """Convert messages one at a time, reusing cached results.
+
+        Args:
+            messages: The messages to convert, in order.
+            convert: Converts a single-message list to zero or more provider
+                items. Its results must not be mutated by the caller.
+
+        Returns:
+            The concatenated provider items for all messages.
+        """
+        converted: list[T] = []
+        for message in messages:
+            converted.extend(self._get(message, convert))
+        return converted
+
+    def _get(
+        self, message: LLMMessage, convert: Callable[[list[LLMMessage]], list[T]]
+    ) -> list[T]:
+        key = id(message)
+        fields = tuple(message.__dict__.values())
+        entry = self._entries.get(key)
+        if entry is not None and entry.matches(message, fields):
+            self.hits += 1
+            return entry.converted
+
+        self.misses += 1
+        converted = convert([message])
+        self._entries[key] = _CacheEntry(
+            ref=weakref.ref(message, self._make_discard(key)),
+            fields=fields,
+            list_lengths=tuple(
+                (value, len(value)) for value in fields if isinstance(value, list)
+            ),
+            converted=converted,
+        )
+        return converted
+
+    def _make_discard(self, key: int) -> Callable[[weakref.ref[LLMMessage]], None]:
+        # Hold the cache weakly so cached messages don't keep it alive
+        cache_ref = weakref.ref(self)
+
+        def discard(ref: weakref.ref[LLMMessage]) -> None:
+            cache = cache_ref()
+            if cache is None:
+                return
+            entry = cache._entries.get(key)
+            # The id may already have been reused by a newer message
+            if entry is not None and entry.ref is ref:
+                del cache._entries[key]
+
+        return discard
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -31,12 +31,13 @@ class LLMClientFactory:
         "claude-": "anthropic",
     }
 
-    # Provider classes will be imported on demand to avoid circular imports
+    # Provider classes are imported on demand, so each provider's SDK is only
+    # loaded when a client for it is created
     _provider_classes: dict[str, str] = {
         "openai": "family_assistant.llm.providers.openai_client.OpenAIClient",
         "google": "family_assistant.llm.providers.google_genai_client.GoogleGenAIClient",
         "anthropic": "family_assistant.llm.providers.anthropic_client.AnthropicClient",
-        "litellm": "family_assistant.llm.LiteLLMClient",
+        "litellm": "family_assistant.llm.providers.litellm_client.LiteLLMClient",
     }
 
     @classmethod
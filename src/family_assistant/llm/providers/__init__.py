@@ -1,13 +1,36 @@
 """
 Provider-specific LLM client implementations.
+
+Each client is imported on first access, so that only the SDKs of providers
+that are actually configured get loaded.
 """
 
-from .anthropic_client import AnthropicClient
-from .google_genai_client import GoogleGenAIClient
-from .openai_client import OpenAIClient
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .anthropic_client import AnthropicClient
+    from .google_genai_client import GoogleGenAIClient
+    from .litellm_client import LiteLLMClient
+    from .openai_client import OpenAIClient
+
+_CLIENT_MODULES = {
+    "OpenAIClient": ".openai_client",
+    "GoogleGenAIClient": ".google_genai_client",
+    "AnthropicClient": ".anthropic_client",
+    "LiteLLMClient": ".litellm_client",
+}
 
 __all__ = [
     "OpenAIClient",
     "GoogleGenAIClient",
     "AnthropicClient",
+    "LiteLLMClient",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _CLIENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -47,7 +47,6 @@ from family_assistant.llm.messages import (
     TextContentPart,
     ToolMessage,
     UserMessage,
-    message_to_json_dict,
 )
 from family_assistant.llm.request_buffer import LLMRequestRecord, get_request_buffer
 from family_assistant.tools.types import ToolDefinition
@@ -311,65 +310,92 @@ class AnthropicClient(BaseLLMClient):
         - Consecutive same-role messages are merged (Anthropic requires alternating roles)
         - Images use source.type: "base64" format
         """
-        system_parts: list[str] = []
-        # ast-grep-ignore: no-dict-any - Anthropic message format
-        api_messages: list[dict[str, Any]] = []
+        return self._assemble_anthropic_request([
+            item for msg in messages for item in self._convert_message(msg)
+        ])
 
-        for msg in messages:
-            if isinstance(msg, SystemMessage):
-                system_parts.append(msg.content)
-
-            elif isinstance(msg, UserMessage):
-                content = self._convert_user_content(msg)
-                api_messages.append({"role": "user", "content": content})
-
-            elif isinstance(msg, AssistantMessage):
-                content_blocks: list[TextBlockParam | ToolUseBlockParam] = []
-                if msg.content:
-                    content_blocks.append(TextBlockParam(type="text", text=msg.content))
-                if msg.tool_calls:
-                    for tc in msg.tool_calls:
-                        arguments = tc.function.arguments
-                        if isinstance(arguments, str):
-                            try:
-                                arguments = json.loads(arguments)
-                            except json.JSONDecodeError as e:
-                                raise InvalidRequestError(
-                                    f"Malformed tool call arguments for "
-                                    f"'{tc.function.name}' (id={tc.id}): {e}",
-                                    provider="anthropic",
-                                    model=self.model,
-                                ) from e
-                        content_blocks.append(
-                            ToolUseBlockParam(
-                                type="tool_use",
-                                id=tc.id,
-                                name=tc.function.name,
-                                input=arguments,
-                            )
-                        )
-                if content_blocks:
-                    api_messages.append({
-                        "role": "assistant",
-                        "content": content_blocks,
-                    })
-
-            elif isinstance(msg, ToolMessage):
-                # content may be a string or list of content blocks (from _process_tool_messages
-                # for native multimodal support). Anthropic tool_result accepts both.
-                tool_result_block = ToolResultBlockParam(
-                    type="tool_result",
-                    tool_use_id=msg.tool_call_id,
-                    content=msg.content,
-                )
-                api_messages.append({"role": "user", "content": [tool_result_block]})
+    # ast-grep-ignore: no-dict-any - Anthropic message format
+    def _convert_messages_incrementally(
+        self, messages: Sequence[LLMMessage]
+    ) -> tuple[str | None, list[dict[str, Any]]]:
+        """Process and convert messages, reusing conversions from earlier calls."""
+        items = self._message_conversion_cache.convert(
+            messages,
+            lambda batch: [
+                item
+                for msg in self._process_tool_messages(batch)
+                for item in self._convert_message(msg)
+            ],
+        )
+        return self._assemble_anthropic_request(items)
 
+    def _assemble_anthropic_request(
+        self,
+        # ast-grep-ignore: no-dict-any - Anthropic message format
+        items: list[str | dict[str, Any]],
+        # ast-grep-ignore: no-dict-any - Anthropic message format
+    ) -> tuple[str | None, list[dict[str, Any]]]:
+        """Split converted items into the system prompt and merged API messages."""
+        system_parts = [item for item in items if isinstance(item, str)]
         # Merge consecutive same-role messages (Anthropic requires alternating roles)
-        api_messages = self._merge_consecutive_roles(api_messages)
+        api_messages = self._merge_consecutive_roles([
+            item for item in items if not isinstance(item, str)
+        ])
 
         system_prompt = "\n\n".join(system_parts) if system_parts else None
         return system_prompt, api_messages
 
+    # ast-grep-ignore: no-dict-any - Anthropic message format
+    def _convert_message(self, msg: LLMMessage) -> list[str | dict[str, Any]]:
+        """Convert one message to system prompt text or Anthropic API messages."""
+        if isinstance(msg, SystemMessage):
+            return [msg.content]
+
+        if isinstance(msg, UserMessage):
+            content = self._convert_user_content(msg)
+            return [{"role": "user", "content": content}]
+
+        if isinstance(msg, AssistantMessage):
+            content_blocks: list[TextBlockParam | ToolUseBlockParam] = []
+            if msg.content:
+                content_blocks.append(TextBlockParam(type="text", text=msg.content))
+            if msg.tool_calls:
+                for tc in msg.tool_calls:
+                    arguments = tc.function.arguments
+                    if isinstance(arguments, str):
+                        try:
+                            arguments = json.loads(arguments)
+                        except json.JSONDecodeError as e:
+                            raise InvalidRequestError(
+                                f"Malformed tool call arguments for "
+                                f"'{tc.function.name}' (id={tc.id}): {e}",
+                                provider="anthropic",
+                                model=self.model,
+                            ) from e
+                    content_blocks.append(
+                        ToolUseBlockParam(
+                            type="tool_use",
+                            id=tc.id,
+                            name=tc.function.name,
+                            input=arguments,
+                        )
+                    )
+            if content_blocks:
+                return [{"role": "assistant", "content": content_blocks}]
+            return []
+
+        if isinstance(msg, ToolMessage):
+            # content may be a string or list of content blocks (from _process_tool_messages
+            # for native multimodal support). Anthropic tool_result accepts both.
+            tool_result_block = ToolResultBlockParam(
+                type="tool_result",
+                tool_use_id=msg.tool_call_id,
+                content=msg.content,
+            )
+            return [{"role": "user", "content": [tool_result_block]}]
+
+        return []
+
     @staticmethod
     def _convert_user_content(
         msg: UserMessage,
@@ -469,14 +495,8 @@ class AnthropicClient(BaseLLMClient):
         request_timestamp = datetime.now(UTC)
         request_id = f"anthropic_{uuid.uuid4().hex[:16]}"
 
-        message_dicts = [message_to_json_dict(msg) for msg in messages]
-
         try:
-            processed_messages = self._process_tool_messages(list(messages))
-
-            system_prompt, api_messages = self._convert_messages_to_anthropic_format(
-                processed_messages
-            )
+            system_prompt, api_messages = self._convert_messages_incrementally(messages)
 
             # ast-grep-ignore: no-dict-any - Anthropic API params dict has heterogeneous value types
             params: dict[str, Any] = {
@@ -542,7 +562,7 @@ class AnthropicClient(BaseLLMClient):
                         timestamp=request_timestamp,
                         request_id=request_id,
                         model_id=self.model,
-                        messages=message_dicts,
+                        messages=messages,
                         tools=tools,
                         tool_choice=tool_choice,
                         response=asdict(llm_output),
@@ -563,7 +583,7 @@ class AnthropicClient(BaseLLMClient):
                         timestamp=request_timestamp,
                         request_id=request_id,
                         model_id=self.model,
-                        messages=message_dicts,
+                        messages=messages,
                         tools=tools,
                         tool_choice=tool_choice,
                         response=None,
@@ -727,14 +747,8 @@ class AnthropicClient(BaseLLMClient):
         request_timestamp = datetime.now(UTC)
         request_id = f"anthropic_stream_{uuid.uuid4().hex[:16]}"
 
-        message_dicts = [message_to_json_dict(msg) for msg in messages]
-
         try:
-            processed_messages = self._process_tool_messages(list(messages))
-
-            system_prompt, api_messages = self._convert_messages_to_anthropic_format(
-                processed_messages
-            )
+            system_prompt, api_messages = self._convert_messages_incrementally(messages)
 
             # ast-grep-ignore: no-dict-any - Anthropic API params dict has heterogeneous value types
             params: dict[str, Any] = {
@@ -823,7 +837,7 @@ class AnthropicClient(BaseLLMClient):
                         timestamp=request_timestamp,
                         request_id=request_id,
                         model_id=self.model,
-                        messages=message_dicts,
+                        messages=messages,
                         tools=tools,
                         tool_choice=tool_choice,
                         response={"streaming": True, "metadata": metadata},
@@ -844,7 +858,7 @@ class AnthropicClient(BaseLLMClient):
                         timestamp=request_timestamp,
                         request_id=request_id,
                         model_id=self.model,
-                        messages=message_dicts,
+                        messages=messages,
                         tools=tools,
                         tool_choice=tool_choice,
                         response=None,
@@ -43,7 +43,6 @@ from family_assistant.llm.messages import (
     TextContentPart,
     ToolMessage,
     UserMessage,
-    message_to_json_dict,
 )
 from family_assistant.llm.request_buffer import LLMRequestRecord, get_request_buffer
 from family_assistant.tools.types import ToolDefinition
@@ -386,6 +385,17 @@ class GoogleGenAIClient(BaseLLMClient):
             parts=parts,
         )
 
+    def _convert_messages_incrementally(
+        self, messages: Sequence[LLMMessage]
+    ) -> list[types.ContentUnionDict]:
+        """Process and convert messages, reusing conversions from earlier calls."""
+        return self._message_conversion_cache.convert(
+            messages,
+            lambda batch: self._convert_messages_to_genai_format(
+                self._process_tool_messages(batch)
+            ),
+        )
+
     def _convert_messages_to_genai_format(
         self,
         messages: list[LLMMessage],
@@ -767,9 +777,6 @@ class GoogleGenAIClient(BaseLLMClient):
         request_timestamp = datetime.now(UTC)
         request_id = f"google_{uuid.uuid4().hex[:16]}"
 
-        # Convert messages to dict format for request buffer recording
-        message_dicts = [message_to_json_dict(msg) for msg in messages]
-
         try:
             # Keep messages as typed objects for processing
             typed_messages = list(messages)
@@ -781,15 +788,13 @@ class GoogleGenAIClient(BaseLLMClient):
                     f"{_format_messages_for_debug(typed_messages, tools, tool_choice)}"
                 )
 
-            # Process tool attachments with typed messages
-            processed_typed_messages = self._process_tool_messages(typed_messages)
-
-            # Convert messages to format expected by new API
-            # _convert_messages_to_genai_format expects typed LLMMessage objects
-            contents = self._convert_messages_to_genai_format(processed_typed_messages)
+            # Process tool attachments and convert to the API format, reusing the
+            # conversions of messages already sent in earlier iterations
+            contents = self._convert_messages_incrementally(typed_messages)
 
             # Debug: Log post-processed messages if enabled
             if self.should_debug_messages:
+                processed_typed_messages = self._process_tool_messages(typed_messages)
                 logger.info(
                     f"=== After _process_tool_messages ({len(processed_typed_messages)} messages) ===\n"
                     f"{_format_messages_for_debug(processed_typed_messages, None, None)}"
@@ -1014,7 +1019,7 @@ class GoogleGenAIClient(BaseLLMClient):
                         timestamp=request_timestamp,
                         request_id=request_id,
                         model_id=self.model_name,
-                        messages=message_dicts,
+                        messages=messages,
                         tools=tools,
                         tool_choice=tool_choice,
                         response=asdict(llm_output),
@@ -1036,7 +1041,7 @@ class GoogleGenAIClient(BaseLLMClient):
                         timestamp=request_timestamp,
                         request_id=request_id,
                         model_id=self.model_name,
-                        messages=message_dicts,
+                        messages=messages,
                         tools=tools,
                         tool_choice=tool_choice,
                         response=None,
@@ -1333,7 +1338,6 @@ class GoogleGenAIClient(BaseLLMClient):
         start_time = time.monotonic()
         request_timestamp = datetime.now(UTC)
         request_id = f"google_stream_{uuid.uuid4().hex[:16]}"
-        message_dicts = [message_to_json_dict(msg) for msg in messages]
 
         content_yielded = False
         try:
@@ -1347,15 +1351,13 @@ class GoogleGenAIClient(BaseLLMClient):
                     f"{_format_messages_for_debug(typed_messages, tools, tool_choice)}"
                 )
 
-            # Process tool attachments with typed messages
-            processed_typed_messages = self._process_tool_messages(typed_messages)
-
-            # Convert messages to format expected by API
-            # _convert_messages_to_genai_format expects typed LLMMessage objects
-            contents = self._convert_messages_to_genai_format(processed_typed_messages)
+            # Process tool attachments and convert to the API format, reusing the
+            # conversions of messages already sent in earlier iterations
+            contents = self._convert_messages_incrementally(typed_messages)
 
             # Debug: Log post-processed messages if enabled
             if self.should_debug_messages:
+                processed_typed_messages = self._process_tool_messages(typed_messages)
                 logger.info(
                     f"=== After _process_tool_messages ({len(processed_typed_messages)} messages) ===\n"
                     f"{_format_messages_for_debug(processed_typed_messages, None, None)}"
@@ -1565,7 +1567,7 @@ class GoogleGenAIClient(BaseLLMClient):
                         timestamp=request_timestamp,
                         request_id=request_id,
                         model_id=self.model_name,
-                        messages=message_dicts,
+                        messages=messages,
                         tools=tools,
                         tool_choice=tool_choice,
                         response={"streaming": True, "metadata": done_metadata},
@@ -1587,7 +1589,7 @@ class GoogleGenAIClient(BaseLLMClient):
                         timestamp=request_timestamp,
                         request_id=request_id,
                         model_id=self.model_name,
-                        messages=message_dicts,
+                        messages=messages,
                         tools=tools,
                         tool_choice=tool_choice,
                         response=None,
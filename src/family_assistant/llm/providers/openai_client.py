@@ -183,17 +183,16 @@ class OpenAIClient(BaseLLMClient):
         request_timestamp = datetime.now(UTC)
         request_id = f"openai_{uuid.uuid4().hex[:16]}"
 
-        # Convert messages to dict format for request buffer recording (before try block)
-        message_dicts = [message_to_json_dict(msg) for msg in messages]
-
         try:
-            # Process tool attachments before sending
-            processed_messages = self._process_tool_messages(list(messages))
-
-            # Convert typed messages to dicts for API call
-            api_message_dicts = [
-                message_to_json_dict(msg) for msg in processed_messages
-            ]
+            # Process tool attachments and convert to dicts, reusing the
+            # conversions of messages already sent in earlier iterations
+            api_message_dicts = self._message_conversion_cache.convert(
+                messages,
+                lambda batch: [
+                    message_to_json_dict(msg)
+                    for msg in self._process_tool_messages(batch)
+                ],
+            )
 
             # Build parameters with defaults, then model-specific overrides
             params = {
@@ -259,7 +258,7 @@ class OpenAIClient(BaseLLMClient):
                         timestamp=request_timestamp,
                         request_id=request_id,
                         model_id=self.model,
-                        messages=message_dicts,
+                        messages=messages,
                         tools=tools,
                         tool_choice=tool_choice,
                         response=asdict(llm_output),
@@ -281,7 +280,7 @@ class OpenAIClient(BaseLLMClient):
                         timestamp=request_timestamp,
                         request_id=request_id,
                         model_id=self.model,
-                        messages=message_dicts,
+                        messages=messages,
                         tools=tools,
                         tool_choice=tool_choice,
                         response=None,
@@ -413,17 +412,16 @@ class OpenAIClient(BaseLLMClient):
         request_timestamp = datetime.now(UTC)
         request_id = f"openai_stream_{uuid.uuid4().hex[:16]}"
 
-        # Convert messages to dict format for request buffer recording (before try block)
-        message_dicts = [message_to_json_dict(msg) for msg in messages]
-
         try:
-            # Process tool attachments before sending
-            processed_messages = self._process_tool_messages(list(messages))
-
-            # Convert typed messages to dicts for SDK boundary
-            api_message_dicts = [
-                message_to_json_dict(msg) for msg in processed_messages
-            ]
+            # Process tool attachments and convert to dicts, reusing the
+            # conversions of messages already sent in earlier iterations
+            api_message_dicts = self._message_conversion_cache.convert(
+                messages,
+                lambda batch: [
+                    message_to_json_dict(msg)
+                    for msg in self._process_tool_messages(batch)
+                ],
+            )
 
             # Build parameters with defaults, then model-specific overrides
             params = {
@@ -540,7 +538,7 @@ class OpenAIClient(BaseLLMClient):
                         timestamp=request_timestamp,
                         request_id=request_id,
                         model_id=self.model,
-                        messages=message_dicts,
+                        messages=messages,
                         tools=tools,
                         tool_choice=tool_choice,
                         response={"streaming": True, "metadata": metadata},
@@ -563,7 +561,7 @@ class OpenAIClient(BaseLLMClient):
                         timestamp=request_timestamp,
                         request_id=request_id,
                         model_id=self.model,
-                        messages=message_dicts,
+                        messages=messages,
                         tools=tools,
                         tool_choice=tool_choice,
                         response=None,
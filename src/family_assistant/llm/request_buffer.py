@@ -3,16 +3,41 @@
 This module provides a thread-safe ring buffer that captures LLM request/response
 data for debugging and diagnostic export. All LLM client instances write to a
 global singleton buffer.
+
+The buffer is only read when diagnostics are exported, so records keep the typed
+messages they were given and are serialized on export. To bound memory, inline
+binary content (base64 data URIs) is replaced with a size-and-hash stub, tool
+schema lists and system prompts shared between requests are stored once, and
+the oldest records are evicted when the buffer exceeds a byte budget.
 """
 
+import hashlib
 from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from threading import Lock
-from typing import Any
+from typing import Any, TypeIs
+
+from pydantic import BaseModel
 
+from family_assistant.llm.messages import (
+    ImageUrlContentPart,
+    LLMMessage,
+    SystemMessage,
+    ToolMessage,
+    UserMessage,
+    message_to_json_dict,
+)
 from family_assistant.tools.types import ToolDefinition
 
+DEFAULT_MAX_RECORDS = 100
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Typed messages, or already-serialized dicts from clients that build them anyway
+# ast-grep-ignore: no-dict-any - Serialized LLM messages from external APIs
+RecordedMessage = LLMMessage | dict[str, Any]
+
 
 @dataclass
 class LLMRequestRecord:
@@ -21,15 +46,22 @@ class LLMRequestRecord:
     timestamp: datetime
     request_id: str
     model_id: str
-    # ast-grep-ignore: no-dict-any - Serialized LLM messages from external APIs
-    messages: list[dict[str, Any]]
-    tools: list[ToolDefinition] | None = None
+    messages: Sequence[RecordedMessage]
+    tools: Sequence[ToolDefinition] | None = None
     tool_choice: str | None = None
     # ast-grep-ignore: no-dict-any - Serialized LLM response from external APIs
     response: dict[str, Any] | None = None
     duration_ms: float = 0.0
     error: str | None = None
 
+    # ast-grep-ignore: no-dict-any - JSON serialization output
+    def serialized_messages(self) -> list[dict[str, Any]]:
+        """Serialize the recorded messages to JSON-compatible dicts."""
+        return [
+            message if isinstance(message, dict) else message_to_json_dict(message)
+            for message in self.messages
+        ]
+
     # ast-grep-ignore: no-dict-any - JSON serialization output
     def to_dict(self) -> dict[str, Any]:
         """Convert record to a JSON-serializable dictionary."""
@@ -37,8 +69,8 @@ class LLMRequestRecord:
             "timestamp": self.timestamp.isoformat(),
             "request_id": self.request_id,
             "model_id": self.model_id,
-            "messages": self.messages,
-            "tools": self.tools,
+            "messages": self.serialized_messages(),
+            "tools": list(self.tools) if self.tools is not None else None,
             "tool_choice": self.tool_choice,
             "response": self.response,
             "duration_ms": self.duration_ms,
@@ -46,28 +78,185 @@ class LLMRequestRecord:
         }
 
 
+def _approx_size(value: object) -> int:
+    """Roughly estimate the bytes held by a JSON-like value."""
+    if isinstance(value, str | bytes | bytearray):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_approx_size(k) + _approx_size(v) for k, v in value.items())
+    if isinstance(value, list | tuple):
+        return sum(_approx_size(item) for item in value)
+    if isinstance(value, BaseModel):
+        return _approx_size(value.__dict__)
+    return 8
+
+
+def _binary_stub(url: str) -> str:
+    """Replace the payload of a data URI with its size and a hash prefix."""
+    header, _, data = url.partition(",")
+    digest = hashlib.sha256(data.encode()).hexdigest()[:16]
+    return f"{header},<{len(data)} bytes omitted, sha256:{digest}>"
+
+
+def _is_data_uri(url: object) -> TypeIs[str]:
+    return isinstance(url, str) and url.startswith("data:")
+
+
+def _compact_message(message: RecordedMessage) -> RecordedMessage:
+    """Drop binary payloads and non-serialized fields from a message."""
+    if isinstance(message, dict):
+        content = message.get("content")
+        if not isinstance(content, list) or not any(
+            isinstance(part, dict)
+            and _is_data_uri((part.get("image_url") or {}).get("url"))
+            for part in content
+        ):
+            return message
+        parts = [
+            {**part, "image_url": {**part["image_url"], "url": _binary_stub(url)}}
+            if isinstance(part, dict)
+            and _is_data_uri(url := (part.get("image_url") or {}).get("url"))
+            else part
+            for part in content
+        ]
+        return {**message, "content": parts}
+
+    if isinstance(message, UserMessage):
+        update: dict[str, object] = {}
+        if message.parts is not None:
+            update["parts"] = None
+        if isinstance(message.content, list) and any(
+            isinstance(part, ImageUrlContentPart)
+            and _is_data_uri(part.image_url.get("url"))
+            for part in message.content
+        ):
+            update["content"] = [
+                part.model_copy(
+                    update={
+                        "image_url": {
+                            **part.image_url,
+                            "url": _binary_stub(part.image_url["url"]),
+                        }
+                    }
+                )
+                if isinstance(part, ImageUrlContentPart)
+                and _is_data_uri(part.image_url.get("url"))
+                else part
+                for part in message.content
+            ]
+        return message.model_copy(update=update) if update else message
+
+    if isinstance(message, ToolMessage) and (
+        message.transient_attachments or message.tool_result is not None
+    ):
+        # Neither field is serialized; both can hold raw attachment bytes
+        return message.model_copy(
+            update={"transient_attachments": None, "tool_result": None}
+        )
+    return message
+
+
+@dataclass
+class _Interned:
+    """A value shared by several buffered records."""
+
+    value: Any
+    size: int
+    refs: int = 0
+
+
+@dataclass
+class _BufferedRecord:
+    record: LLMRequestRecord
+    size: int
+    interned_keys: list[object]
+
+
 @dataclass
 class LLMRequestBuffer:
     """Thread-safe ring buffer for storing recent LLM requests.
 
-    Uses collections.deque with maxlen for automatic oldest-entry eviction.
+    Records are evicted oldest first once there are more than max_size of them
+    or their estimated size exceeds max_bytes. The newest record is always kept.
     """
 
-    max_size: int = 100
-    _buffer: deque[LLMRequestRecord] = field(default_factory=deque)
+    max_size: int = DEFAULT_MAX_RECORDS
+    max_bytes: int = DEFAULT_MAX_BYTES
+    _buffer: deque[_BufferedRecord] = field(default_factory=deque)
+    _interned: dict[object, _Interned] = field(default_factory=dict)
+    _total_bytes: int = 0
     _lock: Lock = field(default_factory=Lock)
 
-    def __post_init__(self) -> None:
-        """Initialize the buffer with the correct max size."""
-        self._buffer = deque(maxlen=self.max_size)
-
     def add(self, record: LLMRequestRecord) -> None:
         """Add a request record to the buffer.
 
-        Thread-safe. Automatically evicts oldest entries when full.
+        Thread-safe. Evicts the oldest entries when over the count or byte limit.
         """
+        messages = [_compact_message(message) for message in record.messages]
         with self._lock:
-            self._buffer.append(record)
+            keys: list[object] = []
+            size = 0
+            for i, message in enumerate(messages):
+                content = (
+                    message.content
+                    if isinstance(message, SystemMessage)
+                    else message.get("content")
+                    if isinstance(message, dict) and message.get("role") == "system"
+                    else None
+                )
+                if isinstance(content, str):
+                    # Keyed by the prompt text, whose hash Python caches
+                    key = ("system", type(message), content)
+                    messages[i] = self._intern(key, message)
+                    keys.append(key)
+                else:
+                    size += _approx_size(message)
+
+            tools = record.tools
+            if tools:
+                # Providers hand out the same schema dicts on every turn, so the
+                # identities of the definitions identify the tool set
+                key = ("tools", tuple(id(tool) for tool in tools))
+                tools = self._intern(key, list(tools))
+                keys.append(key)
+
+            size += _approx_size(record.response) + _approx_size(record.error)
+            stored = LLMRequestRecord(
+                timestamp=record.timestamp,
+                request_id=record.request_id,
+                model_id=record.model_id,
+                messages=tuple(messages),
+                tools=tools,
+                tool_choice=record.tool_choice,
+                response=record.response,
+                duration_ms=record.duration_ms,
+                error=record.error,
+            )
+            self._buffer.append(_BufferedRecord(stored, size, keys))
+            self._total_bytes += size
+            while len(self._buffer) > self.max_size or (
+                self._total_bytes > self.max_bytes and len(self._buffer) > 1
+            ):
+                self._evict_oldest()
+
+    def _intern(self, key: object, value: Any) -> Any:  # noqa: ANN401
+        interned = self._interned.get(key)
+        if interned is None:
+            interned = _Interned(value, _approx_size(value))
+            self._interned[key] = interned
+            self._total_bytes += interned.size
+        interned.refs += 1
+        return interned.value
+
+    def _evict_oldest(self) -> None:
+        evicted = self._buffer.popleft()
+        self._total_bytes -= evicted.size
+        for key in evicted.interned_keys:
+            interned = self._interned[key]
+            interned.refs -= 1
+            if interned.refs == 0:
+                del self._interned[key]
+                self._total_bytes -= interned.size
 
     def get_recent(
         self,
@@ -84,7 +273,7 @@ class LLMRequestBuffer:
             List of request records, newest first.
         """
         with self._lock:
-            records = list(self._buffer)
+            records = [entry.record for entry in self._buffer]
 
         if since_minutes is not None:
             cutoff = datetime.now(UTC) - timedelta(minutes=since_minutes)
@@ -93,10 +282,17 @@ class LLMRequestBuffer:
         records.reverse()
         return records[:limit]
 
+    def size_bytes(self) -> int:
+        """Return the estimated bytes held by buffered records."""
+        with self._lock:
+            return self._total_bytes
+
     def clear(self) -> None:
         """Clear all records from the buffer."""
         with self._lock:
             self._buffer.clear()
+            self._interned.clear()
+            self._total_bytes = 0
 
     def __len__(self) -> int:
         """Return the current number of records in the buffer."""
@@ -108,13 +304,17 @@ _global_buffer: LLMRequestBuffer | None = None
 _buffer_lock = Lock()
 
 
-def get_request_buffer(max_size: int = 100) -> LLMRequestBuffer:
+def get_request_buffer(
+    max_size: int = DEFAULT_MAX_RECORDS, max_bytes: int = DEFAULT_MAX_BYTES
+) -> LLMRequestBuffer:
     """Get the global LLM request buffer.
 
     Creates the buffer on first access. Thread-safe.
 
     Args:
         max_size: Maximum number of records to store (only used on first call).
+        max_bytes: Approximate byte budget for stored records (only used on
+            first call).
 
     Returns:
         The global LLMRequestBuffer instance.
@@ -122,7 +322,7 @@ def get_request_buffer(max_size: int = 100) -> LLMRequestBuffer:
     global _global_buffer
     with _buffer_lock:
         if _global_buffer is None:
-            _global_buffer = LLMRequestBuffer(max_size=max_size)
+            _global_buffer = LLMRequestBuffer(max_size=max_size, max_bytes=max_bytes)
         return _global_buffer
 
 
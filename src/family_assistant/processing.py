@@ -1,11 +1,16 @@
 import asyncio
-import base64
 import json
 import logging
 import re
 import traceback  # Added for error traceback
 import uuid  # Added for unique task IDs
-from collections.abc import AsyncIterator, Awaitable, Callable  # Added Union, Awaitable
+from collections.abc import (  # Added Union, Awaitable
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+)
+from contextlib import aclosing
 from dataclasses import dataclass  # Added
 from datetime import (  # Added timezone
     UTC,
@@ -21,7 +26,6 @@ if TYPE_CHECKING:
     from family_assistant.camera.protocol import CameraBackend
     from family_assistant.home_assistant_wrapper import HomeAssistantClientWrapper
 
-import aiofiles
 import pytz  # Added
 from pydantic import TypeAdapter
 
@@ -67,7 +71,12 @@ from .llm.messages import (
 from .storage.context import DatabaseContext, get_db_context
 
 # Import ToolsProvider interface and context
-from .tools import ToolExecutionContext, ToolNotFoundError, ToolsProvider
+from .tools import (
+    ToolExecutionContext,
+    ToolNotFoundError,
+    ToolsProvider,
+    get_side_effect_free_tools,
+)
 from .tools.types import ToolAttachment, ToolDefinition, ToolResult
 from .utils.clock import Clock, SystemClock
 
@@ -490,6 +499,74 @@ class ProcessingService:
 
         This generator handles the same logic as process_message but yields events incrementally.
         """
+        # Tool tasks not yet finished; cancelled if the generator exits early
+        tool_tasks_in_flight: set[asyncio.Task[ToolExecutionResult]] = set()
+        stream = self._process_message_stream(
+            db_context,
+            messages,
+            interface_type,
+            conversation_id,
+            user_name,
+            turn_id,
+            chat_interface,
+            user_id=user_id,
+            chat_interfaces=chat_interfaces,
+            request_confirmation_callback=request_confirmation_callback,
+            subconversation_id=subconversation_id,
+            tool_tasks_in_flight=tool_tasks_in_flight,
+        )
+        try:
+            async with aclosing(stream):
+                async for item in stream:
+                    yield item
+        finally:
+            # Covers every exit, including the consumer closing the generator
+            # at a yield before the tool results were collected
+            unfinished = list(tool_tasks_in_flight)
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
+    async def _process_message_stream(
+        self,
+        db_context: DatabaseContext,
+        messages: list[LLMMessage],
+        interface_type: str,
+        conversation_id: str,
+        user_name: str,
+        turn_id: str,
+        chat_interface: ChatInterface | None,
+        user_id: str | None = None,
+        chat_interfaces: dict[str, ChatInterface] | None = None,
+        request_confirmation_callback: (
+            Callable[
+                # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
+                [
+                    str,
+                    str,
+                    str | None,
+                    str,
+                    str,
+                    # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
+                    dict[str, Any],
+                    float,
+                    "ToolExecutionContext",
+                ],
+                Awaitable[bool],
+            ]
+            | None
+        ) = None,
+        subconversation_id: str | None = None,
+        *,
+        tool_tasks_in_flight: set[asyncio.Task[ToolExecutionResult]],
+        # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
+    ) -> AsyncGenerator[tuple[LLMStreamEvent, dict[str, Any]]]:
+        """
+        Run the streaming tool loop for process_message_stream.
+
+        Every tool task started is added to tool_tasks_in_flight and removed
+        when it finishes, so the caller can cancel the rest on exit.
+        """
         final_content: str | None = None
         # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
         final_reasoning_info: dict[str, Any] | None = None
@@ -505,6 +582,36 @@ class ProcessingService:
         tools_for_llm = all_tool_definitions
         logger.debug(f"Total available tools: {len(all_tool_definitions)}")
 
+        # Side-effect free tools may be started as soon as the LLM emits their
+        # call, overlapping their latency with the rest of the stream
+        speculative_tool_names: frozenset[str] = frozenset()
+        if self.service_config.tools_config.get("speculative_tool_execution"):
+            speculative_tool_names = get_side_effect_free_tools(
+                self.tools_provider
+            ).difference(self.service_config.tools_config.get("confirm_tools", []))
+
+        def start_tool_task(
+            tool_call: ToolCallItem,
+        ) -> asyncio.Task[ToolExecutionResult]:
+            task = asyncio.create_task(
+                self._execute_single_tool(
+                    tool_call,
+                    interface_type=interface_type,
+                    conversation_id=conversation_id,
+                    user_name=user_name,
+                    user_id=user_id,
+                    turn_id=turn_id,
+                    db_context=db_context,
+                    chat_interface=chat_interface,
+                    chat_interfaces=chat_interfaces,
+                    request_confirmation_callback=request_confirmation_callback,
+                    subconversation_id=subconversation_id,
+                )
+            )
+            tool_tasks_in_flight.add(task)
+            task.add_done_callback(tool_tasks_in_flight.discard)
+            return task
+
         if request_confirmation_callback is None:
             confirmable_tool_names = self.service_config.tools_config.get(
                 "confirm_tools", []
@@ -593,6 +700,8 @@ class ProcessingService:
             accumulated_content = []
             tool_calls_from_stream = []
             done_provider_metadata = None  # Initialize before loop
+            # Tool tasks started during the stream, by index in tool_calls_from_stream
+            speculative_tool_tasks: dict[int, asyncio.Task[ToolExecutionResult]] = {}
 
             # On final iteration, don't offer any tools to ensure we get a response
             tools_to_offer = None if is_final_iteration else tools_for_llm
@@ -614,6 +723,16 @@ class ProcessingService:
                     # Collect tool calls
                     elif event.type == "tool_call" and event.tool_call:
                         tool_calls_from_stream.append(event.tool_call)
+                        if (
+                            not is_final_iteration
+                            and event.tool_call.function.name in speculative_tool_names
+                        ):
+                            logger.debug(
+                                f"Speculatively executing tool '{event.tool_call.function.name}' while streaming"
+                            )
+                            speculative_tool_tasks[len(tool_calls_from_stream) - 1] = (
+                                start_tool_task(event.tool_call)
+                            )
                         yield (event, {})  # No message to save yet
 
                     # Handle done event
@@ -782,24 +901,10 @@ class ProcessingService:
             # Execute tool calls in parallel
             tool_response_messages_for_llm = []
 
-            # Create tasks for all tool calls
+            # Create tasks for the tool calls not already started during the stream
             tool_tasks = [
-                asyncio.create_task(
-                    self._execute_single_tool(
-                        tool_call,
-                        interface_type=interface_type,
-                        conversation_id=conversation_id,
-                        user_name=user_name,
-                        user_id=user_id,
-                        turn_id=turn_id,
-                        db_context=db_context,
-                        chat_interface=chat_interface,
-                        chat_interfaces=chat_interfaces,
-                        request_confirmation_callback=request_confirmation_callback,
-                        subconversation_id=subconversation_id,
-                    )
-                )
-                for tool_call in tool_calls_from_stream
+                speculative_tool_tasks.get(index) or start_tool_task(tool_call)
+                for index, tool_call in enumerate(tool_calls_from_stream)
             ]
 
             # Process results as they complete
@@ -1458,42 +1563,28 @@ class ProcessingService:
                     if match:
                         attachment_id = match.group(1)
 
-                        # Use AttachmentRegistry to get the file path
-                        file_path = self.attachment_registry.get_attachment_path(
-                            attachment_id
-                        )
-
-                        if file_path and file_path.exists():
-                            try:
-                                # Read file asynchronously
-                                async with aiofiles.open(file_path, "rb") as f:
-                                    file_bytes = await f.read()
-
-                                # Detect MIME type from file extension
-                                content_type = (
-                                    self.attachment_registry.get_content_type(file_path)
-                                )
-
-                                # Convert to base64
-                                base64_data = base64.b64encode(file_bytes).decode(
-                                    "utf-8"
-                                )
-                                data_uri = f"data:{content_type};base64,{base64_data}"
-
-                                # Replace with data URI
-                                converted_parts.append({
-                                    "type": "image_url",
-                                    "image_url": {"url": data_uri},
-                                })
-                                logger.info(
-                                    f"Converted attachment URL to data URI for attachment {attachment_id} (type: {content_type})"
-                                )
-                            except Exception as e:
-                                logger.error(
-                                    f"Failed to convert attachment URL to data URI: {e}"
-                                )
-                                # Keep original if conversion fails
-                                converted_parts.append(part)
+                        try:
+                            # Encodings are cached by the registry across turns
+                            data_uri = await self.attachment_registry.get_data_uri(
+                                attachment_id
+                            )
+                        except Exception as e:
+                            logger.error(
+                                f"Failed to convert attachment URL to data URI: {e}"
+                            )
+                            # Keep original if conversion fails
+                            converted_parts.append(part)
+                            continue
+
+                        if data_uri:
+                            # Replace with data URI
+                            converted_parts.append({
+                                "type": "image_url",
+                                "image_url": {"url": data_uri},
+                            })
+                            logger.debug(
+                                f"Converted attachment URL to data URI for attachment {attachment_id}"
+                            )
                         else:
                             logger.warning(
                                 f"Attachment file not found for ID: {attachment_id}"
@@ -397,6 +397,7 @@ class AttachmentAPI:
                 conversation_id=self.conversation_id,
                 message_id=None,
                 metadata={"original_filename": filename, "created_by": "script"},
+                content_hash=file_metadata.content_hash,
             )
 
         # Use existing db_context if available (allows rollback on failure)
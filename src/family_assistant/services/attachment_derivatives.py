@@ -0,0 +1,182 @@
+"""
+Cache for derived representations of attachments.
+
+Attachments are immutable once stored, so anything computed from their content
+(base64 data URIs for LLM providers, downscaled images for Telegram, ...) can be
+reused across turns. This module provides a size-bounded LRU cache for such
+derivatives, computing misses in a dedicated worker pool so that encoding and
+image resampling never run on the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_DERIVATIVE_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 256MB
+DEFAULT_DERIVATIVE_WORKERS = 2
+
+
+def _estimate_size(value: object) -> int:
+    """Estimate the memory held by a cached derivative."""
+    if isinstance(value, bytes | bytearray | str):
+        return len(value)
+    if isinstance(value, tuple):
+        return sum(_estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class AttachmentDerivativeCache:
+    """
+    Size-bounded LRU cache of attachment derivatives.
+
+    Entries are keyed by (source key, transform name), where the source key is
+    the attachment's content hash when known (so identical content is shared) or
+    otherwise its attachment ID. Concurrent requests for the same missing entry
+    share a single computation.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_DERIVATIVE_CACHE_MAX_BYTES,
+        max_workers: int = DEFAULT_DERIVATIVE_WORKERS,
+    ) -> None:
+        """
+        Initialize the derivative cache.
+
+        Args:
+            max_bytes: Upper bound on the total size of cached derivatives
+            max_workers: Number of worker threads used to compute derivatives
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str], tuple[Any, int]] = OrderedDict()
+        self._current_bytes = 0
+        self._in_flight: dict[tuple[str, str], asyncio.Future[Any]] = {}
+        self._max_workers = max_workers
+        # Started on first use, so a cache that was shut down can be reused
+        self._executor: ThreadPoolExecutor | None = None
+        self.hits = 0
+        self.misses = 0
+        # Time computations spent waiting for a worker, and running on one
+        self.queue_seconds_total = 0.0
+        self.queue_seconds_max = 0.0
+        self.compute_seconds_total = 0.0
+
+    @property
+    def current_bytes(self) -> int:
+        """Total estimated size of cached derivatives."""
+        return self._current_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_compute(
+        self,
+        source_key: str,
+        transform: str,
+        compute: Callable[[], T],
+    ) -> T:
+        """
+        Return a cached derivative, computing it in the worker pool on a miss.
+
+        Args:
+            source_key: Content hash or attachment ID the derivative is built from
+            transform: Name of the transform, including any parameters
+            compute: Blocking function producing the derivative
+
+        Returns:
+            The cached or freshly computed derivative
+        """
+        key = (source_key, transform)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cast("T", entry[0])
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.hits += 1
+            return cast("T", await asyncio.shield(in_flight))
+
+        self.misses += 1
+        loop = asyncio.get_running_loop()
+        submitted = time.monotonic()
+        # Filled in by the worker and recorded back on the event loop
+        timing: list[float] = []
+
+        def _timed_compute() -> T:
+            started = time.monotonic()
+            timing.append(started - submitted)
+            try:
+                return compute()
+            finally:
+                timing.append(time.monotonic() - started)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="attachment-derivative",
+            )
+        future: asyncio.Future[T] = loop.run_in_executor(self._executor, _timed_compute)
+        self._in_flight[key] = future
+        try:
+            value = await asyncio.shield(future)
+        finally:
+            self._in_flight.pop(key, None)
+            if len(timing) == 2:
+                self._record_timing(timing[0], timing[1])
+
+        self._store(key, value)
+        return value
+
+    def _record_timing(self, queue_seconds: float, compute_seconds: float) -> None:
+        """Record how long a computation queued for and ran on a worker."""
+        self.queue_seconds_total += queue_seconds
+        self.queue_seconds_max = max(self.queue_seconds_max, queue_seconds)
+        self.compute_seconds_total += compute_seconds
+
+    def _store(self, key: tuple[str, str], value: object) -> None:
+        """Insert an entry and evict least recently used entries over budget."""
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            logger.debug(
+                f"Derivative {key[1]} for {key[0]} ({size} bytes) exceeds cache budget, not caching"
+            )
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._current_bytes -= previous[1]
+
+        self._entries[key] = (value, size)
+        self._current_bytes += size
+
+        while self._current_bytes > self.max_bytes and self._entries:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._current_bytes -= evicted_size
+
+    def invalidate(self, source_key: str) -> None:
+        """Drop all derivatives built from a source."""
+        for key in [key for key in self._entries if key[0] == source_key]:
+            _, size = self._entries.pop(key)
+            self._current_bytes -= size
+
+    def shutdown(self) -> None:
+        """Stop the worker pool. Later misses start a new one."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
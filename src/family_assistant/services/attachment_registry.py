@@ -8,20 +8,32 @@ lifecycle, and access control across user-sourced and tool-generated attachments
 from __future__ import annotations
 
 import asyncio
+import base64
 import hashlib
 import logging
 import mimetypes
 import os
+import time
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import aiofiles
+import aiofiles.os
 from fastapi import HTTPException, UploadFile
-from sqlalchemy import and_, delete, insert, select, update
-
-from family_assistant.storage.base import attachment_metadata_table
+from sqlalchemy import and_, delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from family_assistant.services.attachment_derivatives import (
+    DEFAULT_DERIVATIVE_CACHE_MAX_BYTES,
+    DEFAULT_DERIVATIVE_WORKERS,
+    AttachmentDerivativeCache,
+)
+from family_assistant.storage.base import (
+    attachment_blobs_table,
+    attachment_metadata_table,
+)
 from family_assistant.storage.context import DatabaseContext
 
 if TYPE_CHECKING:
@@ -52,6 +64,12 @@ DEFAULT_ALLOWED_MIME_TYPES: set[str] = {
     "audio/webm",
 }
 
+# Subdirectory of the storage root holding content-addressed blobs
+BLOB_DIR_NAME = "blobs"
+# Unreferenced blob files younger than this are left alone by garbage collection,
+# since they may belong to an upload whose metadata row is not yet committed
+BLOB_GC_GRACE_SECONDS = 60 * 60
+
 
 class AttachmentMetadata:
     """Metadata container for attachment information."""
@@ -72,6 +90,7 @@ class AttachmentMetadata:
         accessed_at: datetime | None = None,
         # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
         metadata: dict[str, Any] | None = None,
+        content_hash: str | None = None,
     ) -> None:
         self.attachment_id = attachment_id
         self.source_type = source_type  # "user", "tool", "script"
@@ -86,6 +105,7 @@ class AttachmentMetadata:
         self.created_at = created_at or datetime.now(UTC)
         self.accessed_at = accessed_at
         self.metadata = metadata or {}
+        self.content_hash = content_hash  # SHA-256 of the blob, None for legacy files
 
     # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
     def to_dict(self) -> dict[str, Any]:
@@ -104,6 +124,7 @@ class AttachmentMetadata:
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "accessed_at": self.accessed_at.isoformat() if self.accessed_at else None,
             "metadata": self.metadata,
+            "content_hash": self.content_hash,
         }
 
     @classmethod
@@ -124,6 +145,7 @@ class AttachmentMetadata:
             created_at=row["created_at"],
             accessed_at=row["accessed_at"],
             metadata=row["metadata"],
+            content_hash=row.get("content_hash"),
         )
 
 
@@ -147,7 +169,14 @@ class AttachmentRegistry:
         """
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.blob_path = self.storage_path / BLOB_DIR_NAME
         self.db_engine = db_engine
+        # attachment_id -> absolute file path, so lookups avoid directory scans
+        self._path_index: dict[str, Path] = {}
+        # attachment_id -> MIME type from its metadata row; a blob is shared by
+        # attachments uploaded under different names, so its extension is not
+        # authoritative
+        self._mime_types: dict[str, str] = {}
 
         # Set up configuration with defaults
         attachment_config = config or {}
@@ -163,6 +192,16 @@ class AttachmentRegistry:
         else:
             self.allowed_mime_types = DEFAULT_ALLOWED_MIME_TYPES
 
+        # Cache of encoded/resized variants sent to LLMs and chat interfaces
+        self.derivatives = AttachmentDerivativeCache(
+            max_bytes=attachment_config.get(
+                "derivative_cache_max_bytes", DEFAULT_DERIVATIVE_CACHE_MAX_BYTES
+            ),
+            max_workers=attachment_config.get(
+                "derivative_workers", DEFAULT_DERIVATIVE_WORKERS
+            ),
+        )
+
         logger.info(
             f"AttachmentRegistry initialized with storage path: {self.storage_path}, "
             f"max_file_size: {self.max_file_size // (1024 * 1024)}MB, "
@@ -185,6 +224,7 @@ class AttachmentRegistry:
         message_id: int | None = None,
         # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
         metadata: dict[str, Any] | None = None,
+        content_hash: str | None = None,
     ) -> AttachmentMetadata:
         """
         Register a new attachment in the metadata database.
@@ -202,6 +242,8 @@ class AttachmentRegistry:
             conversation_id: Associated conversation ID
             message_id: Associated message ID
             metadata: Additional metadata
+            content_hash: SHA-256 of the blob backing this attachment. When set,
+                the blob's reference count is incremented.
 
         Returns:
             AttachmentMetadata object
@@ -218,6 +260,7 @@ class AttachmentRegistry:
             conversation_id=conversation_id,
             message_id=message_id,
             metadata=metadata,
+            content_hash=content_hash,
         )
 
         # Insert into database
@@ -234,10 +277,16 @@ class AttachmentRegistry:
             message_id=attachment_metadata.message_id,
             created_at=attachment_metadata.created_at,
             metadata=attachment_metadata.metadata,
+            content_hash=attachment_metadata.content_hash,
         )
 
         await db_context.execute_with_retry(insert_stmt)
 
+        if content_hash and storage_path:
+            await self._acquire_blob(db_context, content_hash, storage_path, size)
+            self._path_index[attachment_id] = self._resolve_storage_path(storage_path)
+        self._mime_types[attachment_id] = mime_type
+
         logger.info(
             f"Registered attachment {attachment_id} from {source_type}:{source_id}"
         )
@@ -269,7 +318,13 @@ class AttachmentRegistry:
         if not row:
             return None
 
-        return AttachmentMetadata.from_row(row)
+        attachment = AttachmentMetadata.from_row(row)
+        if attachment.content_hash and attachment.storage_path:
+            self._path_index[attachment_id] = self._resolve_storage_path(
+                attachment.storage_path
+            )
+        self._mime_types[attachment_id] = attachment.mime_type
+        return attachment
 
     async def list_attachments(
         self,
@@ -379,6 +434,7 @@ class AttachmentRegistry:
             conversation_id=conversation_id,
             message_id=message_id,
             metadata={"original_filename": filename, "upload_method": "api"},
+            content_hash=attachment_data.content_hash,
         )
 
     async def register_tool_attachment(
@@ -395,6 +451,7 @@ class AttachmentRegistry:
         message_id: int | None = None,
         # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
         metadata: dict[str, Any] | None = None,
+        content_hash: str | None = None,
     ) -> AttachmentMetadata:
         """
         Register a tool-generated attachment.
@@ -411,6 +468,7 @@ class AttachmentRegistry:
             conversation_id: Associated conversation
             message_id: Associated message
             metadata: Additional metadata
+            content_hash: SHA-256 of the backing blob, if stored via the blob store
 
         Returns:
             AttachmentMetadata object
@@ -428,6 +486,7 @@ class AttachmentRegistry:
             conversation_id=conversation_id,
             message_id=message_id,
             metadata=metadata or {},
+            content_hash=content_hash,
         )
 
     async def get_attachment_content(
@@ -471,6 +530,10 @@ class AttachmentRegistry:
         """
         Delete an attachment (metadata and file).
 
+        Blob-backed attachments release their reference on the blob. The blob
+        file is left for cleanup_orphaned_attachments, which removes it once it
+        is unreferenced and past the garbage collection grace period.
+
         Args:
             db_context: Database context
             attachment_id: Attachment identifier
@@ -480,6 +543,11 @@ class AttachmentRegistry:
         """
         conditions = [attachment_metadata_table.c.attachment_id == attachment_id]
 
+        hash_row = await db_context.fetch_one(
+            select(attachment_metadata_table.c.content_hash).where(and_(*conditions))
+        )
+        content_hash = hash_row["content_hash"] if hash_row else None
+
         # Atomic delete
         delete_stmt = delete(attachment_metadata_table).where(and_(*conditions))
         result = await db_context.execute_with_retry(delete_stmt)
@@ -488,8 +556,15 @@ class AttachmentRegistry:
         file_deleted = False
 
         if success:
+            self._path_index.pop(attachment_id, None)
+            self._mime_types.pop(attachment_id, None)
+            self.derivatives.invalidate(attachment_id)
             # Only delete file if database deletion succeeded
-            file_deleted = self._delete_attachment_file(attachment_id)
+            if content_hash:
+                # The blob itself is removed later by garbage collection
+                await self._release_blob(db_context, content_hash)
+            else:
+                file_deleted = self._delete_attachment_file(attachment_id)
             logger.info(
                 f"Deleted attachment {attachment_id} (db: {success}, file: {file_deleted})"
             )
@@ -544,22 +619,29 @@ class AttachmentRegistry:
 
     async def cleanup_orphaned_attachments(self, db_context: DatabaseContext) -> int:
         """
-        Clean up file system attachments that are no longer referenced in the database.
-        Uses AttachmentService to clean up orphaned files based on current database references.
+        Garbage-collect attachment files that are no longer referenced.
+
+        Blob reference counts are reconciled against attachment_metadata, blobs
+        whose count drops to zero are removed, and legacy per-attachment files
+        without a metadata row are deleted.
 
         Args:
             db_context: Database context
 
         Returns:
-            Number of attachments cleaned up
+            Number of files cleaned up
         """
+        deleted_count = await self._collect_unreferenced_blobs(db_context)
+
         # Get attachment IDs that are still referenced in the database
-        referenced_query = select(attachment_metadata_table.c.attachment_id).distinct()
+        referenced_query = select(attachment_metadata_table.c.attachment_id).where(
+            attachment_metadata_table.c.content_hash.is_(None)
+        )
         referenced_rows = await db_context.fetch_all(referenced_query)
         referenced_ids = {row["attachment_id"] for row in referenced_rows}
 
-        # Clean up orphaned files directly
-        return self._cleanup_orphaned_files(referenced_ids)
+        # Clean up orphaned legacy files directly
+        return deleted_count + self._cleanup_orphaned_files(referenced_ids)
 
     async def update_attachment_conversation(
         self,
@@ -671,6 +753,7 @@ class AttachmentRegistry:
         message_id: int | None = None,
         # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
         metadata: dict[str, Any] | None = None,
+        content_hash: str | None = None,
     ) -> AttachmentMetadata:
         """
         Register a tool-generated attachment using internal database context.
@@ -691,6 +774,7 @@ class AttachmentRegistry:
                 conversation_id=conversation_id,
                 message_id=message_id,
                 metadata=metadata,
+                content_hash=content_hash,
             )
 
     async def get_attachment_with_context(
@@ -765,6 +849,7 @@ class AttachmentRegistry:
                 conversation_id=conversation_id,
                 message_id=message_id,
                 metadata=final_metadata,
+                content_hash=file_metadata.content_hash,
             )
         else:
             return await self.register_tool_attachment_with_context(
@@ -781,6 +866,7 @@ class AttachmentRegistry:
                 conversation_id=conversation_id,
                 message_id=message_id,
                 metadata=final_metadata,
+                content_hash=file_metadata.content_hash,
             )
 
     # File storage methods (previously from AttachmentService)
@@ -789,21 +875,215 @@ class AttachmentRegistry:
         """Calculate SHA-256 hash of file content."""
         return hashlib.sha256(content).hexdigest()
 
-    def _get_file_path(self, attachment_id: str, filename: str) -> Path:
+    def _get_blob_path(self, content_hash: str, filename: str) -> Path:
         """
-        Generate file storage path for an attachment.
+        Generate the storage path for a content-addressed blob.
 
-        Uses hash-based directory structure: XX/attachment_id.ext
-        where XX is the first 2 characters of the attachment_id (provides 256 buckets).
+        Uses hash-based directory structure: blobs/XX/<sha256>.ext
+        where XX is the first 2 characters of the content hash (provides 256 buckets).
+        The original extension is kept so the content type can be inferred from the path.
         """
-        # Use first 2 characters of attachment_id for directory sharding
-        hash_prefix = attachment_id[:2]
-        hash_dir = self.storage_path / hash_prefix
+        hash_dir = self.blob_path / content_hash[:2]
         hash_dir.mkdir(parents=True, exist_ok=True)
 
-        # Use attachment_id as filename with original extension
         file_ext = Path(filename).suffix.lower()
-        return hash_dir / f"{attachment_id}{file_ext}"
+        return hash_dir / f"{content_hash}{file_ext}"
+
+    def _resolve_storage_path(self, storage_path: str) -> Path:
+        """Resolve a stored path, which may be relative to the storage root."""
+        path = Path(storage_path)
+        return path if path.is_absolute() else self.storage_path / path
+
+    async def _write_blob(self, content: bytes, filename: str) -> tuple[str, Path]:
+        """
+        Write content to the blob store unless an identical blob already exists.
+
+        Args:
+            content: File content bytes
+            filename: Sanitized filename, used for the blob's extension
+
+        Returns:
+            Tuple of (content hash, path of the blob file)
+        """
+        content_hash = self._calculate_content_hash(content)
+        blob_file = self._get_blob_path(content_hash, filename)
+
+        # Identical content may already be stored under a different extension
+        for existing in blob_file.parent.glob(f"{content_hash}*"):
+            if existing.is_file():
+                # Refresh mtime so garbage collection's grace period covers the
+                # window before the new reference is committed
+                existing.touch()
+                logger.info(
+                    f"Reusing existing blob {content_hash} ({len(content)} bytes)"
+                )
+                return content_hash, existing
+
+        # Write to a temporary file first so readers never see a partial blob
+        tmp_file = blob_file.parent / f".{uuid.uuid4()}.tmp"
+        try:
+            async with aiofiles.open(tmp_file, "wb") as f:
+                await f.write(content)
+            await aiofiles.os.replace(tmp_file, blob_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+        return content_hash, blob_file
+
+    async def _acquire_blob(
+        self,
+        db_context: DatabaseContext,
+        content_hash: str,
+        storage_path: str,
+        size: int,
+    ) -> None:
+        """Add a reference to a blob, creating its row on first use."""
+        blob_file = self._resolve_storage_path(storage_path)
+        try:
+            relative_path = str(blob_file.relative_to(self.storage_path))
+        except ValueError:
+            relative_path = str(blob_file)
+
+        if db_context.engine.dialect.name == "postgresql":
+            stmt = pg_insert(attachment_blobs_table).values(
+                content_hash=content_hash,
+                storage_path=relative_path,
+                size=size,
+                ref_count=1,
+                created_at=datetime.now(UTC),
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["content_hash"],
+                set_={"ref_count": attachment_blobs_table.c.ref_count + 1},
+            )
+            await db_context.execute_with_retry(stmt)
+            return
+
+        result = await db_context.execute_with_retry(
+            update(attachment_blobs_table)
+            .where(attachment_blobs_table.c.content_hash == content_hash)
+            .values(ref_count=attachment_blobs_table.c.ref_count + 1)
+        )
+        if result.rowcount == 0:
+            await db_context.execute_with_retry(
+                insert(attachment_blobs_table).values(
+                    content_hash=content_hash,
+                    storage_path=relative_path,
+                    size=size,
+                    ref_count=1,
+                    created_at=datetime.now(UTC),
+                )
+            )
+
+    async def _release_blob(
+        self, db_context: DatabaseContext, content_hash: str
+    ) -> None:
+        """
+        Drop a reference to a blob.
+
+        The file is not deleted here, even at zero references: a concurrent
+        upload of the same content may already have found the file and be
+        about to add its reference. Garbage collection deletes unreferenced
+        blobs once they are past the grace period, which _write_blob restarts
+        whenever it reuses a blob.
+        """
+        await db_context.execute_with_retry(
+            update(attachment_blobs_table)
+            .where(attachment_blobs_table.c.content_hash == content_hash)
+            .values(ref_count=attachment_blobs_table.c.ref_count - 1)
+        )
+
+    def _unlink_blob_file(self, blob_file: Path) -> bool:
+        """Delete a blob file, returning True if it existed."""
+        try:
+            blob_file.unlink()
+            logger.info(f"Deleted unreferenced blob: {blob_file.name}")
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.error(f"Failed to delete blob {blob_file}: {e}")
+            return False
+
+    @staticmethod
+    def _is_past_gc_grace(file_path: Path) -> bool:
+        """Check whether a file is old enough to be garbage-collected."""
+        try:
+            age = time.time() - file_path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return age > BLOB_GC_GRACE_SECONDS
+
+    async def _collect_unreferenced_blobs(self, db_context: DatabaseContext) -> int:
+        """
+        Reconcile blob reference counts and delete blobs nothing refers to.
+
+        Args:
+            db_context: Database context
+
+        Returns:
+            Number of blob files deleted
+        """
+        # Count the attachments that actually point at each blob; this repairs
+        # counts that drifted, e.g. from rows deleted outside the registry
+        refs_query = (
+            select(
+                attachment_metadata_table.c.content_hash,
+                func.count().label("refs"),
+            )
+            .where(attachment_metadata_table.c.content_hash.is_not(None))
+            .group_by(attachment_metadata_table.c.content_hash)
+        )
+        actual_refs = {
+            row["content_hash"]: row["refs"]
+            for row in await db_context.fetch_all(refs_query)
+        }
+
+        blob_rows = await db_context.fetch_all(select(attachment_blobs_table))
+        tracked_hashes: set[str] = set()
+        deleted_count = 0
+
+        for row in blob_rows:
+            content_hash = row["content_hash"]
+            refs = actual_refs.get(content_hash, 0)
+            blob_file = self._resolve_storage_path(row["storage_path"])
+
+            if refs == 0 and self._is_past_gc_grace(blob_file):
+                await db_context.execute_with_retry(
+                    delete(attachment_blobs_table).where(
+                        attachment_blobs_table.c.content_hash == content_hash
+                    )
+                )
+                self.derivatives.invalidate(content_hash)
+                if self._unlink_blob_file(blob_file):
+                    deleted_count += 1
+                continue
+
+            tracked_hashes.add(content_hash)
+            if refs != row["ref_count"]:
+                logger.warning(
+                    f"Correcting ref_count for blob {content_hash}: {row['ref_count']} -> {refs}"
+                )
+                await db_context.execute_with_retry(
+                    update(attachment_blobs_table)
+                    .where(attachment_blobs_table.c.content_hash == content_hash)
+                    .values(ref_count=refs)
+                )
+
+        # Files without a blob row come from stores that were never registered
+        if self.blob_path.is_dir():
+            for blob_file in self.blob_path.glob("*/*"):
+                if not blob_file.is_file() or not self._is_past_gc_grace(blob_file):
+                    continue
+                content_hash = blob_file.name.split(".", 1)[0]
+                if content_hash not in tracked_hashes and self._unlink_blob_file(
+                    blob_file
+                ):
+                    deleted_count += 1
+
+        logger.info(f"Garbage-collected {deleted_count} unreferenced blobs")
+        return deleted_count
 
     def _validate_file(self, file: UploadFile) -> None:
         """
@@ -906,15 +1186,12 @@ class AttachmentRegistry:
         safe_filename = self._sanitize_filename(filename)
 
         try:
-            # Calculate content hash for potential future deduplication
-            _ = self._calculate_content_hash(file_content)
-
-            # Get storage path
-            file_path = self._get_file_path(attachment_id, safe_filename)
-
-            # Write file to disk asynchronously
-            async with aiofiles.open(file_path, "wb") as f:
-                await f.write(file_content)
+            # Store content in the blob store, reusing identical content
+            content_hash, file_path = await self._write_blob(
+                file_content, safe_filename
+            )
+            self._path_index[attachment_id] = file_path
+            self._mime_types[attachment_id] = content_type
 
             # Create minimal attachment metadata object (caller should provide proper metadata)
             attachment_metadata = AttachmentMetadata(
@@ -930,6 +1207,7 @@ class AttachmentRegistry:
                     "original_filename": safe_filename,
                     "storage_method": "file_only",
                 },
+                content_hash=content_hash,
             )
 
             logger.info(
@@ -968,27 +1246,26 @@ class AttachmentRegistry:
             # Read file content
             file_content = await file.read()
 
-            # Calculate content hash for potential future deduplication
-            _ = self._calculate_content_hash(file_content)
-
-            # Get storage path
-            file_path = self._get_file_path(attachment_id, safe_filename)
-
-            # Write file to disk asynchronously
-            async with aiofiles.open(file_path, "wb") as f:
-                await f.write(file_content)
+            # Store content in the blob store, reusing identical content
+            content_hash, file_path = await self._write_blob(
+                file_content, safe_filename
+            )
+            self._path_index[attachment_id] = file_path
+            mime_type = file.content_type or "application/octet-stream"
+            self._mime_types[attachment_id] = mime_type
 
             # Create attachment metadata
             attachment_metadata = AttachmentMetadata(
                 attachment_id=attachment_id,
                 source_type="user",
                 source_id="api_user",
-                mime_type=file.content_type or "application/octet-stream",
+                mime_type=mime_type,
                 description=f"User uploaded: {safe_filename}",
                 size=len(file_content),
                 content_url=f"/api/attachments/{attachment_id}",
                 storage_path=str(file_path.relative_to(self.storage_path)),
                 metadata={"original_filename": safe_filename, "upload_method": "api"},
+                content_hash=content_hash,
             )
 
             logger.info(
@@ -1006,12 +1283,21 @@ class AttachmentRegistry:
         """
         Get the file system path for an attachment by ID.
 
+        Blob-backed attachments are resolved through the in-memory path index,
+        which is filled when attachments are stored or looked up. Use
+        resolve_attachment_path() when the attachment may not have been seen
+        since startup.
+
         Args:
             attachment_id: The attachment UUID
 
         Returns:
             Path to the attachment file, or None if not found
         """
+        indexed_path = self._path_index.get(attachment_id)
+        if indexed_path is not None:
+            return indexed_path
+
         try:
             # Parse as UUID to validate format
             uuid.UUID(attachment_id)
@@ -1027,25 +1313,127 @@ class AttachmentRegistry:
             logger.info(f"Attachment file not found: {attachment_id}")
             return None
 
-        # Look for files starting with the attachment ID in the hash directory
-        # Use attachment_id* to find both files with and without extensions
+        # Legacy attachments are stored per-ID; look for files starting with
+        # the attachment ID to find both files with and without extensions
         for file_path in hash_dir.glob(f"{attachment_id}*"):
             if file_path.is_file():
+                self._path_index[attachment_id] = file_path
                 return file_path
 
         logger.info(f"Attachment file not found: {attachment_id}")
         return None
 
-    def get_content_type(self, file_path: Path) -> str:
+    async def resolve_attachment_path(
+        self,
+        attachment_id: str,
+        db_context: DatabaseContext | None = None,
+    ) -> Path | None:
+        """
+        Get the file system path for an attachment, consulting the database on index misses.
+
+        Args:
+            attachment_id: The attachment UUID
+            db_context: Optional database context; a new one is created if omitted
+
+        Returns:
+            Path to the attachment file, or None if not found
+        """
+        if attachment_id not in self._path_index:
+            if db_context is not None:
+                await self.get_attachment(db_context, attachment_id)
+            else:
+                await self.get_attachment_with_context(attachment_id)
+        return self.get_attachment_path(attachment_id)
+
+    def _derivative_key(self, attachment_id: str, file_path: Path) -> str:
+        """
+        Get the derivative cache key for an attachment.
+
+        Blob-backed attachments are keyed by content hash (the blob file's stem)
+        so identical content shares derivatives; legacy files use the attachment ID.
+        """
+        if file_path.parent.parent == self.blob_path:
+            return file_path.name.split(".", 1)[0]
+        return attachment_id
+
+    async def get_content_hash(
+        self, attachment: AttachmentMetadata, file_path: Path
+    ) -> str:
+        """
+        Get the SHA-256 of an attachment's content.
+
+        Blob-backed attachments already record their hash; for legacy files the
+        hash is computed in the derivative worker pool and cached.
+
+        Args:
+            attachment: Attachment metadata
+            file_path: Path to the attachment file
+
+        Returns:
+            Hex-encoded SHA-256 digest
+        """
+        if attachment.content_hash:
+            return attachment.content_hash
+
+        def _hash_file() -> str:
+            digest = hashlib.sha256()
+            with file_path.open("rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            return digest.hexdigest()
+
+        return await self.derivatives.get_or_compute(
+            attachment.attachment_id, "sha256", _hash_file
+        )
+
+    async def get_data_uri(self, attachment_id: str) -> str | None:
+        """
+        Get an attachment as a base64 data URI, suitable for LLM providers.
+
+        Encodings are cached, so attachments that stay in the conversation
+        history are read and encoded once rather than on every turn.
+
+        Args:
+            attachment_id: The attachment UUID
+
+        Returns:
+            Data URI string, or None if the attachment file was not found
+        """
+        file_path = await self.resolve_attachment_path(attachment_id)
+        if not file_path or not file_path.exists():
+            return None
+
+        content_type = self.get_content_type(file_path, attachment_id)
+
+        def _encode() -> str:
+            encoded = base64.b64encode(file_path.read_bytes()).decode("ascii")
+            return f"data:{content_type};base64,{encoded}"
+
+        return await self.derivatives.get_or_compute(
+            # Attachments sharing a blob may differ in MIME type
+            self._derivative_key(attachment_id, file_path),
+            f"data_uri:{content_type}",
+            _encode,
+        )
+
+    def get_content_type(
+        self, file_path: Path, attachment_id: str | None = None
+    ) -> str:
         """
-        Get the MIME type for a file.
+        Get the MIME type for an attachment file.
+
+        The type recorded for the attachment is preferred; the file extension is
+        only a fallback, since a blob keeps the extension of its first upload.
 
         Args:
             file_path: Path to the file
+            attachment_id: The attachment UUID, if known
 
         Returns:
             MIME type string
         """
+        if attachment_id is not None and attachment_id in self._mime_types:
+            return self._mime_types[attachment_id]
         content_type, _ = mimetypes.guess_type(str(file_path))
         return content_type or "application/octet-stream"
 
@@ -1060,6 +1448,7 @@ class AttachmentRegistry:
             True if file was deleted, False if not found
         """
         file_path = self.get_attachment_path(attachment_id)
+        self._path_index.pop(attachment_id, None)
         if file_path and file_path.exists():
             try:
                 file_path.unlink()
@@ -1072,7 +1461,9 @@ class AttachmentRegistry:
 
     def _cleanup_orphaned_files(self, referenced_attachment_ids: set[str]) -> int:
         """
-        Clean up attachment files that are no longer referenced in the database.
+        Clean up legacy per-attachment files that are no longer referenced in the database.
+
+        Blobs are handled separately by _collect_unreferenced_blobs().
 
         Args:
             referenced_attachment_ids: Set of attachment IDs that are still referenced
@@ -1084,7 +1475,7 @@ class AttachmentRegistry:
 
         # Iterate through hash-prefixed directories (00-ff)
         for hash_dir in self.storage_path.glob("*/"):
-            if not hash_dir.is_dir():
+            if not hash_dir.is_dir() or hash_dir == self.blob_path:
                 continue
 
             for file_path in hash_dir.glob("*"):
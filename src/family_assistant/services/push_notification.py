@@ -3,8 +3,13 @@
 import asyncio
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 
-from pywebpush import WebPushException, webpush
+import httpx
+from py_vapid import Vapid, Vapid01
+from pywebpush import WebPusher
 
 from family_assistant.storage.context import DatabaseContext
 from family_assistant.storage.push_subscription import (
@@ -13,6 +18,21 @@ from family_assistant.storage.push_subscription import (
 
 logger = logging.getLogger(__name__)
 
+# VAPID JWTs are valid for 12 hours (the maximum push services accept is 24h);
+# a cached token is re-signed once less than VAPID_REFRESH_MARGIN remains.
+VAPID_TOKEN_LIFETIME_SECONDS = 12 * 60 * 60
+VAPID_REFRESH_MARGIN_SECONDS = 60 * 60
+
+PUSH_REQUEST_TIMEOUT_SECONDS = 10.0
+PUSH_TTL_SECONDS = 0
+
+# Payload encryption (an ECDH key exchange per message) and VAPID signing are
+# CPU-bound; a small dedicated pool keeps a burst of sends from occupying the
+# default executor.
+_push_crypto_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="push-crypto"
+)
+
 
 class PushNotificationService:
     """Service for sending push notifications to subscribed users."""
@@ -21,12 +41,15 @@ class PushNotificationService:
         self,
         vapid_private_key: str | None,
         vapid_contact_email: str | None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize the push notification service.
 
         Args:
             vapid_private_key: VAPID private key for signing push messages.
             vapid_contact_email: Admin contact email for VAPID 'sub' claim.
+            http_client: Client used to reach push services. If omitted, one is
+                created on first send and closed by close().
         """
         self.vapid_private_key = vapid_private_key
         self.vapid_claims: dict[str, str | int] = {}
@@ -40,6 +63,83 @@ class PushNotificationService:
 
         self.enabled = bool(vapid_private_key and vapid_contact_email)
 
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        self._vapid: Vapid01 | None = None
+        # Push service origin ("aud" claim) -> (expiry, signed VAPID headers)
+        self._vapid_headers: dict[str, tuple[float, dict[str, str]]] = {}
+        self._vapid_lock = asyncio.Lock()
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=PUSH_REQUEST_TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the HTTP client if this service created it."""
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def _sign_vapid_headers(self, audience: str, expires_at: int) -> dict[str, str]:
+        """Sign VAPID headers for one push service (runs in the crypto pool)."""
+        if self._vapid is None:
+            assert self.vapid_private_key is not None
+            self._vapid = Vapid.from_string(private_key=self.vapid_private_key)
+        return self._vapid.sign({
+            **self.vapid_claims,
+            "aud": audience,
+            "exp": expires_at,
+        })
+
+    async def _get_vapid_headers(self, endpoint: str) -> dict[str, str]:
+        """Return VAPID headers for the endpoint's push service, re-signing near expiry."""
+        url = urlparse(endpoint)
+        audience = f"{url.scheme}://{url.netloc}"
+        now = time.time()
+        cached = self._vapid_headers.get(audience)
+        if cached is not None and cached[0] - VAPID_REFRESH_MARGIN_SECONDS > now:
+            return cached[1]
+
+        # Concurrent sends to the same push service wait for one signature
+        async with self._vapid_lock:
+            cached = self._vapid_headers.get(audience)
+            if cached is not None and cached[0] - VAPID_REFRESH_MARGIN_SECONDS > now:
+                return cached[1]
+            expires_at = int(now) + VAPID_TOKEN_LIFETIME_SECONDS
+            headers = await asyncio.get_running_loop().run_in_executor(
+                _push_crypto_executor, self._sign_vapid_headers, audience, expires_at
+            )
+            self._vapid_headers[audience] = (expires_at, headers)
+            return headers
+
+    @staticmethod
+    def _encrypt(sub: PushSubscriptionModel, payload: bytes) -> bytes:
+        """Encrypt the payload for one subscription (runs in the crypto pool)."""
+        return WebPusher(sub.subscription_json).encode(payload, "aes128gcm")["body"]
+
+    async def _send_to_subscription(
+        self, sub: PushSubscriptionModel, payload: bytes
+    ) -> httpx.Response:
+        endpoint = sub.subscription_json["endpoint"]
+        vapid_headers = await self._get_vapid_headers(endpoint)
+        body = await asyncio.get_running_loop().run_in_executor(
+            _push_crypto_executor, self._encrypt, sub, payload
+        )
+        return await self._get_http_client().post(
+            endpoint,
+            content=body,
+            headers={
+                **vapid_headers,
+                "content-encoding": "aes128gcm",
+                "ttl": str(PUSH_TTL_SECONDS),
+            },
+            timeout=PUSH_REQUEST_TIMEOUT_SECONDS,
+        )
+
     async def send_notification(
         self,
         user_identifier: str,
@@ -65,34 +165,13 @@ class PushNotificationService:
         if not subscriptions:
             return
 
-        payload = json.dumps({"title": title, "body": body})
+        payload = json.dumps({"title": title, "body": body}).encode()
 
         # Send notifications concurrently to reduce latency for users with multiple subscriptions
         async def send_to_subscription(sub: PushSubscriptionModel) -> int | None:
             """Send notification to a single subscription, returning subscription id if 410."""
             try:
-                await asyncio.to_thread(
-                    webpush,
-                    subscription_info=sub.subscription_json,
-                    data=payload,
-                    vapid_private_key=self.vapid_private_key,
-                    vapid_claims=self.vapid_claims,
-                )
-                logger.info(f"Sent push notification to user {user_identifier}")
-                return None
-            except WebPushException as e:
-                # The pywebpush library automatically handles JSON responses
-                # and raises exceptions with response objects.
-                if e.response and e.response.status_code == 410:
-                    logger.info(
-                        f"Subscription for user {user_identifier} is stale (410 Gone). Deleting."
-                    )
-                    return sub.id
-                else:
-                    logger.warning(
-                        f"Failed to send push notification to user {user_identifier}: {e}",
-                    )
-                    return None
+                response = await self._send_to_subscription(sub, payload)
             except Exception as e:
                 logger.error(
                     f"An unexpected error occurred while sending push notification to user {user_identifier}: {e}",
@@ -100,12 +179,26 @@ class PushNotificationService:
                 )
                 return None
 
+            if response.status_code == 410:
+                logger.info(
+                    f"Subscription for user {user_identifier} is stale (410 Gone). Deleting."
+                )
+                return sub.id
+            if response.status_code > 202:
+                logger.warning(
+                    f"Failed to send push notification to user {user_identifier}: "
+                    f"{response.status_code} {response.reason_phrase} {response.text}",
+                )
+                return None
+            logger.info(f"Sent push notification to user {user_identifier}")
+            return None
+
         # Run all sends concurrently
-        stale_subscription_ids = await asyncio.gather(
+        results = await asyncio.gather(
             *(send_to_subscription(sub) for sub in subscriptions)
         )
 
-        # Handle 410 (stale) subscriptions sequentially to avoid concurrent DB writes
-        for sub_id in stale_subscription_ids:
-            if sub_id is not None:
-                await db_context.push_subscriptions.delete(sub_id)
+        # Remove 410 (stale) subscriptions in one statement
+        stale_subscription_ids = [sub_id for sub_id in results if sub_id is not None]
+        if stale_subscription_ids:
+            await db_context.push_subscriptions.delete_many(stale_subscription_ids)
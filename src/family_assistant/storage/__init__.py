@@ -3,9 +3,8 @@ import logging
 import os
 import random
 import traceback
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from alembic.config import Config as AlembicConfig
 from sqlalchemy import (
     inspect,
     text,
@@ -18,8 +17,6 @@ from sqlalchemy.exc import (
 )
 from sqlalchemy.ext.asyncio import AsyncEngine
 
-from alembic import command as alembic_command
-
 # Import base components using absolute package paths
 from family_assistant.paths import PROJECT_ROOT
 from family_assistant.storage.base import (
@@ -35,15 +32,22 @@ from family_assistant.storage.events import (
     EventActionType,
     EventSourceType,
     InterfaceType,
+    event_listener_triggers_table,
     event_listeners_table,
     recent_events_table,
 )
-from family_assistant.storage.message_history import message_history_table
+from family_assistant.storage.message_history import (
+    conversation_summaries_table,
+    message_history_table,
+)
 from family_assistant.storage.notes import notes_table
 from family_assistant.storage.push_subscription import push_subscriptions_table
 from family_assistant.storage.schedule_automations import schedule_automations_table
 from family_assistant.storage.tasks import tasks_table
 
+if TYPE_CHECKING:
+    from alembic.config import Config as AlembicConfig
+
 logger = logging.getLogger(__name__)
 
 # --- Vector Storage Imports ---
@@ -129,8 +133,11 @@ async def _log_current_revision(engine: AsyncEngine) -> None:
         )
 
 
-def _get_alembic_config(engine: AsyncEngine) -> AlembicConfig:
+def _get_alembic_config(engine: AsyncEngine) -> "AlembicConfig":
     """Loads the Alembic configuration."""
+    # Alembic is slow to import and only needed when migrating
+    from alembic.config import Config as AlembicConfig  # noqa: PLC0415
+
     alembic_ini_env_var = os.getenv("ALEMBIC_CONFIG")
     project_root = str(PROJECT_ROOT)
     default_alembic_ini_path = os.path.join(project_root, "alembic.ini")
@@ -174,9 +181,11 @@ def _get_alembic_config(engine: AsyncEngine) -> AlembicConfig:
 
 
 async def _run_alembic_command(
-    engine: AsyncEngine, config: AlembicConfig, command_name: str, *args: str
+    engine: AsyncEngine, config: "AlembicConfig", command_name: str, *args: str
 ) -> None:
     """Executes an Alembic command asynchronously with detailed logging."""
+    from alembic import command as alembic_command  # noqa: PLC0415
+
     command_func = getattr(alembic_command, command_name)
     args_repr = ", ".join(map(repr, args))
     logger.info(f"Preparing to run Alembic command: {command_name}({args_repr})")
@@ -319,11 +328,13 @@ __all__ = [
     # Tables - still exported for direct use
     "notes_table",
     "message_history_table",
+    "conversation_summaries_table",
     "tasks_table",
     "received_emails_table",
     "error_logs_table",
     "event_listeners_table",
     "recent_events_table",
+    "event_listener_triggers_table",
     "schedule_automations_table",
     "push_subscriptions_table",
     "metadata",
@@ -7,6 +7,7 @@ different storage modules to prevent circular dependencies.
 
 import logging
 import os
+import weakref
 from typing import Any
 
 from sqlalchemy import (
@@ -23,11 +24,21 @@ from sqlalchemy import (
     Text,
     event,
 )
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-from sqlalchemy.pool import NullPool, StaticPool
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.pool.base import _ConnectionRecord
 from sqlalchemy.sql import func
 
+from family_assistant.storage.connection_pool import (
+    DEFAULT_MAX_OVERFLOW,
+    DEFAULT_POOL_RECYCLE_SECONDS,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_POOL_TIMEOUT_SECONDS,
+    DEFAULT_SQLITE_READERS,
+    LoopOwnedQueuePool,
+)
+
 logger = logging.getLogger(__name__)
 
 # Define shared metadata object
@@ -37,58 +48,152 @@ metadata = MetaData()
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///family_assistant.db")
 
 
-def create_engine_with_sqlite_optimizations(database_url: str) -> AsyncEngine:
-    """Create engine with SQLite optimizations if applicable."""
-    # Determine pool class based on database type
-    # Use StaticPool for SQLite to reuse connections
-    # Use NullPool for PostgreSQL to avoid event loop affinity issues
-    # NullPool creates a new connection for each request, which is less efficient
-    # but avoids the "Future attached to a different loop" errors with asyncpg
-    pool_class = StaticPool if database_url.startswith("sqlite") else NullPool
+# Reader engines for SQLite databases, keyed by their writer's sync engine
+_reader_engines: "weakref.WeakKeyDictionary[Engine, AsyncEngine]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _set_sqlite_pragma(
+    dbapi_connection: Any,  # noqa: ANN401 # DBAPI connection type varies
+    connection_record: _ConnectionRecord,
+) -> None:
+    # Check if this is actually a SQLite connection
+    if hasattr(dbapi_connection, "execute"):
+        # Use a more robust check
+        cursor = dbapi_connection.cursor()
+        try:
+            # This will only work on SQLite
+            cursor.execute("SELECT sqlite_version()")
+            cursor.fetchone()
+
+            # If we get here, it's SQLite
+            cursor.execute("PRAGMA journal_mode=WAL")  # Enable WAL mode
+            cursor.execute("PRAGMA busy_timeout=30000")  # 30 second timeout
+            cursor.execute("PRAGMA synchronous=NORMAL")  # Better performance
+            cursor.execute("PRAGMA cache_size=-64000")  # 64MB cache
+            cursor.execute("PRAGMA temp_store=MEMORY")  # Use memory for temp tables
+            cursor.execute("PRAGMA mmap_size=536870912")  # 512MB memory-mapped I/O
+
+            logger.debug("Applied SQLite optimizations")
+        except Exception:
+            # Not SQLite, ignore
+            pass
+        finally:
+            cursor.close()
+
 
-    # Create the engine first
-    engine = create_async_engine(
-        database_url,
+def _set_sqlite_query_only(
+    dbapi_connection: Any,  # noqa: ANN401 # DBAPI connection type varies
+    connection_record: _ConnectionRecord,
+) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA query_only=ON")  # Reject writes on reader connections
+    finally:
+        cursor.close()
+
+
+def _is_file_sqlite(engine: AsyncEngine) -> bool:
+    database = engine.url.database
+    return (
+        bool(database)
+        and database != ":memory:"
+        and "mode=memory" not in str(engine.url)
+    )
+
+
+def _create_sqlite_reader_engine(
+    writer: AsyncEngine, readers: int, pool_timeout: float
+) -> AsyncEngine:
+    """Creates a pool of query-only connections to the writer's database file.
+
+    In WAL mode these read the last committed state without waiting for the
+    writer connection. The reader engine is disposed together with the writer.
+    """
+    reader = create_async_engine(
+        writer.url,
         echo=False,
         connect_args={
             "timeout": 30,  # 30 second busy timeout for SQLite
             "check_same_thread": False,
-        }
-        if database_url.startswith("sqlite")
-        else {},
-        pool_pre_ping=pool_class != NullPool,
-        poolclass=pool_class,
+        },
+        poolclass=LoopOwnedQueuePool,
+        pool_size=readers,
+        max_overflow=0,
+        pool_timeout=pool_timeout,
+        # Query-only connections to a local file never hold writes or go
+        # stale, so skip the per-checkout ping and rollback round trips
+        pool_reset_on_return=None,
     )
+    event.listen(reader.sync_engine, "connect", _set_sqlite_pragma)
+    event.listen(reader.sync_engine, "connect", _set_sqlite_query_only)
+
+    def dispose_reader(sync_engine: Engine) -> None:
+        # Runs inside the writer's AsyncEngine.dispose() greenlet
+        reader.sync_engine.dispose()
 
-    # Add SQLite-specific optimizations using dialect detection
-    @event.listens_for(engine.sync_engine, "connect")
-    def set_sqlite_pragma(
-        dbapi_connection: Any,  # noqa: ANN401 # DBAPI connection type varies
-        connection_record: _ConnectionRecord,
-    ) -> None:
-        # Check if this is actually a SQLite connection
-        if hasattr(dbapi_connection, "execute"):
-            # Use a more robust check
-            cursor = dbapi_connection.cursor()
-            try:
-                # This will only work on SQLite
-                cursor.execute("SELECT sqlite_version()")
-                cursor.fetchone()
-
-                # If we get here, it's SQLite
-                cursor.execute("PRAGMA journal_mode=WAL")  # Enable WAL mode
-                cursor.execute("PRAGMA busy_timeout=30000")  # 30 second timeout
-                cursor.execute("PRAGMA synchronous=NORMAL")  # Better performance
-                cursor.execute("PRAGMA cache_size=-64000")  # 64MB cache
-                cursor.execute("PRAGMA temp_store=MEMORY")  # Use memory for temp tables
-                cursor.execute("PRAGMA mmap_size=536870912")  # 512MB memory-mapped I/O
-
-                logger.debug("Applied SQLite optimizations")
-            except Exception:
-                # Not SQLite, ignore
-                pass
-            finally:
-                cursor.close()
+    event.listen(writer.sync_engine, "engine_disposed", dispose_reader)
+    return reader
+
+
+def get_reader_engine(engine: AsyncEngine) -> AsyncEngine:
+    """Returns the engine to use for read-only work.
+
+    For file-backed SQLite created by create_engine_with_sqlite_optimizations
+    this is a pool of query-only connections; otherwise it is ``engine``.
+    """
+    return _reader_engines.get(engine.sync_engine, engine)
+
+
+def create_engine_with_sqlite_optimizations(
+    database_url: str,
+    *,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    max_overflow: int = DEFAULT_MAX_OVERFLOW,
+    pool_timeout: float = DEFAULT_POOL_TIMEOUT_SECONDS,
+    pool_recycle: int = DEFAULT_POOL_RECYCLE_SECONDS,
+    pool_pre_ping: bool = True,
+    sqlite_readers: int = DEFAULT_SQLITE_READERS,
+) -> AsyncEngine:
+    """Create engine with SQLite optimizations if applicable.
+
+    SQLite writes go through a StaticPool sharing one connection. For
+    file-backed databases, up to ``sqlite_readers`` query-only connections
+    serve read-only DatabaseContexts concurrently (see get_reader_engine).
+
+    Other databases use a LoopOwnedQueuePool configured by the pool_*
+    arguments, which keeps connections for the event loop that owns the engine
+    and hands other loops unpooled connections to avoid asyncpg's "attached to
+    a different loop" errors.
+    """
+    if database_url.startswith("sqlite"):
+        engine = create_async_engine(
+            database_url,
+            echo=False,
+            connect_args={
+                "timeout": 30,  # 30 second busy timeout for SQLite
+                "check_same_thread": False,
+            },
+            pool_pre_ping=True,
+            poolclass=StaticPool,
+        )
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragma)
+        if sqlite_readers > 0 and _is_file_sqlite(engine):
+            _reader_engines[engine.sync_engine] = _create_sqlite_reader_engine(
+                engine, sqlite_readers, pool_timeout
+            )
+    else:
+        engine = create_async_engine(
+            database_url,
+            echo=False,
+            poolclass=LoopOwnedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+        )
 
     return engine
 
@@ -150,9 +255,25 @@ attachment_metadata_table = Table(
     Column("created_at", DateTime(timezone=True), nullable=False),
     Column("accessed_at", DateTime(timezone=True), nullable=True),
     Column("metadata", JSON, nullable=True),
+    # SHA-256 of the content; NULL for legacy per-attachment files
+    Column("content_hash", String(64), nullable=True),
     # Indexes for common queries
     Index("idx_attachment_conversation", "conversation_id"),
     Index("idx_attachment_source", "source_type", "source_id"),
     Index("idx_attachment_created", "created_at"),
+    Index("idx_attachment_content_hash", "content_hash"),
+    extend_existing=True,
+)
+
+
+# Content-addressed blob storage shared by attachments with identical content
+attachment_blobs_table = Table(
+    "attachment_blobs",
+    metadata,
+    Column("content_hash", String(64), primary_key=True),  # SHA-256 hex digest
+    Column("storage_path", Text, nullable=False),  # Relative to the storage root
+    Column("size", Integer, nullable=False),
+    Column("ref_count", Integer, nullable=False, default=0),
+    Column("created_at", DateTime(timezone=True), nullable=False),
     extend_existing=True,
 )
@@ -0,0 +1,181 @@
+"""
+Event-loop-aware connection pooling for async database drivers.
+
+asyncpg connections are bound to the event loop that opened them, so a
+plain QueuePool breaks as soon as an engine is used from a second loop
+(e.g. a script calling ``asyncio.run`` in a worker thread). LoopOwnedQueuePool
+pools connections only for the loop that first used it; other loops get
+short-lived connections that are closed instead of being returned, up to the
+same pool_size + max_overflow limit.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+from sqlalchemy.util import await_only
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_TIMEOUT_SECONDS = 30.0
+DEFAULT_POOL_RECYCLE_SECONDS = 1800
+DEFAULT_SQLITE_READERS = 4
+
+_FOREIGN_LOOP_KEY = "family_assistant_foreign_loop"
+# How often a foreign loop re-checks for a free connection slot
+_FOREIGN_SLOT_POLL_SECONDS = 0.01
+
+
+@dataclass
+class ConnectionPoolStats:
+    """Utilization and timing counters for a LoopOwnedQueuePool."""
+
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    checkout_seconds_total: float
+    checkout_seconds_max: float
+    connects: int
+    connect_seconds_total: float
+    connect_seconds_max: float
+    foreign_loop_connections: int
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class LoopOwnedQueuePool(AsyncAdaptedQueuePool):
+    """
+    A queue pool owned by the first event loop that checks out a connection.
+
+    Checkouts from any other loop bypass the queue with a dedicated connection
+    that is closed on return; at most pool_size + max_overflow of these are open
+    at once. If the owning loop is closed, its connections are discarded and the
+    next loop to check out takes ownership.
+    """
+
+    def __init__(self, *args: Any, **kw: Any) -> None:  # noqa: ANN401
+        super().__init__(*args, **kw)
+        self._owner_loop: asyncio.AbstractEventLoop | None = None
+        self._checkouts = 0
+        self._checkout_seconds_total = 0.0
+        self._checkout_seconds_max = 0.0
+        self._connects = 0
+        self._connect_seconds_total = 0.0
+        self._connect_seconds_max = 0.0
+        self._foreign_loop_connections = 0
+        # Foreign loops run in other threads, so their limit is a thread-safe
+        # semaphore rather than the owner loop's queue
+        self._foreign_limit = self._pool.maxsize + self._max_overflow
+        self._foreign_slots: threading.BoundedSemaphore | None = None
+        if self._pool.maxsize > 0 and self._max_overflow >= 0:
+            self._foreign_slots = threading.BoundedSemaphore(self._foreign_limit)
+
+    def stats(self) -> ConnectionPoolStats:
+        """Returns a snapshot of the pool's gauges and counters."""
+        return ConnectionPoolStats(
+            pool_size=self.size(),
+            max_overflow=self._max_overflow,
+            checked_out=self.checkedout(),
+            idle=self.checkedin(),
+            overflow=max(0, self.overflow()),
+            checkouts=self._checkouts,
+            checkout_seconds_total=self._checkout_seconds_total,
+            checkout_seconds_max=self._checkout_seconds_max,
+            connects=self._connects,
+            connect_seconds_total=self._connect_seconds_total,
+            connect_seconds_max=self._connect_seconds_max,
+            foreign_loop_connections=self._foreign_loop_connections,
+        )
+
+    def _create_connection(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        record = super()._create_connection()
+        elapsed = time.perf_counter() - started
+        self._connects += 1
+        self._connect_seconds_total += elapsed
+        self._connect_seconds_max = max(self._connect_seconds_max, elapsed)
+        return record
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        loop = _running_loop()
+        if loop is not None and loop is not self._owner_loop:
+            if self._owner_loop is not None and not self._owner_loop.is_closed():
+                self._acquire_foreign_slot()
+                try:
+                    record = self._create_connection()
+                except BaseException:
+                    self._release_foreign_slot()
+                    raise
+                record.info[_FOREIGN_LOOP_KEY] = True
+                self._foreign_loop_connections += 1
+                return record
+            self._adopt_loop(loop)
+
+        started = time.perf_counter()
+        record = super()._do_get()
+        elapsed = time.perf_counter() - started
+        self._checkouts += 1
+        self._checkout_seconds_total += elapsed
+        self._checkout_seconds_max = max(self._checkout_seconds_max, elapsed)
+        return record
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        if record.info.pop(_FOREIGN_LOOP_KEY, False):
+            record.close()
+            self._release_foreign_slot()
+            return
+        super()._do_return_conn(record)
+
+    def _acquire_foreign_slot(self) -> None:
+        """Wait for a foreign-loop connection slot, up to the pool timeout."""
+        if self._foreign_slots is None:
+            return
+        deadline = time.monotonic() + self._timeout
+        while not self._foreign_slots.acquire(blocking=False):
+            if time.monotonic() >= deadline:
+                raise exc.TimeoutError(
+                    f"Foreign event loop connection limit of {self._foreign_limit} "
+                    f"reached, connection timed out, timeout {self._timeout:.2f}",
+                    code="3o7r",
+                )
+            # Sleep on the calling loop so its own connections can be returned
+            await_only(asyncio.sleep(_FOREIGN_SLOT_POLL_SECONDS))
+
+    def _release_foreign_slot(self) -> None:
+        if self._foreign_slots is not None:
+            self._foreign_slots.release()
+
+    def _adopt_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._owner_loop is not None:
+            logger.info(
+                "Database pool's event loop has closed; discarding its connections."
+            )
+            self.dispose()
+            # The queue's waiters were bound to the old loop, so take the
+            # empty queue of a freshly configured pool
+            self._pool = self.recreate()._pool
+        self._owner_loop = loop
+
+
+def get_connection_pool_stats(engine: AsyncEngine) -> ConnectionPoolStats | None:
+    """Returns pool stats for the engine, or None if it does not pool connections."""
+    pool = engine.pool
+    if isinstance(pool, LoopOwnedQueuePool):
+        return pool.stats()
+    return None
@@ -8,16 +8,19 @@ enabling dependency injection for testing and centralizing retry logic.
 import asyncio
 import logging
 import random
+import re
 from collections.abc import Callable
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
-from sqlalchemy import TextClause, event
+from sqlalchemy import TextClause
 from sqlalchemy.engine import CursorResult  # CursorResult added
 from sqlalchemy.exc import DBAPIError, IntegrityError, ProgrammingError
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 from sqlalchemy.sql import Delete, Insert, Select, Update
 
+from family_assistant.storage.base import get_reader_engine
+
 # PostgreSQL SQLSTATE codes - the authoritative way to identify error types
 # See: https://www.postgresql.org/docs/current/errcodes-appendix.html
 PGCODE_IN_FAILED_SQL_TRANSACTION = "25P02"  # Transaction is aborted
@@ -128,6 +131,22 @@ def _is_non_retryable_postgres_error(
     return False, ""
 
 
+class ReadOnlyContextError(RuntimeError):
+    """Raised when a read-only DatabaseContext is asked to write."""
+
+
+_WRITE_SQL_PREFIX = re.compile(
+    r"^\s*(INSERT|UPDATE|DELETE|REPLACE|UPSERT|CREATE|DROP|ALTER|TRUNCATE)\b",
+    re.IGNORECASE,
+)
+
+
+def _is_write_statement(query: Select | Insert | Update | Delete | TextClause) -> bool:
+    if isinstance(query, Insert | Update | Delete):
+        return True
+    return isinstance(query, TextClause) and bool(_WRITE_SQL_PREFIX.match(query.text))
+
+
 class DatabaseContext:
     """
     Context manager for database operations with retry logic.
@@ -142,6 +161,7 @@ class DatabaseContext:
         max_retries: int = 3,
         base_delay: float = 0.5,
         message_notifier: "MessageNotifier | None" = None,
+        readonly: bool = False,
     ) -> None:
         """
         Initialize the database context.
@@ -152,6 +172,10 @@ class DatabaseContext:
             max_retries: Maximum number of retries for database operations.
             base_delay: Base delay in seconds for exponential backoff.
             message_notifier: Optional MessageNotifier instance for live message updates.
+            readonly: If True, run without a transaction on the engine's reader
+                connections (see storage.base.get_reader_engine). Each query
+                sees the latest committed data, and writes raise
+                ReadOnlyContextError.
         """
         if engine is None:
             raise ValueError("DatabaseContext requires an engine to be provided")
@@ -159,8 +183,10 @@ class DatabaseContext:
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.message_notifier = message_notifier
+        self.readonly = readonly
         self.conn: AsyncConnection | None = None
         self._transaction_cm: AbstractAsyncContextManager[AsyncConnection] | None = None
+        self._on_commit_callbacks: list[Callable[[], Any]] = []
 
         # Repository instances (lazy-loaded)
         self._notes = None
@@ -176,11 +202,31 @@ class DatabaseContext:
         self._worker_tasks = None
 
     async def __aenter__(self) -> "DatabaseContext":
-        """Enter the async context manager, starting a transaction."""
+        """Enter the async context manager, starting a transaction.
+
+        Read-only contexts instead check out an autocommit connection, so they
+        skip the BEGIN/COMMIT round trips and hold no transaction open.
+        """
         if self._transaction_cm is not None:
             # This shouldn't happen if used correctly with 'async with'
             raise RuntimeError("DatabaseContext is not reentrant")
 
+        if self.readonly:
+            self._transaction_cm = get_reader_engine(self.engine).connect()
+            conn = await self._transaction_cm.__aenter__()
+            if conn.dialect.name == "sqlite":
+                # pysqlite only opens a transaction for writes, so plain
+                # SELECTs on the query-only readers already run unwrapped
+                self.conn = conn
+                return self
+            try:
+                self.conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            except BaseException as e:
+                await self._transaction_cm.__aexit__(type(e), e, e.__traceback__)
+                self._transaction_cm = None
+                raise
+            return self
+
         # Get the transaction context manager from engine.begin()
         self._transaction_cm = self.engine.begin()
         # Enter the transaction context manager to get the connection
@@ -198,6 +244,7 @@ class DatabaseContext:
             # This shouldn't happen if __aenter__ succeeded
             return
 
+        callbacks, self._on_commit_callbacks = self._on_commit_callbacks, []
         try:
             # Exit the underlying transaction context manager, which handles commit/rollback
             await self._transaction_cm.__aexit__(exc_type, exc_val, exc_tb)
@@ -206,6 +253,13 @@ class DatabaseContext:
             self.conn = None
             self._transaction_cm = None
 
+        if exc_type is None:
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(f"Error in on_commit callback: {e}", exc_info=True)
+
     # Removed begin, commit, rollback methods
 
     async def execute_with_retry(
@@ -230,6 +284,10 @@ class DatabaseContext:
         """
         if self.conn is None:
             raise RuntimeError("No active database connection")
+        if self.readonly and _is_write_statement(query):
+            raise ReadOnlyContextError(
+                f"Write attempted in a read-only DatabaseContext: {query}"
+            )
 
         for attempt in range(self.max_retries):
             try:
@@ -353,7 +411,7 @@ class DatabaseContext:
 
     def on_commit(self, callback: Callable[[], Any]) -> Callable[[], Any]:
         """
-        Register a callback to be called on transaction commit.
+        Register a callback to be called after the transaction commits.
 
         Args:
             callback: A callable to be executed on commit.
@@ -361,6 +419,10 @@ class DatabaseContext:
         Returns:
             The original callback for chaining.
         """
+        if self.readonly:
+            raise ReadOnlyContextError(
+                "on_commit called in a read-only DatabaseContext"
+            )
         if (
             self.conn is None or not self.conn.in_transaction()
         ):  # Check for active transaction
@@ -368,12 +430,9 @@ class DatabaseContext:
                 "on_commit called without an active database connection or outside of a transaction context."
             )
 
-        # Wrapper to call the original callback without arguments
-        def event_listener_wrapper(*args: object, **kwargs: object) -> None:  # noqa: ARG001
-            callback()
-
-        # Register the wrapper with the transaction context manager
-        event.listen(self.conn.sync_connection, "commit", event_listener_wrapper)
+        # Run from __aexit__ once the commit has completed, so that anything the
+        # callback wakes up (e.g. a task worker) can already see the new rows.
+        self._on_commit_callbacks.append(callback)
         return callback
 
     @property
@@ -511,6 +570,7 @@ def get_db_context(
     max_retries: int = 3,
     base_delay: float = 0.5,
     message_notifier: "MessageNotifier | None" = None,
+    readonly: bool = False,
 ) -> DatabaseContext:
     """
     Creates an instance of DatabaseContext.
@@ -523,6 +583,9 @@ def get_db_context(
         max_retries: Maximum number of retries for database operations.
         base_delay: Base delay in seconds for exponential backoff.
         message_notifier: Optional MessageNotifier instance for live message updates.
+        readonly: Create a transaction-free context for query-only call sites.
+            On SQLite it uses the reader connections; writes raise
+            ReadOnlyContextError.
 
     Returns:
         A DatabaseContext instance.
@@ -534,4 +597,6 @@ def get_db_context(
             result = await db.fetch_all(...)
         ```
     """
-    return DatabaseContext(engine, max_retries, base_delay, message_notifier)
+    return DatabaseContext(
+        engine, max_retries, base_delay, message_notifier, readonly=readonly
+    )
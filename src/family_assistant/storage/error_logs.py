@@ -43,6 +43,11 @@ error_logs_table = Table(
     Column("function_name", String(255)),
     # Additional metadata
     Column("extra_data", JSON),
+    # Deduplication: repeats of the same error (see SQLAlchemyErrorHandler) update
+    # one row instead of inserting new ones. `timestamp` is the first occurrence.
+    Column("fingerprint", String(64), nullable=True, index=True),
+    Column("occurrence_count", Integer, nullable=False, default=1, server_default="1"),
+    Column("last_seen", DateTime(timezone=True), nullable=True),
 )
 
 
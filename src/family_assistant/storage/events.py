@@ -12,6 +12,7 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    ForeignKey,
     Index,
     Integer,
     String,
@@ -144,6 +145,25 @@ recent_events_table = Table(
     # Indexes for efficient querying
     Index("idx_source_time", "source_id", "timestamp"),
     Index("idx_created", "created_at"),  # For efficient cleanup
+    Index("idx_recent_events_time_id", "timestamp", "id"),  # Keyset pagination
+)
+
+
+# Normalized record of which listeners each recent event triggered. Mirrors
+# recent_events.triggered_listener_ids so listener lookups can use an index.
+# listener_id deliberately has no foreign key: history outlives deleted listeners.
+event_listener_triggers_table = Table(
+    "event_listener_triggers",
+    metadata,
+    Column(
+        "event_id",
+        Integer,
+        ForeignKey("recent_events.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("listener_id", Integer, primary_key=True),
+    Column("timestamp", DateTime(timezone=True), nullable=False),
+    Index("idx_listener_triggers_listener_time", "listener_id", "timestamp"),
 )
 
 
@@ -12,6 +12,7 @@ from sqlalchemy import (
     BigInteger,
     Column,
     DateTime,
+    Index,
     Integer,  # Import Integer
     Select,  # Used in cast() for type checking
     String,
@@ -89,6 +90,29 @@ message_history_table = Table(
     ),  # Provider-specific metadata for round-trip (e.g., thought signatures)
 )
 
+# Length of the last-message preview kept in conversation_summaries
+CONVERSATION_PREVIEW_LENGTH = 100
+
+# One row per conversation, maintained by MessageHistoryRepository.add_message so
+# the conversations list doesn't have to aggregate the whole message_history table.
+# Only user/assistant messages are counted. The last_* columns describe the newest
+# such message with content and stay NULL until one arrives.
+conversation_summaries_table = Table(
+    "conversation_summaries",
+    metadata,
+    Column("conversation_id", String(255), primary_key=True),
+    Column("interface_type", String(50), nullable=False, index=True),
+    Column("message_count", Integer, nullable=False, default=0),
+    Column("last_message_id", Integer, nullable=True),
+    Column("last_message", Text, nullable=True),
+    Column("last_timestamp", DateTime(timezone=True), nullable=True),
+    Index(
+        "idx_conversation_summaries_last_ts",
+        "last_timestamp",
+        "conversation_id",
+    ),
+)
+
 
 async def add_message_to_history(
     db_context: DatabaseContext,  # Added context
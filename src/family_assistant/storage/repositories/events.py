@@ -5,8 +5,7 @@ import time
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import String, cast, delete, insert, select, update
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import and_, delete, exists, insert, or_, select, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.sql import functions as func
 
@@ -14,6 +13,7 @@ from family_assistant.storage.datetime_utils import normalize_datetime
 from family_assistant.storage.events import (
     EventActionType,
     EventSourceType,
+    event_listener_triggers_table,
     event_listeners_table,
     recent_events_table,
 )
@@ -540,16 +540,34 @@ class EventsRepository(BaseRepository):
             # Generate unique event ID
             event_id = f"{source_id}:{int(time.time() * 1000000)}"
 
-            stmt = insert(recent_events_table).values(
-                event_id=event_id,
-                source_id=source_id,
-                event_data=event_data,
-                triggered_listener_ids=triggered_listener_ids,
-                timestamp=timestamp,
-                created_at=datetime.now(UTC),
+            stmt = (
+                insert(recent_events_table)
+                .values(
+                    event_id=event_id,
+                    source_id=source_id,
+                    event_data=event_data,
+                    triggered_listener_ids=triggered_listener_ids,
+                    timestamp=timestamp,
+                    created_at=datetime.now(UTC),
+                )
+                .returning(recent_events_table.c.id)
             )
 
-            await self._db.execute_with_retry(stmt)
+            result = await self._db.execute_with_retry(stmt)
+            row_id = result.scalar_one()  # type: ignore[attr-defined]
+
+            # Mirror triggered listeners into the junction table for indexed lookups
+            if triggered_listener_ids:
+                await self._db.execute_with_retry(
+                    insert(event_listener_triggers_table).values([
+                        {
+                            "event_id": row_id,
+                            "listener_id": listener_id,
+                            "timestamp": timestamp,
+                        }
+                        for listener_id in dict.fromkeys(triggered_listener_ids)
+                    ])
+                )
 
         except SQLAlchemyError as e:
             self._logger.error(f"Database error in store_event: {e}", exc_info=True)
@@ -618,6 +636,18 @@ class EventsRepository(BaseRepository):
         try:
             cutoff_time = datetime.now(UTC) - timedelta(hours=retention_hours)
 
+            # Delete triggers explicitly; SQLite does not enforce ON DELETE CASCADE
+            # unless foreign keys are enabled on the connection
+            await self._db.execute_with_retry(
+                delete(event_listener_triggers_table).where(
+                    event_listener_triggers_table.c.event_id.in_(
+                        select(recent_events_table.c.id).where(
+                            recent_events_table.c.created_at < cutoff_time
+                        )
+                    )
+                )
+            )
+
             stmt = delete(recent_events_table).where(
                 recent_events_table.c.created_at < cutoff_time
             )
@@ -688,54 +718,103 @@ class EventsRepository(BaseRepository):
         limit: int = 50,
         offset: int = 0,
         only_triggered: bool = False,
+        before_timestamp: datetime | None = None,
+        before_id: int | None = None,
     ) -> tuple[list[dict], int]:
-        """Get events with listener information."""
+        """
+        Get events with listener information, newest first.
+
+        Pages can be requested either by offset or, more efficiently for deep
+        pages, by keyset: pass the timestamp and id of the last event on the
+        previous page as before_timestamp/before_id (offset is then ignored).
+
+        Args:
+            source_id: Filter by event source
+            hours: How many hours back to look
+            limit: Maximum number of events to return
+            offset: Number of events to skip (ignored with before_timestamp)
+            only_triggered: Only return events that triggered a listener
+            before_timestamp: Return events older than this (keyset pagination)
+            before_id: Tie-breaker id for events sharing before_timestamp
+
+        Returns:
+            Tuple of (events, total matching events ignoring pagination)
+        """
         try:
             cutoff_time = datetime.now(UTC) - timedelta(hours=hours)
 
-            # Build base query
-            stmt = select(recent_events_table).where(
-                recent_events_table.c.timestamp >= cutoff_time
-            )
-
+            conditions = [recent_events_table.c.timestamp >= cutoff_time]
             if source_id:
-                stmt = stmt.where(recent_events_table.c.source_id == source_id)
-
+                conditions.append(recent_events_table.c.source_id == source_id)
             if only_triggered:
-                stmt = stmt.where(
-                    recent_events_table.c.triggered_listener_ids.isnot(None)
+                conditions.append(
+                    exists().where(
+                        event_listener_triggers_table.c.event_id
+                        == recent_events_table.c.id
+                    )
                 )
 
             # Get total count
-            count_stmt = select(func.count().label("count")).select_from(
-                stmt.alias("events_subquery")
-            )
+            count_stmt = select(func.count().label("count")).where(*conditions)
             count_result = await self._db.fetch_one(count_stmt)
             total_count = count_result["count"] if count_result else 0
 
             # Apply pagination and ordering
-            stmt = stmt.order_by(recent_events_table.c.timestamp.desc())
-            stmt = stmt.limit(limit).offset(offset)
-
-            rows = await self._db.fetch_all(stmt)
-
-            # Process events and add listener names
-            events = []
-            for row in rows:
-                event = dict(row)
-
-                # Get listener names if any were triggered
-                if event.get("triggered_listener_ids"):
-                    listener_names = []
-                    for lid in event["triggered_listener_ids"]:
-                        listener = await self.get_event_listener_by_id(lid)
-                        if listener:
-                            listener_names.append(listener["name"])
-                    event["triggered_listener_names"] = listener_names
-                else:
-                    event["triggered_listener_names"] = []
-
-                events.append(event)
+            stmt = select(recent_events_table).where(*conditions)
+            if before_timestamp is not None:
+                keyset = recent_events_table.c.timestamp < before_timestamp
+                if before_id is not None:
+                    keyset = or_(
+                        keyset,
+                        and_(
+                            recent_events_table.c.timestamp == before_timestamp,
+                            recent_events_table.c.id < before_id,
+                        ),
+                    )
+                stmt = stmt.where(keyset)
+            else:
+                stmt = stmt.offset(offset)
+            stmt = stmt.order_by(
+                recent_events_table.c.timestamp.desc(),
+                recent_events_table.c.id.desc(),
+            ).limit(limit)
+
+            events = [dict(row) for row in await self._db.fetch_all(stmt)]
+
+            # Look up listener names for the whole page in one query
+            names_by_event: dict[int, dict[int, str]] = {}
+            if events:
+                names_stmt = (
+                    select(
+                        event_listener_triggers_table.c.event_id,
+                        event_listener_triggers_table.c.listener_id,
+                        event_listeners_table.c.name,
+                    )
+                    .select_from(
+                        event_listener_triggers_table.join(
+                            event_listeners_table,
+                            event_listeners_table.c.id
+                            == event_listener_triggers_table.c.listener_id,
+                        )
+                    )
+                    .where(
+                        event_listener_triggers_table.c.event_id.in_([
+                            event["id"] for event in events
+                        ])
+                    )
+                )
+                for row in await self._db.fetch_all(names_stmt):
+                    names_by_event.setdefault(row["event_id"], {})[
+                        row["listener_id"]
+                    ] = row["name"]
+
+            for event in events:
+                names = names_by_event.get(event["id"], {})
+                event["triggered_listener_names"] = [
+                    names[lid]
+                    for lid in event.get("triggered_listener_ids") or []
+                    if lid in names
+                ]
 
             return events, total_count
 
@@ -757,55 +836,27 @@ class EventsRepository(BaseRepository):
             if not listener:
                 return {}
 
-            # Check if we're using SQLite or PostgreSQL
-            is_sqlite = self._db.engine.dialect.name == "sqlite"
-
-            if is_sqlite:
-                # For SQLite, we need to use LIKE on the JSON string representation
-                # SQLite stores JSON as text, so we can search for the listener ID
-                # We need to search for both "[listener_id]" and "[listener_id," patterns
-                search_pattern = f"%{listener_id}%"
-
-                # Count total executions from recent_events
-                stmt = select(func.count().label("count")).select_from(
-                    recent_events_table
-                )
-                stmt = stmt.where(
-                    cast(recent_events_table.c.triggered_listener_ids, String).like(
-                        search_pattern
-                    )
-                )
-            else:
-                # For PostgreSQL, use the proper JSONB contains operator
-                stmt = select(func.count().label("count")).select_from(
-                    recent_events_table
-                )
-                stmt = stmt.where(
-                    recent_events_table.c.triggered_listener_ids.op("@>")(
-                        cast([listener_id], JSONB)
-                    )
-                )
-
+            # Count total executions via the indexed junction table
+            stmt = select(func.count().label("count")).where(
+                event_listener_triggers_table.c.listener_id == listener_id
+            )
             result = await self._db.fetch_one(stmt)
             total_executions = result["count"] if result else 0
 
             # Get recent events that triggered this listener
-            if is_sqlite:
-                recent_stmt = select(recent_events_table).where(
-                    cast(recent_events_table.c.triggered_listener_ids, String).like(
-                        search_pattern
-                    )
-                )
-            else:
-                recent_stmt = select(recent_events_table).where(
-                    recent_events_table.c.triggered_listener_ids.op("@>")(
-                        cast([listener_id], JSONB)
+            recent_stmt = (
+                select(recent_events_table)
+                .select_from(
+                    event_listener_triggers_table.join(
+                        recent_events_table,
+                        recent_events_table.c.id
+                        == event_listener_triggers_table.c.event_id,
                     )
                 )
-
-            recent_stmt = recent_stmt.order_by(
-                recent_events_table.c.timestamp.desc()
-            ).limit(10)
+                .where(event_listener_triggers_table.c.listener_id == listener_id)
+                .order_by(event_listener_triggers_table.c.timestamp.desc())
+                .limit(10)
+            )
 
             recent_events = await self._db.fetch_all(recent_stmt)
 
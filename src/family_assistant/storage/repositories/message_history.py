@@ -6,9 +6,21 @@ from dataclasses import asdict
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import insert, or_, select, update
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    case,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.sql import functions as func
 
 from family_assistant.llm.google_types import GeminiProviderMetadata
 from family_assistant.llm.messages import (
@@ -24,13 +36,20 @@ from family_assistant.llm.messages import (
     UserMessage,
 )
 from family_assistant.llm.tool_call import ToolCallFunction, ToolCallItem
-from family_assistant.storage.message_history import message_history_table
+from family_assistant.storage.message_history import (
+    CONVERSATION_PREVIEW_LENGTH,
+    conversation_summaries_table,
+    message_history_table,
+)
 from family_assistant.storage.repositories.base import BaseRepository
 
 # Note: ToolCallFunction, ToolCallItem, GeminiProviderMetadata are used in _process_message_row() method
 
 logger = logging.getLogger(__name__)
 
+# Roles that appear in the conversations list and its message counts
+SUMMARY_ROLES = ("user", "assistant")
+
 
 class MessageHistoryRepository(BaseRepository):
     """Repository for managing message history in the database."""
@@ -207,6 +226,15 @@ class MessageHistoryRepository(BaseRepository):
             row = result.one()  # type: ignore[attr-defined]
             internal_id = row[0]
 
+            if role in SUMMARY_ROLES:
+                await self._update_conversation_summary(
+                    conversation_id=conversation_id,
+                    interface_type=interface_type,
+                    internal_id=internal_id,
+                    timestamp=timestamp,
+                    content=content,
+                )
+
             self._logger.info(
                 f"Added message to history: role={role}, "
                 f"interface={interface_type}, internal_id={internal_id}"
@@ -231,6 +259,66 @@ class MessageHistoryRepository(BaseRepository):
             self._logger.error(f"Failed to add message to history: {e}", exc_info=True)
             return None
 
+    async def _update_conversation_summary(
+        self,
+        conversation_id: str,
+        interface_type: str,
+        internal_id: int,
+        timestamp: datetime,
+        content: str | None,
+    ) -> None:
+        """Fold a newly stored user/assistant message into conversation_summaries.
+
+        The count always increments. The last-message columns only move forward:
+        a message without content, or one older than the current last message
+        (e.g. imported history), leaves them untouched.
+        """
+        table = conversation_summaries_table
+        has_content = content is not None
+        values = {
+            "conversation_id": conversation_id,
+            "interface_type": interface_type,
+            "message_count": 1,
+            "last_message_id": internal_id if has_content else None,
+            "last_message": content[:CONVERSATION_PREVIEW_LENGTH]
+            if content is not None
+            else None,
+            "last_timestamp": timestamp if has_content else None,
+        }
+        if self._db.engine.dialect.name == "postgresql":
+            stmt = pg_insert(table).values(**values)
+        else:
+            stmt = sqlite_insert(table).values(**values)
+
+        excluded = stmt.excluded
+        is_newer = and_(
+            excluded.last_timestamp.isnot(None),
+            or_(
+                table.c.last_timestamp.is_(None),
+                excluded.last_timestamp > table.c.last_timestamp,
+                and_(
+                    excluded.last_timestamp == table.c.last_timestamp,
+                    excluded.last_message_id > table.c.last_message_id,
+                ),
+            ),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["conversation_id"],
+            set_={
+                "message_count": table.c.message_count + 1,
+                **{
+                    column: case((is_newer, excluded[column]), else_=table.c[column])
+                    for column in (
+                        "interface_type",
+                        "last_message_id",
+                        "last_message",
+                        "last_timestamp",
+                    )
+                },
+            },
+        )
+        await self._db.execute_with_retry(stmt)
+
     async def get_recent(
         self,
         interface_type: str,
@@ -1163,155 +1251,210 @@ class MessageHistoryRepository(BaseRepository):
         conversation_id: str | None = None,
         date_from: datetime | None = None,
         date_to: datetime | None = None,
+        before_timestamp: datetime | None = None,
+        before_conversation_id: str | None = None,
         # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
     ) -> tuple[list[dict[str, Any]], int]:
         """
-        Get conversation summaries with pagination, optimized for performance.
+        Get conversation summaries with pagination, newest conversation first.
+
+        Reads the incrementally maintained conversation_summaries table. Date
+        filters restrict which messages are counted, so those requests fall back
+        to aggregating message_history.
 
         Args:
             interface_type: Filter by interface type (None for all interfaces)
             limit: Maximum number of conversations to return
-            offset: Number of conversations to skip for pagination
+            offset: Number of conversations to skip for pagination (ignored when
+                before_timestamp is given)
             conversation_id: Filter by specific conversation ID
             date_from: Filter conversations with messages after this date
             date_to: Filter conversations with messages before this date
+            before_timestamp: Keyset cursor - only return conversations whose last
+                message is older than this (or equally old with a smaller
+                conversation_id than before_conversation_id)
+            before_conversation_id: Tie-breaker for before_timestamp
 
         Returns:
             Tuple of (summaries list, total count)
         """
-        # Build base conditions
-        base_conditions = []
-        base_conditions.append(message_history_table.c.role.in_(["user", "assistant"]))
-        base_conditions.append(message_history_table.c.content.isnot(None))
+        if date_from or date_to:
+            conditions: list[ColumnElement[bool]] = [
+                message_history_table.c.role.in_(SUMMARY_ROLES)
+            ]
+            if interface_type:
+                conditions.append(
+                    message_history_table.c.interface_type == interface_type
+                )
+            if conversation_id:
+                conditions.append(
+                    message_history_table.c.conversation_id == conversation_id
+                )
+            if date_from:
+                conditions.append(message_history_table.c.timestamp >= date_from)
+            if date_to:
+                conditions.append(message_history_table.c.timestamp <= date_to)
+            source = self._conversation_aggregate_query(conditions).subquery()
+        else:
+            source = conversation_summaries_table
 
+        filters: list[ColumnElement[bool]] = [source.c.last_timestamp.isnot(None)]
         if interface_type:
-            base_conditions.append(
-                message_history_table.c.interface_type == interface_type
-            )
-
+            filters.append(source.c.interface_type == interface_type)
         if conversation_id:
-            base_conditions.append(
-                message_history_table.c.conversation_id == conversation_id
-            )
+            filters.append(source.c.conversation_id == conversation_id)
 
-        if date_from:
-            base_conditions.append(message_history_table.c.timestamp >= date_from)
+        count_query = (
+            select(func.count().label("count")).select_from(source).where(*filters)
+        )
 
-        if date_to:
-            base_conditions.append(message_history_table.c.timestamp <= date_to)
+        page_filters = list(filters)
+        if before_timestamp is not None:
+            before_key = source.c.last_timestamp < before_timestamp
+            if before_conversation_id is not None:
+                before_key = or_(
+                    before_key,
+                    and_(
+                        source.c.last_timestamp == before_timestamp,
+                        source.c.conversation_id < before_conversation_id,
+                    ),
+                )
+            page_filters.append(before_key)
 
-        # Subquery to get the latest message id and count per conversation
-        # We get the max internal_id within the max timestamp to handle timestamp collisions
-        latest_msg_subq = (
+        summaries_query = (
             select(
-                message_history_table.c.conversation_id,
-                func.max(message_history_table.c.timestamp).label("max_timestamp"),
+                source.c.conversation_id,
+                source.c.last_message,
+                source.c.last_timestamp,
+                source.c.interface_type,
+                source.c.message_count,
             )
-            .where(*base_conditions)
-            .group_by(message_history_table.c.conversation_id)
-            .subquery()
+            .where(*page_filters)
+            .order_by(source.c.last_timestamp.desc(), source.c.conversation_id.desc())
+            .limit(limit)
         )
+        if before_timestamp is None:
+            summaries_query = summaries_query.offset(offset)
 
-        # Get the max internal_id for messages with the latest timestamp
-        latest_id_subq = (
-            select(
-                message_history_table.c.conversation_id,
-                func.max(message_history_table.c.internal_id).label("max_id"),
-            )
-            .join(
-                latest_msg_subq,
-                (
-                    message_history_table.c.conversation_id
-                    == latest_msg_subq.c.conversation_id
-                )
-                & (
-                    message_history_table.c.timestamp == latest_msg_subq.c.max_timestamp
-                ),
-            )
-            .where(*base_conditions)
-            .group_by(message_history_table.c.conversation_id)
-            .subquery()
-        )
+        summaries_rows = await self._db.fetch_all(summaries_query)
+        count_row = await self._db.fetch_one(count_query)
+        total_count = count_row["count"] if count_row else 0
 
-        # Get message counts per conversation (without content filter)
-        count_conditions = []
-        count_conditions.append(message_history_table.c.role.in_(["user", "assistant"]))
+        summaries = []
+        for row in summaries_rows:
+            summaries.append({
+                "conversation_id": row["conversation_id"],
+                "last_message": (row["last_message"] or "")[
+                    :CONVERSATION_PREVIEW_LENGTH
+                ],
+                "last_timestamp": row["last_timestamp"],
+                "message_count": row["message_count"],
+                "interface_type": row["interface_type"],
+            })
 
-        if interface_type:
-            count_conditions.append(
-                message_history_table.c.interface_type == interface_type
-            )
+        return summaries, total_count
 
-        if conversation_id:
-            count_conditions.append(
-                message_history_table.c.conversation_id == conversation_id
+    async def rebuild_conversation_summaries(self) -> int:
+        """
+        Recompute conversation_summaries from message_history.
+
+        Used for maintenance after messages are edited or deleted outside
+        add_message.
+
+        Returns:
+            Number of conversations summarised
+        """
+        aggregate = self._conversation_aggregate_query([
+            message_history_table.c.role.in_(SUMMARY_ROLES)
+        ])
+        await self._db.execute_with_retry(delete(conversation_summaries_table))
+        await self._db.execute_with_retry(
+            insert(conversation_summaries_table).from_select(
+                [
+                    "conversation_id",
+                    "interface_type",
+                    "message_count",
+                    "last_message_id",
+                    "last_message",
+                    "last_timestamp",
+                ],
+                aggregate,
+            )
+        )
+        count_row = await self._db.fetch_one(
+            select(func.count().label("count")).select_from(
+                conversation_summaries_table
             )
+        )
+        total = count_row["count"] if count_row else 0
+        self._logger.info(f"Rebuilt summaries for {total} conversations")
+        return total
 
-        if date_from:
-            count_conditions.append(message_history_table.c.timestamp >= date_from)
+    def _conversation_aggregate_query(
+        self, conditions: list[ColumnElement[bool]]
+    ) -> Select[Any]:
+        """
+        Build a per-conversation summary query over message_history.
 
-        if date_to:
-            count_conditions.append(message_history_table.c.timestamp <= date_to)
+        The result has the same columns as conversation_summaries. The last
+        message is the newest matching message with content (highest
+        internal_id among equal timestamps); conversations without one get
+        NULL last_* columns.
+
+        Args:
+            conditions: Filters applied to the messages being summarised
+        """
+        mh = message_history_table
+        with_content = [*conditions, mh.c.content.isnot(None)]
 
-        msg_count_subq = (
+        counts = (
             select(
-                message_history_table.c.conversation_id,
-                func.count(message_history_table.c.internal_id).label("msg_count"),
+                mh.c.conversation_id,
+                func.count(mh.c.internal_id).label("message_count"),
+                func.max(mh.c.interface_type).label("interface_type"),
             )
-            .where(*count_conditions)
-            .group_by(message_history_table.c.conversation_id)
+            .where(*conditions)
+            .group_by(mh.c.conversation_id)
             .subquery()
         )
-
-        # Main query to get conversation summaries with the latest message content
-        summaries_query = (
+        latest_ts = (
             select(
-                message_history_table.c.conversation_id,
-                message_history_table.c.content,
-                message_history_table.c.timestamp,
-                message_history_table.c.interface_type,  # Include interface_type in results
-                msg_count_subq.c.msg_count.label("message_count"),
+                mh.c.conversation_id,
+                func.max(mh.c.timestamp).label("max_timestamp"),
             )
-            .join(
-                latest_id_subq,
-                message_history_table.c.internal_id == latest_id_subq.c.max_id,
+            .where(*with_content)
+            .group_by(mh.c.conversation_id)
+            .subquery()
+        )
+        latest_id = (
+            select(
+                mh.c.conversation_id,
+                func.max(mh.c.internal_id).label("max_id"),
             )
             .join(
-                msg_count_subq,
-                message_history_table.c.conversation_id
-                == msg_count_subq.c.conversation_id,
+                latest_ts,
+                (mh.c.conversation_id == latest_ts.c.conversation_id)
+                & (mh.c.timestamp == latest_ts.c.max_timestamp),
             )
-            .where(
-                message_history_table.c.content.isnot(None),
-            )
-            .order_by(message_history_table.c.timestamp.desc())
-            .limit(limit)
-            .offset(offset)
-        )
-
-        # Count query - count conversations that have messages with content
-        count_subquery = (
-            select(message_history_table.c.conversation_id)
-            .where(*base_conditions)
-            .distinct()
+            .where(*with_content)
+            .group_by(mh.c.conversation_id)
             .subquery()
         )
-        count_query = select(func.count().label("count")).select_from(count_subquery)
-
-        # Execute queries
-        summaries_rows = await self._db.fetch_all(summaries_query)
-        count_row = await self._db.fetch_one(count_query)
-        total_count = count_row["count"] if count_row else 0
-
-        # Process results
-        summaries = []
-        for row in summaries_rows:
-            summaries.append({
-                "conversation_id": row["conversation_id"],
-                "last_message": row["content"][:100] if row["content"] else "",
-                "last_timestamp": row["timestamp"],
-                "message_count": row["message_count"],
-                "interface_type": row["interface_type"],  # Include interface_type
-            })
-
-        return summaries, total_count
+        last = mh.alias("last_message")
+
+        return select(
+            counts.c.conversation_id,
+            func.coalesce(last.c.interface_type, counts.c.interface_type).label(
+                "interface_type"
+            ),
+            counts.c.message_count,
+            last.c.internal_id.label("last_message_id"),
+            func.substr(last.c.content, 1, CONVERSATION_PREVIEW_LENGTH).label(
+                "last_message"
+            ),
+            last.c.timestamp.label("last_timestamp"),
+        ).select_from(
+            counts.outerjoin(
+                latest_id, counts.c.conversation_id == latest_id.c.conversation_id
+            ).outerjoin(last, last.c.internal_id == latest_id.c.max_id)
+        )
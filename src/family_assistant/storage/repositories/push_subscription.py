@@ -69,6 +69,23 @@ class PushSubscriptionRepository(BaseRepository):
         result = await self._db.execute_with_retry(stmt)
         return result.rowcount  # type: ignore[attr-defined]
 
+    async def delete_many(self, subscription_ids: list[int]) -> int:
+        """Delete several push subscriptions by ID in one statement.
+
+        Args:
+            subscription_ids: The subscription IDs to delete
+
+        Returns:
+            Number of rows deleted
+        """
+        if not subscription_ids:
+            return 0
+        stmt = push_subscriptions_table.delete().where(
+            push_subscriptions_table.c.id.in_(subscription_ids)
+        )
+        result = await self._db.execute_with_retry(stmt)
+        return result.rowcount  # type: ignore[attr-defined]
+
     async def delete_by_endpoint(self, user_identifier: str, endpoint: str) -> int:
         """Delete push subscriptions by endpoint URL for a specific user.
 
@@ -1,39 +1,24 @@
 """Repository for tasks storage operations."""
 
-import asyncio
 import logging
-from asyncio import Event
 from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 
-from sqlalchemy import and_, insert, or_, select, update
+from sqlalchemy import and_, case, insert, or_, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.sql import functions as func
 
 from family_assistant.storage.repositories.base import BaseRepository
-from family_assistant.storage.tasks import tasks_table
+from family_assistant.storage.tasks import notify_task_scheduled, tasks_table
 from family_assistant.storage.types import TaskDict
 
 logger = logging.getLogger(__name__)
 
-# Module state for task notifications
-_task_event: Event | None = None
-
-
-def get_task_event() -> Event:
-    """Get the event that's set when new tasks are available.
-
-    This event is automatically set when immediate tasks are enqueued.
-    Task workers can wait on this event to be notified of new work.
-
-    Returns:
-        The global task notification event
-    """
-    global _task_event
-    if _task_event is None:
-        _task_event = asyncio.Event()
-    return _task_event
+# Task timeout: tasks stuck in processing state for longer than this will be reclaimed
+# Must be significantly larger than TASK_HANDLER_TIMEOUT (300s/5m) to prevent
+# race conditions where a running worker is treated as stalled.
+STALE_TASK_TIMEOUT = timedelta(minutes=15)
 
 
 class TasksRepository(BaseRepository):
@@ -140,12 +125,7 @@ class TasksRepository(BaseRepository):
             if stmt is not None:
                 await self._db.execute_with_retry(stmt)
 
-            # If task is immediate and we're in the main context, set the event
-            if not processed_scheduled_at or processed_scheduled_at <= datetime.now(
-                UTC
-            ):
-                event = get_task_event()
-                event.set()
+            self._notify_on_commit(processed_scheduled_at)
 
             logger.info(
                 f"Successfully enqueued task: {task_id} (type: {task_type}, scheduled: {processed_scheduled_at})"
@@ -172,6 +152,60 @@ class TasksRepository(BaseRepository):
             )
             raise
 
+    def _notify_on_commit(self, scheduled_at: datetime | None) -> None:
+        """Tell task workers about a pending task once it is visible to them."""
+        conn = self._db.conn
+        if conn is not None and conn.in_transaction():
+            self._db.on_commit(lambda: notify_task_scheduled(scheduled_at))
+        else:
+            notify_task_scheduled(scheduled_at)
+
+    async def get_next_due_time(
+        self, task_types: list[str], current_time: datetime
+    ) -> datetime | None:
+        """Returns when the next task of the given types can be dequeued.
+
+        A single aggregate over the claimable tasks, much cheaper than a
+        dequeue attempt; idle workers use it to sleep until the next task is
+        due instead of polling.
+
+        Args:
+            task_types: Task types the worker handles
+            current_time: Current time for scheduling checks
+
+        Returns:
+            current_time if a task can be dequeued now, the earliest future
+            scheduled_at otherwise, or None if there are no pending tasks
+        """
+        stale_task_cutoff = current_time - STALE_TASK_TIMEOUT
+        stale_processing = and_(
+            tasks_table.c.status == "processing",
+            tasks_table.c.locked_at <= stale_task_cutoff,
+        )
+        claimable_now = or_(
+            stale_processing,
+            tasks_table.c.scheduled_at.is_(None),
+            tasks_table.c.scheduled_at <= current_time,
+        )
+        stmt = select(
+            func.min(tasks_table.c.scheduled_at).label("next_at"),
+            func.sum(case((claimable_now, 1), else_=0)).label("due_count"),
+        ).where(
+            or_(tasks_table.c.status == "pending", stale_processing),
+            tasks_table.c.task_type.in_(task_types),
+            tasks_table.c.retry_count <= tasks_table.c.max_retries,
+        )
+        row = await self._db.fetch_one(stmt)
+        if not row:
+            return None
+        if row["due_count"]:
+            return current_time
+        next_at = row["next_at"]
+        if next_at is not None and next_at.tzinfo is None:
+            # SQLite returns naive datetimes (stored as UTC)
+            next_at = next_at.replace(tzinfo=UTC)
+        return next_at
+
     async def dequeue(
         self,
         worker_id: str,
@@ -194,11 +228,7 @@ class TasksRepository(BaseRepository):
             f"DEQUEUE START: Worker {worker_id} searching for tasks of types {task_types} at {current_time}"
         )
 
-        # Task timeout: tasks stuck in processing state for longer than this will be reclaimed
-        # Must be significantly larger than TASK_HANDLER_TIMEOUT (300s/5m) to prevent
-        # race conditions where a running worker is treated as stalled.
-        task_timeout_minutes = 15
-        stale_task_cutoff = current_time - timedelta(minutes=task_timeout_minutes)
+        stale_task_cutoff = current_time - STALE_TASK_TIMEOUT
 
         if self._db.engine.dialect.name == "postgresql":
             # PostgreSQL: Use SELECT FOR UPDATE SKIP LOCKED for true atomic dequeue
@@ -549,6 +579,7 @@ class TasksRepository(BaseRepository):
                 f"Successfully queued task {task['task_id']} for manual retry. "
                 f"Max retries increased to {new_max_retries}."
             )
+            self._notify_on_commit(None)
             return True
         else:
             logger.error(f"Failed to update task {task['task_id']} for manual retry.")
@@ -5,6 +5,7 @@ Handles storage and retrieval of background tasks using the database queue.
 import asyncio
 import logging
 from asyncio import Event
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
@@ -53,6 +54,42 @@ def get_task_event() -> Event:
     return _task_event
 
 
+# Callbacks told the scheduled_at (None = immediate) of each committed task
+_task_scheduled_listeners: list[Callable[[datetime | None], None]] = []
+
+
+def add_task_scheduled_listener(listener: Callable[[datetime | None], None]) -> None:
+    """Register a callback invoked whenever a task becomes pending.
+
+    Task workers use this to learn about future tasks without polling; the
+    callback may run on any thread and must not block.
+    """
+    _task_scheduled_listeners.append(listener)
+
+
+def remove_task_scheduled_listener(
+    listener: Callable[[datetime | None], None],
+) -> None:
+    """Unregister a callback added with add_task_scheduled_listener."""
+    if listener in _task_scheduled_listeners:
+        _task_scheduled_listeners.remove(listener)
+
+
+def notify_task_scheduled(scheduled_at: datetime | None) -> None:
+    """Announce a newly pending task once it has been committed.
+
+    Sets the task event for immediate tasks and passes the scheduled time to
+    every registered listener.
+    """
+    if scheduled_at is None or scheduled_at <= datetime.now(UTC):
+        get_task_event().set()
+    for listener in list(_task_scheduled_listeners):
+        try:
+            listener(scheduled_at)
+        except Exception as e:
+            logger.error(f"Task scheduled listener failed: {e}", exc_info=True)
+
+
 # Define the tasks table for the message queue
 tasks_table = Table(
     "tasks",
@@ -195,18 +232,15 @@ async def enqueue_task(
         logger.info(
             f"{'Updated' if is_system_task else 'Enqueued'} task {task_id} (Type: {task_type}, Original: {values_to_insert.get('original_task_id')}, Recurrence: {'Yes' if recurrence_rule else 'No'})."
         )
-        is_immediate = scheduled_at is None or scheduled_at <= datetime.now(UTC)
-        if is_immediate:
-            # Automatically notify workers about immediate tasks
-            event = get_task_event()
 
-            def notify() -> None:
-                event.set()
-                logger.info(f"Notified worker about immediate task {task_id}.")
+        # Notify workers once the transaction commits: immediate tasks wake them,
+        # future tasks let them shorten their sleep to the new deadline.
+        def notify() -> None:
+            notify_task_scheduled(processed_scheduled_at)
+            logger.info(f"Notified worker about task {task_id}.")
 
-            # Trigger eager task execution after the transaction commits.
-            logger.info("Scheduling worker task notification for transaction commit.")
-            db_context.on_commit(notify)
+        logger.info("Scheduling worker task notification for transaction commit.")
+        db_context.on_commit(notify)
     except ValueError:  # Re-raise specific errors
         raise
     except SQLAlchemyError as e:
@@ -443,10 +477,9 @@ async def manually_retry_task(
                 f"Successfully set task with internal ID {internal_task_id} for manual retry. New max_retries: {task_row['max_retries'] + 1}."
             )
             # Notify workers about the retry
-            event = get_task_event()
 
             def notify() -> None:
-                event.set()
+                notify_task_scheduled(None)
                 logger.info(
                     f"Notified worker about manual retry for task internal ID {internal_task_id}."
                 )
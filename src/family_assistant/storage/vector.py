@@ -866,6 +866,45 @@ async def update_document_title_in_db(
         raise  # Re-raise to allow task retry or failure handling
 
 
+async def update_document_metadata_in_db(
+    db_context: DatabaseContext,
+    document_id: int,
+    # ast-grep-ignore: no-dict-any - Document metadata is free-form JSON
+    metadata_updates: dict[str, Any],
+) -> None:
+    """
+    Merges keys into the doc_metadata of a specific document.
+
+    Args:
+        db_context: The DatabaseContext to use for the operation.
+        document_id: The ID of the document to update.
+        metadata_updates: Top-level keys to set in the document's metadata.
+    """
+    try:
+        row = await db_context.fetch_one(
+            select(DocumentRecord.doc_metadata).where(DocumentRecord.id == document_id)
+        )
+        if row is None:
+            logger.warning(
+                f"No document found with ID {document_id} to update metadata."
+            )
+            return
+        merged_metadata = {**(row["doc_metadata"] or {}), **metadata_updates}
+        stmt = (
+            sa
+            .update(DocumentRecord)
+            .where(DocumentRecord.id == document_id)
+            .values(doc_metadata=merged_metadata)
+        )
+        await db_context.execute_with_retry(stmt)
+    except SQLAlchemyError as e:
+        logger.error(
+            f"Database error updating metadata for document ID {document_id}: {e}",
+            exc_info=True,
+        )
+        raise
+
+
 async def delete_document_embeddings(
     db_context: DatabaseContext, document_id: int
 ) -> None:
@@ -897,6 +936,7 @@ async def delete_document_embeddings(
 __all__ = [
     "init_vector_db",
     "update_document_title_in_db",  # Add new function to __all__
+    "update_document_metadata_in_db",
     "add_document",
     "get_document_by_source_id",
     "get_document_by_id",
@@ -39,7 +39,11 @@ if TYPE_CHECKING:
 from family_assistant.processing import ProcessingService
 from family_assistant.storage.context import DatabaseContext, get_db_context
 from family_assistant.storage.message_history import message_history_table
-from family_assistant.storage.tasks import get_task_event
+from family_assistant.storage.tasks import (
+    add_task_scheduled_listener,
+    get_task_event,
+    remove_task_scheduled_listener,
+)
 from family_assistant.storage.types import TaskDict
 from family_assistant.tools import ToolExecutionContext
 from family_assistant.utils.clock import Clock, SystemClock
@@ -155,7 +159,14 @@ async def _schedule_reminder_follow_up(
 
 
 # --- Constants ---
-TASK_POLLING_INTERVAL = 5  # Seconds to wait between polling for tasks
+TASK_POLLING_INTERVAL = 5  # Seconds to back off after a failed iteration
+# How often an idle worker checks for due tasks it was not notified about.
+# In-process enqueues notify the worker directly; this catches anything else
+# (tasks written by another process such as the web server or a second worker,
+# stalled tasks becoming reclaimable), so it bounds their pickup latency. The
+# check is a single read-only aggregate; the worker only dequeues if it finds a
+# due task.
+TASK_IDLE_POLL_INTERVAL = 5
 TASK_HANDLER_TIMEOUT = 300  # Seconds to wait for task handler execution (5 minutes)
 
 # --- Events for coordination (can remain module-level) ---
@@ -537,6 +548,9 @@ class TaskWorker:
             str, Callable[[ToolExecutionContext, Any], Awaitable[None]]
         ] = {}
         self.worker_id = f"worker-{uuid.uuid4()}"
+        # Earliest known scheduled_at of a future task this worker may handle
+        self._next_deadline: datetime | None = None
+        self._deadline_changed = asyncio.Event()
         self.last_activity: datetime | None = None  # Track last activity time
         self._update_last_activity()  # Set initial activity
         logger.info(f"TaskWorker instance {self.worker_id} created.")
@@ -882,23 +896,115 @@ class TaskWorker:
             # Handle recurrence even if task failed (after max retries)
             await self._handle_recurrence(db_context, task)
 
-    async def _wait_for_next_poll(self, wake_up_event: asyncio.Event) -> None:
-        """Waits for the polling interval or a wake-up event."""
+    def _note_task_scheduled(
+        self, scheduled_at: datetime | None, wake_up_event: asyncio.Event
+    ) -> None:
+        """Handles an enqueue notification on the worker's event loop."""
+        if scheduled_at is None or scheduled_at <= self.clock.now():
+            wake_up_event.set()
+        elif self._next_deadline is None or scheduled_at < self._next_deadline:
+            self._next_deadline = scheduled_at
+            self._deadline_changed.set()
+
+    async def _record_next_deadline(
+        self, db_context: DatabaseContext, task_types: list[str]
+    ) -> None:
+        """Records when the next pending task is due, after a dequeue found none.
+
+        Only runs once the queue is drained, so a busy worker pays no extra
+        query per task. A task that is already due (e.g. one another worker is
+        claiming) sets the deadline to now, so the worker retries immediately.
+        """
+        now = self.clock.now()
+        # Notifications arriving while the query runs are merged below
+        self._next_deadline = None
+        next_at = await db_context.tasks.get_next_due_time(task_types, now)
+        if next_at is not None and (
+            self._next_deadline is None or next_at < self._next_deadline
+        ):
+            self._next_deadline = next_at
+
+    async def _refresh_next_deadline(self, task_types: list[str]) -> bool:
+        """Re-reads the next task deadline in a read-only context.
+
+        Writes share one connection under SQLite, so reads stay off it.
+
+        Returns:
+            False if the deadline could not be read
+        """
+        assert self.engine is not None
         try:
-            logger.debug(
-                f"Worker {self.worker_id}: No tasks found, waiting for event or timeout ({TASK_POLLING_INTERVAL}s)..."
+            async with get_db_context(
+                engine=self.engine, readonly=True
+            ) as deadline_context:
+                await self._record_next_deadline(deadline_context, task_types)
+        except Exception as e:
+            logger.error(
+                f"Error reading next task deadline for worker {self.worker_id}: {e}",
+                exc_info=True,
             )
+            return False
+        return True
+
+    def _next_task_is_due(self) -> bool:
+        return self._next_deadline is not None and (
+            self._next_deadline <= self.clock.now()
+        )
+
+    def _seconds_until_next_poll(self) -> float:
+        timeout = float(TASK_IDLE_POLL_INTERVAL)
+        if self._next_deadline is not None:
+            until_deadline = (self._next_deadline - self.clock.now()).total_seconds()
+            timeout = min(timeout, max(until_deadline, 0.0))
+        return timeout
 
-            await asyncio.wait_for(wake_up_event.wait(), timeout=TASK_POLLING_INTERVAL)
-            # If wait_for completes without timeout, the event was set
-            logger.debug(f"Worker {self.worker_id}: Woken up by event.")
-            wake_up_event.clear()  # Reset the event for the next notification
-        except TimeoutError:
-            # Event didn't fire, timeout reached, proceed to next polling cycle
+    async def _wait_for_next_poll(
+        self, wake_up_event: asyncio.Event, task_types: list[str]
+    ) -> None:
+        """Sleeps until the next scheduled task is due or a wake-up event fires.
+
+        An enqueue notification for an earlier task re-arms the sleep with the
+        new deadline without touching the database. Every TASK_IDLE_POLL_INTERVAL
+        the deadline is re-read, and the sleep only ends if a task is due.
+        """
+        while not self.shutdown_event.is_set():
+            self._deadline_changed.clear()
+            timeout = self._seconds_until_next_poll()
             logger.debug(
-                f"Worker {self.worker_id}: Wait timed out, continuing poll cycle."
+                f"Worker {self.worker_id}: No tasks found, waiting for event or timeout ({timeout:.3f}s, next deadline {self._next_deadline})..."
             )
-            # Continue the loop normally after timeout
+            wake_wait = asyncio.ensure_future(wake_up_event.wait())
+            deadline_wait = asyncio.ensure_future(self._deadline_changed.wait())
+            shutdown_wait = asyncio.ensure_future(self.shutdown_event.wait())
+            try:
+                done, _ = await asyncio.wait(
+                    {wake_wait, deadline_wait, shutdown_wait},
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                for waiter in (wake_wait, deadline_wait, shutdown_wait):
+                    waiter.cancel()
+
+            if wake_wait in done:
+                logger.debug(f"Worker {self.worker_id}: Woken up by event.")
+                wake_up_event.clear()  # Reset the event for the next notification
+                return
+            if deadline_wait in done:
+                # An earlier task was scheduled; sleep again with the new deadline
+                continue
+            if self.shutdown_event.is_set() or self._next_task_is_due():
+                logger.debug(
+                    f"Worker {self.worker_id}: Wait timed out, continuing poll cycle."
+                )
+                return
+            # Idle interval elapsed; look for tasks this worker was not told about
+            self._update_last_activity()
+            if not await self._refresh_next_deadline(task_types):
+                return
+            if self._next_task_is_due():
+                logger.debug(f"Worker {self.worker_id}: Found a due task.")
+                return
 
     async def run(self, wake_up_event: asyncio.Event | None = None) -> None:
         """Continuously polls for and processes tasks.
@@ -920,6 +1026,25 @@ class TaskWorker:
             )
             return
 
+        # Enqueues can come from other threads' event loops
+        loop = asyncio.get_running_loop()
+
+        def on_task_scheduled(scheduled_at: datetime | None) -> None:
+            loop.call_soon_threadsafe(
+                self._note_task_scheduled, scheduled_at, wake_up_event
+            )
+
+        add_task_scheduled_listener(on_task_scheduled)
+        try:
+            await self._run_loop(wake_up_event, task_types_handled)
+        finally:
+            remove_task_scheduled_listener(on_task_scheduled)
+
+        logger.info(f"Task worker {self.worker_id} stopped.")
+
+    async def _run_loop(
+        self, wake_up_event: asyncio.Event, task_types_handled: list[str]
+    ) -> None:
         while not self.shutdown_event.is_set():  # Use self.shutdown_event
             try:
                 task = None  # Initialize task variable for the outer scope
@@ -947,6 +1072,10 @@ class TaskWorker:
                         )
                         # Continue to next iteration without processing
 
+                if task is None:
+                    # Queue drained; find out how long the worker may sleep
+                    await self._refresh_next_deadline(task_types_handled)
+
                 # Process task in separate transaction if one was dequeued
                 if task:
                     logger.debug("Dequeued task: %s", task["task_id"])
@@ -973,7 +1102,7 @@ class TaskWorker:
                 else:
                     # No task found, wait for next poll
                     logger.debug("No tasks found, waiting for next poll")
-                    await self._wait_for_next_poll(wake_up_event)
+                    await self._wait_for_next_poll(wake_up_event, task_types_handled)
                     self._update_last_activity()  # Update after polling cycle
 
             # --- Exception handling for the outer try block (whole loop iteration) ---
@@ -995,8 +1124,6 @@ class TaskWorker:
                     TASK_POLLING_INTERVAL * 2
                 )  # Longer sleep after error
 
-        logger.info(f"Task worker {self.worker_id} stopped.")
-
 
 async def handle_system_event_cleanup(
     exec_context: ToolExecutionContext,
@@ -1054,6 +1181,54 @@ async def handle_system_error_log_cleanup(
         raise
 
 
+async def handle_rebuild_conversation_summaries(
+    exec_context: ToolExecutionContext,
+    # ast-grep-ignore: no-dict-any - Task payload is dynamic
+    payload: dict[str, Any],
+) -> None:
+    """
+    Task handler for recomputing the conversation_summaries table from message history.
+    """
+    logger.info("Starting conversation summary rebuild")
+
+    try:
+        total = await exec_context.db_context.message_history.rebuild_conversation_summaries()
+        logger.info(
+            f"Conversation summary rebuild completed for {total} conversations."
+        )
+    except Exception as e:
+        logger.error(f"Error during conversation summary rebuild: {e}", exc_info=True)
+        raise
+
+
+async def handle_attachment_cleanup(
+    exec_context: ToolExecutionContext,
+    # ast-grep-ignore: no-dict-any - Task payload is dynamic
+    payload: dict[str, Any],
+) -> None:
+    """
+    Task handler for garbage-collecting unreferenced attachment blobs and files.
+    """
+    attachment_registry = exec_context.attachment_registry
+    if attachment_registry is None:
+        logger.warning("Attachment cleanup skipped: no attachment registry available")
+        return
+
+    logger.info("Starting attachment cleanup")
+
+    try:
+        deleted_count = await attachment_registry.cleanup_orphaned_attachments(
+            exec_context.db_context
+        )
+
+        logger.info(
+            f"Attachment cleanup completed. Deleted {deleted_count} unreferenced files."
+        )
+    except Exception as e:
+        logger.error(f"Error during attachment cleanup: {e}", exc_info=True)
+        raise
+
+
 async def handle_worker_task_cleanup(
     exec_context: ToolExecutionContext,
     # ast-grep-ignore: no-dict-any - Task payload is dynamic
@@ -1496,6 +1671,7 @@ __all__ = [
     "handle_llm_callback",
     "handle_system_event_cleanup",
     "handle_system_error_log_cleanup",
+    "handle_attachment_cleanup",
     "handle_script_execution",
     "handle_reindex_document",
 ]  # Export class and relevant handlers
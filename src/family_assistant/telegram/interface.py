@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import io
 import logging
 import mimetypes
@@ -224,6 +225,36 @@ class TelegramChatInterface(ChatInterface):
             logger.error(f"Failed to resize image {attachment_id}: {e}", exc_info=True)
             return content, None
 
+    async def _prepare_photo(
+        self, content: bytes, attachment_id: str
+    ) -> tuple[bytes, str | None]:
+        """
+        Resize an image for Telegram off the event loop, reusing earlier results.
+
+        Resized variants are kept in the attachment registry's derivative cache,
+        so re-sending the same large image does not decode and resample it again.
+
+        Args:
+            content: Original image content as bytes
+            attachment_id: ID of the attachment being sent
+
+        Returns:
+            Same as _resize_image_if_needed
+        """
+        if len(content) <= TELEGRAM_PHOTO_SIZE_LIMIT:
+            return content, None
+
+        if self.attachment_registry is None:
+            return await asyncio.to_thread(
+                self._resize_image_if_needed, content, attachment_id
+            )
+
+        return await self.attachment_registry.derivatives.get_or_compute(
+            attachment_id,
+            f"telegram_photo:{TELEGRAM_PHOTO_SIZE_LIMIT}",
+            lambda: self._resize_image_if_needed(content, attachment_id),
+        )
+
     async def _send_attachments(
         self,
         chat_id: int,
@@ -313,11 +344,12 @@ class TelegramChatInterface(ChatInterface):
                             oversized_attachments = []
 
                             for img_data in image_group:
-                                processed_content, size_note = (
-                                    self._resize_image_if_needed(
-                                        img_data["content"],
-                                        img_data["id"],
-                                    )
+                                (
+                                    processed_content,
+                                    size_note,
+                                ) = await self._prepare_photo(
+                                    img_data["content"],
+                                    img_data["id"],
                                 )
 
                                 if size_note:
@@ -379,7 +411,7 @@ class TelegramChatInterface(ChatInterface):
 
                         else:
                             img_data = image_group[0]
-                            processed_content, size_note = self._resize_image_if_needed(
+                            processed_content, size_note = await self._prepare_photo(
                                 img_data["content"], img_data["id"]
                             )
 
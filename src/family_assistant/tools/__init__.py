@@ -131,6 +131,7 @@ from family_assistant.tools.infrastructure import (
     ToolNotFoundError,
     ToolsProvider,
     find_provider_by_type,
+    get_side_effect_free_tools,
 )
 from family_assistant.tools.media_download import (
     MEDIA_DOWNLOAD_TOOLS_DEFINITION,
@@ -206,6 +207,7 @@ __all__ = [
     "FilteredToolsProvider",
     "MCPServerConfig",
     "find_provider_by_type",
+    "get_side_effect_free_tools",
     "ToolNotFoundError",
     "ToolConfirmationRequired",
     "ToolConfirmationFailed",
@@ -13,15 +13,17 @@ from datetime import date, datetime, time, timedelta
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
-import caldav
 import httpx
 import vobject
 from caldav.lib.error import DAVError, NotFoundError
 from dateutil.parser import isoparse
 
 from family_assistant.similarity import create_similarity_strategy_from_config
+from family_assistant.utils.http_clients import get_http_client_registry
 
 if TYPE_CHECKING:
+    import caldav
+
     from family_assistant.tools.types import (
         CalendarConfig,
         CalendarEvent,
@@ -132,82 +134,78 @@ async def _check_for_duplicate_events(
 
         # Search events in time window (synchronous, run in executor)
         def search_events_sync() -> list[CalendarEvent]:
-            with caldav.DAVClient(
+            client = get_http_client_registry().get_dav_client(
                 url=client_url_to_use,
                 username=username,
                 password=password,
                 timeout=30,
-            ) as client:
-                all_events = []
-                for cal_url in calendar_urls_list:  # type: ignore
-                    try:
-                        calendar_obj = client.calendar(url=cal_url)
-                        if not calendar_obj:
-                            logger.warning(
-                                f"Could not get calendar object for {cal_url}"
-                            )
-                            continue
+            )
+            all_events = []
+            for cal_url in calendar_urls_list:  # type: ignore
+                try:
+                    calendar_obj = client.calendar(url=cal_url)
+                    if not calendar_obj:
+                        logger.warning(f"Could not get calendar object for {cal_url}")
+                        continue
 
-                        # WORKAROUND FOR CALDAV SERVERS WITH TIMEZONE ISSUES:
-                        # Some CalDAV servers (e.g., Radicale) don't handle timezone-aware
-                        # datetime searches reliably. If _use_naive_datetimes_for_search is set,
-                        # convert to naive datetimes using only date parts.
-                        # This is primarily for testing with Radicale.
-                        if caldav_config.get("_use_naive_datetimes_for_search", False):
-                            search_start_naive = datetime.combine(
-                                search_start_dt.date(), time.min
-                            )
-                            search_end_naive = datetime.combine(
-                                search_end_dt.date(), time.max
-                            )
-                            events = calendar_obj.search(
-                                start=search_start_naive,
-                                end=search_end_naive,
-                                event=True,
-                                expand=True,  # Include recurring event instances
-                            )
-                        else:
-                            # Standard search with timezone-aware datetimes
-                            events = calendar_obj.search(
-                                start=search_start_dt,
-                                end=search_end_dt,
-                                event=True,
-                                expand=True,  # Include recurring event instances
-                            )
-
-                        for event in events:
-                            try:
-                                vevent = event.icalendar_component
-                                event_summary = str(vevent.get("summary", ""))
-                                uid = str(vevent.get("uid", ""))
-                                dtstart = vevent.get("dtstart")
-
-                                # Format start time for display
-                                if dtstart:
-                                    start_val = dtstart.dt
-                                    if isinstance(start_val, datetime):
-                                        start_str = start_val.strftime(
-                                            "%Y-%m-%d %H:%M %Z"
-                                        )
-                                    else:
-                                        start_str = str(start_val)
-                                else:
-                                    start_str = "Unknown time"
+                    # WORKAROUND FOR CALDAV SERVERS WITH TIMEZONE ISSUES:
+                    # Some CalDAV servers (e.g., Radicale) don't handle timezone-aware
+                    # datetime searches reliably. If _use_naive_datetimes_for_search is set,
+                    # convert to naive datetimes using only date parts.
+                    # This is primarily for testing with Radicale.
+                    if caldav_config.get("_use_naive_datetimes_for_search", False):
+                        search_start_naive = datetime.combine(
+                            search_start_dt.date(), time.min
+                        )
+                        search_end_naive = datetime.combine(
+                            search_end_dt.date(), time.max
+                        )
+                        events = calendar_obj.search(
+                            start=search_start_naive,
+                            end=search_end_naive,
+                            event=True,
+                            expand=True,  # Include recurring event instances
+                        )
+                    else:
+                        # Standard search with timezone-aware datetimes
+                        events = calendar_obj.search(
+                            start=search_start_dt,
+                            end=search_end_dt,
+                            event=True,
+                            expand=True,  # Include recurring event instances
+                        )
 
-                                all_events.append({
-                                    "summary": event_summary,
-                                    "uid": uid,
-                                    "start": start_str,
-                                })
-                            except Exception as e:
-                                logger.warning(f"Error processing event: {e}")
-                                continue
+                    for event in events:
+                        try:
+                            vevent = event.icalendar_component
+                            event_summary = str(vevent.get("summary", ""))
+                            uid = str(vevent.get("uid", ""))
+                            dtstart = vevent.get("dtstart")
+
+                            # Format start time for display
+                            if dtstart:
+                                start_val = dtstart.dt
+                                if isinstance(start_val, datetime):
+                                    start_str = start_val.strftime("%Y-%m-%d %H:%M %Z")
+                                else:
+                                    start_str = str(start_val)
+                            else:
+                                start_str = "Unknown time"
+
+                            all_events.append({
+                                "summary": event_summary,
+                                "uid": uid,
+                                "start": start_str,
+                            })
+                        except Exception as e:
+                            logger.warning(f"Error processing event: {e}")
+                            continue
 
-                    except Exception as e:
-                        logger.error(f"Error searching calendar {cal_url}: {e}")
-                        continue
+                except Exception as e:
+                    logger.error(f"Error searching calendar {cal_url}: {e}")
+                    continue
 
-                return all_events
+            return all_events
 
         # Search for events
         loop = asyncio.get_running_loop()
@@ -326,6 +324,7 @@ CALENDAR_TOOLS_DEFINITION: list[ToolDefinition] = [
     },
     {
         "type": "function",
+        "side_effect_free": True,
         "function": {
             "name": "search_calendar_events",
             "description": (
@@ -528,12 +527,8 @@ async def add_calendar_event_tool(
         # Attributes like summary, dtstart are ContentLine objects after being added.
         vevent.add("uid").value = str(uuid.uuid4())  # type: ignore[union-attr]
         vevent.add("summary").value = summary  # type: ignore[union-attr]
-        vevent.add(
-            "dtstart"
-        ).value = dtstart  # vobject handles date vs datetime # type: ignore[union-attr]
-        vevent.add(
-            "dtend"
-        ).value = dtend  # vobject handles date vs datetime # type: ignore[union-attr]
+        vevent.add("dtstart").value = dtstart  # vobject handles date vs datetime # type: ignore[union-attr]
+        vevent.add("dtend").value = dtend  # vobject handles date vs datetime # type: ignore[union-attr]
         vevent.add("dtstamp").value = datetime.now(  # type: ignore[union-attr]
             ZoneInfo("UTC")
         )  # Use ZoneInfo for UTC
@@ -549,30 +544,30 @@ async def add_calendar_event_tool(
         # Connect to CalDAV server and save event (synchronous, run in executor)
         def save_event_sync() -> str:
             logger.debug(f"Connecting to CalDAV server: {client_url_to_use}")
-            with caldav.DAVClient(
+            client = get_http_client_registry().get_dav_client(
                 url=client_url_to_use,  # Use base_url for client
                 username=username,
                 password=password,
                 timeout=30,
-            ) as client:
-                # Get the specific calendar object using its full URL
-                target_calendar_obj: caldav.objects.Calendar = client.calendar(
-                    url=target_calendar_url  # Use full collection URL here
+            )
+            # Get the specific calendar object using its full URL
+            target_calendar_obj: caldav.objects.Calendar = client.calendar(
+                url=target_calendar_url  # Use full collection URL here
+            )
+            if not target_calendar_obj:
+                raise ConnectionError(
+                    f"Failed to obtain calendar object for URL: {target_calendar_url} on server {client_url_to_use}"
                 )
-                if not target_calendar_obj:
-                    raise ConnectionError(
-                        f"Failed to obtain calendar object for URL: {target_calendar_url} on server {client_url_to_use}"
-                    )
 
-                logger.info(f"Saving event to calendar: {target_calendar_obj.url}")
-                # Save event with no_overwrite=True to use If-None-Match:* for creation
-                new_event_resource: caldav.objects.Event = (
-                    target_calendar_obj.save_event(event_data, no_overwrite=True)
-                )
-                logger.info(
-                    f"Event saved successfully. URL: {getattr(new_event_resource, 'url', 'N/A')}, ETag: {getattr(new_event_resource, 'etag', 'N/A')}"
-                )
-                return f"OK. Event '{summary}' added to the calendar."
+            logger.info(f"Saving event to calendar: {target_calendar_obj.url}")
+            # Save event with no_overwrite=True to use If-None-Match:* for creation
+            new_event_resource: caldav.objects.Event = target_calendar_obj.save_event(
+                event_data, no_overwrite=True
+            )
+            logger.info(
+                f"Event saved successfully. URL: {getattr(new_event_resource, 'url', 'N/A')}, ETag: {getattr(new_event_resource, 'etag', 'N/A')}"
+            )
+            return f"OK. Event '{summary}' added to the calendar."
 
         try:
             # Check for duplicate events BEFORE creation (if duplicate detection is enabled and not bypassed)
@@ -716,77 +711,75 @@ async def search_calendar_events_tool(
         # Search events (synchronous, run in executor) - returns structured data
         def search_events_sync() -> list[CalendarEvent]:
             logger.debug(f"Connecting to CalDAV server: {client_url_to_use}")
-            with caldav.DAVClient(
+            client = get_http_client_registry().get_dav_client(
                 url=client_url_to_use,
                 username=username,
                 password=password,
                 timeout=30,
-            ) as client:
-                all_events = []
-                for cal_url in calendar_urls_list:  # type: ignore
-                    try:
-                        calendar_obj = client.calendar(url=cal_url)
-                        if not calendar_obj:
-                            logger.warning(f"Could not access calendar at {cal_url}")
-                            continue
+            )
+            all_events = []
+            for cal_url in calendar_urls_list:  # type: ignore
+                try:
+                    calendar_obj = client.calendar(url=cal_url)
+                    if not calendar_obj:
+                        logger.warning(f"Could not access calendar at {cal_url}")
+                        continue
 
-                        # Search for events in the date range
-                        events = calendar_obj.search(
-                            start=search_start,
-                            end=search_end,
-                            event=True,
-                            expand=True,  # Expand recurring events
-                        )
+                    # Search for events in the date range
+                    events = calendar_obj.search(
+                        start=search_start,
+                        end=search_end,
+                        event=True,
+                        expand=True,  # Expand recurring events
+                    )
 
-                        for event in events:
-                            try:
-                                vevent = event.icalendar_component
-                                summary = str(vevent.get("summary", ""))
-
-                                # Don't filter by text here - we'll do similarity-based filtering after
-                                # retrieving all events
-
-                                uid = str(vevent.get("uid", ""))
-                                dtstart = vevent.get("dtstart")
-                                dtend = vevent.get("dtend")
-
-                                # Format event info
-                                if dtstart:
-                                    start_val = dtstart.dt
-                                    if isinstance(start_val, datetime):
-                                        start_str = start_val.strftime(
-                                            "%Y-%m-%d %H:%M %Z"
-                                        )
-                                    else:
-                                        start_str = str(start_val)
+                    for event in events:
+                        try:
+                            vevent = event.icalendar_component
+                            summary = str(vevent.get("summary", ""))
+
+                            # Don't filter by text here - we'll do similarity-based filtering after
+                            # retrieving all events
+
+                            uid = str(vevent.get("uid", ""))
+                            dtstart = vevent.get("dtstart")
+                            dtend = vevent.get("dtend")
+
+                            # Format event info
+                            if dtstart:
+                                start_val = dtstart.dt
+                                if isinstance(start_val, datetime):
+                                    start_str = start_val.strftime("%Y-%m-%d %H:%M %Z")
                                 else:
-                                    start_str = "No start time"
-
-                                if dtend:
-                                    end_val = dtend.dt
-                                    if isinstance(end_val, datetime):
-                                        end_str = end_val.strftime("%Y-%m-%d %H:%M %Z")
-                                    else:
-                                        end_str = str(end_val)
+                                    start_str = str(start_val)
+                            else:
+                                start_str = "No start time"
+
+                            if dtend:
+                                end_val = dtend.dt
+                                if isinstance(end_val, datetime):
+                                    end_str = end_val.strftime("%Y-%m-%d %H:%M %Z")
                                 else:
-                                    end_str = "No end time"
-
-                                all_events.append({
-                                    "summary": summary,
-                                    "uid": uid,
-                                    "start": start_str,
-                                    "end": end_str,
-                                    "calendar_url": cal_url,
-                                })
-                            except Exception as e:
-                                logger.warning(f"Error processing event: {e}")
-                                continue
+                                    end_str = str(end_val)
+                            else:
+                                end_str = "No end time"
+
+                            all_events.append({
+                                "summary": summary,
+                                "uid": uid,
+                                "start": start_str,
+                                "end": end_str,
+                                "calendar_url": cal_url,
+                            })
+                        except Exception as e:
+                            logger.warning(f"Error processing event: {e}")
+                            continue
 
-                    except Exception as e:
-                        logger.error(f"Error searching calendar {cal_url}: {e}")
-                        continue
+                except Exception as e:
+                    logger.error(f"Error searching calendar {cal_url}: {e}")
+                    continue
 
-                return all_events
+            return all_events
 
         try:
             loop = asyncio.get_running_loop()
@@ -922,172 +915,159 @@ async def modify_calendar_event_tool(
         # Modify event (synchronous, run in executor)
         def modify_event_sync() -> str:
             logger.debug(f"Connecting to CalDAV server: {client_url_to_use}")
-            with caldav.DAVClient(
+            client = get_http_client_registry().get_dav_client(
                 url=client_url_to_use,
                 username=username,
                 password=password,
                 timeout=30,
-            ) as client:
-                # Get the specific calendar
-                calendar_obj = client.calendar(url=calendar_url)
-                if not calendar_obj:
-                    raise ConnectionError(
-                        f"Failed to obtain calendar object for URL: {calendar_url}"
-                    )
+            )
+            # Get the specific calendar
+            calendar_obj = client.calendar(url=calendar_url)
+            if not calendar_obj:
+                raise ConnectionError(
+                    f"Failed to obtain calendar object for URL: {calendar_url}"
+                )
 
-                # Search for the event by UID
-                # Note: calendar.search(uid=uid) doesn't work reliably with all CalDAV servers
-                # So we fetch all events and search manually
-                try:
-                    all_events = calendar_obj.events()
-                    event = None
+            # Search for the event by UID
+            # Note: calendar.search(uid=uid) doesn't work reliably with all CalDAV servers
+            # So we fetch all events and search manually
+            try:
+                all_events = calendar_obj.events()
+                event = None
 
-                    for evt in all_events:
-                        try:
-                            # Use vobject_instance to get vobject representation
-                            evt_vobj = evt.vobject_instance
-                            evt_vevent = (
-                                evt_vobj.vevent
-                                if hasattr(evt_vobj, "vevent")
-                                else evt_vobj
-                            )
-                            evt_uid = str(
-                                evt_vevent.uid.value
-                                if hasattr(evt_vevent, "uid")
-                                else ""
-                            )
-                            if evt_uid == uid:
-                                event = evt
-                                break
-                        except Exception as e:
-                            logger.warning(f"Error checking event UID: {e}")
-                            continue
+                for evt in all_events:
+                    try:
+                        # Use vobject_instance to get vobject representation
+                        evt_vobj = evt.vobject_instance
+                        evt_vevent = (
+                            evt_vobj.vevent if hasattr(evt_vobj, "vevent") else evt_vobj
+                        )
+                        evt_uid = str(
+                            evt_vevent.uid.value if hasattr(evt_vevent, "uid") else ""
+                        )
+                        if evt_uid == uid:
+                            event = evt
+                            break
+                    except Exception as e:
+                        logger.warning(f"Error checking event UID: {e}")
+                        continue
 
-                    if not event:
-                        return f"Error: Event with UID '{uid}' not found in calendar."
+                if not event:
+                    return f"Error: Event with UID '{uid}' not found in calendar."
+
+                # Get the existing event data using vobject_instance (not icalendar_component)
+                vobj = event.vobject_instance
+                old_vevent = vobj.vevent if hasattr(vobj, "vevent") else vobj
 
-                    # Get the existing event data using vobject_instance (not icalendar_component)
-                    vobj = event.vobject_instance
-                    old_vevent = vobj.vevent if hasattr(vobj, "vevent") else vobj
+                # Store original values for the result message
+                original_summary = str(
+                    old_vevent.summary.value if hasattr(old_vevent, "summary") else ""
+                )
 
-                    # Store original values for the result message
-                    original_summary = str(
+                # Extract current values from the existing event
+                current_summary = (
+                    new_summary
+                    if new_summary is not None
+                    else str(
                         old_vevent.summary.value
                         if hasattr(old_vevent, "summary")
                         else ""
                     )
+                )
+                current_description = (
+                    old_vevent.description.value
+                    if hasattr(old_vevent, "description")
+                    else None
+                )
+                if new_description is not None:
+                    current_description = new_description if new_description else None
 
-                    # Extract current values from the existing event
-                    current_summary = (
-                        new_summary
-                        if new_summary is not None
-                        else str(
-                            old_vevent.summary.value
-                            if hasattr(old_vevent, "summary")
-                            else ""
-                        )
-                    )
-                    current_description = (
-                        old_vevent.description.value
-                        if hasattr(old_vevent, "description")
-                        else None
-                    )
-                    if new_description is not None:
-                        current_description = (
-                            new_description if new_description else None
-                        )
-
-                    # Extract existing times
-                    current_start = (
-                        old_vevent.dtstart.value
-                        if hasattr(old_vevent, "dtstart")
-                        else None
-                    )
-                    current_end = (
-                        old_vevent.dtend.value if hasattr(old_vevent, "dtend") else None
-                    )
+                # Extract existing times
+                current_start = (
+                    old_vevent.dtstart.value if hasattr(old_vevent, "dtstart") else None
+                )
+                current_end = (
+                    old_vevent.dtend.value if hasattr(old_vevent, "dtend") else None
+                )
 
-                    local_tz = ZoneInfo(exec_context.timezone_str)
-
-                    # Parse new times if provided
-                    if new_start_time:
-                        current_start = isoparse(new_start_time)
-                        if (
-                            isinstance(current_start, datetime)
-                            and current_start.tzinfo is None
-                        ):
-                            current_start = current_start.replace(tzinfo=local_tz)
-
-                    if new_end_time:
-                        current_end = isoparse(new_end_time)
-                        if (
-                            isinstance(current_end, datetime)
-                            and current_end.tzinfo is None
-                        ):
-                            current_end = current_end.replace(tzinfo=local_tz)
-
-                    # Get existing or new recurrence rule
-                    current_rrule = None
-                    if hasattr(old_vevent, "rrule"):
-                        current_rrule = old_vevent.rrule.value
-                    if recurrence_rule is not None:
-                        current_rrule = recurrence_rule if recurrence_rule else None
-
-                    # Create a fresh vobject calendar with updated values (like in add_calendar_event_tool)
-                    new_cal = vobject.iCalendar()
-                    new_vevent = new_cal.add("vevent")
-                    new_vevent.add("uid").value = uid  # Keep the same UID
-                    new_vevent.add("summary").value = current_summary
-                    new_vevent.add("dtstart").value = current_start  # type: ignore[union-attr]
-                    new_vevent.add("dtend").value = current_end  # type: ignore[union-attr]
-                    new_vevent.add("dtstamp").value = datetime.now(  # type: ignore[union-attr]
-                        ZoneInfo("UTC")
-                    )
-                    new_vevent.add("last-modified").value = datetime.now(  # type: ignore[union-attr]
-                        ZoneInfo("UTC")
-                    )
+                local_tz = ZoneInfo(exec_context.timezone_str)
+
+                # Parse new times if provided
+                if new_start_time:
+                    current_start = isoparse(new_start_time)
+                    if (
+                        isinstance(current_start, datetime)
+                        and current_start.tzinfo is None
+                    ):
+                        current_start = current_start.replace(tzinfo=local_tz)
+
+                if new_end_time:
+                    current_end = isoparse(new_end_time)
+                    if isinstance(current_end, datetime) and current_end.tzinfo is None:
+                        current_end = current_end.replace(tzinfo=local_tz)
+
+                # Get existing or new recurrence rule
+                current_rrule = None
+                if hasattr(old_vevent, "rrule"):
+                    current_rrule = old_vevent.rrule.value
+                if recurrence_rule is not None:
+                    current_rrule = recurrence_rule if recurrence_rule else None
+
+                # Create a fresh vobject calendar with updated values (like in add_calendar_event_tool)
+                new_cal = vobject.iCalendar()
+                new_vevent = new_cal.add("vevent")
+                new_vevent.add("uid").value = uid  # Keep the same UID
+                new_vevent.add("summary").value = current_summary
+                new_vevent.add("dtstart").value = current_start  # type: ignore[union-attr]
+                new_vevent.add("dtend").value = current_end  # type: ignore[union-attr]
+                new_vevent.add("dtstamp").value = datetime.now(  # type: ignore[union-attr]
+                    ZoneInfo("UTC")
+                )
+                new_vevent.add("last-modified").value = datetime.now(  # type: ignore[union-attr]
+                    ZoneInfo("UTC")
+                )
 
-                    if current_description:
-                        new_vevent.add("description").value = current_description
-
-                    if current_rrule:
-                        new_vevent.add("rrule").value = current_rrule
-                        logger.info(f"Updated recurrence rule to: {current_rrule}")
-
-                    # Serialize and save the new calendar data
-                    event_data = new_cal.serialize()
-                    event.data = event_data
-                    event.save()
-                    logger.info(f"Event '{original_summary}' modified successfully")
-
-                    # Build result message
-                    changes = []
-                    if new_summary:
-                        changes.append(f"title to '{new_summary}'")
-                    if new_start_time:
-                        changes.append(f"start time to {new_start_time}")
-                    if new_end_time:
-                        changes.append(f"end time to {new_end_time}")
-                    if new_description is not None:
-                        changes.append("description")
-                    if recurrence_rule is not None:
-                        if recurrence_rule:
-                            changes.append("recurrence rule")
-                        else:
-                            changes.append("removed recurrence")
-
-                    if changes:
-                        return f"OK. Event '{original_summary}' updated: {', '.join(changes)}."
+                if current_description:
+                    new_vevent.add("description").value = current_description
+
+                if current_rrule:
+                    new_vevent.add("rrule").value = current_rrule
+                    logger.info(f"Updated recurrence rule to: {current_rrule}")
+
+                # Serialize and save the new calendar data
+                event_data = new_cal.serialize()
+                event.data = event_data
+                event.save()
+                logger.info(f"Event '{original_summary}' modified successfully")
+
+                # Build result message
+                changes = []
+                if new_summary:
+                    changes.append(f"title to '{new_summary}'")
+                if new_start_time:
+                    changes.append(f"start time to {new_start_time}")
+                if new_end_time:
+                    changes.append(f"end time to {new_end_time}")
+                if new_description is not None:
+                    changes.append("description")
+                if recurrence_rule is not None:
+                    if recurrence_rule:
+                        changes.append("recurrence rule")
                     else:
-                        return (
-                            f"OK. Event '{original_summary}' checked (no changes made)."
-                        )
+                        changes.append("removed recurrence")
 
-                except NotFoundError:
-                    return f"Error: Event with UID '{uid}' not found in calendar."
-                except Exception as e:
-                    logger.error(f"Error modifying event: {e}", exc_info=True)
-                    return f"Error: Failed to modify event. {e}"
+                if changes:
+                    return (
+                        f"OK. Event '{original_summary}' updated: {', '.join(changes)}."
+                    )
+                else:
+                    return f"OK. Event '{original_summary}' checked (no changes made)."
+
+            except NotFoundError:
+                return f"Error: Event with UID '{uid}' not found in calendar."
+            except Exception as e:
+                logger.error(f"Error modifying event: {e}", exc_info=True)
+                return f"Error: Failed to modify event. {e}"
 
         try:
             loop = asyncio.get_running_loop()
@@ -1156,62 +1136,58 @@ async def delete_calendar_event_tool(
         # Delete event (synchronous, run in executor)
         def delete_event_sync() -> str:
             logger.debug(f"Connecting to CalDAV server: {client_url_to_use}")
-            with caldav.DAVClient(
+            client = get_http_client_registry().get_dav_client(
                 url=client_url_to_use,
                 username=username,
                 password=password,
                 timeout=30,
-            ) as client:
-                # Get the specific calendar
-                calendar_obj = client.calendar(url=calendar_url)
-                if not calendar_obj:
-                    raise ConnectionError(
-                        f"Failed to obtain calendar object for URL: {calendar_url}"
-                    )
-
-                # Search for the event by UID
-                # Note: calendar.search(uid=uid) doesn't work reliably with all CalDAV servers
-                # So we fetch all events and search manually
-                try:
-                    all_events = calendar_obj.events()
-                    event = None
-
-                    for evt in all_events:
-                        try:
-                            # Use vobject_instance to get vobject representation
-                            evt_vobj = evt.vobject_instance
-                            evt_vevent = (
-                                evt_vobj.vevent
-                                if hasattr(evt_vobj, "vevent")
-                                else evt_vobj
-                            )
-                            evt_uid = str(
-                                evt_vevent.uid.value
-                                if hasattr(evt_vevent, "uid")
-                                else ""
-                            )
-                            if evt_uid == uid:
-                                event = evt
-                                break
-                        except Exception as e:
-                            logger.warning(f"Error checking event UID: {e}")
-                            continue
+            )
+            # Get the specific calendar
+            calendar_obj = client.calendar(url=calendar_url)
+            if not calendar_obj:
+                raise ConnectionError(
+                    f"Failed to obtain calendar object for URL: {calendar_url}"
+                )
 
-                    if not event:
-                        return f"Error: Event with UID '{uid}' not found in calendar."
-                    vevent = event.icalendar_component
-                    summary = str(vevent.get("summary", "Untitled"))
+            # Search for the event by UID
+            # Note: calendar.search(uid=uid) doesn't work reliably with all CalDAV servers
+            # So we fetch all events and search manually
+            try:
+                all_events = calendar_obj.events()
+                event = None
 
-                    # Delete the event
-                    event.delete()
-                    logger.info(f"Event '{summary}' deleted successfully")
-                    return f"OK. Event '{summary}' deleted from calendar."
+                for evt in all_events:
+                    try:
+                        # Use vobject_instance to get vobject representation
+                        evt_vobj = evt.vobject_instance
+                        evt_vevent = (
+                            evt_vobj.vevent if hasattr(evt_vobj, "vevent") else evt_vobj
+                        )
+                        evt_uid = str(
+                            evt_vevent.uid.value if hasattr(evt_vevent, "uid") else ""
+                        )
+                        if evt_uid == uid:
+                            event = evt
+                            break
+                    except Exception as e:
+                        logger.warning(f"Error checking event UID: {e}")
+                        continue
 
-                except NotFoundError:
+                if not event:
                     return f"Error: Event with UID '{uid}' not found in calendar."
-                except Exception as e:
-                    logger.error(f"Error deleting event: {e}", exc_info=True)
-                    return f"Error: Failed to delete event. {e}"
+                vevent = event.icalendar_component
+                summary = str(vevent.get("summary", "Untitled"))
+
+                # Delete the event
+                event.delete()
+                logger.info(f"Event '{summary}' deleted successfully")
+                return f"OK. Event '{summary}' deleted from calendar."
+
+            except NotFoundError:
+                return f"Error: Event with UID '{uid}' not found in calendar."
+            except Exception as e:
+                logger.error(f"Error deleting event: {e}", exc_info=True)
+                return f"Error: Failed to delete event. {e}"
 
         try:
             loop = asyncio.get_running_loop()
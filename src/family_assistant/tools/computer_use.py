@@ -12,14 +12,6 @@ import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from rebrowser_playwright.async_api import (
-    Browser,
-    BrowserContext,
-    Page,
-    Playwright,
-    async_playwright,
-)
-
 from family_assistant.tools.types import ToolAttachment, ToolDefinition, ToolResult
 from family_assistant.utils.stealth_browser import (
     create_stealth_context,
@@ -27,6 +19,13 @@ from family_assistant.utils.stealth_browser import (
 )
 
 if TYPE_CHECKING:
+    from rebrowser_playwright.async_api import (
+        Browser,
+        BrowserContext,
+        Page,
+        Playwright,
+    )
+
     from family_assistant.tools.types import ToolExecutionContext
 
 logger = logging.getLogger(__name__)
@@ -57,6 +56,11 @@ class BrowserSession:
             return self.page
 
         if self.playwright is None:
+            # Imported here so that profiles without computer use never load Playwright
+            from rebrowser_playwright.async_api import (  # noqa: PLC0415
+                async_playwright,
+            )
+
             self.playwright = await async_playwright().start()
 
         if self.browser is None:
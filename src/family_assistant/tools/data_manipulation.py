@@ -7,8 +7,10 @@ particularly JSON data using jq queries.
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 import jq
@@ -17,10 +19,137 @@ from family_assistant.scripting.apis.attachments import ScriptAttachment
 from family_assistant.tools.types import ToolDefinition, ToolResult
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from family_assistant.tools.types import ToolExecutionContext
 
 logger = logging.getLogger(__name__)
 
+JQ_PROGRAM_CACHE_SIZE = 256
+# Budget is expressed in source JSON bytes; the parsed objects are larger
+PARSED_JSON_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64MB
+# Larger documents are handed to jq as text instead of being parsed into Python
+JQ_STREAMING_THRESHOLD_BYTES = 16 * 1024 * 1024  # 16MB
+NDJSON_SUFFIXES = frozenset({".ndjson", ".jsonl"})
+NDJSON_MIME_TYPES = frozenset({
+    "application/x-ndjson",
+    "application/ndjson",
+    "application/jsonl",
+})
+# Returned by ParsedJSONCache.get on a miss, since a document may itself be null
+CACHE_MISS = object()
+
+
+@functools.lru_cache(maxsize=JQ_PROGRAM_CACHE_SIZE)
+def _compile_jq(jq_program: str) -> jq._Program:
+    """Compile a jq program, reusing previously compiled programs.
+
+    Compilation errors raise ValueError and are not cached.
+    """
+    return jq.compile(jq_program)
+
+
+class ParsedJSONCache:
+    """
+    Size-bounded LRU cache of parsed JSON attachments.
+
+    Entries are keyed by attachment ID and validated against the file's
+    modification time and size, so a rewritten file is never served stale.
+    Sizes are accounted in source bytes.
+    """
+
+    def __init__(self, max_bytes: int = PARSED_JSON_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        # ast-grep-ignore: no-dict-any - Parsed JSON is arbitrary
+        self._entries: OrderedDict[str, tuple[tuple[int, int], Any]] = OrderedDict()
+        self._current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def current_bytes(self) -> int:
+        """Total source size of cached documents."""
+        return self._current_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, attachment_id: str, stamp: tuple[int, int]) -> Any:  # noqa: ANN401
+        """
+        Return the cached document for an attachment, or CACHE_MISS on a miss.
+
+        Args:
+            attachment_id: The attachment UUID
+            stamp: (mtime_ns, size) of the attachment file
+
+        Returns:
+            The parsed document, or CACHE_MISS if absent or stale
+        """
+        entry = self._entries.get(attachment_id)
+        if entry is None or entry[0] != stamp:
+            self.misses += 1
+            return CACHE_MISS
+        self._entries.move_to_end(attachment_id)
+        self.hits += 1
+        return entry[1]
+
+    def put(
+        self,
+        attachment_id: str,
+        stamp: tuple[int, int],
+        document: Any,  # noqa: ANN401
+    ) -> None:
+        """Store a parsed document, evicting least recently used entries over budget."""
+        size = stamp[1]
+        if size > self.max_bytes:
+            return
+
+        self.invalidate(attachment_id)
+        self._entries[attachment_id] = (stamp, document)
+        self._current_bytes += size
+
+        while self._current_bytes > self.max_bytes and self._entries:
+            _, ((_, evicted_size), _) = self._entries.popitem(last=False)
+            self._current_bytes -= evicted_size
+
+    def invalidate(self, attachment_id: str) -> None:
+        """Drop the cached document for an attachment."""
+        entry = self._entries.pop(attachment_id, None)
+        if entry is not None:
+            self._current_bytes -= entry[0][1]
+
+    def clear(self) -> None:
+        """Drop all cached documents."""
+        self._entries.clear()
+        self._current_bytes = 0
+
+
+_parsed_json_cache = ParsedJSONCache()
+
+
+def _is_ndjson(file_path: Path, mime_type: str) -> bool:
+    """Check whether an attachment holds newline-delimited JSON."""
+    return (
+        file_path.suffix.lower() in NDJSON_SUFFIXES
+        or mime_type.split(";", 1)[0].strip().lower() in NDJSON_MIME_TYPES
+    )
+
+
+def _stream_ndjson(program: jq._Program, file_path: Path) -> list[Any]:
+    """Run a jq program over each line of an NDJSON file without loading it whole."""
+    results: list[Any] = []
+    with file_path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                results.extend(program.input_text(line).all())
+    return results
+
+
+def _run_on_text(program: jq._Program, file_path: Path) -> list[Any]:
+    """Run a jq program on a file's text, letting jq do the parsing."""
+    return program.input_text(file_path.read_text(encoding="utf-8")).all()
+
+
 # Tool Definitions
 DATA_MANIPULATION_TOOLS_DEFINITION: list[ToolDefinition] = [
     {
@@ -99,45 +228,72 @@ async def jq_query_tool(
                 text=f"Error: Attachment file not found for {attachment_id}."
             )
 
-        # Read and parse JSON - use asyncio.to_thread to avoid blocking event loop
-        # File I/O and JSON parsing can be blocking on large files
+        # Compile first so query errors are reported even for unreadable data
         try:
+            program = _compile_jq(jq_program)
+        except ValueError as e:
+            logger.error(f"jq query error: {e}")
+            return ToolResult(text=f"Error: Invalid jq query. {str(e)}")
 
-            def _load_and_parse_json() -> Any:  # noqa: ANN401
-                content = file_path.read_bytes()
-                return json.loads(content.decode("utf-8"))
-
-            json_data = await asyncio.to_thread(_load_and_parse_json)
-        except UnicodeDecodeError:
-            return ToolResult(
-                text="Error: Attachment is not valid UTF-8 text. Cannot process as JSON."
-            )
-        except json.JSONDecodeError as e:
-            return ToolResult(
-                text=f"Error: Attachment is not valid JSON. Parse error: {str(e)}"
-            )
-
-        # Compile and execute jq query - use asyncio.to_thread to avoid blocking event loop
-        # jq.compile() and .input().all() are CPU-intensive synchronous operations
-        try:
+        stat = file_path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        streaming = _is_ndjson(file_path, attachment.mime_type)
+        # Large documents and NDJSON are parsed by jq itself rather than
+        # materialised as Python objects, and are never cached
+        if streaming or stat.st_size > JQ_STREAMING_THRESHOLD_BYTES:
+            run_streaming = _stream_ndjson if streaming else _run_on_text
+            try:
+                result = await asyncio.to_thread(run_streaming, program, file_path)
+            except UnicodeDecodeError:
+                return ToolResult(
+                    text="Error: Attachment is not valid UTF-8 text. Cannot process as JSON."
+                )
+            except ValueError as e:
+                if str(e).startswith("parse error"):
+                    return ToolResult(
+                        text=f"Error: Attachment is not valid JSON. Parse error: {str(e)}"
+                    )
+                logger.error(f"jq query error: {e}")
+                return ToolResult(text=f"Error: Invalid jq query. {str(e)}")
+        else:
+            json_data = _parsed_json_cache.get(attachment_id_str, stamp)
+            if json_data is CACHE_MISS:
+                # Read and parse JSON - use asyncio.to_thread to avoid blocking event loop
+                # File I/O and JSON parsing can be blocking on large files
+                try:
 
-            def _execute_jq_query() -> list[Any]:
-                jq_compiled = jq.compile(jq_program)
-                return jq_compiled.input(json_data).all()
+                    def _load_and_parse_json() -> Any:  # noqa: ANN401
+                        content = file_path.read_bytes()
+                        return json.loads(content.decode("utf-8"))
 
-            result = await asyncio.to_thread(_execute_jq_query)
+                    json_data = await asyncio.to_thread(_load_and_parse_json)
+                except UnicodeDecodeError:
+                    return ToolResult(
+                        text="Error: Attachment is not valid UTF-8 text. Cannot process as JSON."
+                    )
+                except json.JSONDecodeError as e:
+                    return ToolResult(
+                        text=f"Error: Attachment is not valid JSON. Parse error: {str(e)}"
+                    )
+                _parsed_json_cache.put(attachment_id_str, stamp, json_data)
 
-            # Return structured data - ToolResult handles conversion to text for LLM
-            # If single result, unwrap from list
-            if len(result) == 1:
-                return ToolResult(data=result[0])
-            else:
-                return ToolResult(data=result)
+            # Execute jq query - use asyncio.to_thread to avoid blocking event loop
+            # .input_value().all() is a CPU-intensive synchronous operation
+            try:
+                result = await asyncio.to_thread(
+                    lambda: program.input_value(json_data).all()
+                )
+            except ValueError as e:
+                # jq execution error
+                logger.error(f"jq query error: {e}")
+                return ToolResult(text=f"Error: Invalid jq query. {str(e)}")
 
-        except ValueError as e:
-            # jq compilation or execution error
-            logger.error(f"jq query error: {e}")
-            return ToolResult(text=f"Error: Invalid jq query. {str(e)}")
+        # Return structured data - ToolResult handles conversion to text for LLM
+        # If single result, unwrap from list
+        if len(result) == 1:
+            return ToolResult(data=result[0])
+        else:
+            return ToolResult(data=result)
 
     except Exception as e:
         logger.error(
@@ -7,13 +7,13 @@ specifications and returning them as PNG attachments.
 
 import asyncio
 import csv
+import hashlib
 import io
 import json
 import logging
 from typing import TYPE_CHECKING, Any
 
-import vl_convert as vlc
-
+from family_assistant.services.attachment_derivatives import AttachmentDerivativeCache
 from family_assistant.tools.types import ToolAttachment, ToolDefinition, ToolResult
 
 if TYPE_CHECKING:
@@ -22,6 +22,34 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+CHART_RENDER_CACHE_MAX_BYTES = 32 * 1024 * 1024  # 32MB
+CHART_RENDER_WORKERS = 2
+
+# Charts render in their own bounded pool so bursts of renders cannot starve the
+# default executor, and identical charts are served from cache. Repeated PNGs
+# then share one content-addressed blob in the attachment store.
+_chart_renders = AttachmentDerivativeCache(
+    max_bytes=CHART_RENDER_CACHE_MAX_BYTES, max_workers=CHART_RENDER_WORKERS
+)
+
+
+def shutdown_chart_renders() -> None:
+    """Stop the chart render worker pool."""
+    _chart_renders.shutdown()
+
+
+# ast-grep-ignore: no-dict-any - Vega specs are arbitrary JSON
+def _render_key(spec_dict: dict[str, Any], scale: float, is_vega_lite: bool) -> str:
+    """Hash the merged spec and render options into a render cache key."""
+    canonical = json.dumps(
+        {"spec": spec_dict, "scale": scale, "vega_lite": is_vega_lite},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 # Tool Definitions
 DATA_VISUALIZATION_TOOLS_DEFINITION: list[ToolDefinition] = [
     {
@@ -197,10 +225,15 @@ async def create_vega_chart_tool(
             is_vega_lite = "vega-lite" in spec_dict["$schema"].lower()
 
         # Convert to PNG using vl-convert
-        # Use asyncio.to_thread as vl-convert rendering is CPU-intensive and can block for seconds
+        # Rendering is CPU-intensive and can block for seconds, so it runs in the
+        # dedicated chart render pool
         try:
 
             def _render_chart() -> bytes:
+                # vl-convert embeds a whole JavaScript runtime, so it is only
+                # loaded once a chart is actually rendered
+                import vl_convert as vlc  # noqa: PLC0415
+
                 if is_vega_lite:
                     return vlc.vegalite_to_png(
                         vl_spec=spec_dict,
@@ -212,7 +245,14 @@ async def create_vega_chart_tool(
                         scale=scale,
                     )
 
-            png_data = await asyncio.to_thread(_render_chart)
+            png_data = await _chart_renders.get_or_compute(
+                _render_key(spec_dict, scale, is_vega_lite), "vega_png", _render_chart
+            )
+            logger.debug(
+                f"Chart render cache: {_chart_renders.hits} hits, "
+                f"{_chart_renders.misses} misses, "
+                f"max queue time {_chart_renders.queue_seconds_max:.3f}s"
+            )
         except Exception as e:
             logger.error(f"Error rendering Vega spec: {e}", exc_info=True)
             return ToolResult(text=f"Error rendering chart: {str(e)}")
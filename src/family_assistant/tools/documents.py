@@ -42,6 +42,7 @@ logger = logging.getLogger(__name__)
 DOCUMENT_TOOLS_DEFINITION: list[ToolDefinition] = [
     {
         "type": "function",
+        "side_effect_free": True,
         "function": {
             "name": "search_documents",
             "description": (
@@ -169,6 +170,7 @@ DOCUMENT_TOOLS_DEFINITION: list[ToolDefinition] = [
     },
     {
         "type": "function",
+        "side_effect_free": True,
         "function": {
             "name": "get_user_documentation_content",
             "description": (
@@ -20,6 +20,7 @@ logger = logging.getLogger(__name__)
 EVENT_TOOLS_DEFINITION: list[ToolDefinition] = [
     {
         "type": "function",
+        "side_effect_free": True,
         "function": {
             "name": "query_recent_events",
             "description": (
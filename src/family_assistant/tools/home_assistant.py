@@ -124,6 +124,7 @@ HOME_ASSISTANT_TOOLS_DEFINITION: list[ToolDefinition] = [
     },
     {
         "type": "function",
+        "side_effect_free": True,
         "function": {
             "name": "render_home_assistant_template",
             "description": (
@@ -186,6 +187,7 @@ HOME_ASSISTANT_TOOLS_DEFINITION: list[ToolDefinition] = [
     },
     {
         "type": "function",
+        "side_effect_free": True,
         "function": {
             "name": "list_home_assistant_entities",
             "description": (
@@ -7,6 +7,7 @@ concrete implementations including mock (PIL-based) and Gemini API backends.
 
 import asyncio
 import base64
+import importlib.util
 import io
 import logging
 import random
@@ -16,13 +17,9 @@ from typing import Protocol, runtime_checkable
 
 from PIL import Image, ImageDraw, ImageFilter, ImageFont, ImageOps
 
-# Optional import for production use
-try:
-    from google import genai
-
-    GENAI_AVAILABLE = True
-except ImportError:
-    GENAI_AVAILABLE = False
+# Optional dependency for production use. google-genai is slow to import, so it
+# is only imported once a Gemini backend is actually created.
+GENAI_AVAILABLE = importlib.util.find_spec("google.genai") is not None
 
 logger = logging.getLogger(__name__)
 
@@ -317,6 +314,8 @@ class GeminiImageBackend:
                 "google-genai library required for Gemini image generation"
             )
 
+        from google import genai  # noqa: PLC0415
+
         self.api_key = api_key
         self.client = genai.Client(api_key=api_key)
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
@@ -12,6 +12,7 @@ import inspect
 import json
 import logging
 import uuid
+from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -46,7 +47,8 @@ def translate_attachment_schemas_for_llm(
     Translate tool schemas for LLM compatibility by converting attachment types.
 
     Transforms 'type': 'attachment' parameters to 'type': 'string' with descriptive text
-    explaining that the LLM should provide an attachment UUID.
+    explaining that the LLM should provide an attachment UUID, and drops the
+    internal 'side_effect_free' flag.
 
     Args:
         tool_definitions: List of tool definitions with potentially internal attachment types
@@ -58,6 +60,7 @@ def translate_attachment_schemas_for_llm(
     translated_definitions: list[ToolDefinition] = list(copy.deepcopy(tool_definitions))
 
     for tool_def in translated_definitions:
+        tool_def.pop("side_effect_free", None)
         if tool_def.get("type") == "function":
             function_def = tool_def.get("function", {})
             parameters = function_def.get("parameters", {})
@@ -245,6 +248,135 @@ class ToolNotFoundError(Exception):
         super().__init__(message)
 
 
+@dataclass(frozen=True)
+class _ToolDispatch:
+    """Per-tool metadata LocalToolsProvider compiles once instead of per call."""
+
+    # ast-grep-ignore: no-dict-any - Implementation map has heterogeneous callable types
+    func: Any
+    definition: ToolDefinition | None
+    # Names of the framework-provided parameters to inject
+    injections: frozenset[str]
+    # Parameters whose schema type is an attachment (or array of attachments)
+    attachment_params: frozenset[str]
+
+
+def _attachment_parameters(definition: ToolDefinition | None) -> frozenset[str]:
+    if definition is None:
+        return frozenset()
+    properties = (
+        definition.get("function", {}).get("parameters", {}).get("properties", {})
+    )
+    names = set()
+    for param_name, param_def in properties.items():
+        items = param_def.get("items", {})
+        if param_def.get("type") == "attachment" or (
+            param_def.get("type") == "array"
+            and isinstance(items, dict)
+            and items.get("type") == "attachment"
+        ):
+            names.add(param_name)
+    return frozenset(names)
+
+
+# ast-grep-ignore: no-dict-any - Implementation map has heterogeneous callable types
+def _injected_parameters(callable_func: Any) -> frozenset[str]:  # noqa: ANN401
+    """Works out which framework-provided arguments a tool function accepts."""
+    sig = inspect.signature(callable_func)
+
+    resolved_hints = {}
+    try:
+        func_module = inspect.getmodule(callable_func)
+        global_ns = func_module.__dict__ if func_module else None
+        resolved_hints = get_type_hints(callable_func, globalns=global_ns)
+    except Exception as e:
+        logger.warning(
+            f"Could not fully resolve type hints for '{callable_func.__name__}': {e}. "
+            "Injection will rely on raw annotations where resolution failed."
+        )
+
+    injections = set()
+    for param_name, param in sig.parameters.items():
+        # Use resolved hint if available, otherwise use the raw annotation from signature.
+        annotation_to_check = resolved_hints.get(param_name, param.annotation)
+
+        if param_name == "exec_context":
+            if annotation_to_check is ToolExecutionContext:
+                injections.add(param_name)
+            # Fallback for unresolved forward reference string
+            elif (
+                isinstance(param.annotation, str)
+                and param.annotation == "ToolExecutionContext"
+            ):
+                injections.add(param_name)
+                logger.debug(
+                    f"Identified 'exec_context' for {callable_func.__name__} via string forward reference fallback."
+                )
+
+        elif param_name == "db_context":
+            # Check for DatabaseContext by name since we can't import it
+            if (
+                hasattr(annotation_to_check, "__name__")
+                and annotation_to_check.__name__ == "DatabaseContext"
+            ):
+                injections.add(param_name)
+            # Fallback for unresolved forward reference string
+            elif isinstance(param.annotation, str) and (
+                param.annotation == "DatabaseContext"
+                or param.annotation.endswith(".DatabaseContext")
+            ):
+                injections.add(param_name)
+                logger.debug(
+                    f"Identified 'db_context' for {callable_func.__name__} via string forward reference fallback."
+                )
+
+        elif param_name == "embedding_generator":
+            # Check for EmbeddingGenerator by name since we can't import it
+            if (
+                hasattr(annotation_to_check, "__name__")
+                and annotation_to_check.__name__ == "EmbeddingGenerator"
+            ):
+                injections.add(param_name)
+            # Also check for string annotation
+            elif (
+                isinstance(param.annotation, str)
+                and param.annotation == "EmbeddingGenerator"
+            ):
+                injections.add(param_name)
+                logger.debug(
+                    f"Identified 'embedding_generator' for {callable_func.__name__} via string annotation."
+                )
+
+        elif param_name == "calendar_config":
+            if (
+                annotation_to_check == "CalendarConfig"
+                or annotation_to_check == dict[str, Any]
+            ):
+                injections.add(param_name)
+            # Handle string annotation fallback
+            elif (
+                isinstance(param.annotation, str)
+                and param.annotation == "dict[str, Any]"
+            ):
+                injections.add(param_name)
+                logger.debug(
+                    f"Identified 'calendar_config' for {callable_func.__name__} via string annotation fallback."
+                )
+            # Also handle cases where the type might not match exactly
+            elif (
+                hasattr(annotation_to_check, "__origin__")
+                and annotation_to_check.__origin__ is dict
+            ):
+                injections.add(param_name)
+                logger.debug(
+                    f"Matched calendar_config via __origin__ check for {callable_func.__name__}"
+                )
+            elif annotation_to_check == CalendarConfig:
+                injections.add(param_name)
+
+    return frozenset(injections)
+
+
 class LocalToolsProvider:
     """Provides and executes locally defined Python functions as tools."""
 
@@ -260,6 +392,26 @@ class LocalToolsProvider:
         self._implementations = implementations
         self._embedding_generator = embedding_generator
         self._calendar_config = calendar_config
+        # Translating schemas and inspecting signatures is done once here
+        # rather than on every turn and every call
+        self._llm_definitions = translate_attachment_schemas_for_llm(self._definitions)
+        self._definitions_by_name: dict[str, ToolDefinition] = {}
+        for definition in self._definitions:
+            tool_name = definition.get("function", {}).get("name")
+            if tool_name is not None:
+                self._definitions_by_name.setdefault(tool_name, definition)
+        self._side_effect_free_tools = frozenset(
+            name
+            for name, definition in self._definitions_by_name.items()
+            if definition.get("side_effect_free")
+        )
+        self._dispatch: dict[str, _ToolDispatch] = {}
+        for tool_name, func in implementations.items():
+            try:
+                self._dispatch[tool_name] = self._compile_dispatch(tool_name, func)
+            except (TypeError, ValueError) as e:
+                # Retried (and reported) when the tool is called
+                logger.warning(f"Could not precompile local tool '{tool_name}': {e}")
         logger.info(
             f"LocalToolsProvider initialized with {len(self._definitions)} tools: {list(self._implementations.keys())}"
         )
@@ -272,9 +424,14 @@ class LocalToolsProvider:
         """Get tool definitions translated for LLM compatibility.
 
         Returns tool definitions with attachment types converted to string types
-        with UUID descriptions for LLM compatibility.
+        with UUID descriptions for LLM compatibility. The translation is done
+        once at construction; callers must not mutate the returned schemas.
         """
-        return translate_attachment_schemas_for_llm(self._definitions)
+        return list(self._llm_definitions)
+
+    def get_side_effect_free_tools(self) -> frozenset[str]:
+        """Names of the tools whose definitions are flagged side_effect_free."""
+        return self._side_effect_free_tools
 
     def get_raw_tool_definitions(self) -> list[ToolDefinition]:
         """Get raw internal tool definitions without LLM translation.
@@ -301,128 +458,36 @@ class LocalToolsProvider:
         callable_func = self._implementations[name]
         logger.info(f"Executing local tool '{name}' with args: {arguments}")
         try:
+            dispatch = self._dispatch.get(name)
+            if dispatch is None or dispatch.func is not callable_func:
+                # Implementation registered or replaced after construction
+                dispatch = self._compile_dispatch(name, callable_func)
+                self._dispatch[name] = dispatch
+
             # Prepare arguments, potentially injecting context or generator
             call_args = arguments.copy()
             logger.debug(f"Tool '{name}' - Initial arguments from LLM: {arguments}")
-            logger.debug(f"Tool '{name}' - Initial call_args (copy): {call_args}")
 
             # Process attachment arguments (convert string IDs to ScriptAttachment objects)
             try:
-                # Find the tool definition to know which parameters are attachments
-                tool_definition = None
-                for definition in self._definitions:
-                    if definition.get("function", {}).get("name") == name:
-                        tool_definition = definition
-                        break
-
-                call_args = await process_attachment_arguments(
-                    call_args, context, tool_definition
-                )
+                if (
+                    dispatch.definition is None
+                    or not dispatch.attachment_params.isdisjoint(call_args)
+                ):
+                    call_args = await process_attachment_arguments(
+                        call_args, context, dispatch.definition
+                    )
             except ValueError as e:
                 logger.error(f"Attachment processing failed for tool '{name}': {e}")
                 return f"Error: {str(e)}"
-            sig = inspect.signature(callable_func)
-
-            resolved_hints = {}
-            try:
-                func_module = inspect.getmodule(callable_func)
-                global_ns = func_module.__dict__ if func_module else None
-                resolved_hints = get_type_hints(callable_func, globalns=global_ns)
-            except Exception as e:
-                logger.warning(
-                    f"Could not fully resolve type hints for '{callable_func.__name__}': {e}. "
-                    "Injection will rely on raw annotations where resolution failed."
-                )
 
-            needs_exec_context = False
-            needs_db_context = False
-            needs_embedding_generator = False
-            needs_calendar_config = False
-
-            for param_name, param in sig.parameters.items():
-                # Use resolved hint if available, otherwise use the raw annotation from signature.
-                annotation_to_check = resolved_hints.get(param_name, param.annotation)
-
-                if param_name == "exec_context":
-                    if annotation_to_check is ToolExecutionContext:
-                        needs_exec_context = True
-                    # Fallback for unresolved forward reference string
-                    elif (
-                        isinstance(param.annotation, str)
-                        and param.annotation == "ToolExecutionContext"
-                    ):
-                        needs_exec_context = True
-                        logger.debug(
-                            f"Identified 'exec_context' for {callable_func.__name__} via string forward reference fallback."
-                        )
-
-                elif param_name == "db_context":
-                    # Check for DatabaseContext by name since we can't import it
-                    if (
-                        hasattr(annotation_to_check, "__name__")
-                        and annotation_to_check.__name__ == "DatabaseContext"
-                    ):
-                        needs_db_context = True
-                    # Fallback for unresolved forward reference string
-                    elif isinstance(param.annotation, str) and (
-                        param.annotation == "DatabaseContext"
-                        or param.annotation.endswith(".DatabaseContext")
-                    ):
-                        needs_db_context = True
-                        logger.debug(
-                            f"Identified 'db_context' for {callable_func.__name__} via string forward reference fallback."
-                        )
-
-                elif param_name == "embedding_generator":
-                    # Check for EmbeddingGenerator by name since we can't import it
-                    if (
-                        hasattr(annotation_to_check, "__name__")
-                        and annotation_to_check.__name__ == "EmbeddingGenerator"
-                    ):
-                        needs_embedding_generator = True
-                    # Also check for string annotation
-                    elif (
-                        isinstance(param.annotation, str)
-                        and param.annotation == "EmbeddingGenerator"
-                    ):
-                        needs_embedding_generator = True
-                        logger.debug(
-                            f"Identified 'embedding_generator' for {callable_func.__name__} via string annotation."
-                        )
-
-                elif param_name == "calendar_config":
-                    if (
-                        annotation_to_check == "CalendarConfig"
-                        or annotation_to_check == dict[str, Any]
-                    ):
-                        needs_calendar_config = True
-                    # Handle string annotation fallback
-                    elif (
-                        isinstance(param.annotation, str)
-                        and param.annotation == "dict[str, Any]"
-                    ):
-                        needs_calendar_config = True
-                        logger.debug(
-                            f"Identified 'calendar_config' for {callable_func.__name__} via string annotation fallback."
-                        )
-                    # Also handle cases where the type might not match exactly
-                    elif (
-                        hasattr(annotation_to_check, "__origin__")
-                        and annotation_to_check.__origin__ is dict
-                    ):
-                        needs_calendar_config = True
-                        logger.debug(
-                            f"Matched calendar_config via __origin__ check for {callable_func.__name__}"
-                        )
-                    elif annotation_to_check == CalendarConfig:
-                        needs_calendar_config = True
-
-            # Inject dependencies based on resolved needs
-            if needs_exec_context:
+            # Inject dependencies based on the precompiled plan
+            if "exec_context" in dispatch.injections:
                 call_args["exec_context"] = context
-            if needs_db_context:  # db_context is part of ToolExecutionContext
+            if "db_context" in dispatch.injections:
+                # db_context is part of ToolExecutionContext
                 call_args["db_context"] = context.db_context
-            if needs_embedding_generator:
+            if "embedding_generator" in dispatch.injections:
                 if self._embedding_generator:
                     call_args["embedding_generator"] = self._embedding_generator
                 else:
@@ -430,7 +495,7 @@ class LocalToolsProvider:
                         f"Tool '{name}' requires an embedding generator, but none was provided to LocalToolsProvider."
                     )
                     return f"Error: Tool '{name}' cannot be executed because the embedding generator is missing."
-            if needs_calendar_config:
+            if "calendar_config" in dispatch.injections:
                 if self._calendar_config:
                     call_args["calendar_config"] = self._calendar_config
                 else:
@@ -439,21 +504,7 @@ class LocalToolsProvider:
                     )
                     return f"Error: Tool '{name}' cannot be executed because the calendar_config is missing."
 
-            # Clean up arguments not expected by the function signature
-            # (Ensures we don't pass exec_context if only db_context was needed, etc.)
-            expected_args = set(sig.parameters.keys())
-            args_to_remove = set(call_args.keys()) - expected_args
-            for arg_name in args_to_remove:
-                # Only remove if it wasn't part of the original LLM arguments
-                if arg_name not in arguments:
-                    del call_args[arg_name]
-
-            # Ensure all original arguments that are expected by the function are included
-            for param_name in sig.parameters:
-                if param_name in arguments and param_name not in call_args:
-                    call_args[param_name] = arguments[param_name]
-
-            logger.debug(f"Tool '{name}' - Final call_args after cleanup: {call_args}")
+            logger.debug(f"Tool '{name}' - Final call_args: {call_args}")
 
             # Execute the function with prepared arguments
             result = await callable_func(**call_args)
@@ -489,6 +540,20 @@ class LocalToolsProvider:
             # Re-raise or return formatted error string? Returning error string for now.
             return f"Error executing tool '{name}': {e}"
 
+    def _compile_dispatch(
+        self,
+        name: str,
+        # ast-grep-ignore: no-dict-any - Implementation map has heterogeneous callable types
+        callable_func: Any,  # noqa: ANN401
+    ) -> _ToolDispatch:
+        definition = self._definitions_by_name.get(name)
+        return _ToolDispatch(
+            func=callable_func,
+            definition=definition,
+            injections=_injected_parameters(callable_func),
+            attachment_params=_attachment_parameters(definition),
+        )
+
     def get_calendar_config(self) -> CalendarConfig | None:
         """Get the calendar configuration."""
         return self._calendar_config
@@ -807,6 +872,32 @@ class ConfirmingToolsProvider(ToolsProvider):
         logger.info("ConfirmingToolsProvider finished closing wrapped provider.")
 
 
+def get_side_effect_free_tools(provider: ToolsProvider) -> frozenset[str]:
+    """Collects the side-effect free local tools reachable from a provider.
+
+    Traverses wrappers and composites like find_provider_by_type. Only
+    LocalToolsProvider definitions carry the flag.
+
+    Args:
+        provider: The root provider to start searching from
+
+    Returns:
+        Names of tools that can safely be executed speculatively
+    """
+    if isinstance(provider, LocalToolsProvider):
+        return provider.get_side_effect_free_tools()
+
+    if isinstance(provider, ToolProviderWrapper):
+        return get_side_effect_free_tools(provider.wrapped_provider)
+
+    if isinstance(provider, ToolProviderComposite):
+        return frozenset().union(
+            *(get_side_effect_free_tools(sub) for sub in provider.get_providers())
+        )
+
+    return frozenset()
+
+
 def find_provider_by_type[T](
     provider: ToolsProvider, provider_type: type[T]
 ) -> T | None:
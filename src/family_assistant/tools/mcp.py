@@ -2,8 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
+import json
 import logging
 import os  # Import os for environment variable resolution
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -15,9 +20,6 @@ if TYPE_CHECKING:
     from collections.abc import Mapping
 
     from mcp import ClientSession
-from mcp import ClientSession, StdioServerParameters, stdio_client
-from mcp.client.sse import sse_client  # Assuming sse_client is in mcp.client.sse
-from mcp.types import TextContent  # Import TextContent from mcp.types
 
 # Import storage functions needed by local tools
 # Import the context from the new types file
@@ -37,6 +39,40 @@ MCP_SERVER_STATUS_CONNECTED = "connected"
 MCP_SERVER_STATUS_FAILED = "failed"
 MCP_SERVER_STATUS_CANCELLED = "cancelled"
 
+DEFAULT_RESULT_CACHE_TTL_SECONDS = 60.0
+RESULT_CACHE_MAX_ENTRIES = 256
+
+
+@dataclass
+class _PooledSession:
+    """A session to an MCP server and the number of calls it is serving."""
+
+    session: ClientSession
+    in_flight: int = 0
+
+
+@dataclass
+class _ServerCallStats:
+    calls: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    total_latency_seconds: float = 0.0
+    last_latency_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class MCPServerMetrics:
+    """Snapshot of an MCP server's sessions and call statistics."""
+
+    status: str
+    sessions: int
+    in_flight: int
+    calls: int
+    errors: int
+    cache_hits: int
+    mean_latency_ms: float
+    last_latency_ms: float
+
 
 class MCPToolsProvider:
     """
@@ -55,7 +91,8 @@ class MCPToolsProvider:
         self._mcp_server_configs = dict(mcp_server_configs)
         self._initialization_timeout_seconds = initialization_timeout_seconds
         self._health_check_interval_seconds = health_check_interval_seconds
-        self._sessions: dict[str, ClientSession] = {}
+        # Each server has a pool of sessions; calls go to the least busy one
+        self._sessions: dict[str, list[_PooledSession]] = {}
         self._tool_map: dict[str, str] = {}  # Map tool name -> server_id
         self._definitions: list[ToolDefinition] = []
         self._initialized = False
@@ -66,6 +103,14 @@ class MCPToolsProvider:
         }
         self._health_check_task: asyncio.Task | None = None
         self._health_check_enabled = True
+        self._call_stats: dict[str, _ServerCallStats] = {
+            server_id: _ServerCallStats() for server_id in self._mcp_server_configs
+        }
+        self._calls_at_last_report: dict[str, int] = {}
+        # Results of idempotent tools: (tool name, canonical arguments) -> (expiry, result)
+        self._result_cache: OrderedDict[tuple[str, str], tuple[float, str]] = (
+            OrderedDict()
+        )
         logger.info(
             f"MCPToolsProvider created for {len(self._mcp_server_configs)} configured servers. "
             f"Initialization timeout: {self._initialization_timeout_seconds}s. "
@@ -127,13 +172,27 @@ class MCPToolsProvider:
         self,
         server_id: str,
         server_conf: MCPServerConfig,
-    ) -> tuple[ClientSession | None, list[ToolDefinition], dict[str, str]]:
-        """Connects to a single MCP server, discovers tools, and returns results."""
+    ) -> tuple[list[ClientSession], list[ToolDefinition], dict[str, str]]:
+        """Connects to a single MCP server, discovers tools, and returns results.
+
+        Opens `pool_size` sessions (default 1) so that concurrent calls to the
+        server are not serialized on one channel. All of them share the
+        server's exit stack.
+        """
+        # The MCP SDK is slow to import, so it is only loaded once a server is
+        # actually configured
+        from mcp import (  # noqa: PLC0415
+            ClientSession,
+            StdioServerParameters,
+            stdio_client,
+        )
+        from mcp.client.sse import sse_client  # noqa: PLC0415
+
         self._server_statuses[server_id] = MCP_SERVER_STATUS_CONNECTING
         discovered_tools = []
         tool_map = {}
-        session = None
         exit_stack = contextlib.AsyncExitStack()
+        pool_size = max(1, int(server_conf.get("pool_size", 1)))
 
         transport_type = server_conf.get("transport", "stdio").lower()
         url = server_conf.get("url")  # Needed for SSE
@@ -207,22 +266,13 @@ class MCPToolsProvider:
                     self._server_statuses[server_id] = MCP_SERVER_STATUS_FAILED
                     with contextlib.suppress(Exception):
                         await exit_stack.aclose()
-                    return None, [], {}
+                    return [], [], {}
                 server_params = StdioServerParameters(
                     command=command,
                     args=args,
                     env=resolved_env_stdio,  # Use stdio-specific env vars
                 )
-
-                read_stream, write_stream = await exit_stack.enter_async_context(
-                    stdio_client(server_params)
-                )
-
-                session = await exit_stack.enter_async_context(
-                    ClientSession(read_stream, write_stream)
-                )
-
-                self._connection_contexts[server_id] = exit_stack
+                open_transport = functools.partial(stdio_client, server_params)
 
             elif transport_type == "sse":
                 if not url:
@@ -230,7 +280,7 @@ class MCPToolsProvider:
                     self._server_statuses[server_id] = MCP_SERVER_STATUS_FAILED
                     with contextlib.suppress(Exception):
                         await exit_stack.aclose()
-                    return None, [], {}
+                    return [], [], {}
 
                 # Construct headers using the resolved token
                 headers = {}
@@ -244,16 +294,7 @@ class MCPToolsProvider:
                         f"No token resolved for SSE server '{server_id}'. Connecting without Authorization header."
                     )
                     # Add other potential header mappings here if needed
-
-                read_stream, write_stream = await exit_stack.enter_async_context(
-                    sse_client(url=url, headers=headers)
-                )
-
-                session = await exit_stack.enter_async_context(
-                    ClientSession(read_stream, write_stream)
-                )
-
-                self._connection_contexts[server_id] = exit_stack
+                open_transport = functools.partial(sse_client, url=url, headers=headers)
 
             else:
                 logger.error(
@@ -262,10 +303,22 @@ class MCPToolsProvider:
                 self._server_statuses[server_id] = MCP_SERVER_STATUS_FAILED
                 with contextlib.suppress(Exception):
                     await exit_stack.aclose()
-                return None, [], {}
+                return [], [], {}
+
+            async def open_session() -> ClientSession:
+                read_stream, write_stream = await exit_stack.enter_async_context(
+                    open_transport()
+                )
+                session = await exit_stack.enter_async_context(
+                    ClientSession(read_stream, write_stream)
+                )
+                await session.initialize()
+                return session
+
+            self._connection_contexts[server_id] = exit_stack
 
             # --- Initialize Session and Discover Tools (Common Logic) ---
-            await session.initialize()
+            session = await open_session()
             self._server_statuses[server_id] = MCP_SERVER_STATUS_CONNECTED
             logger.info(
                 f"Initialized session with MCP server '{server_id}' ({transport_type}). Status: {self._server_statuses[server_id]}."
@@ -291,7 +344,23 @@ class MCPToolsProvider:
                         f"Found tool definition without a name on server '{server_id}': {tool_def}"
                     )
 
-            return session, discovered_tools, tool_map
+            sessions = [session]
+            # Opened in this task, since the transports' cancel scopes must be
+            # exited by the task that entered them
+            while len(sessions) < pool_size:
+                try:
+                    sessions.append(await open_session())
+                except Exception as e:
+                    logger.warning(
+                        f"Could only open {len(sessions)} of {pool_size} sessions to MCP server '{server_id}': {e}"
+                    )
+                    break
+            if pool_size > 1:
+                logger.info(
+                    f"Opened a pool of {len(sessions)} sessions to MCP server '{server_id}'."
+                )
+
+            return sessions, discovered_tools, tool_map
 
         except Exception as e:
             logger.error(
@@ -304,7 +373,7 @@ class MCPToolsProvider:
             # Clean up any partially created contexts
             if server_id in self._connection_contexts:
                 await self._close_server_connections(server_id)
-            return None, [], {}  # Return empty on failure
+            return [], [], {}  # Return empty on failure
 
     async def initialize(self) -> None:
         """Connects to configured MCP servers, fetches and sanitizes tool definitions."""
@@ -433,10 +502,12 @@ class MCPToolsProvider:
                 )
                 self._server_statuses[server_id] = MCP_SERVER_STATUS_FAILED
             else:
-                session, discovered_tools, tool_map_for_server = res_item
-                if session:
+                sessions, discovered_tools, tool_map_for_server = res_item
+                if sessions:
                     # Status should be CONNECTED from _connect_and_discover_mcp
-                    self._sessions[server_id] = session
+                    self._sessions[server_id] = [
+                        _PooledSession(session) for session in sessions
+                    ]
 
                     # Check for duplicates before adding
                     for tool_def in discovered_tools:
@@ -554,14 +625,17 @@ class MCPToolsProvider:
                     break
 
                 # Check each connected server
-                for server_id, session in list(self._sessions.items()):
+                for server_id, pool in list(self._sessions.items()):
                     if not self._health_check_enabled:
                         break
 
                     try:
                         # Simple health check - list tools to verify connection
                         # Using a short timeout to avoid blocking too long
-                        await asyncio.wait_for(session.list_tools(), timeout=5.0)
+                        for pooled in pool:
+                            await asyncio.wait_for(
+                                pooled.session.list_tools(), timeout=5.0
+                            )
                         logger.debug(f"Health check passed for server '{server_id}'")
 
                     except TimeoutError:
@@ -605,6 +679,8 @@ class MCPToolsProvider:
                                     f"Failed to reconnect server '{server_id}' during health check"
                                 )
 
+                self._report_metrics()
+
             except asyncio.CancelledError:
                 logger.info("Health check loop cancelled")
                 break
@@ -616,6 +692,87 @@ class MCPToolsProvider:
 
         logger.info("Health check loop stopped")
 
+    def get_server_metrics(self) -> dict[str, MCPServerMetrics]:
+        """Returns session pool and latency metrics for each configured server."""
+        metrics = {}
+        for server_id in self._mcp_server_configs:
+            stats = self._call_stats.setdefault(server_id, _ServerCallStats())
+            pool = self._sessions.get(server_id, [])
+            metrics[server_id] = MCPServerMetrics(
+                status=self._server_statuses.get(server_id, MCP_SERVER_STATUS_PENDING),
+                sessions=len(pool),
+                in_flight=sum(pooled.in_flight for pooled in pool),
+                calls=stats.calls,
+                errors=stats.errors,
+                cache_hits=stats.cache_hits,
+                mean_latency_ms=(
+                    stats.total_latency_seconds / stats.calls * 1000
+                    if stats.calls
+                    else 0.0
+                ),
+                last_latency_ms=stats.last_latency_seconds * 1000,
+            )
+        return metrics
+
+    def _report_metrics(self) -> None:
+        """Logs metrics for servers that handled calls since the last report."""
+        for server_id, metrics in self.get_server_metrics().items():
+            handled = metrics.calls + metrics.cache_hits
+            if handled == self._calls_at_last_report.get(server_id, 0):
+                continue
+            self._calls_at_last_report[server_id] = handled
+            logger.info(
+                f"MCP server '{server_id}': {metrics.sessions} session(s), "
+                f"{metrics.in_flight} in flight, {metrics.calls} calls "
+                f"({metrics.errors} errors, {metrics.cache_hits} cache hits), "
+                f"mean latency {metrics.mean_latency_ms:.0f}ms, "
+                f"last {metrics.last_latency_ms:.0f}ms"
+            )
+
+    def _result_cache_key(
+        self,
+        server_id: str,
+        name: str,
+        # ast-grep-ignore: no-dict-any - Tool arguments are dynamic JSON from LLM
+        arguments: dict[str, Any],
+    ) -> tuple[str, str] | None:
+        """Returns the cache key for a call, or None if the tool isn't idempotent."""
+        server_conf = self._mcp_server_configs.get(server_id, {})
+        if name not in server_conf.get("idempotent_tools", ()):
+            return None
+        try:
+            canonical_arguments = json.dumps(
+                arguments, sort_keys=True, separators=(",", ":")
+            )
+        except (TypeError, ValueError):
+            return None
+        return name, canonical_arguments
+
+    def _get_cached_result(self, key: tuple[str, str]) -> str | None:
+        cached = self._result_cache.get(key)
+        if cached is None:
+            return None
+        expires_at, result = cached
+        if expires_at <= time.monotonic():
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return result
+
+    def _store_cached_result(
+        self, server_id: str, key: tuple[str, str], result: str
+    ) -> None:
+        server_conf = self._mcp_server_configs.get(server_id, {})
+        ttl = float(
+            server_conf.get(
+                "result_cache_ttl_seconds", DEFAULT_RESULT_CACHE_TTL_SECONDS
+            )
+        )
+        self._result_cache[key] = (time.monotonic() + ttl, result)
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > RESULT_CACHE_MAX_ENTRIES:
+            self._result_cache.popitem(last=False)
+
     async def _reconnect_server(self, server_id: str) -> bool:
         """Attempts to reconnect a single MCP server."""
         logger.info(f"Attempting to reconnect MCP server '{server_id}'...")
@@ -653,12 +810,14 @@ class MCPToolsProvider:
         # Attempt reconnection
         try:
             # Call the existing connection method
-            session, discovered_tools, tool_map = await self._connect_and_discover_mcp(
+            sessions, discovered_tools, tool_map = await self._connect_and_discover_mcp(
                 server_id, server_conf
             )
 
-            if session:
-                self._sessions[server_id] = session
+            if sessions:
+                self._sessions[server_id] = [
+                    _PooledSession(session) for session in sessions
+                ]
                 self._definitions.extend(discovered_tools)
                 self._tool_map.update(tool_map)
                 logger.info(
@@ -692,22 +851,46 @@ class MCPToolsProvider:
         if not server_id:
             raise ToolNotFoundError(f"MCP tool '{name}' not found in tool map.")
 
-        session = self._sessions.get(server_id)
-        if not session:
+        pool = self._sessions.get(server_id)
+        if not pool:
             # This might happen if the server failed to connect during initialize
             logger.error(
                 f"Session for server '{server_id}' (tool '{name}') not found or inactive."
             )
             raise ToolNotFoundError(f"Session for MCP tool '{name}' is unavailable.")
 
+        stats = self._call_stats.setdefault(server_id, _ServerCallStats())
+        cache_key = self._result_cache_key(server_id, name, arguments)
+        if cache_key is not None:
+            cached_result = self._get_cached_result(cache_key)
+            if cached_result is not None:
+                stats.cache_hits += 1
+                logger.info(
+                    f"Using cached result for idempotent MCP tool '{name}' on server '{server_id}'."
+                )
+                return cached_result
+
         logger.info(
             f"Executing MCP tool '{name}' on server '{server_id}' with args: {arguments}"
         )
 
+        from mcp.types import TextContent  # noqa: PLC0415
+
         # Try to execute the tool, with one reconnection attempt on failure
         for attempt in range(2):
+            pooled = min(pool, key=lambda candidate: candidate.in_flight)
+            pooled.in_flight += 1
+            started = time.monotonic()
             try:
-                mcp_result = await session.call_tool(name=name, arguments=arguments)
+                try:
+                    mcp_result = await pooled.session.call_tool(
+                        name=name, arguments=arguments
+                    )
+                finally:
+                    pooled.in_flight -= 1
+                    stats.calls += 1
+                    stats.last_latency_seconds = time.monotonic() - started
+                    stats.total_latency_seconds += stats.last_latency_seconds
 
                 # Process MCP result content
                 response_parts = []
@@ -724,6 +907,7 @@ class MCPToolsProvider:
                 )
 
                 if mcp_result.isError:
+                    stats.errors += 1
                     logger.error(
                         f"MCP tool '{name}' on server '{server_id}' returned an error: {result_str}"
                     )
@@ -732,9 +916,12 @@ class MCPToolsProvider:
                     logger.info(
                         f"MCP tool '{name}' on server '{server_id}' executed successfully."
                     )
+                    if cache_key is not None:
+                        self._store_cached_result(server_id, cache_key, result_str)
                     return result_str
 
             except Exception as e:
+                stats.errors += 1
                 if attempt == 0:
                     # First attempt failed, try to reconnect
                     logger.warning(
@@ -768,9 +955,9 @@ class MCPToolsProvider:
                         # Try to reconnect
                         reconnected = await self._reconnect_server(server_id)
                         if reconnected:
-                            # Update session reference after reconnection
-                            session = self._sessions.get(server_id)
-                            if session:
+                            # Update session references after reconnection
+                            pool = self._sessions.get(server_id)
+                            if pool:
                                 logger.info(
                                     f"Retrying tool '{name}' after successful reconnection..."
                                 )
@@ -10,9 +10,6 @@ from pathlib import Path
 from typing import TypedDict
 from urllib.parse import urlparse
 
-import yt_dlp
-from yt_dlp.utils import DownloadError, sanitize_filename
-
 from family_assistant.tools.types import (
     ToolAttachment,
     ToolDefinition,
@@ -57,6 +54,8 @@ def _sanitize_title(title: str) -> str:
     Uses yt-dlp's sanitize_filename and handles edge cases like
     leading/trailing dots and consecutive dots.
     """
+    from yt_dlp.utils import sanitize_filename  # noqa: PLC0415
+
     # Use yt-dlp's sanitization first
     safe = sanitize_filename(title, restricted=False)
     # Remove leading/trailing dots and spaces
@@ -162,6 +161,8 @@ def _extract_metadata(url: str) -> MediaMetadata:
         "extract_flat": False,  # Get full metadata
     }
 
+    import yt_dlp  # noqa: PLC0415
+
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:  # pyright: ignore[reportArgumentType] - yt_dlp lacks type stubs
         info = ydl.extract_info(url, download=False)
         if info is None:
@@ -223,6 +224,8 @@ def _download_media(
         "postprocessors": postprocessors,
     }
 
+    import yt_dlp  # noqa: PLC0415
+
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:  # pyright: ignore[reportArgumentType] - yt_dlp lacks type stubs
         info = ydl.extract_info(url, download=True)
         if info is None:
@@ -324,6 +327,10 @@ async def download_media_tool(
     # Get file size limits from config
     max_file_size, _ = get_attachment_limits(exec_context)
 
+    # yt-dlp registers hundreds of extractors on import, so it is only loaded
+    # when media is actually requested
+    from yt_dlp.utils import DownloadError  # noqa: PLC0415
+
     try:
         if metadata_only:
             # Just extract metadata without downloading
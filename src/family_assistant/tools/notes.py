@@ -158,6 +158,7 @@ NOTE_TOOLS_DEFINITION: list[ToolDefinition] = [
     },
     {
         "type": "function",
+        "side_effect_free": True,
         "function": {
             "name": "get_note",
             "description": (
@@ -182,6 +183,7 @@ NOTE_TOOLS_DEFINITION: list[ToolDefinition] = [
     },
     {
         "type": "function",
+        "side_effect_free": True,
         "function": {
             "name": "list_notes",
             "description": (
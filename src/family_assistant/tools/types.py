@@ -36,7 +36,15 @@ class CalendarConfig(TypedDict, total=False):
     ical: ICalConfig | None
 
 
-class MCPServerStdIOConfig(TypedDict, total=False):
+class MCPServerPoolConfig(TypedDict, total=False):
+    """Session pool and result cache options shared by all MCP transports."""
+
+    pool_size: int  # Sessions opened to the server, default 1
+    idempotent_tools: list[str]  # Tools whose results may be cached
+    result_cache_ttl_seconds: float
+
+
+class MCPServerStdIOConfig(MCPServerPoolConfig, total=False):
     """Configuration for a stdio-based MCP server."""
 
     transport: Literal["stdio"]
@@ -45,7 +53,7 @@ class MCPServerStdIOConfig(TypedDict, total=False):
     env: dict[str, str]
 
 
-class MCPServerSSEConfig(TypedDict):
+class MCPServerSSEConfig(MCPServerPoolConfig):
     """Configuration for an SSE-based MCP server."""
 
     transport: Literal["sse"]
@@ -53,7 +61,7 @@ class MCPServerSSEConfig(TypedDict):
     token: NotRequired[str | None]
 
 
-class MCPServerGenericConfig(TypedDict, total=False):
+class MCPServerGenericConfig(MCPServerPoolConfig, total=False):
     """Generic configuration for MCP servers, used when transport is not explicitly specified."""
 
     transport: str
@@ -156,6 +164,9 @@ class ToolDefinition(TypedDict):
 
     type: str
     function: ToolFunctionSchema
+    # Set on tools that only read state, so they may be started while the LLM
+    # is still streaming. Stripped before definitions are sent to the LLM.
+    side_effect_free: NotRequired[bool]
 
 
 if TYPE_CHECKING:
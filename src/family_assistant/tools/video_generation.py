@@ -6,10 +6,7 @@ import asyncio
 import logging
 import os
 import time
-from typing import Any, cast
-
-from google import genai
-from google.genai import types
+from typing import TYPE_CHECKING, Any, cast
 
 from family_assistant.scripting.apis.attachments import ScriptAttachment
 from family_assistant.tools.types import (
@@ -19,6 +16,9 @@ from family_assistant.tools.types import (
     ToolResult,
 )
 
+if TYPE_CHECKING:
+    from google.genai import types
+
 logger = logging.getLogger(__name__)
 
 VIDEO_GENERATION_TOOLS_DEFINITION: list[ToolDefinition] = [
@@ -90,6 +90,8 @@ async def _process_image_attachment(
     Returns:
         A types.Image object if successful, or None if content retrieval fails.
     """
+    from google.genai import types  # noqa: PLC0415
+
     if not isinstance(attachment, ScriptAttachment):
         logger.warning(f"Invalid object for {label}: {type(attachment)}")
         return None
@@ -148,6 +150,10 @@ async def generate_video_tool(
             data={"error": "GEMINI_API_KEY missing"},
         )
 
+    # google-genai is slow to import, so it is only loaded when a video is requested
+    from google import genai  # noqa: PLC0415
+    from google.genai import types  # noqa: PLC0415
+
     # Use client.aio as async context manager
     async with genai.Client(api_key=api_key).aio as client:
         try:
@@ -0,0 +1,519 @@
+"""Shared, pooled HTTP clients for outbound integrations.
+
+Calendar feeds, CalDAV servers, weather and web scraping all talk to the same
+few hosts on every message. Rather than each call opening (and TLS-handshaking)
+a fresh connection, integrations take their clients from an
+``HttpClientRegistry``, which keeps connections alive between calls.
+
+The registry is owned by ``Assistant``, which installs it as the process-wide
+registry with ``set_http_client_registry`` and closes it on shutdown. Code
+without access to the Assistant (tools, module-level helpers) uses
+``get_http_client_registry()``.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import http.cookiejar
+import ipaddress
+import logging
+import socket
+import threading
+import time
+import urllib.request
+import weakref
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import cast
+
+import caldav
+import httpcore
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Concurrent requests to any one host (scheme, host and port) per client; further
+# requests wait for a slot rather than opening more connections.
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 8
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 60.0
+DEFAULT_TIMEOUT_SECONDS = 30.0
+DNS_CACHE_TTL_SECONDS = 300.0
+DNS_CACHE_MAX_ENTRIES = 256
+
+# httpcore errors and the httpx errors they surface as, most specific first
+_TRANSPORT_ERRORS: list[tuple[type[Exception], type[httpx.TransportError]]] = [
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+]
+
+
+@dataclass
+class HostPoolStats:
+    """Request counters for one host."""
+
+    host: str
+    in_flight: int = 0
+    requests: int = 0
+    waited_for_slot: int = 0
+    """Requests that had to wait because the host was at its connection limit."""
+
+
+@dataclass
+class ClientPoolStats:
+    """Utilization of one pooled httpx client."""
+
+    verify: bool
+    connections: int
+    idle_connections: int
+    requests: int
+    hosts: list[HostPoolStats]
+
+
+@dataclass
+class HttpPoolStats:
+    """Utilization of all clients in an HttpClientRegistry."""
+
+    max_connections_per_host: int
+    clients: list[ClientPoolStats]
+    dav_clients: int
+    dns_cache_entries: int
+
+
+class _CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that caches host name resolution for new connections.
+
+    TLS still verifies the original host name: httpcore passes it to
+    ``start_tls`` separately from the address it connects to.
+    """
+
+    def __init__(
+        self,
+        backend: httpcore.AsyncNetworkBackend,
+        ttl: float,
+        max_entries: int = DNS_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._backend = backend
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._cache: dict[tuple[str, int], tuple[float, list[str]]] = {}
+
+    @property
+    def cache_size(self) -> int:
+        return len(self._cache)
+
+    async def _resolve(self, host: str, port: int) -> list[str]:
+        try:
+            ipaddress.ip_address(host)
+            return [host]
+        except ValueError:
+            pass
+        cached = self._cache.get((host, port))
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+        addresses = list(dict.fromkeys(str(info[4][0]) for info in infos))
+        self._cache.pop((host, port), None)
+        if len(self._cache) >= self._max_entries:
+            # Scraping reaches arbitrary hosts; forget the oldest lookup
+            del self._cache[next(iter(self._cache))]
+        self._cache[host, port] = (time.monotonic() + self._ttl, addresses)
+        return addresses
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await self._resolve(host, port)
+        except OSError as e:
+            raise httpcore.ConnectError(str(e)) from e
+        last_error: Exception | None = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout, local_address, socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                last_error = e
+        # Every cached address failed; resolve again next time
+        self._cache.pop((host, port), None)
+        assert last_error is not None
+        raise last_error
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+@contextlib.contextmanager
+def _map_transport_errors(request: httpx.Request) -> Iterator[None]:
+    """Re-raise httpcore errors as the matching httpx errors."""
+    try:
+        yield
+    except Exception as e:
+        for core_error, httpx_error in _TRANSPORT_ERRORS:
+            if isinstance(e, core_error):
+                raise httpx_error(str(e), request=request) from e
+        raise
+
+
+class _CoreResponseStream(httpx.AsyncByteStream):
+    """Adapts an httpcore response body to httpx."""
+
+    def __init__(self, stream: AsyncIterable[bytes], request: httpx.Request) -> None:
+        self._stream = stream
+        self._request = request
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _map_transport_errors(self._request):
+            async for chunk in self._stream:
+                yield chunk
+
+    async def aclose(self) -> None:
+        aclose = getattr(self._stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+class _DNSCachingTransport(httpx.AsyncBaseTransport):
+    """httpx transport over an httpcore pool that resolves through a DNS cache.
+
+    Equivalent to ``httpx.AsyncHTTPTransport``, which does not accept a network
+    backend, built on httpcore's public connection pool instead.
+    """
+
+    def __init__(
+        self, verify: bool, limits: httpx.Limits, dns_cache_ttl: float
+    ) -> None:
+        # httpcore exports a placeholder AnyIOBackend when anyio is missing;
+        # httpx depends on anyio, so this is always the real backend
+        backend = cast("httpcore.AsyncNetworkBackend", httpcore.AnyIOBackend())
+        self.dns_backend = _CachingDNSBackend(backend, dns_cache_ttl)
+        self.pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(verify=verify),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=self.dns_backend,
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        assert isinstance(request.stream, httpx.AsyncByteStream)
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _map_transport_errors(request):
+            response = await self.pool.handle_async_request(core_request)
+        assert isinstance(response.stream, AsyncIterable)
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_CoreResponseStream(response.stream, request),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.pool.aclose()
+
+
+class _SlotReleasingStream(httpx.AsyncByteStream):
+    """Response stream that frees the host's request slot once closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: "_SlotRelease") -> None:
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+@dataclass
+class _SlotRelease:
+    """Releases a host slot exactly once."""
+
+    semaphore: asyncio.Semaphore
+    stats: HostPoolStats
+    released: bool = False
+
+    def __call__(self) -> None:
+        if not self.released:
+            self.released = True
+            self.stats.in_flight -= 1
+            self.semaphore.release()
+
+
+@dataclass
+class _HostLimiter:
+    semaphore: asyncio.Semaphore
+    stats: HostPoolStats
+
+
+class _HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Limits concurrent requests per host and counts them for diagnostics."""
+
+    def __init__(self, transport: _DNSCachingTransport, max_per_host: int) -> None:
+        self.transport = transport
+        self._max_per_host = max_per_host
+        self._hosts: dict[str, _HostLimiter] = {}
+        self.requests = 0
+
+    def _limiter(self, url: httpx.URL) -> _HostLimiter:
+        host = f"{url.scheme}://{url.netloc.decode('ascii')}"
+        limiter = self._hosts.get(host)
+        if limiter is None:
+            limiter = _HostLimiter(
+                asyncio.Semaphore(self._max_per_host), HostPoolStats(host=host)
+            )
+            self._hosts[host] = limiter
+        return limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = self._limiter(request.url)
+        if limiter.semaphore.locked():
+            limiter.stats.waited_for_slot += 1
+        await limiter.semaphore.acquire()
+        self.requests += 1
+        limiter.stats.requests += 1
+        limiter.stats.in_flight += 1
+        release = _SlotRelease(limiter.semaphore, limiter.stats)
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _SlotReleasingStream(response.stream, release)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    def stats(self) -> tuple[int, int, list[HostPoolStats]]:
+        """Returns (open connections, idle connections, per-host stats)."""
+        connections = self.transport.pool.connections
+        idle = sum(1 for connection in connections if connection.is_idle())
+        hosts = [
+            HostPoolStats(**vars(limiter.stats)) for limiter in self._hosts.values()
+        ]
+        return len(connections), idle, hosts
+
+
+class _RejectAllCookiesPolicy(http.cookiejar.DefaultCookiePolicy):
+    """Never stores cookies, so integrations sharing a client cannot leak them.
+
+    Cookies passed explicitly on a request are still sent.
+    """
+
+    def set_ok(self, cookie: http.cookiejar.Cookie, request: object) -> bool:  # noqa: ARG002
+        return False
+
+
+@dataclass
+class _PooledClient:
+    client: httpx.AsyncClient
+    transport: _HostLimitedTransport
+
+
+@dataclass
+class HttpClientRegistry:
+    """Owns pooled HTTP clients shared by integrations.
+
+    Clients are created lazily, one per event loop and certificate verification
+    setting, since connections cannot move between loops. Callers pass per-request options (headers, timeout, follow_redirects) on
+    each request rather than configuring their own client.
+    """
+
+    max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS
+    timeout: float = DEFAULT_TIMEOUT_SECONDS
+    dns_cache_ttl: float = DNS_CACHE_TTL_SECONDS
+    # Entries go away with their event loop
+    _clients: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, dict[bool, _PooledClient]
+    ] = field(default_factory=weakref.WeakKeyDictionary)
+    # Keyed by thread as well: a DAVClient's requests session is not thread-safe
+    _dav_clients: dict[tuple[int, str, str | None, str, int], caldav.DAVClient] = field(
+        default_factory=dict
+    )
+    _dav_lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def get_client(self, verify: bool = True) -> httpx.AsyncClient:
+        """Returns the shared async client for the current event loop.
+
+        Args:
+            verify: Whether to verify TLS certificates.
+        """
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        pooled = clients.get(verify)
+        if pooled is None:
+            pooled = self._create_client(verify)
+            clients[verify] = pooled
+        return pooled.client
+
+    def _create_client(self, verify: bool) -> _PooledClient:
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        transport = _HostLimitedTransport(
+            _DNSCachingTransport(verify, limits, self.dns_cache_ttl),
+            max_per_host=self.max_connections_per_host,
+        )
+        # The client builds its own transports from HTTP(S)_PROXY/NO_PROXY
+        # (trust_env); the more specific proxy and NO_PROXY mounts take
+        # precedence over the pooled one. With ALL_PROXY everything is proxied.
+        mounts: dict[str, httpx.AsyncBaseTransport | None] = (
+            {} if "all" in urllib.request.getproxies() else {"all://": transport}
+        )
+        client = httpx.AsyncClient(
+            verify=verify,
+            limits=limits,
+            mounts=mounts,
+            timeout=self.timeout,
+            cookies=http.cookiejar.CookieJar(policy=_RejectAllCookiesPolicy()),
+        )
+        logger.info(f"Created pooled httpx client (verify={verify}).")
+        return _PooledClient(client=client, transport=transport)
+
+    def get_dav_client(
+        self,
+        url: str,
+        username: str | None,
+        password: str | None,
+        timeout: int = 30,
+    ) -> caldav.DAVClient:
+        """Returns a cached CalDAV client, whose session keeps connections open.
+
+        Call from the worker thread that uses the synchronous caldav library;
+        each thread gets its own client.
+        """
+        password_digest = hashlib.sha256((password or "").encode()).hexdigest()
+        key = (threading.get_ident(), url, username, password_digest, timeout)
+        with self._dav_lock:
+            client = self._dav_clients.get(key)
+            if client is None:
+                client = caldav.DAVClient(
+                    url=url, username=username, password=password, timeout=timeout
+                )
+                self._dav_clients[key] = client
+            return client
+
+    def stats(self) -> HttpPoolStats:
+        """Returns connection pool utilization for diagnostics."""
+        clients = []
+        pooled_clients = [
+            (verify, pooled)
+            for by_verify in list(self._clients.values())
+            for verify, pooled in by_verify.items()
+        ]
+        for verify, pooled in pooled_clients:
+            connections, idle, hosts = pooled.transport.stats()
+            clients.append(
+                ClientPoolStats(
+                    verify=verify,
+                    connections=connections,
+                    idle_connections=idle,
+                    requests=pooled.transport.requests,
+                    hosts=hosts,
+                )
+            )
+        return HttpPoolStats(
+            max_connections_per_host=self.max_connections_per_host,
+            clients=clients,
+            dav_clients=len(self._dav_clients),
+            dns_cache_entries=sum(
+                pooled.transport.transport.dns_backend.cache_size
+                for _, pooled in pooled_clients
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Closes every client created by the registry, each on its own loop."""
+        clients, self._clients = (
+            list(self._clients.items()),
+            weakref.WeakKeyDictionary(),
+        )
+        current_loop = asyncio.get_running_loop()
+        for loop, by_verify in clients:
+            for pooled in by_verify.values():
+                try:
+                    if loop is current_loop:
+                        await pooled.client.aclose()
+                    elif loop.is_running():
+                        await asyncio.wrap_future(
+                            asyncio.run_coroutine_threadsafe(
+                                pooled.client.aclose(), loop
+                            )
+                        )
+                    # Connections of a stopped loop cannot be closed cleanly
+                except Exception as e:
+                    logger.warning(f"Error closing pooled httpx client: {e}")
+        with self._dav_lock:
+            dav_clients, self._dav_clients = self._dav_clients, {}
+        for dav_client in dav_clients.values():
+            await asyncio.to_thread(dav_client.close)
+        logger.info("HTTP client registry closed.")
+
+
+_registry: HttpClientRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_http_client_registry() -> HttpClientRegistry:
+    """Returns the process-wide registry, creating one if none is installed."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = HttpClientRegistry()
+        return _registry
+
+
+def set_http_client_registry(registry: HttpClientRegistry | None) -> None:
+    """Installs the process-wide registry (None uninstalls it)."""
+    global _registry
+    with _registry_lock:
+        _registry = registry
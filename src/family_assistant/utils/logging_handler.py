@@ -1,20 +1,42 @@
 """SQLAlchemy database logging handler."""
 
 import asyncio
+import hashlib
 import logging
 import sys
+import time
 import traceback
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import insert
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql import functions as func
 
 from family_assistant.storage.context import DatabaseContext
 from family_assistant.storage.error_logs import error_logs_table
 
 
+@dataclass
+class _PendingError:
+    """An error waiting to be written, with repeats folded into a count."""
+
+    # ast-grep-ignore: no-dict-any - Mirrors the error_logs row
+    row: dict[str, Any]
+    count: int
+    last_seen: datetime
+
+
 class SQLAlchemyErrorHandler(logging.Handler):
-    """Async handler that writes ERROR and above to database.
+    """Handler that writes ERROR and above to the database in batches.
+
+    Records are fingerprinted and queued in memory; a single flusher task writes
+    each batch in one transaction. Repeats of an error - within a batch or of a
+    row written in the last `dedupe_window` seconds - increment that row's
+    occurrence_count and last_seen instead of adding rows, and their tracebacks
+    are not formatted again. When `max_pending` distinct errors are queued, new
+    ones are dropped and counted in `dropped_count`.
 
     Includes filtering for known noisy loggers (e.g., LiteLLM optional dependency errors).
     """
@@ -35,13 +57,25 @@ class SQLAlchemyErrorHandler(logging.Handler):
         self,
         engine: AsyncEngine,
         min_level: int = logging.ERROR,
+        flush_interval: float = 1.0,
+        max_pending: int = 1000,
+        dedupe_window: float = 600.0,
     ) -> None:
         super().__init__()
         self.engine = engine
         self.min_level = min_level
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.dedupe_window = dedupe_window
         self.consecutive_failures = 0
         self.circuit_breaker_threshold = 5
-        self._pending_tasks: set[asyncio.Task] = set()
+        self.dropped_count = 0
+        # Guarded by self.lock (held by logging.Handler.handle around emit)
+        self._pending: dict[str, _PendingError] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._flusher_task: asyncio.Task | None = None
+        self._write_lock: asyncio.Lock | None = None
 
     def _should_filter(self, record: logging.LogRecord) -> bool:
         """Check if this log record should be filtered out.
@@ -65,8 +99,36 @@ class SQLAlchemyErrorHandler(logging.Handler):
 
         return False
 
+    @staticmethod
+    def _fingerprint(record: logging.LogRecord) -> str:
+        """Identify repeats of the same error.
+
+        Exceptions are keyed by logger, exception type and the innermost
+        traceback frame. Plain error messages are keyed by logger, call site and
+        the unformatted message, so distinct messages logged from one place
+        (e.g. frontend error reports) stay separate.
+        """
+        exc_type, _, tb = record.exc_info or (None, None, None)
+        if exc_type is not None:
+            location = "?"
+            while tb is not None:
+                frame = tb.tb_frame
+                location = (
+                    f"{frame.f_code.co_filename}:{tb.tb_lineno}:{frame.f_code.co_name}"
+                )
+                tb = tb.tb_next
+            parts = [record.name, exc_type.__qualname__, location]
+        else:
+            parts = [
+                record.name,
+                record.levelname,
+                f"{record.pathname}:{record.lineno}",
+                str(record.msg),
+            ]
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
     def emit(self, record: logging.LogRecord) -> None:
-        """Write log record to database asynchronously."""
+        """Queue log record for the next batched database write."""
         if record.levelno < self.min_level:
             return
 
@@ -79,32 +141,133 @@ class SQLAlchemyErrorHandler(logging.Handler):
             return
 
         try:
-            # Get current event loop
             loop = asyncio.get_running_loop()
         except RuntimeError:
-            # No event loop running - can't log to database
-            # This might happen during shutdown or in sync contexts
+            # Off-loop threads (e.g. executors) hand records to the loop that
+            # owns the flusher; before one exists there is nowhere to write.
+            loop = None
+            if self._loop is None or self._loop.is_closed():
+                return
+
+        fingerprint = self._fingerprint(record)
+        seen_at = datetime.fromtimestamp(record.created)
+        pending = self._pending.get(fingerprint)
+        if pending is not None:
+            pending.count += 1
+            pending.last_seen = max(pending.last_seen, seen_at)
+        elif len(self._pending) >= self.max_pending:
+            self.dropped_count += 1
             return
+        else:
+            row = self._create_error_log_dict(record)
+            row["fingerprint"] = fingerprint
+            self._pending[fingerprint] = _PendingError(
+                row=row, count=1, last_seen=seen_at
+            )
 
-        # Create task and track it
-        task = loop.create_task(self._async_emit(record))
-        self._pending_tasks.add(task)
-        task.add_done_callback(self._pending_tasks.discard)
+        if loop is None:
+            assert self._loop is not None
+            self._loop.call_soon_threadsafe(self._wake_flusher)
+        else:
+            self._ensure_flusher(loop)
+            self._wake_flusher()
 
-    async def _async_emit(self, record: logging.LogRecord) -> None:
-        """Write log record to database."""
-        try:
-            async with DatabaseContext(engine=self.engine) as db_context:
-                error_log = self._create_error_log_dict(record)
-                stmt = insert(error_logs_table).values(**error_log)
-                await db_context.execute_with_retry(stmt)
+    def _ensure_flusher(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the flusher task on `loop` if it isn't running there already."""
+        if (
+            self._loop is loop
+            and self._flusher_task is not None
+            and not self._flusher_task.done()
+        ):
+            return
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        self._flusher_task = loop.create_task(self._run_flusher())
+
+    def _wake_flusher(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run_flusher(self) -> None:
+        """Write queued errors, at most once per flush_interval."""
+        assert self._wakeup is not None
+        while True:
+            await self._wakeup.wait()
+            # Let a burst accumulate so it lands in one transaction
+            await asyncio.sleep(self.flush_interval)
+            self._wakeup.clear()
+            await self._flush()
+
+    async def _flush(self) -> None:
+        """Write everything queued so far in a single transaction."""
+        if self._write_lock is None:
+            return
+        async with self._write_lock:
+            with self.lock:  # type: ignore[union-attr] # Created by createLock()
+                batch = list(self._pending.values())
+                self._pending = {}
+            if not batch:
+                return
+            try:
+                async with DatabaseContext(engine=self.engine) as db_context:
+                    await self._write_batch(db_context, batch)
                 self.consecutive_failures = 0  # Reset on success
-        except Exception as e:
-            self.consecutive_failures += 1
-            # Log to stderr as fallback
-            print(f"Failed to log error to database: {e}", file=sys.stderr)
+            except Exception as e:
+                self.consecutive_failures += 1
+                self.dropped_count += sum(pending.count for pending in batch)
+                # Log to stderr as fallback
+                print(f"Failed to log error to database: {e}", file=sys.stderr)
+
+    async def _write_batch(
+        self, db_context: DatabaseContext, batch: list[_PendingError]
+    ) -> None:
+        """Fold repeats into recent rows and insert the rest as one statement."""
+        cutoff = datetime.fromtimestamp(time.time() - self.dedupe_window)
+        existing_rows = await db_context.fetch_all(
+            select(
+                error_logs_table.c.fingerprint,
+                func.max(error_logs_table.c.id).label("id"),
+            )
+            .where(
+                error_logs_table.c.fingerprint.in_([
+                    pending.row["fingerprint"] for pending in batch
+                ]),
+                func.coalesce(
+                    error_logs_table.c.last_seen, error_logs_table.c.timestamp
+                )
+                >= cutoff,
+            )
+            .group_by(error_logs_table.c.fingerprint)
+        )
+        existing = {row["fingerprint"]: row["id"] for row in existing_rows}
 
-    def _create_error_log_dict(self, record: logging.LogRecord) -> dict:
+        new_rows = []
+        for pending in batch:
+            row_id = existing.get(pending.row["fingerprint"])
+            if row_id is None:
+                new_rows.append({
+                    **pending.row,
+                    "occurrence_count": pending.count,
+                    "last_seen": pending.last_seen,
+                })
+                continue
+            await db_context.execute_with_retry(
+                update(error_logs_table)
+                .where(error_logs_table.c.id == row_id)
+                .values(
+                    occurrence_count=error_logs_table.c.occurrence_count
+                    + pending.count,
+                    last_seen=pending.last_seen,
+                )
+            )
+        if new_rows:
+            await db_context.execute_with_retry(
+                insert(error_logs_table).values(new_rows)
+            )
+
+    # ast-grep-ignore: no-dict-any - Mirrors the error_logs row
+    def _create_error_log_dict(self, record: logging.LogRecord) -> dict[str, Any]:
         """Create error log dictionary from LogRecord."""
         exc_info = record.exc_info
         exception_type = None
@@ -130,28 +293,16 @@ class SQLAlchemyErrorHandler(logging.Handler):
         }
 
     async def wait_for_pending_logs(self, timeout: float = 5.0) -> None:
-        """Wait for all pending log writes to complete."""
-        if not self._pending_tasks:
-            return
-
-        # Wait for all tasks with timeout
+        """Write all queued errors now, waiting up to `timeout` seconds."""
         try:
-            await asyncio.wait_for(
-                asyncio.gather(*self._pending_tasks, return_exceptions=True),
-                timeout=timeout,
-            )
+            await asyncio.wait_for(self._flush(), timeout=timeout)
         except TimeoutError:
-            # Cancel remaining tasks
-            for task in self._pending_tasks:
-                if not task.done():
-                    task.cancel()
+            print("Timed out flushing error logs to database", file=sys.stderr)
 
     def close(self) -> None:
-        """Close handler and cancel pending tasks."""
-        # Cancel all pending tasks
-        for task in self._pending_tasks:
-            if not task.done():
-                task.cancel()
+        """Close handler and stop the flusher; unflushed errors are discarded."""
+        if self._flusher_task is not None and not self._flusher_task.done():
+            self._flusher_task.cancel()
         super().close()
 
 
@@ -4,10 +4,11 @@ rendering JavaScript, and returning content.
 """
 
 import asyncio
+import contextlib
 import io
 import logging
 import os
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Sequence
 from dataclasses import dataclass
 from importlib.metadata import version
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
@@ -15,7 +16,16 @@ from urllib.parse import urlparse
 
 import httpx
 
+from family_assistant.utils.http_clients import get_http_client_registry
+
 if TYPE_CHECKING:
+    from rebrowser_playwright.async_api import (
+        Browser,
+        BrowserContext,
+        Page,
+        Playwright,
+        Route,
+    )
     from rebrowser_playwright.async_api._context_manager import (  # noqa: PLC2701
         PlaywrightContextManager,
     )
@@ -114,6 +124,15 @@ VERBATIM_TEXT_MIME_TYPES = [
 ]
 HTML_MIME_TYPE = "text/html"
 
+DEFAULT_MAX_CONCURRENT_PAGES = 4
+DEFAULT_CONTEXT_MAX_USES = 25
+DEFAULT_CONTEXT_MAX_HEAP_MB = 256
+# Resource types that never contribute to extracted text
+DEFAULT_BLOCKED_RESOURCE_TYPES = ("image", "font", "media")
+_JS_HEAP_USED_SCRIPT = (
+    "() => performance.memory ? performance.memory.usedJSHeapSize : 0"
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -149,6 +168,246 @@ class Scraper(Protocol):
         ...
 
 
+@dataclass
+class BrowserPoolStats:
+    """Counters describing browser pool activity."""
+
+    browser_launches: int
+    browser_restarts: int
+    contexts_created: int
+    contexts_recycled: int
+    pages_served: int
+    blocked_requests: int
+    idle_contexts: int
+
+
+@dataclass
+class _PooledContext:
+    """A browser context with the single page it renders into."""
+
+    browser: "Browser"
+    context: "BrowserContext"
+    page: "Page"
+    uses: int = 0
+
+
+class BrowserPool:
+    """
+    Keeps one stealth Chromium instance running and hands out pages from a
+    pool of reusable browser contexts.
+
+    Each context owns one page and is checked out exclusively, so the number
+    of contexts never exceeds ``max_concurrent_pages``. Contexts are recycled
+    after ``context_max_uses`` pages or once their JavaScript heap grows past
+    ``context_max_heap_mb``, and the browser is relaunched if it disconnects.
+    """
+
+    def __init__(
+        self,
+        verify_ssl: bool = True,
+        user_agent: str | None = None,
+        max_concurrent_pages: int = DEFAULT_MAX_CONCURRENT_PAGES,
+        context_max_uses: int = DEFAULT_CONTEXT_MAX_USES,
+        context_max_heap_mb: int = DEFAULT_CONTEXT_MAX_HEAP_MB,
+        blocked_resource_types: Sequence[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
+    ) -> None:
+        """
+        Initializes the pool. The browser is launched on first use.
+
+        Args:
+            verify_ssl: Whether contexts verify SSL certificates.
+            user_agent: User agent for new contexts (random Chrome UA if None).
+            max_concurrent_pages: Maximum number of pages rendering at once.
+            context_max_uses: Pages rendered before a context is replaced.
+            context_max_heap_mb: JS heap size (MiB) above which a context is
+                replaced.
+            blocked_resource_types: Playwright resource types (e.g. "image",
+                "font", "media") to abort instead of downloading.
+        """
+        self.verify_ssl = verify_ssl
+        self.user_agent = user_agent
+        self.max_concurrent_pages = max(1, max_concurrent_pages)
+        self.context_max_uses = max(1, context_max_uses)
+        self.context_max_heap_bytes = context_max_heap_mb * 1024 * 1024
+        self.blocked_resource_types = frozenset(blocked_resource_types)
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._slots = asyncio.Semaphore(self.max_concurrent_pages)
+        self._launch_lock = asyncio.Lock()
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._idle: list[_PooledContext] = []
+
+        self._browser_launches = 0
+        self._browser_restarts = 0
+        self._contexts_created = 0
+        self._contexts_recycled = 0
+        self._pages_served = 0
+        self._blocked_requests = 0
+
+    def stats(self) -> BrowserPoolStats:
+        """Returns a snapshot of the pool's counters."""
+        return BrowserPoolStats(
+            browser_launches=self._browser_launches,
+            browser_restarts=self._browser_restarts,
+            contexts_created=self._contexts_created,
+            contexts_recycled=self._contexts_recycled,
+            pages_served=self._pages_served,
+            blocked_requests=self._blocked_requests,
+            idle_contexts=len(self._idle),
+        )
+
+    @contextlib.asynccontextmanager
+    async def page(self) -> AsyncIterator["Page"]:
+        """
+        Checks out a page, waiting for a free slot if all pages are busy.
+
+        The page is returned to the pool afterwards unless the body raised,
+        the page or browser crashed, or the context is due for recycling.
+
+        Raises:
+            PlaywrightError: If the browser cannot be launched.
+        """
+        self._bind_to_running_loop()
+        async with self._slots:
+            entry = await self._checkout()
+            healthy = False
+            try:
+                yield entry.page
+                healthy = True
+            finally:
+                await self._checkin(entry, healthy)
+
+    async def aclose(self) -> None:
+        """Closes all contexts, the browser and the Playwright driver."""
+        idle, self._idle = self._idle, []
+        for entry in idle:
+            await self._close_context(entry)
+        await self._shutdown_browser()
+
+    def _bind_to_running_loop(self) -> None:
+        """Drops loop-bound state if the pool is used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            logger.warning(
+                "Browser pool used from a new event loop; abandoning the old browser."
+            )
+        self._loop = loop
+        self._slots = asyncio.Semaphore(self.max_concurrent_pages)
+        self._launch_lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None
+        self._idle = []
+
+    async def _ensure_browser(self) -> "Browser":
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+            if self._browser is not None:
+                logger.warning("Playwright browser disconnected; relaunching.")
+                self._browser_restarts += 1
+                self._idle = []
+                await self._shutdown_browser()
+
+            if async_playwright is None:
+                raise PlaywrightError("Playwright library is not installed")
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            try:
+                self._browser = await launch_stealth_browser(
+                    self._playwright, headless=True
+                )
+            except Exception:
+                await self._shutdown_browser()
+                raise
+            self._browser_launches += 1
+            logger.info("Launched pooled Playwright browser.")
+            return self._browser
+
+    async def _shutdown_browser(self) -> None:
+        browser, self._browser = self._browser, None
+        playwright, self._playwright = self._playwright, None
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing Playwright browser: {e}")
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception as e:
+                logger.debug(f"Error stopping Playwright: {e}")
+
+    async def _checkout(self) -> _PooledContext:
+        browser = await self._ensure_browser()
+        while self._idle:
+            entry = self._idle.pop()
+            if entry.browser is browser and not entry.page.is_closed():
+                self._pages_served += 1
+                return entry
+            await self._close_context(entry)
+
+        context = await create_stealth_context(
+            browser,
+            ignore_https_errors=not self.verify_ssl,
+            user_agent=self.user_agent,
+        )
+        try:
+            if self.blocked_resource_types:
+                await context.route("**/*", self._route_request)
+            page = await context.new_page()
+        except Exception:
+            await context.close()
+            raise
+        self._contexts_created += 1
+        self._pages_served += 1
+        return _PooledContext(browser=browser, context=context, page=page)
+
+    async def _checkin(self, entry: _PooledContext, healthy: bool) -> None:
+        entry.uses += 1
+        reason = await self._recycle_reason(entry, healthy)
+        if reason is None:
+            self._idle.append(entry)
+            return
+        logger.debug(f"Recycling browser context after {entry.uses} uses: {reason}")
+        self._contexts_recycled += 1
+        await self._close_context(entry)
+
+    async def _recycle_reason(self, entry: _PooledContext, healthy: bool) -> str | None:
+        if not healthy:
+            return "error while in use"
+        if entry.browser is not self._browser or not entry.browser.is_connected():
+            return "browser gone"
+        if entry.page.is_closed():
+            return "page closed"
+        if entry.uses >= self.context_max_uses:
+            return "max uses reached"
+        try:
+            # Stop the previous page's scripts before measuring what it left behind
+            await entry.page.goto("about:blank")
+            heap_bytes = await entry.page.evaluate(_JS_HEAP_USED_SCRIPT)
+        except PlaywrightError as e:
+            return f"page unusable ({e})"
+        if heap_bytes > self.context_max_heap_bytes:
+            return f"JS heap at {heap_bytes // (1024 * 1024)} MiB"
+        return None
+
+    async def _close_context(self, entry: _PooledContext) -> None:
+        try:
+            await entry.context.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser context: {e}")
+
+    async def _route_request(self, route: "Route") -> None:
+        if route.request.resource_type in self.blocked_resource_types:
+            self._blocked_requests += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+
 class PlaywrightScraper:
     """
     Scrapes web content asynchronously using httpx and Playwright,
@@ -161,9 +420,14 @@ class PlaywrightScraper:
         verify_ssl: bool = True,
         user_agent: str | None = None,
         use_stealth_user_agent: bool = True,
+        max_concurrent_pages: int = DEFAULT_MAX_CONCURRENT_PAGES,
+        context_max_uses: int = DEFAULT_CONTEXT_MAX_USES,
+        context_max_heap_mb: int = DEFAULT_CONTEXT_MAX_HEAP_MB,
+        blocked_resource_types: Sequence[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
     ) -> None:
         """
-        Initializes the scraper.
+        Initializes the scraper. Playwright pages come from a shared
+        BrowserPool, so call aclose() when the scraper is no longer needed.
 
         Args:
             verify_ssl: Whether to verify SSL certificates. Defaults to True.
@@ -173,6 +437,11 @@ class PlaywrightScraper:
                 Chrome user agent instead of the bot-like DEFAULT_USER_AGENT.
                 This ensures consistent user agent between httpx and Playwright.
                 Defaults to True.
+            max_concurrent_pages: Maximum pages rendered at once by Playwright.
+            context_max_uses: Pages rendered before a browser context is replaced.
+            context_max_heap_mb: JS heap size (MiB) above which a browser context
+                is replaced.
+            blocked_resource_types: Playwright resource types to skip downloading.
         """
         self.verify_ssl = verify_ssl
         if user_agent is not None:
@@ -183,6 +452,14 @@ class PlaywrightScraper:
         else:
             self.user_agent = DEFAULT_USER_AGENT
         self.playwright_available = _playwright_installed
+        self.browser_pool = BrowserPool(
+            verify_ssl=verify_ssl,
+            user_agent=self.user_agent,
+            max_concurrent_pages=max_concurrent_pages,
+            context_max_uses=context_max_uses,
+            context_max_heap_mb=context_max_heap_mb,
+            blocked_resource_types=blocked_resource_types,
+        )
         if MarkItDownType is not None:
             self.md_converter: ActualMarkItDownClass | None = MarkItDownType()
         else:
@@ -412,7 +689,7 @@ class PlaywrightScraper:
         self, url: str
     ) -> tuple[str | None, str | None, str | None]:
         """
-        Internal: Scrapes using Playwright Async API.
+        Internal: Scrapes using a pooled Playwright page.
         Returns (html_content_str, final_mime_type, page_title_str).
         """
         if async_playwright is None or not self.playwright_available:
@@ -425,96 +702,70 @@ class PlaywrightScraper:
         content_str: str | None = None
         final_mime_type: str | None = None
         page_title_str: str | None = None
-        browser = None
-        context = None
-        page = None
 
         try:
-            async with async_playwright() as p:
+            async with self.browser_pool.page() as page:
+                response = None
                 try:
-                    # Use stealth browser with same user agent as httpx for consistency
-                    browser = await launch_stealth_browser(p, headless=True)
-                    context = await create_stealth_context(
-                        browser,
-                        ignore_https_errors=not self.verify_ssl,
-                        user_agent=self.user_agent,
+                    logger.debug(f"Playwright navigating to {url}")
+                    response = await page.goto(
+                        url, wait_until="networkidle", timeout=60000
+                    )
+                    logger.debug(f"Playwright navigation to {url} completed.")
+                except PlaywrightTimeoutError:
+                    logger.warning(
+                        f"Playwright timed out waiting for network idle at {url}. Content might be incomplete."
                     )
-                    page = await context.new_page()
-                    response = None
-                    try:
-                        logger.debug(f"Playwright navigating to {url}")
-                        response = await page.goto(
-                            url, wait_until="networkidle", timeout=60000
-                        )
-                        logger.debug(f"Playwright navigation to {url} completed.")
-                    except PlaywrightTimeoutError:
-                        logger.warning(
-                            f"Playwright timed out waiting for network idle at {url}. Content might be incomplete."
-                        )
-                    except PlaywrightError as e:
-                        if "net::ERR_" in str(e):
-                            logger.error(
-                                f"Playwright navigation network error for {url}: {e}"
-                            )
-                        else:
-                            logger.error(f"Playwright navigation error for {url}: {e}")
-                        return None, None, None
-
-                    try:
-                        content_str = await page.content()
-                        page_title_str = await page.title()  # Fetch page title
-                        if response:
-                            headers = await response.all_headers()
-                            content_type_header = headers.get("content-type")
-                            if content_type_header:
-                                final_mime_type = (
-                                    content_type_header.split(";")[0].strip().lower()
-                                )
-                        logger.debug(
-                            f"Playwright successfully fetched content for {url}. Title: '{page_title_str}', Length: {len(content_str or '')}"
-                        )
-                    except PlaywrightError as e:
-                        logger.error(f"Playwright error getting content for {url}: {e}")
-                        content_str = None
-                        page_title_str = None
-
                 except PlaywrightError as e:
-                    logger.error(f"Playwright execution error: {e}", exc_info=True)
-                    if "Executable doesn't exist" in str(
-                        e
-                    ) or "Browser process exited" in str(e):
+                    if "net::ERR_" in str(e):
                         logger.error(
-                            "Playwright browser not found or failed to launch. "
-                            "Please run: python -m rebrowser_playwright install --with-deps chromium"
+                            f"Playwright navigation network error for {url}: {e}"
                         )
-                        self.playwright_available = False
+                    else:
+                        logger.error(f"Playwright navigation error for {url}: {e}")
                     return None, None, None
-                except Exception as e:
-                    logger.error(
-                        f"Unexpected error during Playwright scraping context: {e}",
-                        exc_info=True,
+
+                try:
+                    content_str = await page.content()
+                    page_title_str = await page.title()  # Fetch page title
+                    if response:
+                        headers = await response.all_headers()
+                        content_type_header = headers.get("content-type")
+                        if content_type_header:
+                            final_mime_type = (
+                                content_type_header.split(";")[0].strip().lower()
+                            )
+                    logger.debug(
+                        f"Playwright successfully fetched content for {url}. Title: '{page_title_str}', Length: {len(content_str or '')}"
                     )
-                    return None, None, None
-                finally:
-                    if page:
-                        await page.close()
-                    if context:
-                        await context.close()
-                    if browser:
-                        await browser.close()
+                except PlaywrightError as e:
+                    logger.error(f"Playwright error getting content for {url}: {e}")
+                    content_str = None
+                    page_title_str = None
+
+        except PlaywrightError as e:
+            logger.error(f"Playwright execution error: {e}", exc_info=True)
+            if "Executable doesn't exist" in str(e) or "Browser process exited" in str(
+                e
+            ):
+                logger.error(
+                    "Playwright browser not found or failed to launch. "
+                    "Please run: python -m rebrowser_playwright install --with-deps chromium"
+                )
+                self.playwright_available = False
+            return None, None, None
         except Exception as e:
             logger.error(
-                f"Error setting up/tearing down Playwright: {e}", exc_info=True
+                f"Unexpected error during Playwright scraping: {e}", exc_info=True
             )
-            if isinstance(e, PlaywrightError) and (
-                "Executable doesn't exist" in str(e)
-                or "Browser process exited" in str(e)
-            ):
-                self.playwright_available = False
             return None, None, None
 
         return content_str, final_mime_type, page_title_str
 
+    async def aclose(self) -> None:
+        """Shuts down the pooled Playwright browser."""
+        await self.browser_pool.aclose()
+
     async def _fetch_with_httpx(
         self, url: str
     ) -> tuple[bytes | None, str | None, str, str | None]:
@@ -524,23 +775,20 @@ class PlaywrightScraper:
         """
         headers = {"User-Agent": self.user_agent}
         try:
-            async with httpx.AsyncClient(
-                headers=headers,
-                verify=self.verify_ssl,
-                follow_redirects=True,
-                timeout=15.0,
-            ) as client:
-                logger.debug(f"httpx GET request to {url}")
-                response = await client.get(url)
-                response.raise_for_status()
-                raw_bytes = response.content
-                content_type_header = response.headers.get("content-type")
-                final_url = str(response.url)
-                encoding = response.encoding
-                logger.debug(
-                    f"httpx GET successful for {url}. Status: {response.status_code}, Final URL: {final_url}"
-                )
-                return raw_bytes, content_type_header, final_url, encoding
+            client = get_http_client_registry().get_client(verify=self.verify_ssl)
+            logger.debug(f"httpx GET request to {url}")
+            response = await client.get(
+                url, headers=headers, follow_redirects=True, timeout=15.0
+            )
+            response.raise_for_status()
+            raw_bytes = response.content
+            content_type_header = response.headers.get("content-type")
+            final_url = str(response.url)
+            encoding = response.encoding
+            logger.debug(
+                f"httpx GET successful for {url}. Status: {response.status_code}, Final URL: {final_url}"
+            )
+            return raw_bytes, content_type_header, final_url, encoding
         except httpx.HTTPStatusError as http_err:
             logger.error(
                 f"HTTP error occurred for {url}: {http_err.response.status_code} {http_err.response.reason_phrase}"
@@ -0,0 +1,55 @@
+"""Wall-clock timing of the phases that make up application startup.
+
+``Assistant.setup_dependencies`` records each phase (database initialization,
+tool discovery, every service profile, ...) in a ``StartupTimings``. Phases may
+overlap when they run concurrently, so their durations need not add up to the
+total. The finished report is logged and exposed on ``/health``.
+"""
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimings:
+    """Records how long each named startup phase took."""
+
+    def __init__(self) -> None:
+        self._started = time.perf_counter()
+        self._finished: float | None = None
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as phase ``name``, even if it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - started
+
+    def finish(self) -> None:
+        """Mark startup as complete and log the report, slowest phase first."""
+        self._finished = time.perf_counter()
+        slowest = sorted(self.phases.items(), key=lambda item: item[1], reverse=True)
+        breakdown = ", ".join(f"{name}={seconds:.2f}s" for name, seconds in slowest)
+        logger.info(f"Startup completed in {self.total_seconds:.2f}s ({breakdown})")
+
+    @property
+    def total_seconds(self) -> float:
+        """Seconds from creation until ``finish`` (or until now, if still running)."""
+        end = self._finished if self._finished is not None else time.perf_counter()
+        return end - self._started
+
+    def as_dict(self) -> dict[str, object]:
+        """JSON-serializable report for the health endpoint."""
+        return {
+            "complete": self._finished is not None,
+            "total_seconds": round(self.total_seconds, 3),
+            "phases": {
+                name: round(seconds, 3) for name, seconds in self.phases.items()
+            },
+        }
@@ -1,6 +1,12 @@
+import asyncio
 import contextlib
+import hashlib
+import hmac
 import logging
 import re
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any, NoReturn
 
@@ -23,6 +29,18 @@ logger = logging.getLogger(__name__)
 # will be handled elsewhere (e.g., a UI or CLI tool). Here we only verify.
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt deliberately takes 100ms+ per check, so verification runs in a small
+# dedicated pool rather than on the event loop or the shared default executor.
+_token_verify_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="api-token-verify"
+)
+
+# Successfully verified tokens are remembered briefly so that clients polling the
+# API do not pay for bcrypt on every request. Revocation invalidates entries
+# immediately in this process; the TTL bounds staleness elsewhere.
+API_TOKEN_CACHE_TTL_SECONDS = 60.0
+API_TOKEN_CACHE_MAX_ENTRIES = 1024
+
 
 # --- Auth Configuration ---
 # Load config from environment variables
@@ -61,14 +79,31 @@ User = dict[str, Any]  # User information stored in session is a dictionary
 class AuthService:
     """Service class for authentication operations with proper dependency injection."""
 
-    def __init__(self, database_engine: AsyncEngine | None = None) -> None:
+    def __init__(
+        self,
+        database_engine: AsyncEngine | None = None,
+        api_token_cache_ttl: float = API_TOKEN_CACHE_TTL_SECONDS,
+    ) -> None:
         """
         Initialize the AuthService with dependencies.
 
         Args:
             database_engine: The database engine for database operations
+            api_token_cache_ttl: Seconds a verified API token is trusted without
+                re-running bcrypt (0 disables the cache)
         """
         self.database_engine = database_engine
+        self.api_token_cache_ttl = api_token_cache_ttl
+        # Keyed by (prefix, HMAC of the secret) so raw secrets are never held.
+        # Values are (expiry on the monotonic clock, token ID, token expires_at, user).
+        self._api_token_cache: dict[
+            tuple[str, str], tuple[float, int, datetime | None, User]
+        ] = {}
+        self._api_token_cache_key = secrets.token_bytes(32)
+        # Verifications in progress, shared by concurrent requests with the same token
+        self._api_token_verifications: dict[
+            tuple[str, str], asyncio.Future[User | None]
+        ] = {}
         self.auth_enabled = AUTH_ENABLED
         self.oauth: OAuth | None = None
 
@@ -147,7 +182,44 @@ class AuthService:
         token_prefix = token_value[:8]
         token_secret_part = token_value[8:]
 
-        async with get_db_context(self.database_engine) as db:
+        cache_key = (
+            token_prefix,
+            hmac.new(
+                self._api_token_cache_key,
+                token_secret_part.encode("utf-8"),
+                hashlib.sha256,
+            ).hexdigest(),
+        )
+        cached_user = self._get_cached_api_token_user(cache_key)
+        if cached_user is not None:
+            return cached_user
+
+        in_flight = self._api_token_verifications.get(cache_key)
+        if in_flight is not None:
+            user = await asyncio.shield(in_flight)
+            return dict(user) if user is not None else None
+
+        verification = asyncio.ensure_future(
+            self._verify_api_token(
+                self.database_engine, token_prefix, token_secret_part, cache_key
+            )
+        )
+        self._api_token_verifications[cache_key] = verification
+        try:
+            user = await asyncio.shield(verification)
+        finally:
+            self._api_token_verifications.pop(cache_key, None)
+        return dict(user) if user is not None else None
+
+    async def _verify_api_token(
+        self,
+        engine: AsyncEngine,
+        token_prefix: str,
+        token_secret_part: str,
+        cache_key: tuple[str, str],
+    ) -> User | None:
+        """Check a token against the database, caching the user on success."""
+        async with get_db_context(engine) as db:
             query = select(api_tokens_table).where(
                 api_tokens_table.c.prefix == token_prefix
             )
@@ -157,7 +229,14 @@ class AuthService:
                 logger.debug(f"API token with prefix {token_prefix} not found.")
                 return None
 
-            if not pwd_context.verify(token_secret_part, token_row["hashed_token"]):
+            loop = asyncio.get_running_loop()
+            is_valid = await loop.run_in_executor(
+                _token_verify_executor,
+                pwd_context.verify,
+                token_secret_part,
+                token_row["hashed_token"],
+            )
+            if not is_valid:
                 logger.warning(
                     f"Invalid API token provided for prefix {token_prefix}."
                 )  # Potentially log user_identifier if available and safe
@@ -176,7 +255,7 @@ class AuthService:
                 )
                 return None
 
-            # Update last_used_at
+            # Update last_used_at (at most once per cache TTL while the token is cached)
             update_query = (
                 update(api_tokens_table)
                 .where(api_tokens_table.c.id == token_row["id"])
@@ -189,13 +268,57 @@ class AuthService:
                 f"API token authenticated for user: {token_row['user_identifier']} (Token ID: {token_row['id']})"
             )
             # Mimic OIDC userinfo structure for session consistency
-            return {
+            user = {
                 "sub": token_row["user_identifier"],
                 "name": token_row["user_identifier"],  # Or a display name if available
                 "email": token_row["user_identifier"],  # Or actual email if available
                 "source": "api_token",
                 "token_id": token_row["id"],
             }
+            self._cache_api_token_user(cache_key, token_row["expires_at"], user)
+            return user
+
+    def _get_cached_api_token_user(self, cache_key: tuple[str, str]) -> User | None:
+        """Return the user for a recently verified token, if still trusted."""
+        entry = self._api_token_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        cache_expiry, _, token_expires_at, user = entry
+        if time.monotonic() >= cache_expiry or (
+            token_expires_at is not None and token_expires_at < datetime.now(UTC)
+        ):
+            self._api_token_cache.pop(cache_key, None)
+            return None
+        return dict(user)
+
+    def _cache_api_token_user(
+        self,
+        cache_key: tuple[str, str],
+        token_expires_at: datetime | None,
+        user: User,
+    ) -> None:
+        """Remember a successfully verified token for the cache TTL."""
+        if self.api_token_cache_ttl <= 0:
+            return
+        if len(self._api_token_cache) >= API_TOKEN_CACHE_MAX_ENTRIES:
+            # Drop the oldest entry; dicts preserve insertion order
+            self._api_token_cache.pop(next(iter(self._api_token_cache)))
+        self._api_token_cache[cache_key] = (
+            time.monotonic() + self.api_token_cache_ttl,
+            user["token_id"],
+            token_expires_at,
+            user,
+        )
+
+    def invalidate_api_token(self, token_id: int) -> None:
+        """Forget any cached verification of an API token, e.g. after revocation."""
+        for cache_key in [
+            key
+            for key, (_, cached_token_id, _, _) in self._api_token_cache.items()
+            if cached_token_id == token_id
+        ]:
+            del self._api_token_cache[cache_key]
 
     async def handle_login(self, request: Request) -> RedirectResponse:
         """Redirects the user to the OIDC provider for authentication."""
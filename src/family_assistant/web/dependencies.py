@@ -52,6 +52,21 @@ async def get_db(request: Request) -> AsyncGenerator[DatabaseContext]:
         yield db_context
 
 
+async def get_readonly_db(request: Request) -> AsyncGenerator[DatabaseContext]:
+    """FastAPI dependency to get a read-only DatabaseContext for GET endpoints.
+
+    The context runs in autocommit mode without a transaction. On SQLite it
+    uses the reader connections, so listing pages doesn't queue behind the
+    single writer connection.
+    """
+    engine = request.app.state.database_engine
+    if not engine:
+        raise RuntimeError("Database engine not initialized in app.state")
+
+    async with get_db_context(engine, readonly=True) as db_context:
+        yield db_context
+
+
 async def get_tools_provider_dependency(request: Request) -> ToolsProvider:
     """Retrieves the configured ToolsProvider instance from app state."""
     provider = getattr(request.app.state, "tools_provider", None)
@@ -0,0 +1,363 @@
+"""Streaming parser for incoming mail webhook requests.
+
+The mail webhook receives Mailgun's "parsed message" POST, which can carry
+large attachments. Rather than buffering the whole body, the request stream is
+read once: every chunk is teed to the raw archive file and fed to an
+incremental multipart parser that spools attachment parts straight to their
+final location in the attachment store.
+"""
+
+import contextlib
+import logging
+import os
+import re
+import zlib
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from urllib.parse import parse_qsl
+
+import aiofiles
+from aiofiles.threadpool.binary import AsyncBufferedIOBase
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from family_assistant.storage.email import AttachmentData
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for a single text field (body-html of a large newsletter is the
+# usual worst case) and for a non-multipart body.
+MAX_MAIL_FIELD_BYTES = 16 * 1024 * 1024
+
+_ATTACHMENT_FIELD_RE = re.compile(r"^attachment-(\d+)$")
+
+
+class MailFormError(ValueError):
+    """Raised when the webhook body cannot be parsed as a mail form."""
+
+
+class RawArchiveWriter:
+    """Writes the raw request body to disk as it streams in.
+
+    Archiving is best-effort: the first write failure is logged and further
+    chunks are discarded so that the email itself is still processed.
+    """
+
+    def __init__(self, path: str, compress: bool = False) -> None:
+        self.path = path
+        self.bytes_written = 0
+        self._file: AsyncBufferedIOBase | None = None
+        self._compressor = (
+            zlib.compressobj(wbits=31)  # gzip container
+            if compress
+            else None
+        )
+        self._failed = False
+
+    async def open(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = await aiofiles.open(self.path, "wb")
+        except Exception as e:
+            self._fail(e)
+
+    async def write(self, chunk: bytes) -> None:
+        if self._file is None or self._failed:
+            return
+        self.bytes_written += len(chunk)
+        data = self._compressor.compress(chunk) if self._compressor else chunk
+        if not data:
+            return
+        try:
+            await self._file.write(data)
+        except Exception as e:
+            self._fail(e)
+
+    async def close(self) -> None:
+        if self._file is None:
+            return
+        try:
+            if self._compressor and not self._failed:
+                await self._file.write(self._compressor.flush())
+            await self._file.close()
+        except Exception as e:
+            self._fail(e)
+        self._file = None
+        if not self._failed:
+            logger.info(
+                f"Saved raw webhook request body ({self.bytes_written} bytes) to: {self.path}"
+            )
+
+    def _fail(self, error: Exception) -> None:
+        if not self._failed:
+            logger.error(
+                f"Failed to save raw webhook request body: {error}", exc_info=True
+            )
+        self._failed = True
+
+
+@dataclass
+class _Part:
+    """State for the multipart part currently being parsed."""
+
+    name: str = ""
+    filename: str | None = None
+    content_type: str = "application/octet-stream"
+    attachment_index: int | None = None
+    data: bytearray = field(default_factory=bytearray)
+    file: AsyncBufferedIOBase | None = None
+    file_path: str | None = None
+    size: int = 0
+    failed: bool = False
+
+
+@dataclass
+class MailForm:
+    """Result of streaming a mail webhook request."""
+
+    fields: dict[str, str] = field(default_factory=dict)
+    attachments: list[AttachmentData] = field(default_factory=list)
+
+
+class _MultipartMailReceiver:
+    """Drives a MultipartParser, saving attachment parts as they arrive.
+
+    Parser callbacks are synchronous, so they only record what happened; the
+    file I/O they imply is performed by ``_drain`` after each ``write``.
+    """
+
+    def __init__(self, boundary: bytes, charset: str, attachment_dir: str) -> None:
+        self._charset = charset
+        self._attachment_dir = attachment_dir
+        self._part = _Part()
+        self._header_field = bytearray()
+        self._header_value = bytearray()
+        self._headers: dict[bytes, bytes] = {}
+        # File I/O recorded by the callbacks: kind is "open", "data" or "close"
+        self._events: list[tuple[str, _Part, bytes]] = []
+        self._saved: list[tuple[int, _Part]] = []
+        self.fields: dict[str, str] = {}
+        self._complete = False
+        self._parser = MultipartParser(
+            boundary,
+            {
+                "on_part_begin": self._on_part_begin,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_end": self._on_end,
+            },
+        )
+
+    # --- Parser callbacks ---
+
+    def _on_part_begin(self) -> None:
+        self._part = _Part()
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[bytes(self._header_field).lower()] = bytes(self._header_value)
+        self._header_field = bytearray()
+        self._header_value = bytearray()
+
+    def _on_headers_finished(self) -> None:
+        disposition, options = parse_options_header(
+            self._headers.get(b"content-disposition", b"")
+        )
+        if disposition != b"form-data" or b"name" not in options:
+            raise MailFormError("Multipart part is missing a form-data name")
+        part = self._part
+        part.name = options[b"name"].decode(self._charset, errors="replace")
+        if b"filename" in options:
+            part.filename = options[b"filename"].decode(self._charset, errors="replace")
+            content_type = self._headers.get(b"content-type")
+            if content_type:
+                part.content_type = content_type.decode("latin-1")
+            match = _ATTACHMENT_FIELD_RE.match(part.name)
+            if match and part.filename:
+                part.attachment_index = int(match.group(1))
+                self._events.append(("open", part, b""))
+            else:
+                logger.warning(
+                    f"Skipping file field {part.name}: not an attachment-N field with a filename"
+                )
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        part = self._part
+        if part.filename is None:
+            part.data += data[start:end]
+            if len(part.data) > MAX_MAIL_FIELD_BYTES:
+                raise MailFormError(f"Form field {part.name} is too large")
+        elif part.attachment_index is not None:
+            self._events.append(("data", part, data[start:end]))
+
+    def _on_part_end(self) -> None:
+        part = self._part
+        if part.filename is None:
+            self.fields[part.name] = part.data.decode(self._charset, errors="replace")
+        elif part.attachment_index is not None:
+            self._events.append(("close", part, b""))
+
+    def _on_end(self) -> None:
+        self._complete = True
+
+    # --- Driving the parser ---
+
+    async def feed(self, chunk: bytes) -> None:
+        self._parser.write(chunk)
+        await self._drain()
+
+    async def finish(self) -> list[tuple[int, _Part]]:
+        self._parser.finalize()
+        await self._drain()
+        if not self._complete:
+            raise MailFormError("Request body ended before the closing boundary")
+        return self._saved
+
+    async def abort(self) -> None:
+        """Close and remove any attachment left open by a failed request."""
+        self._events.clear()
+        for part in {id(p): p for _, p in self._saved}.values():
+            _remove_quietly(part.file_path)
+        if self._part.file is not None:
+            await self._part.file.close()
+            _remove_quietly(self._part.file_path)
+
+    async def _drain(self) -> None:
+        events, self._events = self._events, []
+        for kind, part, data in events:
+            if part.failed:
+                continue
+            try:
+                if kind == "open":
+                    await self._open_attachment(part)
+                elif kind == "data" and part.file is not None:
+                    await part.file.write(data)
+                    part.size += len(data)
+                elif kind == "close" and part.file is not None:
+                    await part.file.close()
+                    part.file = None
+                    assert part.attachment_index is not None
+                    self._saved.append((part.attachment_index, part))
+            except Exception as e:
+                logger.error(
+                    f"Failed to save attachment {part.filename}: {e}", exc_info=True
+                )
+                part.failed = True
+                if part.file is not None:
+                    with contextlib.suppress(Exception):
+                        await part.file.close()
+                    part.file = None
+                _remove_quietly(part.file_path)
+
+    async def _open_attachment(self, part: _Part) -> None:
+        assert part.filename is not None
+        os.makedirs(self._attachment_dir, exist_ok=True)
+        # Sanitize filename (basic)
+        safe_filename = os.path.basename(part.filename)
+        part.filename = safe_filename
+        part.file_path = os.path.join(self._attachment_dir, safe_filename)
+        part.file = await aiofiles.open(part.file_path, "wb")
+
+
+def _remove_quietly(path: str | None) -> None:
+    if path:
+        with contextlib.suppress(OSError):
+            os.remove(path)
+
+
+async def receive_mail_form(
+    stream: AsyncIterator[bytes],
+    content_type: str,
+    attachment_dir: str,
+    raw_archive: RawArchiveWriter | None = None,
+) -> MailForm:
+    """Read a mail webhook body from ``stream`` in a single pass.
+
+    Args:
+        stream: The request body stream.
+        content_type: The request's Content-Type header.
+        attachment_dir: Directory for this email's attachments. It is only
+            created if the request carries attachments.
+        raw_archive: Optional writer that receives every chunk unchanged.
+
+    Returns:
+        The text fields and saved attachments. Attachments are listed in
+        ``attachment-N`` order, limited to the form's ``attachment-count``.
+
+    Raises:
+        MailFormError: If the body is malformed or a field is too large.
+    """
+    media_type, options = parse_options_header(content_type)
+    charset = options.get(b"charset", b"utf-8").decode("latin-1")
+
+    if raw_archive is not None:
+        await raw_archive.open()
+
+    try:
+        if media_type == b"multipart/form-data":
+            boundary = options.get(b"boundary")
+            if not boundary:
+                raise MailFormError("Missing boundary in multipart/form-data request")
+            receiver = _MultipartMailReceiver(boundary, charset, attachment_dir)
+            try:
+                async for chunk in stream:
+                    if raw_archive is not None:
+                        await raw_archive.write(chunk)
+                    await receiver.feed(chunk)
+                saved = await receiver.finish()
+            except BaseException:
+                await receiver.abort()
+                raise
+            fields = receiver.fields
+        else:
+            # Without attachments Mailgun may send a urlencoded body; those are
+            # small enough to collect before parsing.
+            body = bytearray()
+            async for chunk in stream:
+                if raw_archive is not None:
+                    await raw_archive.write(chunk)
+                body += chunk
+                if len(body) > MAX_MAIL_FIELD_BYTES:
+                    raise MailFormError("Request body is too large")
+            fields = dict(
+                parse_qsl(
+                    body.decode(charset, errors="replace"), keep_blank_values=True
+                )
+            )
+            saved = []
+    finally:
+        if raw_archive is not None:
+            await raw_archive.close()
+
+    attachment_count_str = fields.get("attachment-count", "")
+    attachment_count = (
+        int(attachment_count_str) if attachment_count_str.isdigit() else 0
+    )
+    attachments: list[AttachmentData] = []
+    for index, part in sorted(saved, key=lambda item: item[0]):
+        assert part.filename is not None and part.file_path is not None
+        if index > attachment_count:
+            logger.warning(
+                f"Discarding attachment-{index}: attachment-count is {attachment_count}"
+            )
+            _remove_quietly(part.file_path)
+            continue
+        attachments.append(
+            AttachmentData(
+                filename=part.filename,
+                content_type=part.content_type,
+                size=part.size,
+                storage_path=part.file_path,
+            )
+        )
+        logger.info(f"Saved attachment '{part.filename}' to {part.file_path}")
+    return MailForm(fields=fields, attachments=attachments)
@@ -3,7 +3,7 @@ from datetime import UTC, datetime
 from typing import Annotated
 
 from dateutil import parser as dateutil_parser
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
 from family_assistant.storage import api_tokens as api_tokens_storage
 from family_assistant.storage.context import DatabaseContext
@@ -164,6 +164,7 @@ async def list_api_tokens(
 )
 async def revoke_api_token(
     token_id: int,
+    request: Request,
     current_user: Annotated[dict, Depends(get_current_active_user)],
     db_context: Annotated[DatabaseContext, Depends(get_db)],
 ) -> None:
@@ -191,6 +192,10 @@ async def revoke_api_token(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Token not found or not owned by user.",
             )
+        # Stop trusting any cached verification of the token straight away
+        auth_service = getattr(request.app.state, "auth_service", None)
+        if auth_service is not None:
+            auth_service.invalidate_api_token(token_id)
         logger.info(
             "Token ID %s successfully revoked by user %s via API.",
             token_id,
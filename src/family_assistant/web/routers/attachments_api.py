@@ -1,11 +1,20 @@
 """API endpoints for chat attachment management."""
 
 import logging
+import mimetypes
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    UploadFile,
+)
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel
 
 from family_assistant.services.attachment_registry import AttachmentRegistry
@@ -20,6 +29,18 @@ logger = logging.getLogger(__name__)
 
 attachments_api_router = APIRouter()
 
+# Attachments never change once stored, so clients may cache them indefinitely
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against a strong ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
 
 class AttachmentUploadResponse(BaseModel):
     """Response model for attachment upload."""
@@ -105,7 +126,8 @@ async def upload_attachment(
     "/{attachment_id}",
     response_class=FileResponse,
     summary="Serve attachment file",
-    description="Serve an attachment file by its ID.",
+    description="Serve an attachment file by its ID. Supports Range requests and "
+    "conditional GET via If-None-Match.",
 )
 async def serve_attachment(
     attachment_id: str,
@@ -115,15 +137,22 @@ async def serve_attachment(
         AttachmentRegistry, Depends(get_attachment_registry)
     ],
     db_context: Annotated[DatabaseContext, Depends(get_db)],
-) -> FileResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """
     Serve an attachment file by its ID.
 
+    The file is streamed from disk in chunks rather than read into memory.
+    FileResponse answers Range requests with 206 Partial Content, so video can
+    be seeked. The ETag is the content's SHA-256, so If-None-Match requests for
+    content the client already has get a 304 without a body.
+
     Args:
         attachment_id: UUID of the attachment to serve
+        if_none_match: ETags the client already has cached
 
     Returns:
-        FileResponse with the attachment file
+        FileResponse with the attachment file, or 304 if the client's copy is current
 
     Raises:
         HTTPException: If attachment not found or invalid ID format
@@ -154,18 +183,29 @@ async def serve_attachment(
     if not file_path or not file_path.exists():
         raise HTTPException(status_code=404, detail="Attachment file not found")
 
-    # Get content type
-    content_type = attachment_registry.get_content_type(file_path)
+    content_hash = await attachment_registry.get_content_hash(
+        attachment_metadata, file_path
+    )
+    cache_headers = {
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        "ETag": f'"{content_hash}"',
+    }
+
+    if if_none_match and _etag_matches(if_none_match, cache_headers["ETag"]):
+        return Response(status_code=304, headers=cache_headers)
 
-    # Return file response with proper headers
+    # The blob may be shared with attachments of another type; use this one's
+    content_type = attachment_metadata.mime_type or (
+        attachment_registry.get_content_type(file_path)
+    )
+    extension = mimetypes.guess_extension(content_type) or file_path.suffix
+
+    # Blob files are named by content hash; present the attachment ID instead
     return FileResponse(
         path=str(file_path),
         media_type=content_type,
-        filename=file_path.name,
-        headers={
-            "Cache-Control": "public, max-age=31536000, immutable",  # Cache for 1 year (files are immutable)
-            "ETag": f'"{attachment_id}"',  # Use attachment ID as ETag
-        },
+        filename=f"{attachment_id}{extension}",
+        headers=cache_headers,
     )
 
 
@@ -246,13 +286,13 @@ async def get_attachment_metadata(
         ) from e
 
     # Get file path
-    file_path = attachment_registry.get_attachment_path(attachment_id)
+    file_path = await attachment_registry.resolve_attachment_path(attachment_id)
     if not file_path or not file_path.exists():
         raise HTTPException(status_code=404, detail="Attachment not found")
 
     # Get basic metadata from file
     stat = file_path.stat()
-    content_type = attachment_registry.get_content_type(file_path)
+    content_type = attachment_registry.get_content_type(file_path, attachment_id)
 
     # Return basic metadata (in production, this would come from database)
     return AttachmentMetadata(
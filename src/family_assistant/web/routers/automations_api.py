@@ -9,7 +9,7 @@ from pydantic import BaseModel, Field
 
 from family_assistant.storage.context import DatabaseContext
 from family_assistant.storage.models import Automation
-from family_assistant.web.dependencies import get_db
+from family_assistant.web.dependencies import get_db, get_readonly_db
 
 logger = logging.getLogger(__name__)
 
@@ -151,7 +151,7 @@ def _format_automation_response(automation: Automation) -> AutomationResponse:
 
 @automations_api_router.get("")
 async def list_automations(
-    db: Annotated[DatabaseContext, Depends(get_db)],
+    db: Annotated[DatabaseContext, Depends(get_readonly_db)],
     conversation_id: Annotated[
         str | None,
         Query(
@@ -202,7 +202,7 @@ async def list_automations(
 async def get_automation(
     automation_type: str,
     automation_id: int,
-    db: Annotated[DatabaseContext, Depends(get_db)],
+    db: Annotated[DatabaseContext, Depends(get_readonly_db)],
     conversation_id: Annotated[
         str | None, Query(description="Conversation ID for permission check")
     ] = None,
@@ -600,7 +600,7 @@ async def get_automation_stats(
     conversation_id: Annotated[
         str, Query(description="Conversation ID for permission check")
     ],
-    db: Annotated[DatabaseContext, Depends(get_db)],
+    db: Annotated[DatabaseContext, Depends(get_readonly_db)],
     # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
 ) -> dict[str, Any]:
     """Get execution statistics for an automation."""
@@ -31,6 +31,7 @@ from family_assistant.web.dependencies import (
     get_current_user,
     get_db,
     get_processing_service,
+    get_readonly_db,
     get_web_chat_interface,
 )
 from family_assistant.web.models import ChatMessageResponse, ChatPromptRequest
@@ -291,6 +292,14 @@ class ConversationListResponse(BaseModel):
         ..., description="List of conversation summaries"
     )
     count: int = Field(..., description="Total number of conversations")
+    next_before: datetime | None = Field(
+        default=None,
+        description="Keyset cursor for the next page; pass back as 'before'",
+    )
+    next_before_conversation_id: str | None = Field(
+        default=None,
+        description="Tie-breaker for next_before; pass back as 'before_conversation_id'",
+    )
 
 
 class ConversationMessage(BaseModel):
@@ -560,13 +569,15 @@ async def api_chat_send_message(
 
 @chat_api_router.get("/v1/chat/conversations")
 async def get_conversations(
-    db_context: Annotated[DatabaseContext, Depends(get_db)],
+    db_context: Annotated[DatabaseContext, Depends(get_readonly_db)],
     limit: int = 20,
     offset: int = 0,
     interface_type: str | None = None,
     conversation_id: str | None = None,
     date_from: str | None = None,  # Expected as YYYY-MM-DD string
     date_to: str | None = None,  # Expected as YYYY-MM-DD string
+    before: str | None = None,  # ISO timestamp string
+    before_conversation_id: str | None = None,
 ) -> ConversationListResponse:
     """
     Get a list of chat conversations for the web interface.
@@ -574,6 +585,9 @@ async def get_conversations(
     Args:
         limit: Maximum number of conversations to return
         offset: Number of conversations to skip for pagination
+        before: Keyset cursor (next_before from the previous page); when given,
+            offset is ignored
+        before_conversation_id: Tie-breaker cursor (next_before_conversation_id)
         interface_type: Filter by interface type (web, telegram, api, email)
         conversation_id: Filter by specific conversation ID
         date_from: Filter conversations with messages after this date (YYYY-MM-DD)
@@ -608,6 +622,16 @@ async def get_conversations(
                 detail=f"Invalid date_to format: '{date_to}'. Expected YYYY-MM-DD format.",
             ) from e
 
+    before_dt = None
+    if before:
+        try:
+            before_dt = datetime.fromisoformat(before.replace("Z", "+00:00"))
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid timestamp format. Use ISO format (e.g., 2024-01-15T10:30:00Z): {e}",
+            ) from e
+
     # Use optimized query for conversation summaries with all filters
     summaries, total = await db_context.message_history.get_conversation_summaries(
         interface_type=interface_type,
@@ -616,6 +640,8 @@ async def get_conversations(
         conversation_id=conversation_id,
         date_from=date_from_dt,
         date_to=date_to_dt,
+        before_timestamp=before_dt,
+        before_conversation_id=before_conversation_id,
     )
 
     # Convert to response format
@@ -629,16 +655,20 @@ async def get_conversations(
         for summary in summaries
     ]
 
-    return ConversationListResponse(
+    response = ConversationListResponse(
         conversations=conversations,
         count=total,
     )
+    if summaries and len(summaries) == limit:
+        response.next_before = summaries[-1]["last_timestamp"]
+        response.next_before_conversation_id = summaries[-1]["conversation_id"]
+    return response
 
 
 @chat_api_router.get("/v1/chat/conversations/{conversation_id}/messages")
 async def get_conversation_messages(
     conversation_id: str,
-    db_context: Annotated[DatabaseContext, Depends(get_db)],
+    db_context: Annotated[DatabaseContext, Depends(get_readonly_db)],
     attachment_registry: Annotated[
         "AttachmentRegistry", Depends(get_attachment_registry)
     ],
@@ -1301,7 +1331,9 @@ async def live_message_events(
         Returns:
             Tuple of (message dicts with database fields, updated last_check timestamp)
         """
-        async with get_db_context(request.app.state.database_engine) as db_context:
+        async with get_db_context(
+            request.app.state.database_engine, readonly=True
+        ) as db_context:
             raw_messages = await db_context.message_history.get_messages_after_as_dict(
                 conversation_id=conversation_id,
                 after=last_check_time,
@@ -1,7 +1,8 @@
 """API endpoints for diagnostic export.
 
 This module provides endpoints for exporting diagnostic data useful for debugging,
-including error logs, LLM request/response records, and message history.
+including error logs, LLM request/response records, and message history, plus
+live HTTP and database connection pool utilization.
 """
 
 import platform
@@ -9,13 +10,18 @@ import sys
 from datetime import UTC, datetime, timedelta
 from typing import Annotated, Any, Literal
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
 from family_assistant.llm.request_buffer import get_request_buffer
+from family_assistant.storage.connection_pool import get_connection_pool_stats
 from family_assistant.storage.context import DatabaseContext
 from family_assistant.tools.types import ToolDefinition
+from family_assistant.utils.http_clients import (
+    HttpClientRegistry,
+    get_http_client_registry,
+)
 from family_assistant.web.dependencies import get_current_user, get_db
 
 diagnostics_api_router = APIRouter()
@@ -89,6 +95,51 @@ class DiagnosticsExportResponse(BaseModel):
     summary: ExportSummary
 
 
+class HttpHostPoolMetrics(BaseModel):
+    """Request counters for one host of a pooled HTTP client."""
+
+    host: str
+    in_flight: int
+    requests: int
+    waited_for_slot: int
+
+
+class HttpClientPoolMetrics(BaseModel):
+    """Connection pool utilization of one pooled HTTP client."""
+
+    verify: bool
+    connections: int
+    idle_connections: int
+    requests: int
+    hosts: list[HttpHostPoolMetrics]
+
+
+class HttpPoolMetricsResponse(BaseModel):
+    """Utilization of the shared outbound HTTP clients."""
+
+    max_connections_per_host: int
+    clients: list[HttpClientPoolMetrics]
+    dav_clients: int
+    dns_cache_entries: int
+
+
+class DatabasePoolMetricsResponse(BaseModel):
+    """Utilization and timing of the database connection pool."""
+
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    checkout_seconds_total: float
+    checkout_seconds_max: float
+    connects: int
+    connect_seconds_total: float
+    connect_seconds_max: float
+    foreign_loop_connections: int
+
+
 def _format_markdown_export(data: DiagnosticsExportResponse) -> str:
     """Format the diagnostic export as markdown."""
     lines = [
@@ -254,8 +305,8 @@ async def export_diagnostics(
             request_id=record.request_id,
             model_id=record.model_id,
             duration_ms=record.duration_ms,
-            messages=record.messages,
-            tools=record.tools,
+            messages=record.serialized_messages(),
+            tools=list(record.tools) if record.tools is not None else None,
             tool_choice=record.tool_choice,
             response=record.response,
             error=record.error,
@@ -317,3 +368,41 @@ async def export_diagnostics(
         )
 
     return response
+
+
+@diagnostics_api_router.get("/http-pools")
+async def get_http_pool_metrics(
+    request: Request,
+    _: Annotated[dict, Depends(get_current_user)],
+) -> HttpPoolMetricsResponse:
+    """Report utilization of the shared outbound HTTP connection pools.
+
+    Examples:
+        curl -s http://localhost:8000/api/diagnostics/http-pools | jq '.clients[].hosts'
+    """
+    registry: HttpClientRegistry = (
+        getattr(request.app.state, "http_clients", None) or get_http_client_registry()
+    )
+    return HttpPoolMetricsResponse.model_validate(
+        registry.stats(), from_attributes=True
+    )
+
+
+@diagnostics_api_router.get("/db-pool")
+async def get_db_pool_metrics(
+    request: Request,
+    _: Annotated[dict, Depends(get_current_user)],
+) -> DatabasePoolMetricsResponse:
+    """Report utilization of the database connection pool.
+
+    Only available for PostgreSQL; SQLite shares a single connection.
+
+    Examples:
+        curl -s http://localhost:8000/api/diagnostics/db-pool | jq '.checkout_seconds_max'
+    """
+    stats = get_connection_pool_stats(request.app.state.database_engine)
+    if stats is None:
+        raise HTTPException(
+            status_code=404, detail="Database engine does not use a connection pool"
+        )
+    return DatabasePoolMetricsResponse.model_validate(stats, from_attributes=True)
@@ -22,7 +22,7 @@ from sqlalchemy.sql import functions as func
 from family_assistant.indexing.ingestion import process_document_ingestion_request
 from family_assistant.storage.context import DatabaseContext
 from family_assistant.storage.vector import DocumentRecord, get_document_by_id
-from family_assistant.web.dependencies import get_db
+from family_assistant.web.dependencies import get_db, get_readonly_db
 from family_assistant.web.models import DocumentUploadResponse
 
 if TYPE_CHECKING:
@@ -52,7 +52,7 @@ class DocumentListResponse(BaseModel):
 
 @documents_api_router.get("/")
 async def list_documents(
-    db_context: Annotated[DatabaseContext, Depends(get_db)],
+    db_context: Annotated[DatabaseContext, Depends(get_readonly_db)],
     limit: int = 100,
     offset: int = 0,
     source_type: str | None = None,
@@ -87,7 +87,7 @@ async def list_documents(
 
 @documents_api_router.get("/{document_id}")
 async def get_document(
-    document_id: int, db_context: Annotated[DatabaseContext, Depends(get_db)]
+    document_id: int, db_context: Annotated[DatabaseContext, Depends(get_readonly_db)]
 ) -> dict:
     """Get a document by ID with detailed information including embeddings."""
     record = await get_document_by_id(db_context, document_id)
@@ -8,7 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from family_assistant.storage.context import DatabaseContext
-from family_assistant.web.dependencies import get_db
+from family_assistant.web.dependencies import get_readonly_db
 
 errors_api_router = APIRouter()
 
@@ -30,6 +30,8 @@ class ErrorLogResponse(BaseModel):
     module: str | None = None
     function_name: str | None = None
     extra_data: dict | None = None
+    occurrence_count: int = 1
+    last_seen: datetime | None = None
 
 
 class ErrorLogsListResponse(BaseModel):
@@ -96,7 +98,7 @@ async def report_frontend_error(
 
 @errors_api_router.get("/")
 async def get_errors(
-    db_context: Annotated[DatabaseContext, Depends(get_db)],
+    db_context: Annotated[DatabaseContext, Depends(get_readonly_db)],
     page: Annotated[int, Query(ge=1)] = 1,
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
     level: str | None = None,
@@ -135,7 +137,7 @@ async def get_errors(
 @errors_api_router.get("/{error_id}")
 async def get_error_by_id(
     error_id: int,
-    db_context: Annotated[DatabaseContext, Depends(get_db)],
+    db_context: Annotated[DatabaseContext, Depends(get_readonly_db)],
 ) -> ErrorLogResponse:
     """Get a specific error log by ID."""
     error = await db_context.error_logs.get_by_id(error_id)
@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from family_assistant.storage.context import DatabaseContext
-from family_assistant.web.dependencies import get_db
+from family_assistant.web.dependencies import get_readonly_db
 
 events_api_router = APIRouter()
 
@@ -21,34 +21,49 @@ class EventModel(BaseModel):
 class EventsListResponse(BaseModel):
     events: list[EventModel]
     total: int
+    # Keyset cursor for the next (older) page; pass back as before/before_id
+    next_before: datetime | None = None
+    next_before_id: int | None = None
 
 
 @events_api_router.get("/")
 @events_api_router.get("")
 async def list_events(
-    db_context: Annotated[DatabaseContext, Depends(get_db)],
+    db_context: Annotated[DatabaseContext, Depends(get_readonly_db)],
     source_id: str | None = None,
     hours: Annotated[int, Query(ge=1)] = 24,
     only_triggered: bool = False,
     limit: int = 50,
     offset: int = 0,
+    before: datetime | None = None,
+    before_id: int | None = None,
 ) -> EventsListResponse:
-    """Return recent events."""
+    """Return recent events, newest first.
+
+    Pages by offset, or by keyset when `before`/`before_id` (from the previous
+    response's next_before/next_before_id) are given.
+    """
     events, total = await db_context.events.get_events_with_listeners(
         source_id=source_id,
         hours=hours,
         limit=limit,
         offset=offset,
         only_triggered=only_triggered,
+        before_timestamp=before,
+        before_id=before_id,
     )
-    return EventsListResponse(
+    response = EventsListResponse(
         events=[EventModel(**event) for event in events], total=total
     )
+    if events and len(events) == limit:
+        response.next_before = events[-1]["timestamp"]
+        response.next_before_id = events[-1]["id"]
+    return response
 
 
 @events_api_router.get("/{event_id}")
 async def get_event(
-    event_id: str, db_context: Annotated[DatabaseContext, Depends(get_db)]
+    event_id: str, db_context: Annotated[DatabaseContext, Depends(get_readonly_db)]
 ) -> EventModel:
     """Return details for a single event."""
     event = await db_context.events.get_event_by_id(event_id)
@@ -10,31 +10,36 @@ health_router = APIRouter()
 
 @health_router.get("/health", status_code=status.HTTP_200_OK)
 async def health_check(request: Request) -> JSONResponse:
-    """Checks basic service health and Telegram polling status."""
+    """Checks basic service health and Telegram polling status.
+
+    Also reports how long startup took, broken down by phase.
+    """
+    content, status_code = _telegram_health(request)
+    startup_timings = getattr(request.app.state, "startup_timings", None)
+    if startup_timings is not None:
+        content["startup"] = startup_timings.as_dict()
+    return JSONResponse(content=content, status_code=status_code)
+
+
+def _telegram_health(request: Request) -> tuple[dict[str, object], int]:
     telegram_service = getattr(request.app.state, "telegram_service", None)
 
     # If telegram_service is None, it might be intentionally disabled
     if telegram_service is None:
         # Check if this is intentional by looking for a flag or just assume it's OK
-        return JSONResponse(
-            content={
-                "status": "healthy",
-                "reason": "Web service running (Telegram disabled)",
-            },
-            status_code=status.HTTP_200_OK,
-        )
+        return {
+            "status": "healthy",
+            "reason": "Web service running (Telegram disabled)",
+        }, status.HTTP_200_OK
 
     if not hasattr(telegram_service, "application") or not hasattr(
         telegram_service.application, "updater"
     ):
         # Service exists but structure unexpected - this is an actual problem
-        return JSONResponse(
-            content={
-                "status": "unhealthy",
-                "reason": "Telegram service initialization error",
-            },
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-        )
+        return {
+            "status": "unhealthy",
+            "reason": "Telegram service initialization error",
+        }, status.HTTP_503_SERVICE_UNAVAILABLE
 
     # Check if polling was ever started and if it's currently running
     was_started = getattr(telegram_service, "_was_started", False)
@@ -61,22 +66,16 @@ async def health_check(request: Request) -> JSONResponse:
                 "Health check failing because Telegram polling stopped (no specific error recorded)."
             )  # Log warning
 
-        return JSONResponse(
-            content={"status": "unhealthy", "reason": reason},
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-        )
+        return {
+            "status": "unhealthy",
+            "reason": reason,
+        }, status.HTTP_503_SERVICE_UNAVAILABLE
     elif not was_started:
         # Polling hasn't been started yet (still initializing)
-        return JSONResponse(
-            content={
-                "status": "initializing",
-                "reason": "Telegram service initializing",
-            },
-            status_code=status.HTTP_200_OK,  # Or 503 if you prefer to fail until fully ready
-        )
+        return {
+            "status": "initializing",
+            "reason": "Telegram service initializing",
+        }, status.HTTP_200_OK  # Or 503 if you prefer to fail until fully ready
     else:
         # Polling was started and is running
-        return JSONResponse(
-            content={"status": "ok", "reason": "Telegram polling active"},
-            status_code=status.HTTP_200_OK,
-        )
+        return {"status": "ok", "reason": "Telegram polling active"}, status.HTTP_200_OK
@@ -10,7 +10,7 @@ from family_assistant.storage.repositories.notes import (
     NoteModel,
     NoteNotFoundError,
 )
-from family_assistant.web.dependencies import get_db
+from family_assistant.web.dependencies import get_db, get_readonly_db
 
 logger = logging.getLogger(__name__)
 notes_api_router = APIRouter()
@@ -31,7 +31,7 @@ class NoteRequest(NoteModel):
 
 @notes_api_router.get("/")
 async def list_notes(
-    db_context: Annotated[DatabaseContext, Depends(get_db)],
+    db_context: Annotated[DatabaseContext, Depends(get_readonly_db)],
 ) -> list[NoteModel]:
     """Return all notes."""
     notes = await db_context.notes.get_all(visibility_grants=None)
@@ -40,7 +40,7 @@ async def list_notes(
 
 @notes_api_router.get("/{title}")
 async def get_note(
-    title: str, db_context: Annotated[DatabaseContext, Depends(get_db)]
+    title: str, db_context: Annotated[DatabaseContext, Depends(get_readonly_db)]
 ) -> NoteModel:
     """Return a note by title."""
     note = await db_context.notes.get_by_title(title, visibility_grants=None)
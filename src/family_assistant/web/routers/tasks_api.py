@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
 from family_assistant.storage.context import DatabaseContext
-from family_assistant.web.dependencies import get_db
+from family_assistant.web.dependencies import get_db, get_readonly_db
 
 tasks_api_router = APIRouter()
 
@@ -33,7 +33,7 @@ class TaskListResponse(BaseModel):
 
 @tasks_api_router.get("/")
 async def list_tasks(
-    db_context: Annotated[DatabaseContext, Depends(get_db)],
+    db_context: Annotated[DatabaseContext, Depends(get_readonly_db)],
     status_filter: Annotated[str | None, Query(alias="status")] = None,
     task_type: str | None = None,
     date_from: datetime | None = None,
@@ -8,15 +8,18 @@ import uuid
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Annotated, Any
 
-import aiofiles
 from dateutil.parser import parse as parse_datetime
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel, ValidationError
-from starlette.datastructures import UploadFile as StarletteUploadFile
 
 from family_assistant.storage.context import DatabaseContext
-from family_assistant.storage.email import AttachmentData, ParsedEmailData
+from family_assistant.storage.email import ParsedEmailData
 from family_assistant.web.dependencies import get_db
+from family_assistant.web.mail_stream import (
+    MailFormError,
+    RawArchiveWriter,
+    receive_mail_form,
+)
 from family_assistant.web.models import WebhookEventPayload
 
 if TYPE_CHECKING:
@@ -40,19 +43,16 @@ async def handle_mail_webhook(
     """
     Receives incoming email via webhook (expects multipart/form-data from Mailgun),
     parses it, saves attachments, and passes structured data to the storage layer.
+
+    The body is read once as a stream: each chunk is archived to mailbox_raw_dir
+    and parsed incrementally, with attachments written directly to the
+    attachment store, so large emails are never held in memory.
     """
     logger.info("Received POST request on /webhook/mail")
-    # --- Save raw request body for debugging/replay ---
-    # It's good to read the body once if needed for both raw saving and form parsing.
-    # However, request.form() consumes the body. If raw saving is critical,
-    # read body first, then pass to a method that can parse from bytes if FastAPI allows,
-    # or accept that form() is the primary way. For now, keeping existing raw save logic.
-    raw_body_content = await request.body()
+    config: AppConfig | None = getattr(request.app.state, "config", None)
 
     # Determine directory for saving raw requests from app config or fallback
-
     mailbox_raw_dir_to_use: str = DEFAULT_MAILBOX_RAW_DIR_FALLBACK
-    config: AppConfig | None = getattr(request.app.state, "config", None)
     if config and config.mailbox_raw_dir:
         mailbox_raw_dir_to_use = config.mailbox_raw_dir
     if mailbox_raw_dir_to_use == DEFAULT_MAILBOX_RAW_DIR_FALLBACK:
@@ -60,36 +60,48 @@ async def handle_mail_webhook(
             f"mailbox_raw_dir not found in app.state.config, using fallback: {DEFAULT_MAILBOX_RAW_DIR_FALLBACK}"
         )
 
-    try:
-        os.makedirs(mailbox_raw_dir_to_use, exist_ok=True)
-        now_dt = datetime.now(UTC)
-        timestamp_str = now_dt.strftime("%Y%m%d_%H%M%S_%f")
-        content_type_header = request.headers.get(
-            "content-type", "unknown_content_type"
-        )
-        safe_content_type = (
-            re.sub(r'[<>:"/\\|?*]', "_", content_type_header).split(";")[0].strip()
-        )
-        raw_filename = f"{timestamp_str}_{safe_content_type}.raw"
-        raw_filepath = os.path.join(mailbox_raw_dir_to_use, raw_filename)
+    content_type_header = request.headers.get("content-type", "unknown_content_type")
+    timestamp_str = datetime.now(UTC).strftime("%Y%m%d_%H%M%S_%f")
+    safe_content_type = (
+        re.sub(r'[<>:"/\\|?*]', "_", content_type_header).split(";")[0].strip()
+    )
+    compress_raw = bool(config and config.mailbox_raw_compress)
+    raw_filename = f"{timestamp_str}_{safe_content_type}.raw" + (
+        ".gz" if compress_raw else ""
+    )
+    raw_archive = RawArchiveWriter(
+        os.path.join(mailbox_raw_dir_to_use, raw_filename), compress=compress_raw
+    )
+
+    # Get attachment storage path from app config; one directory per email
+    attachment_storage_path = DEFAULT_ATTACHMENT_STORAGE_PATH
+    if config and config.attachment_storage_path:
+        attachment_storage_path = config.attachment_storage_path
+    base_attachment_dir = os.path.join(attachment_storage_path, str(uuid.uuid4()))
 
-        async with aiofiles.open(raw_filepath, "wb") as f:
-            await f.write(raw_body_content)
-        logger.info(
-            f"Saved raw webhook request body ({len(raw_body_content)} bytes) to: {raw_filepath}"
+    try:
+        mail_form = await receive_mail_form(
+            request.stream(),
+            content_type_header,
+            attachment_dir=base_attachment_dir,
+            raw_archive=raw_archive,
         )
+    except MailFormError as e:
+        logger.error(f"Malformed mail webhook request: {e}")
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
-        logger.error(f"Failed to save raw webhook request body: {e}", exc_info=True)
-    # --- End raw request saving ---
+        logger.error(f"Error reading mail webhook request: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500, detail="Failed to process incoming email"
+        ) from e
 
     try:
-        # FastAPI's request.form() will parse multipart/form-data
-        form_data = await request.form()
+        form_data = mail_form.fields
 
         # --- Parse Email Date ---
         email_date_parsed: datetime | None = None
         email_date_str = form_data.get("Date")
-        if isinstance(email_date_str, str):
+        if email_date_str is not None:
             try:
                 email_date_parsed = parse_datetime(email_date_str)
                 if email_date_parsed.tzinfo is None:
@@ -102,104 +114,17 @@ async def handle_mail_webhook(
         # --- Parse Headers ---
         headers_list: list[list[str]] | None = None
         headers_raw = form_data.get("message-headers")
-        if isinstance(headers_raw, str):
+        if headers_raw is not None:
             try:
                 headers_list = json.loads(headers_raw)
             except json.JSONDecodeError as e:
                 logger.warning(f"Could not decode message-headers JSON: {e}")
 
-        # --- Process Attachments ---
-        processed_attachments: list[AttachmentData] = []
-        attachment_count_str = form_data.get("attachment-count")
-        if isinstance(attachment_count_str, str) and attachment_count_str.isdigit():
-            attachment_count = int(attachment_count_str)
-            # Generate a single UUID for this email's attachments directory
-            email_attachment_batch_id = str(uuid.uuid4())
-
-            # Get attachment storage path from app config
-            attachment_storage_path = DEFAULT_ATTACHMENT_STORAGE_PATH
-            app_config: AppConfig | None = getattr(request.app.state, "config", None)
-            if app_config and app_config.attachment_storage_path:
-                attachment_storage_path = app_config.attachment_storage_path
-
-            base_attachment_dir = os.path.join(
-                attachment_storage_path, email_attachment_batch_id
-            )
-
-            for i in range(1, attachment_count + 1):
-                attachment_field_name = f"attachment-{i}"
-                form_item = form_data.get(attachment_field_name)
-
-                if isinstance(form_item, StarletteUploadFile) and form_item.filename:
-                    try:
-                        os.makedirs(base_attachment_dir, exist_ok=True)
-                        # Sanitize filename (basic)
-                        safe_filename = os.path.basename(form_item.filename)
-                        final_file_path = os.path.join(
-                            base_attachment_dir, safe_filename
-                        )
-
-                        # Save the uploaded file
-                        await form_item.seek(0)  # Ensure pointer is at the start
-                        async with aiofiles.open(final_file_path, "wb") as f_out:
-                            content = await form_item.read()
-                            await f_out.write(content)
-
-                        # Get size after reading
-                        size = (
-                            form_item.size
-                            if form_item.size is not None
-                            else len(content)
-                        )
-
-                        processed_attachments.append(
-                            AttachmentData(
-                                filename=safe_filename,
-                                content_type=form_item.content_type
-                                or "application/octet-stream",
-                                size=size,
-                                storage_path=final_file_path,
-                            )
-                        )
-                        logger.info(
-                            f"Saved attachment '{safe_filename}' to {final_file_path}"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to save attachment {form_item.filename}: {e}",
-                            exc_info=True,
-                        )
-                    finally:
-                        await form_item.close()  # Close the upload file
-                elif form_item:  # Not an UploadFile or no filename
-                    detailed_reason = f"Type: {type(form_item)}"
-                    if isinstance(form_item, StarletteUploadFile):
-                        detailed_reason += f", Filename: '{form_item.filename}'"
-                    else:
-                        detailed_reason += f", Value: {str(form_item)[:100]}"  # Log first 100 chars if not UploadFile
-                    logger.warning(
-                        f"Skipping attachment field {attachment_field_name}: not a valid UploadFile with filename. Details: {detailed_reason}"
-                    )
-
-        # --- Create Pydantic Model ---
-        # Convert form_data (FormData) to a plain dict for Pydantic parsing
-        # FormData can have multiple values for a key, Pydantic expects single values or lists
-        # For Mailgun, most fields are single value. message-headers is special (already handled).
-        # We need to be careful if any other fields could be multi-valued.
-        # For simplicity, assuming other relevant fields are single string values.
-        # ast-grep-ignore: no-dict-any - Legacy code - needs structured types
-        form_data_dict: dict[str, Any] = {
-            key: form_data.get(key)
-            for key in form_data  # type: ignore
-        }
-
         parsed_email_payload = ParsedEmailData(
-            **form_data_dict,  # Pass all form fields, Pydantic will pick what it needs by alias
+            **form_data,  # Pass all form fields, Pydantic will pick what it needs by alias
             email_date=email_date_parsed,  # Override with parsed version
             headers_json=headers_list,  # Override with parsed version
-            attachment_info=(
-                processed_attachments if processed_attachments else None
-            ),  # Override
+            attachment_info=mail_form.attachments or None,  # Override
         )
 
         # Pass the Pydantic model instance to the storage function
@@ -0,0 +1,224 @@
+"""Tests for content-addressed attachment storage and reference counting."""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select
+
+from family_assistant.services.attachment_registry import (
+    BLOB_GC_GRACE_SECONDS,
+    AttachmentRegistry,
+)
+from family_assistant.storage.base import attachment_blobs_table
+from family_assistant.storage.context import DatabaseContext
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@pytest.fixture
+async def attachment_registry(
+    tmp_path: Path, db_engine: AsyncEngine
+) -> AttachmentRegistry:
+    """Create a real AttachmentRegistry backed by a temporary directory."""
+    return AttachmentRegistry(
+        storage_path=str(tmp_path / "attachments"), db_engine=db_engine
+    )
+
+
+async def _get_ref_count(db_context: DatabaseContext, content_hash: str) -> int | None:
+    row = await db_context.fetch_one(
+        select(attachment_blobs_table.c.ref_count).where(
+            attachment_blobs_table.c.content_hash == content_hash
+        )
+    )
+    return row["ref_count"] if row else None
+
+
+def _age_file(path: Path) -> None:
+    """Push a file's mtime past the garbage collection grace period."""
+    old = time.time() - BLOB_GC_GRACE_SECONDS - 60
+    os.utime(path, (old, old))
+
+
+async def test_identical_content_shares_one_blob(
+    db_engine: AsyncEngine, attachment_registry: AttachmentRegistry
+) -> None:
+    """Uploading the same bytes twice stores a single blob with two references."""
+    content = b"\x89PNG identical photo bytes"
+
+    async with DatabaseContext(db_engine) as db_context:
+        first = await attachment_registry.register_user_attachment(
+            db_context=db_context,
+            content=content,
+            filename="photo.png",
+            mime_type="image/png",
+        )
+        second = await attachment_registry.register_user_attachment(
+            db_context=db_context,
+            content=content,
+            filename="forwarded.png",
+            mime_type="image/png",
+        )
+
+        assert first.attachment_id != second.attachment_id
+        assert first.content_hash == second.content_hash
+        assert first.content_hash is not None
+        assert first.storage_path == second.storage_path
+        assert await _get_ref_count(db_context, first.content_hash) == 2
+
+    blob_files = [p for p in attachment_registry.blob_path.rglob("*") if p.is_file()]
+    assert len(blob_files) == 1
+
+    first_path = attachment_registry.get_attachment_path(first.attachment_id)
+    assert first_path == attachment_registry.get_attachment_path(second.attachment_id)
+    assert first_path is not None
+    assert first_path.read_bytes() == content
+
+
+async def test_blob_collected_only_after_last_reference(
+    db_engine: AsyncEngine, attachment_registry: AttachmentRegistry
+) -> None:
+    """Deleting attachments releases references; cleanup removes unreferenced blobs."""
+    content = b"shared chart bytes"
+
+    async with DatabaseContext(db_engine) as db_context:
+        first = await attachment_registry.register_user_attachment(
+            db_context=db_context,
+            content=content,
+            filename="chart.png",
+            mime_type="image/png",
+        )
+        second = await attachment_registry.register_user_attachment(
+            db_context=db_context,
+            content=content,
+            filename="chart.png",
+            mime_type="image/png",
+        )
+        assert first.content_hash is not None
+        blob_file = attachment_registry.get_attachment_path(first.attachment_id)
+        assert blob_file is not None
+
+        assert await attachment_registry.delete_attachment(
+            db_context, first.attachment_id
+        )
+        assert blob_file.exists()
+        assert await _get_ref_count(db_context, first.content_hash) == 1
+
+        assert await attachment_registry.delete_attachment(
+            db_context, second.attachment_id
+        )
+        # Left for garbage collection, in case a concurrent upload reuses it
+        assert blob_file.exists()
+        assert await _get_ref_count(db_context, first.content_hash) == 0
+
+    _age_file(blob_file)
+    async with DatabaseContext(db_engine) as db_context:
+        assert await attachment_registry.cleanup_orphaned_attachments(db_context) == 1
+        assert await _get_ref_count(db_context, first.content_hash) is None
+    assert not blob_file.exists()
+
+
+async def test_shared_blob_keeps_each_attachments_mime_type(
+    db_engine: AsyncEngine, attachment_registry: AttachmentRegistry
+) -> None:
+    """Attachments sharing a blob report their own MIME type, not the first upload's."""
+    content = b'{"readings": [1, 2, 3]}'
+
+    async with DatabaseContext(db_engine) as db_context:
+        as_text = await attachment_registry.register_user_attachment(
+            db_context=db_context,
+            content=content,
+            filename="readings.txt",
+            mime_type="text/plain",
+        )
+        as_json = await attachment_registry.register_user_attachment(
+            db_context=db_context,
+            content=content,
+            filename="readings.json",
+            mime_type="application/json",
+        )
+    blob_file = attachment_registry.get_attachment_path(as_json.attachment_id)
+    assert blob_file is not None
+    assert blob_file.suffix == ".txt"
+
+    assert (
+        attachment_registry.get_content_type(blob_file, as_json.attachment_id)
+        == "application/json"
+    )
+    json_uri = await attachment_registry.get_data_uri(as_json.attachment_id)
+    text_uri = await attachment_registry.get_data_uri(as_text.attachment_id)
+    assert json_uri is not None
+    assert json_uri.startswith("data:application/json;base64,")
+    assert text_uri is not None
+    assert text_uri.startswith("data:text/plain;base64,")
+
+    # A fresh registry reads the type from the attachment's row
+    restarted = AttachmentRegistry(
+        storage_path=str(attachment_registry.storage_path), db_engine=db_engine
+    )
+    restarted_uri = await restarted.get_data_uri(as_json.attachment_id)
+    assert restarted_uri is not None
+    assert restarted_uri.startswith("data:application/json;base64,")
+
+
+async def test_resolve_attachment_path_after_restart(
+    db_engine: AsyncEngine, attachment_registry: AttachmentRegistry
+) -> None:
+    """A fresh registry resolves blob-backed attachments through the database."""
+    async with DatabaseContext(db_engine) as db_context:
+        attachment = await attachment_registry.register_user_attachment(
+            db_context=db_context,
+            content=b"hello",
+            filename="note.txt",
+            mime_type="text/plain",
+        )
+
+    restarted = AttachmentRegistry(
+        storage_path=str(attachment_registry.storage_path), db_engine=db_engine
+    )
+    assert restarted.get_attachment_path(attachment.attachment_id) is None
+
+    resolved = await restarted.resolve_attachment_path(attachment.attachment_id)
+    assert resolved is not None
+    assert resolved.read_bytes() == b"hello"
+
+
+async def test_cleanup_collects_unreferenced_blobs(
+    db_engine: AsyncEngine, attachment_registry: AttachmentRegistry
+) -> None:
+    """Garbage collection removes blobs that were stored but never registered."""
+    kept = await attachment_registry._store_file_only(
+        b"never registered", "orphan.txt", "text/plain"
+    )
+    orphan_path = attachment_registry.get_attachment_path(kept.attachment_id)
+    assert orphan_path is not None
+
+    async with DatabaseContext(db_engine) as db_context:
+        live = await attachment_registry.register_user_attachment(
+            db_context=db_context,
+            content=b"still in use",
+            filename="live.txt",
+            mime_type="text/plain",
+        )
+    live_path = attachment_registry.get_attachment_path(live.attachment_id)
+    assert live_path is not None
+
+    # Recently written blobs are protected by the grace period
+    async with DatabaseContext(db_engine) as db_context:
+        assert await attachment_registry.cleanup_orphaned_attachments(db_context) == 0
+    assert orphan_path.exists()
+
+    _age_file(orphan_path)
+    _age_file(live_path)
+    async with DatabaseContext(db_engine) as db_context:
+        assert await attachment_registry.cleanup_orphaned_attachments(db_context) == 1
+
+    assert not orphan_path.exists()
+    assert live_path.exists()
@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine
 from family_assistant.embeddings import MockEmbeddingGenerator
 from family_assistant.storage.context import DatabaseContext
 from family_assistant.web.app_creator import app as fastapi_app
-from family_assistant.web.dependencies import get_db
+from family_assistant.web.dependencies import get_db, get_readonly_db
 
 # IMPORTANT: Disable auth BEFORE importing any web modules
 # This must happen at the top level of the functional test package
@@ -35,7 +35,12 @@ async def api_client(
         async with DatabaseContext(engine=db_engine) as db:
             yield db
 
+    async def override_get_readonly_db() -> AsyncGenerator[DatabaseContext]:
+        async with DatabaseContext(engine=db_engine, readonly=True) as db:
+            yield db
+
     fastapi_app.dependency_overrides[get_db] = override_get_db
+    fastapi_app.dependency_overrides[get_readonly_db] = override_get_readonly_db
     fastapi_app.state.embedding_generator = MockEmbeddingGenerator(
         model_name="test", dimensions=3
     )
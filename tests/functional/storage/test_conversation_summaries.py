@@ -0,0 +1,122 @@
+"""Functional tests for the incrementally maintained conversation_summaries table."""
+
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from family_assistant.storage.context import DatabaseContext
+from family_assistant.storage.message_history import conversation_summaries_table
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_context(db_engine: AsyncEngine) -> AsyncGenerator[DatabaseContext]:
+    """Provides an entered DatabaseContext for repository tests."""
+    async with DatabaseContext(engine=db_engine) as db_ctx:
+        yield db_ctx
+
+
+async def _add(
+    db_context: DatabaseContext,
+    conversation_id: str,
+    role: str,
+    content: str | None,
+    seconds: int,
+    interface_type: str = "web",
+) -> None:
+    result = await db_context.message_history.add_message(
+        interface_type=interface_type,
+        conversation_id=conversation_id,
+        interface_message_id=None,
+        turn_id=None,
+        thread_root_id=None,
+        timestamp=BASE_TIME + timedelta(seconds=seconds),
+        role=role,
+        content=content,
+    )
+    assert result is not None
+
+
+async def _summary_rows(db_context: DatabaseContext) -> dict[str, dict]:
+    rows = await db_context.fetch_all(select(conversation_summaries_table))
+    return {
+        row["conversation_id"]: {
+            "message_count": row["message_count"],
+            "last_message": row["last_message"],
+            "last_message_id": row["last_message_id"],
+        }
+        for row in rows
+    }
+
+
+async def test_summary_tracks_latest_message_with_content(
+    db_context: DatabaseContext,
+) -> None:
+    """Counts include every user/assistant message; the preview only moves forward."""
+    await _add(db_context, "conv", "user", "first question", seconds=10)
+    await _add(db_context, "conv", "assistant", "x" * 500, seconds=20)
+    # Tool messages are not part of the summary
+    await _add(db_context, "conv", "tool", "tool output", seconds=30)
+    # Assistant message without content counts but keeps the previous preview
+    await _add(db_context, "conv", "assistant", None, seconds=40)
+    # A late-arriving older message doesn't replace the newer preview
+    await _add(db_context, "conv", "user", "imported", seconds=5)
+
+    summaries, total = await db_context.message_history.get_conversation_summaries()
+
+    assert total == 1
+    assert summaries[0]["message_count"] == 4
+    assert summaries[0]["last_message"] == "x" * 100
+    assert summaries[0]["last_timestamp"].replace(tzinfo=UTC) == BASE_TIME + timedelta(
+        seconds=20
+    )
+
+
+async def test_rebuild_matches_incremental_summaries(
+    db_context: DatabaseContext,
+) -> None:
+    """Rebuilding from message_history reproduces what add_message maintained."""
+    await _add(db_context, "a", "user", "hello", seconds=1)
+    await _add(db_context, "a", "assistant", "hi there", seconds=2)
+    await _add(db_context, "b", "user", "ping", seconds=3, interface_type="telegram")
+    await _add(db_context, "c", "user", None, seconds=4)
+    incremental = await _summary_rows(db_context)
+
+    total = await db_context.message_history.rebuild_conversation_summaries()
+
+    assert total == 3
+    assert await _summary_rows(db_context) == incremental
+    # Conversations without any content are not listed
+    _, listed = await db_context.message_history.get_conversation_summaries()
+    assert listed == 2
+
+
+async def test_keyset_pagination_walks_all_conversations(
+    db_context: DatabaseContext,
+) -> None:
+    """Following the (last_timestamp, conversation_id) cursor visits each conversation once."""
+    for i in range(5):
+        # Pairs of conversations share a timestamp to exercise the tie-breaker
+        await _add(db_context, f"conv_{i}", "user", f"message {i}", seconds=i // 2)
+
+    seen: list[str] = []
+    before_timestamp = None
+    before_conversation_id = None
+    while True:
+        page, total = await db_context.message_history.get_conversation_summaries(
+            limit=2,
+            before_timestamp=before_timestamp,
+            before_conversation_id=before_conversation_id,
+        )
+        assert total == 5
+        seen.extend(summary["conversation_id"] for summary in page)
+        if len(page) < 2:
+            break
+        before_timestamp = page[-1]["last_timestamp"]
+        before_conversation_id = page[-1]["conversation_id"]
+
+    assert seen == ["conv_4", "conv_3", "conv_2", "conv_1", "conv_0"]
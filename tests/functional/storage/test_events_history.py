@@ -0,0 +1,106 @@
+"""Functional tests for event history queries backed by the listener-trigger table."""
+
+import uuid
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from family_assistant.storage.context import DatabaseContext
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_context(db_engine: AsyncEngine) -> AsyncGenerator[DatabaseContext]:
+    """Provides an entered DatabaseContext for repository tests."""
+    async with DatabaseContext(engine=db_engine) as db_ctx:
+        yield db_ctx
+
+
+async def _create_listener(db_context: DatabaseContext, name: str) -> int:
+    return await db_context.events.create_event_listener(
+        name=name,
+        source_id="home_assistant",
+        match_conditions={"entity_id": "sensor.test"},
+        conversation_id=str(uuid.uuid4()),
+    )
+
+
+async def test_events_include_listener_names(db_context: DatabaseContext) -> None:
+    """Triggered listener names are resolved in the order they were recorded."""
+    first = await _create_listener(db_context, "Door opened")
+    second = await _create_listener(db_context, "Lights on")
+
+    await db_context.events.store_event(
+        source_id="home_assistant",
+        event_data={"entity_id": "sensor.test"},
+        triggered_listener_ids=[second, first],
+    )
+    await db_context.events.store_event(
+        source_id="home_assistant", event_data={"entity_id": "sensor.other"}
+    )
+
+    events, total = await db_context.events.get_events_with_listeners()
+    assert total == 2
+    triggered = [e for e in events if e["triggered_listener_ids"]]
+    assert triggered[0]["triggered_listener_names"] == ["Lights on", "Door opened"]
+
+    only_triggered, total_triggered = await db_context.events.get_events_with_listeners(
+        only_triggered=True
+    )
+    assert total_triggered == 1
+    assert len(only_triggered) == 1
+
+
+async def test_keyset_pagination_walks_all_events(
+    db_context: DatabaseContext,
+) -> None:
+    """Following the (timestamp, id) cursor returns every event exactly once."""
+    base = datetime.now(UTC) - timedelta(minutes=10)
+    for i in range(5):
+        # Two events share each timestamp to exercise the id tie-breaker
+        await db_context.events.store_event(
+            source_id="indexing",
+            event_data={"n": i},
+            timestamp=base + timedelta(seconds=i // 2),
+        )
+
+    seen: list[int] = []
+    before_timestamp = None
+    before_id = None
+    while True:
+        page, total = await db_context.events.get_events_with_listeners(
+            limit=2, before_timestamp=before_timestamp, before_id=before_id
+        )
+        assert total == 5
+        seen.extend(event["event_data"]["n"] for event in page)
+        if len(page) < 2:
+            break
+        before_timestamp = page[-1]["timestamp"]
+        before_id = page[-1]["id"]
+
+    assert sorted(seen) == [0, 1, 2, 3, 4]
+    assert len(seen) == 5
+
+
+async def test_execution_stats_match_exact_listener_id(
+    db_context: DatabaseContext,
+) -> None:
+    """Stats for one listener do not count events of listeners with similar ids."""
+    listeners = [await _create_listener(db_context, f"L{i}") for i in range(12)]
+    target = listeners[0]
+    lookalike = next(
+        lid for lid in listeners if str(target) in str(lid) and lid != target
+    )
+
+    await db_context.events.store_event(
+        source_id="home_assistant", event_data={}, triggered_listener_ids=[target]
+    )
+    await db_context.events.store_event(
+        source_id="home_assistant", event_data={}, triggered_listener_ids=[lookalike]
+    )
+
+    stats = await db_context.events.get_listener_execution_stats(target)
+
+    assert stats["total_executions"] == 1
+    assert len(stats["recent_events"]) == 1
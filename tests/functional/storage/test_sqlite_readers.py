@@ -0,0 +1,109 @@
+"""Functional tests for read-only DatabaseContexts on SQLite reader connections."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from family_assistant.storage import init_db
+from family_assistant.storage.base import (
+    create_engine_with_sqlite_optimizations,
+    get_reader_engine,
+)
+from family_assistant.storage.context import (
+    DatabaseContext,
+    ReadOnlyContextError,
+    get_db_context,
+)
+from family_assistant.storage.notes import notes_table
+
+
+@pytest_asyncio.fixture
+async def sqlite_engine(tmp_path: Path) -> AsyncGenerator[AsyncEngine]:
+    engine = create_engine_with_sqlite_optimizations(
+        f"sqlite+aiosqlite:///{tmp_path / 'readers.db'}", sqlite_readers=2
+    )
+    await init_db(engine)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_readers_do_not_wait_for_an_open_write_transaction(
+    sqlite_engine: AsyncEngine,
+) -> None:
+    """Read-only contexts see committed data while a writer transaction is open."""
+    async with DatabaseContext(engine=sqlite_engine) as db:
+        await db.notes.add_or_update(title="Committed", content="visible")
+
+    async with DatabaseContext(engine=sqlite_engine) as writer:
+        await writer.notes.add_or_update(title="Pending", content="not yet")
+
+        async def read_titles() -> list[str]:
+            async with DatabaseContext(engine=sqlite_engine, readonly=True) as reader:
+                notes = await reader.notes.get_all(visibility_grants=None)
+                return [note.title for note in notes]
+
+        titles = await asyncio.wait_for(
+            asyncio.gather(read_titles(), read_titles()), timeout=5
+        )
+
+    assert titles == [["Committed"], ["Committed"]]
+    async with DatabaseContext(engine=sqlite_engine, readonly=True) as reader:
+        notes = await reader.notes.get_all(visibility_grants=None)
+        assert {note.title for note in notes} == {"Committed", "Pending"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_reader_connections_reject_writes_and_close_with_the_engine(
+    sqlite_engine: AsyncEngine,
+) -> None:
+    """Reader connections are query-only and are disposed with their writer."""
+    reader_engine = get_reader_engine(sqlite_engine)
+    assert reader_engine is not sqlite_engine
+
+    async with DatabaseContext(engine=sqlite_engine, readonly=True) as reader:
+        assert reader.conn is not None
+        with pytest.raises(OperationalError, match="readonly"):
+            await reader.conn.execute(
+                text("INSERT INTO notes (title, content) VALUES ('x', 'y')")
+            )
+    assert reader_engine.pool.checkedin() == 1  # type: ignore[attr-defined]
+
+    await sqlite_engine.dispose()
+
+    assert reader_engine.pool.checkedin() == 0  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_readonly_context_runs_outside_a_transaction_and_fails_fast_on_writes(
+    sqlite_engine: AsyncEngine,
+) -> None:
+    """Read-only contexts hold no snapshot open and refuse writes before executing."""
+    async with get_db_context(sqlite_engine, readonly=True) as reader:
+        assert await reader.fetch_all(text("SELECT title FROM notes")) == []
+        # No snapshot is held between queries: a later commit is visible
+        async with DatabaseContext(engine=sqlite_engine) as writer:
+            await writer.notes.add_or_update(title="Later", content="visible")
+        assert await reader.fetch_all(text("SELECT title FROM notes")) == [
+            {"title": "Later"}
+        ]
+
+        with pytest.raises(ReadOnlyContextError):
+            await reader.execute_with_retry(
+                insert(notes_table).values(title="x", content="y")
+            )
+        with pytest.raises(ReadOnlyContextError):
+            await reader.execute_with_retry(text("  delete from notes"))
+        with pytest.raises(ReadOnlyContextError):
+            reader.on_commit(lambda: None)
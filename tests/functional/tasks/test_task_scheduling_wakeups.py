@@ -0,0 +1,217 @@
+"""
+Tests for deadline-aware TaskWorker wake-ups for scheduled tasks.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from family_assistant import task_worker
+from family_assistant.storage.context import DatabaseContext
+from family_assistant.storage.repositories.tasks import TasksRepository
+from family_assistant.storage.types import TaskDict
+from family_assistant.task_worker import TaskWorker
+from family_assistant.tools import ToolExecutionContext
+
+
+@pytest.fixture
+def short_idle_poll(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Shortens the idle poll interval; request before counted_worker."""
+    monkeypatch.setattr(task_worker, "TASK_IDLE_POLL_INTERVAL", 0.1)
+
+
+@pytest.fixture
+def due_queries(monkeypatch: pytest.MonkeyPatch) -> list[datetime]:
+    """Records the times of each next-due aggregate query."""
+    queries: list[datetime] = []
+    original_get_next_due_time = TasksRepository.get_next_due_time
+
+    async def counting_get_next_due_time(
+        self: TasksRepository, task_types: list[str], current_time: datetime
+    ) -> datetime | None:
+        queries.append(datetime.now(UTC))
+        return await original_get_next_due_time(self, task_types, current_time)
+
+    monkeypatch.setattr(
+        TasksRepository, "get_next_due_time", counting_get_next_due_time
+    )
+    return queries
+
+
+@pytest_asyncio.fixture
+async def counted_worker(
+    db_engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+) -> AsyncGenerator[tuple[TaskWorker, list[float], list[datetime]]]:
+    """Runs a worker with a private wake-up event, counting its dequeue calls.
+
+    Yields the worker, the monotonic times of each dequeue and the times the
+    "record" handler ran.
+    """
+    dequeue_calls: list[float] = []
+    original_dequeue = TasksRepository.dequeue
+
+    async def counting_dequeue(
+        self: TasksRepository,
+        worker_id: str,
+        task_types: list[str],
+        current_time: datetime,
+    ) -> TaskDict | None:
+        dequeue_calls.append(time.monotonic())
+        return await original_dequeue(self, worker_id, task_types, current_time)
+
+    monkeypatch.setattr(TasksRepository, "dequeue", counting_dequeue)
+
+    ran_at: list[datetime] = []
+
+    async def record_handler(
+        exec_context: ToolExecutionContext,
+        # ast-grep-ignore: no-dict-any - Task payloads are untyped
+        payload: dict[str, Any],
+    ) -> None:
+        ran_at.append(datetime.now(UTC))
+
+    shutdown_event = asyncio.Event()
+    worker = TaskWorker(
+        processing_service=MagicMock(),
+        chat_interface=MagicMock(),
+        calendar_config={},
+        timezone_str="UTC",
+        embedding_generator=MagicMock(),
+        shutdown_event_instance=shutdown_event,
+        engine=db_engine,
+    )
+    worker.register_task_handler("record", record_handler)
+    # The test never sets this event: wake-ups must come from enqueue notifications
+    worker_task = asyncio.create_task(worker.run(asyncio.Event()))
+    try:
+        yield worker, dequeue_calls, ran_at
+    finally:
+        shutdown_event.set()
+        try:
+            await asyncio.wait_for(worker_task, timeout=5.0)
+        except TimeoutError:
+            worker_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker_task
+
+
+@pytest.mark.asyncio
+async def test_scheduled_task_runs_at_its_deadline(
+    db_engine: AsyncEngine,
+    counted_worker: tuple[TaskWorker, list[float], list[datetime]],
+) -> None:
+    """A task scheduled shortly ahead runs on time, without repeated dequeues."""
+    worker, dequeue_calls, ran_at = counted_worker
+    # ast-grep-ignore: no-asyncio-sleep-in-tests - Let the worker go idle first
+    await asyncio.sleep(0.2)
+    idle_dequeues = len(dequeue_calls)
+
+    scheduled_at = datetime.now(UTC) + timedelta(seconds=0.5)
+    async with DatabaseContext(engine=db_engine) as db_context:
+        await db_context.tasks.enqueue(
+            task_id="deadline_test", task_type="record", scheduled_at=scheduled_at
+        )
+
+    for _ in range(40):
+        if ran_at:
+            break
+        # ast-grep-ignore: no-asyncio-sleep-in-tests - Waiting for the scheduled run
+        await asyncio.sleep(0.05)
+
+    assert ran_at, "Scheduled task did not run"
+    assert scheduled_at <= ran_at[0] < scheduled_at + timedelta(seconds=1)
+    # One dequeue when the deadline fired (plus one after processing it)
+    assert len(dequeue_calls) - idle_dequeues <= 2
+
+
+@pytest.mark.asyncio
+async def test_future_task_shortens_idle_sleep_without_polling(
+    db_engine: AsyncEngine,
+    counted_worker: tuple[TaskWorker, list[float], list[datetime]],
+) -> None:
+    """Enqueuing a future task updates the worker's deadline without a dequeue."""
+    worker, dequeue_calls, _ = counted_worker
+    # ast-grep-ignore: no-asyncio-sleep-in-tests - Let the worker go idle first
+    await asyncio.sleep(0.2)
+    idle_dequeues = len(dequeue_calls)
+
+    scheduled_at = datetime.now(UTC) + timedelta(hours=1)
+    async with DatabaseContext(engine=db_engine) as db_context:
+        await db_context.tasks.enqueue(
+            task_id="far_future_test", task_type="record", scheduled_at=scheduled_at
+        )
+    # ast-grep-ignore: no-asyncio-sleep-in-tests - Give the notification time to land
+    await asyncio.sleep(0.3)
+
+    assert worker._next_deadline == scheduled_at
+    assert len(dequeue_calls) == idle_dequeues
+
+
+@pytest.mark.asyncio
+async def test_busy_worker_skips_next_due_query(
+    db_engine: AsyncEngine,
+    counted_worker: tuple[TaskWorker, list[float], list[datetime]],
+    due_queries: list[datetime],
+) -> None:
+    """The next-due aggregate only runs once a dequeue comes back empty."""
+    _, _, ran_at = counted_worker
+
+    # All three become due together, so the worker drains them back to back
+    scheduled_at = datetime.now(UTC) + timedelta(seconds=0.3)
+    for index in range(3):
+        async with DatabaseContext(engine=db_engine) as db_context:
+            await db_context.tasks.enqueue(
+                task_id=f"busy_{index}", task_type="record", scheduled_at=scheduled_at
+            )
+
+    for _ in range(40):
+        if len(ran_at) == 3:
+            break
+        # ast-grep-ignore: no-asyncio-sleep-in-tests - Waiting for the queued tasks
+        await asyncio.sleep(0.05)
+
+    assert len(ran_at) == 3
+    assert not [at for at in due_queries if ran_at[0] <= at <= ran_at[-1]]
+
+
+@pytest.mark.asyncio
+async def test_idle_polls_dequeue_only_when_a_task_is_due(
+    short_idle_poll: None,
+    db_engine: AsyncEngine,
+    counted_worker: tuple[TaskWorker, list[float], list[datetime]],
+    due_queries: list[datetime],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Idle polls run the next-due aggregate; a found task is then dequeued."""
+    worker, dequeue_calls, ran_at = counted_worker
+    # ast-grep-ignore: no-asyncio-sleep-in-tests - Let the worker go idle first
+    await asyncio.sleep(0.2)
+    idle_dequeues = len(dequeue_calls)
+    idle_queries = len(due_queries)
+
+    # ast-grep-ignore: no-asyncio-sleep-in-tests - Several idle intervals pass
+    await asyncio.sleep(0.5)
+
+    assert len(due_queries) - idle_queries >= 3
+    assert len(dequeue_calls) == idle_dequeues
+
+    # As if another process enqueued it: the worker gets no notification
+    monkeypatch.setattr(worker, "_note_task_scheduled", lambda *args: None)
+    async with DatabaseContext(engine=db_engine) as db_context:
+        await db_context.tasks.enqueue(task_id="unnotified", task_type="record")
+
+    for _ in range(40):
+        if ran_at:
+            break
+        # ast-grep-ignore: no-asyncio-sleep-in-tests - Waiting for the idle poll
+        await asyncio.sleep(0.05)
+
+    assert ran_at, "Task enqueued without a notification was not picked up"
@@ -188,3 +188,74 @@ async def test_error_log_cleanup(db_engine: AsyncEngine) -> None:
         assert all(e["logger_name"] != "old.error" for e in remaining_errors)
         assert any(e["logger_name"] == "recent.error" for e in remaining_errors)
         assert any(e["logger_name"] == "very.recent.error" for e in remaining_errors)
+
+
+@pytest.mark.asyncio
+async def test_repeated_errors_fold_into_one_row(db_engine: AsyncEngine) -> None:
+    """Repeats of an exception are counted on a single row, across flushes."""
+    test_logger = logging.getLogger("test_error_dedupe")
+    test_logger.propagate = False
+    handler = SQLAlchemyErrorHandler(db_engine, min_level=logging.ERROR)
+    test_logger.addHandler(handler)
+
+    def fail(n: int) -> None:
+        raise ValueError(f"bad value {n}")
+
+    try:
+        for n in range(50):
+            try:
+                fail(n)
+            except ValueError:
+                test_logger.exception(f"Request {n} failed")
+        await handler.wait_for_pending_logs()
+
+        for n in range(5):
+            try:
+                fail(n)
+            except ValueError:
+                test_logger.exception(f"Request {n} failed")
+        await handler.wait_for_pending_logs()
+
+        async with DatabaseContext(engine=db_engine) as db_context:
+            rows = await db_context.fetch_all(
+                select(error_logs_table).where(
+                    error_logs_table.c.logger_name == "test_error_dedupe"
+                )
+            )
+
+        assert len(rows) == 1
+        assert rows[0]["occurrence_count"] == 55
+        assert rows[0]["message"] == "Request 0 failed"
+        assert rows[0]["last_seen"] >= rows[0]["timestamp"]
+    finally:
+        handler.close()
+        test_logger.removeHandler(handler)
+        test_logger.propagate = True
+
+
+@pytest.mark.asyncio
+async def test_queue_is_bounded(db_engine: AsyncEngine) -> None:
+    """Distinct errors beyond max_pending are dropped and counted."""
+    test_logger = logging.getLogger("test_error_bounded")
+    test_logger.propagate = False
+    handler = SQLAlchemyErrorHandler(db_engine, min_level=logging.ERROR, max_pending=3)
+    test_logger.addHandler(handler)
+
+    try:
+        for n in range(5):
+            test_logger.error(f"Distinct error {n}")
+        await handler.wait_for_pending_logs()
+
+        async with DatabaseContext(engine=db_engine) as db_context:
+            rows = await db_context.fetch_all(
+                select(error_logs_table).where(
+                    error_logs_table.c.logger_name == "test_error_bounded"
+                )
+            )
+
+        assert len(rows) == 3
+        assert handler.dropped_count == 2
+    finally:
+        handler.close()
+        test_logger.removeHandler(handler)
+        test_logger.propagate = True
@@ -16,7 +16,12 @@ from family_assistant.config_models import AppConfig
 from family_assistant.processing import ProcessingService, ProcessingServiceConfig
 from family_assistant.services.attachment_registry import AttachmentRegistry
 from family_assistant.storage.context import DatabaseContext
-from family_assistant.tools import AVAILABLE_FUNCTIONS, TOOLS_DEFINITION
+from family_assistant.tools import (
+    AVAILABLE_FUNCTIONS,
+    TOOLS_DEFINITION,
+    data_manipulation,
+)
+from family_assistant.tools.data_manipulation import _parsed_json_cache, jq_query_tool
 from family_assistant.tools.execute_script import execute_script_tool
 from family_assistant.tools.infrastructure import LocalToolsProvider
 from family_assistant.tools.types import ToolExecutionContext
@@ -76,13 +81,10 @@ async def _store_test_attachment(
     """Helper to store an attachment using registry's proper API."""
     attachment_id = str(uuid.uuid4())
 
-    # Use registry's internal method to get proper file path
-    file_path = registry._get_file_path(attachment_id, filename)
-
-    # Write file
-    file_path.write_bytes(content)
+    # Write the content to the content-addressed blob store
+    content_hash, file_path = await registry._write_blob(content, filename)
 
-    # Register in database
+    # Register in database, taking a reference on the blob
     await registry.register_attachment(
         db_context=db_context,
         attachment_id=attachment_id,
@@ -93,6 +95,7 @@ async def _store_test_attachment(
         size=len(content),
         storage_path=str(file_path),
         conversation_id=conversation_id,
+        content_hash=content_hash,
     )
 
     return attachment_id
@@ -587,3 +590,155 @@ result = jq_query(
             assert (
                 "error" in text or "attachment registry not available" in text.lower()
             )
+
+    async def test_jq_query_reuses_parsed_document(
+        self,
+        db_engine: AsyncEngine,
+        attachment_registry_with_json: tuple[AttachmentRegistry, str, str],
+    ) -> None:
+        """Repeated queries against one attachment parse it only once."""
+        registry, attachment_id, conversation_id = attachment_registry_with_json
+        _parsed_json_cache.clear()
+        misses_before = _parsed_json_cache.misses
+        hits_before = _parsed_json_cache.hits
+
+        async with DatabaseContext(db_engine) as db_context:
+            exec_context = ToolExecutionContext(
+                interface_type="test",
+                conversation_id=conversation_id,
+                user_name="TestUser",
+                turn_id="test-turn",
+                db_context=db_context,
+                attachment_registry=registry,
+                processing_service=None,
+                clock=None,
+                home_assistant_client=None,
+                event_sources={},
+                camera_backend=None,
+            )
+
+            count = await jq_query_tool(exec_context, attachment_id, ".items | length")
+            names = await jq_query_tool(exec_context, attachment_id, "[.items[].name]")
+
+        assert count.get_data() == 3
+        assert names.get_data() == ["Alice", "Bob", "Charlie"]
+        assert _parsed_json_cache.misses - misses_before == 1
+        assert _parsed_json_cache.hits - hits_before == 1
+
+    async def test_jq_query_ndjson_streams_each_line(
+        self, db_engine: AsyncEngine, tmp_path: Path
+    ) -> None:
+        """NDJSON attachments are queried record by record."""
+        storage_path = tmp_path / "attachments"
+        storage_path.mkdir(parents=True, exist_ok=True)
+        registry = AttachmentRegistry(
+            storage_path=str(storage_path), db_engine=db_engine, config=None
+        )
+        lines = [
+            {"entity_id": "sensor.temp", "state": "21.5"},
+            {"entity_id": "sensor.temp", "state": "22.0"},
+        ]
+        content = "\n".join(json.dumps(line) for line in lines).encode("utf-8")
+
+        async with DatabaseContext(db_engine) as db_context:
+            attachment_id = await _store_test_attachment(
+                registry=registry,
+                db_context=db_context,
+                content=content,
+                filename="history.ndjson",
+                mime_type="application/x-ndjson",
+                conversation_id="test_conversation",
+            )
+            exec_context = ToolExecutionContext(
+                interface_type="test",
+                conversation_id="test_conversation",
+                user_name="TestUser",
+                turn_id="test-turn",
+                db_context=db_context,
+                attachment_registry=registry,
+                processing_service=None,
+                clock=None,
+                home_assistant_client=None,
+                event_sources={},
+                camera_backend=None,
+            )
+
+            result = await jq_query_tool(exec_context, attachment_id, ".state")
+
+        assert result.get_data() == ["21.5", "22.0"]
+
+    async def _query_single_attachment(
+        self,
+        db_engine: AsyncEngine,
+        tmp_path: Path,
+        content: bytes,
+        jq_programs: list[str],
+    ) -> list[object]:
+        """Store one JSON attachment and run each jq program against it."""
+        registry = AttachmentRegistry(
+            storage_path=str(tmp_path / "attachments"), db_engine=db_engine, config=None
+        )
+        async with DatabaseContext(db_engine) as db_context:
+            attachment_id = await _store_test_attachment(
+                registry=registry,
+                db_context=db_context,
+                content=content,
+                filename="data.json",
+                mime_type="application/json",
+                conversation_id="test_conversation",
+            )
+            exec_context = ToolExecutionContext(
+                interface_type="test",
+                conversation_id="test_conversation",
+                user_name="TestUser",
+                turn_id="test-turn",
+                db_context=db_context,
+                attachment_registry=registry,
+                processing_service=None,
+                clock=None,
+                home_assistant_client=None,
+                event_sources={},
+                camera_backend=None,
+            )
+            return [
+                (await jq_query_tool(exec_context, attachment_id, program)).get_data()
+                for program in jq_programs
+            ]
+
+    async def test_jq_query_large_document_is_parsed_by_jq(
+        self,
+        db_engine: AsyncEngine,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Large attachments are handed to jq as text and not cached."""
+        monkeypatch.setattr(data_manipulation, "JQ_STREAMING_THRESHOLD_BYTES", 0)
+        _parsed_json_cache.clear()
+        records = [
+            {"name": 'quote " and ] bracket', "tags": ["a\\", "{b}"]},
+            {"name": "ünïcode", "tags": []},
+        ]
+        content = "\n".join(json.dumps(record) for record in records).encode("utf-8")
+
+        [names] = await self._query_single_attachment(
+            db_engine, tmp_path, content, [".name"]
+        )
+
+        assert names == [record["name"] for record in records]
+        assert len(_parsed_json_cache) == 0
+
+    async def test_jq_query_caches_null_documents(
+        self, db_engine: AsyncEngine, tmp_path: Path
+    ) -> None:
+        """A document that is JSON null is cached like any other value."""
+        _parsed_json_cache.clear()
+        misses_before = _parsed_json_cache.misses
+        hits_before = _parsed_json_cache.hits
+
+        results = await self._query_single_attachment(
+            db_engine, tmp_path, b"null", [". == null", "[.]"]
+        )
+
+        assert results == [True, [None]]
+        assert _parsed_json_cache.misses - misses_before == 1
+        assert _parsed_json_cache.hits - hits_before == 1
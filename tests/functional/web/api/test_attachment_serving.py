@@ -0,0 +1,78 @@
+"""Tests for attachment serving: range requests and conditional GET."""
+
+import hashlib
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from family_assistant.services.attachment_registry import AttachmentRegistry
+from family_assistant.storage.context import DatabaseContext
+
+VIDEO_BYTES = bytes(range(256)) * 64  # 16 KiB of deterministic content
+
+
+async def _register_video(
+    db_engine: AsyncEngine, attachment_registry: AttachmentRegistry
+) -> str:
+    async with DatabaseContext(db_engine) as db_context:
+        metadata = await attachment_registry.register_user_attachment(
+            db_context=db_context,
+            content=VIDEO_BYTES,
+            filename="clip.mp4",
+            mime_type="video/mp4",
+        )
+    return metadata.attachment_id
+
+
+async def test_serve_attachment_sets_content_hash_etag(
+    api_test_client: AsyncClient,
+    db_engine: AsyncEngine,
+    attachment_registry_fixture: AttachmentRegistry,
+) -> None:
+    """Full responses carry a strong ETag derived from the content hash."""
+    attachment_id = await _register_video(db_engine, attachment_registry_fixture)
+
+    response = await api_test_client.get(f"/api/attachments/{attachment_id}")
+
+    assert response.status_code == 200
+    assert response.content == VIDEO_BYTES
+    assert response.headers["etag"] == f'"{hashlib.sha256(VIDEO_BYTES).hexdigest()}"'
+    assert "immutable" in response.headers["cache-control"]
+    assert response.headers["accept-ranges"] == "bytes"
+
+
+async def test_serve_attachment_if_none_match_returns_304(
+    api_test_client: AsyncClient,
+    db_engine: AsyncEngine,
+    attachment_registry_fixture: AttachmentRegistry,
+) -> None:
+    """A matching If-None-Match short-circuits with an empty 304."""
+    attachment_id = await _register_video(db_engine, attachment_registry_fixture)
+    first = await api_test_client.get(f"/api/attachments/{attachment_id}")
+    etag = first.headers["etag"]
+
+    response = await api_test_client.get(
+        f"/api/attachments/{attachment_id}",
+        headers={"If-None-Match": f'W/"stale", {etag}'},
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+async def test_serve_attachment_range_request(
+    api_test_client: AsyncClient,
+    db_engine: AsyncEngine,
+    attachment_registry_fixture: AttachmentRegistry,
+) -> None:
+    """Range requests return 206 with only the requested bytes."""
+    attachment_id = await _register_video(db_engine, attachment_registry_fixture)
+
+    response = await api_test_client.get(
+        f"/api/attachments/{attachment_id}", headers={"Range": "bytes=100-199"}
+    )
+
+    assert response.status_code == 206
+    assert response.content == VIDEO_BYTES[100:200]
+    assert response.headers["content-range"] == f"bytes 100-199/{len(VIDEO_BYTES)}"
@@ -179,3 +179,16 @@ async def test_diagnostics_export_with_error_record(
     assert error_request is not None
     assert error_request["error"] == "Connection timeout"
     assert error_request["response"] is None
+
+
+@pytest.mark.asyncio
+async def test_http_pool_metrics(api_client: httpx.AsyncClient) -> None:
+    """Test that pooled HTTP client utilization is reported."""
+    response = await api_client.get("/api/diagnostics/http-pools")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["max_connections_per_host"] > 0
+    assert isinstance(data["clients"], list)
+    assert "dav_clients" in data
+    assert "dns_cache_entries" in data
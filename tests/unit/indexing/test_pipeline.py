@@ -0,0 +1,157 @@
+"""Unit tests for the streaming IndexingPipeline."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, cast
+from unittest.mock import MagicMock
+
+import pytest
+
+from family_assistant.indexing.pipeline import IndexableContent, IndexingPipeline
+
+if TYPE_CHECKING:
+    from family_assistant.storage.vector import Document
+    from family_assistant.tools.types import ToolExecutionContext
+
+
+def _item(name: str) -> IndexableContent:
+    return IndexableContent(
+        embedding_type="raw_body_text", source_processor="test", content=name
+    )
+
+
+class SlowAnnotator:
+    """Item-parallel processor that returns each item plus one derived item."""
+
+    item_parallel = True
+    passes_items_through = True
+
+    def __init__(self, suffix: str, delay: float, max_concurrency: int = 4) -> None:
+        self.suffix = suffix
+        self.delay = delay
+        self.max_concurrency = max_concurrency
+        self.active = 0
+        self.peak_active = 0
+
+    @property
+    def name(self) -> str:
+        return f"annotator_{self.suffix}"
+
+    async def process(
+        self,
+        current_items: list[IndexableContent],
+        original_document: "Document",  # noqa: ARG002
+        initial_content_ref: IndexableContent | None,  # noqa: ARG002
+        context: "ToolExecutionContext",  # noqa: ARG002
+    ) -> list[IndexableContent]:
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            derived = []
+            for item in current_items:
+                if item.embedding_type != "raw_body_text":
+                    continue
+                assert item.content is not None
+                # Later items finish first, to check output order
+                await asyncio.sleep(self.delay / len(item.content))
+                derived.append(
+                    IndexableContent(
+                        embedding_type=self.suffix,
+                        source_processor=self.name,
+                        content=f"{item.content}:{self.suffix}",
+                    )
+                )
+            return current_items + derived
+        finally:
+            self.active -= 1
+
+
+class BatchRecorder:
+    """Whole-list processor that records the batches it receives."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[list[str | None]] = []
+        self.fail = fail
+
+    @property
+    def name(self) -> str:
+        return "batch_recorder"
+
+    async def process(
+        self,
+        current_items: list[IndexableContent],
+        original_document: "Document",  # noqa: ARG002
+        initial_content_ref: IndexableContent | None,  # noqa: ARG002
+        context: "ToolExecutionContext",  # noqa: ARG002
+    ) -> list[IndexableContent]:
+        if self.fail:
+            raise ValueError("boom")
+        self.batches.append([item.content for item in current_items])
+        return current_items
+
+
+DOCUMENT = cast("Document", MagicMock(title="Test document"))
+CONTEXT = cast("ToolExecutionContext", MagicMock())
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_pass_through_stages_overlap_on_the_same_item() -> None:
+    """Two slow stages on one item take the longer of the two, not the sum."""
+    summary = SlowAnnotator("summary", delay=0.3)
+    links = SlowAnnotator("link", delay=0.3)
+    recorder = BatchRecorder()
+    pipeline = IndexingPipeline(processors=[summary, links, recorder], config={})
+
+    started = time.monotonic()
+    result = await pipeline.run_with_timings([_item("a")], DOCUMENT, CONTEXT)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.5
+    assert [i.content for i in result.items] == ["a", "a:link", "a:summary"]
+    assert recorder.batches == [["a", "a:link", "a:summary"]]
+    assert [(t.processor, t.items_in, t.items_out) for t in result.stage_timings] == [
+        ("annotator_summary", 1, 2),
+        ("annotator_link", 2, 3),
+        ("batch_recorder", 3, 3),
+    ]
+    assert result.stage_timings[0].seconds >= 0.3
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_item_parallel_stage_is_bounded_and_keeps_input_order() -> None:
+    """Items run concurrently up to max_concurrency; outputs keep input order."""
+    annotator = SlowAnnotator("summary", delay=0.1, max_concurrency=2)
+    recorder = BatchRecorder()
+    pipeline = IndexingPipeline(processors=[annotator, recorder], config={})
+    items = [_item("a"), _item("bb"), _item("ccc"), _item("dddd")]
+
+    result_items = await pipeline.run(items, DOCUMENT, CONTEXT)
+
+    assert annotator.peak_active == 2
+    contents = [i.content for i in result_items]
+    assert [c for c in contents if c and ":" not in c] == ["a", "bb", "ccc", "dddd"]
+    assert [c for c in contents if c and ":" in c] == [
+        "a:summary",
+        "bb:summary",
+        "ccc:summary",
+        "dddd:summary",
+    ]
+    # The whole-list stage still sees everything in one call
+    assert len(recorder.batches) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_stage_failure_stops_the_pipeline() -> None:
+    """A failing processor surfaces as a RuntimeError naming it."""
+    pipeline = IndexingPipeline(
+        processors=[SlowAnnotator("summary", delay=0.01), BatchRecorder(fail=True)],
+        config={},
+    )
+
+    with pytest.raises(RuntimeError, match="batch_recorder") as exc_info:
+        await pipeline.run([_item("a")], DOCUMENT, CONTEXT)
+
+    assert isinstance(exc_info.value.__cause__, ValueError)
@@ -20,7 +20,8 @@ async def test_generate_response_stream_fallback_on_429() -> None:
 
     # Mocking acompletion
     with patch(
-        "family_assistant.llm.acompletion", new_callable=AsyncMock
+        "family_assistant.llm.providers.litellm_client.acompletion",
+        new_callable=AsyncMock,
     ) as mock_acompletion:
         # Define side effect for acompletion
         # First call (primary): raises RateLimitError
@@ -0,0 +1,104 @@
+"""Unit tests for per-message provider conversion caching."""
+
+import gc
+
+import pytest
+
+from family_assistant.llm.conversion_cache import MessageConversionCache
+from family_assistant.llm.messages import (
+    AssistantMessage,
+    LLMMessage,
+    SystemMessage,
+    ToolMessage,
+    UserMessage,
+)
+from family_assistant.llm.providers.anthropic_client import AnthropicClient
+from family_assistant.llm.tool_call import ToolCallFunction, ToolCallItem
+
+
+def _to_text(batch: list[LLMMessage]) -> list[str]:
+    return [f"{message.role}:{message.content}" for message in batch]
+
+
+@pytest.mark.no_db
+class TestMessageConversionCache:
+    def test_unchanged_messages_are_converted_once(self) -> None:
+        cache: MessageConversionCache[str] = MessageConversionCache()
+        history: list[LLMMessage] = [
+            SystemMessage(content="sys"),
+            UserMessage(content="hi"),
+        ]
+
+        assert cache.convert(history, _to_text) == ["system:sys", "user:hi"]
+        history.append(AssistantMessage(content="hello"))
+        assert cache.convert(history, _to_text) == [
+            "system:sys",
+            "user:hi",
+            "assistant:hello",
+        ]
+
+        assert cache.misses == 3
+        assert cache.hits == 2
+
+    def test_modified_messages_are_converted_again(self) -> None:
+        cache: MessageConversionCache[str] = MessageConversionCache()
+        message = UserMessage(content="before")
+        cache.convert([message], _to_text)
+
+        message.content = "after"
+
+        assert cache.convert([message], _to_text) == ["user:after"]
+        assert cache.misses == 2
+
+    def test_list_fields_growing_in_place_invalidate_the_entry(self) -> None:
+        cache: MessageConversionCache[int] = MessageConversionCache()
+        message = ToolMessage(
+            tool_call_id="call_1", name="tool", content="ok", attachments=[]
+        )
+        cache.convert([message], lambda batch: [len(batch)])
+
+        assert message.attachments is not None
+        message.attachments.append({
+            "type": "image",
+            "mime_type": "image/png",
+            "description": None,
+            "attachment_id": "a1",
+        })
+        cache.convert([message], lambda batch: [len(batch)])
+
+        assert cache.misses == 2
+
+    def test_entries_are_dropped_with_their_message(self) -> None:
+        cache: MessageConversionCache[str] = MessageConversionCache()
+        message = UserMessage(content="transient")
+        cache.convert([message], _to_text)
+        assert len(cache) == 1
+
+        del message
+        gc.collect()
+
+        assert len(cache) == 0
+
+
+@pytest.mark.no_db
+def test_anthropic_incremental_conversion_matches_full_conversion() -> None:
+    client = AnthropicClient(api_key="test", model="claude-3-sonnet")
+    tool_call = ToolCallItem(
+        id="call_1",
+        type="function",
+        function=ToolCallFunction(name="lookup", arguments='{"q": "x"}'),
+    )
+    messages: list[LLMMessage] = [
+        SystemMessage(content="Be helpful."),
+        UserMessage(content="Look something up"),
+        AssistantMessage(content=None, tool_calls=[tool_call]),
+        ToolMessage(tool_call_id="call_1", name="lookup", content="found"),
+        UserMessage(content="Thanks"),
+        UserMessage(content="And again"),
+    ]
+
+    expected = client._convert_messages_to_anthropic_format(messages)
+    assert client._convert_messages_incrementally(messages) == expected
+    # A second pass is served from the cache and must not share mutable state
+    assert client._convert_messages_incrementally(messages) == expected
+    assert client._message_conversion_cache.hits == len(messages)
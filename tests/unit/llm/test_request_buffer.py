@@ -5,6 +5,12 @@ from datetime import UTC, datetime, timedelta
 
 import pytest
 
+from family_assistant.llm.messages import (
+    ImageUrlContentPart,
+    SystemMessage,
+    TextContentPart,
+    UserMessage,
+)
 from family_assistant.llm.request_buffer import (
     LLMRequestBuffer,
     LLMRequestRecord,
@@ -223,6 +229,120 @@ class TestLLMRequestBuffer:
         assert len(buffer) == num_threads * records_per_thread
 
 
+class TestCompactStorage:
+    """Tests for how the buffer stores records compactly."""
+
+    def test_typed_messages_are_serialized_on_export_with_binary_stubbed(
+        self,
+    ) -> None:
+        """Image data URIs are replaced by a size-and-hash stub."""
+        buffer = LLMRequestBuffer(max_size=10)
+        image_url = "data:image/png;base64," + "A" * 10_000
+        buffer.add(
+            LLMRequestRecord(
+                timestamp=datetime.now(UTC),
+                request_id="img",
+                model_id="test-model",
+                messages=[
+                    UserMessage(
+                        content=[
+                            TextContentPart(type="text", text="What is this?"),
+                            ImageUrlContentPart(
+                                type="image_url", image_url={"url": image_url}
+                            ),
+                        ]
+                    ),
+                    {
+                        "role": "user",
+                        "content": [
+                            {"type": "image_url", "image_url": {"url": image_url}}
+                        ],
+                    },
+                ],
+            )
+        )
+
+        [record] = buffer.get_recent()
+        typed, raw = record.to_dict()["messages"]
+        assert typed["content"][0] == {"type": "text", "text": "What is this?"}
+        stub = typed["content"][1]["image_url"]["url"]
+        assert stub.startswith("data:image/png;base64,<10000 bytes omitted, sha256:")
+        assert raw["content"][0]["image_url"]["url"] == stub
+        assert buffer.size_bytes() < 1_000
+
+    def test_shared_tools_and_system_prompts_are_counted_once(self) -> None:
+        """Records reuse one stored copy of repeated tool schemas and prompts."""
+        buffer = LLMRequestBuffer(max_size=10)
+        tools = [
+            ToolDefinition(
+                type="function",
+                function={
+                    "name": f"tool_{i}",
+                    "description": "x" * 1_000,
+                    "parameters": {"type": "object", "properties": {}},
+                },
+            )
+            for i in range(5)
+        ]
+        prompt = "You are a helpful assistant. " * 100
+
+        def add(request_id: str) -> None:
+            buffer.add(
+                LLMRequestRecord(
+                    timestamp=datetime.now(UTC),
+                    request_id=request_id,
+                    model_id="test-model",
+                    # A new list and prompt string on every turn
+                    messages=[
+                        SystemMessage(content="".join(prompt)),
+                        UserMessage(content=request_id),
+                    ],
+                    tools=list(tools),
+                )
+            )
+
+        add("r0")
+        first_size = buffer.size_bytes()
+        add("r1")
+        add("r2")
+
+        assert buffer.size_bytes() < first_size + 100
+        newest, _, oldest = buffer.get_recent()
+        assert newest.tools is oldest.tools
+        assert newest.messages[0] is oldest.messages[0]
+
+        buffer.clear()
+        assert buffer.size_bytes() == 0
+
+    def test_byte_budget_evicts_oldest(self) -> None:
+        """Records are evicted once their estimated size exceeds max_bytes."""
+        buffer = LLMRequestBuffer(max_size=100, max_bytes=5_000)
+
+        for i in range(5):
+            buffer.add(
+                LLMRequestRecord(
+                    timestamp=datetime.now(UTC),
+                    request_id=f"r{i}",
+                    model_id="test-model",
+                    messages=[UserMessage(content=f"{i}" * 2_000)],
+                )
+            )
+
+        assert [r.request_id for r in buffer.get_recent()] == ["r4", "r3"]
+        assert buffer.size_bytes() <= 5_000
+
+        # A single oversized record is still kept
+        buffer.add(
+            LLMRequestRecord(
+                timestamp=datetime.now(UTC),
+                request_id="huge",
+                model_id="test-model",
+                messages=[UserMessage(content="x" * 10_000)],
+            )
+        )
+        assert [r.request_id for r in buffer.get_recent()] == ["huge"]
+
+
 class TestGlobalBuffer:
     """Tests for global buffer singleton."""
 
@@ -0,0 +1,220 @@
+"""Tests for starting side-effect free tools while the LLM is still streaming."""
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import Any, cast
+from unittest.mock import MagicMock
+
+import pytest
+
+from family_assistant.config_models import AppConfig
+from family_assistant.llm import LLMStreamEvent, ToolCallItem
+from family_assistant.llm.messages import LLMMessage, SystemMessage, UserMessage
+from family_assistant.llm.tool_call import ToolCallFunction
+from family_assistant.processing import ProcessingService, ProcessingServiceConfig
+from family_assistant.storage.context import DatabaseContext
+from family_assistant.tools import LocalToolsProvider
+from family_assistant.tools.types import ToolDefinition, ToolExecutionContext
+
+
+def _definition(name: str, side_effect_free: bool) -> ToolDefinition:
+    definition: ToolDefinition = {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": name,
+            "parameters": {"type": "object", "properties": {}, "required": []},
+        },
+    }
+    if side_effect_free:
+        definition["side_effect_free"] = True
+    return definition
+
+
+class _ToolCallThenWaitLLM:
+    """Streams one tool call, then waits for `release` before finishing."""
+
+    def __init__(self, tool_name: str) -> None:
+        self.tool_name = tool_name
+        self.release = asyncio.Event()
+        self.calls = 0
+
+    def generate_response_stream(
+        self,
+        messages: list[LLMMessage],
+        tools: list[ToolDefinition] | None = None,
+        tool_choice: str | None = "auto",
+    ) -> AsyncIterator[LLMStreamEvent]:
+        self.calls += 1
+        first_call = self.calls == 1
+
+        async def _stream() -> AsyncIterator[LLMStreamEvent]:
+            if first_call:
+                yield LLMStreamEvent(
+                    type="tool_call",
+                    tool_call=ToolCallItem(
+                        id="call_1",
+                        type="function",
+                        function=ToolCallFunction(name=self.tool_name, arguments="{}"),
+                    ),
+                )
+                # The rest of the response is still being generated
+                await asyncio.wait_for(self.release.wait(), timeout=1)
+            else:
+                yield LLMStreamEvent(type="content", content="Done.")
+            yield LLMStreamEvent(type="done")
+
+        return _stream()
+
+
+def _service(
+    llm: _ToolCallThenWaitLLM,
+    # ast-grep-ignore: no-dict-any - Tool implementations are heterogeneous callables
+    implementations: dict[str, Any],
+    speculative: bool,
+) -> ProcessingService:
+    provider = LocalToolsProvider(
+        definitions=[
+            _definition("read_state", side_effect_free=True),
+            _definition("change_state", side_effect_free=False),
+        ],
+        implementations=implementations,
+    )
+    return ProcessingService(
+        llm_client=llm,  # type: ignore[arg-type]
+        tools_provider=provider,
+        service_config=ProcessingServiceConfig(
+            prompts={},
+            timezone_str="UTC",
+            max_history_messages=5,
+            history_max_age_hours=24,
+            tools_config={"speculative_tool_execution": speculative},
+            delegation_security_level="confirm",
+            id="test",
+        ),
+        context_providers=[],
+        server_url=None,
+        app_config=AppConfig(),
+    )
+
+
+async def _run(service: ProcessingService) -> list[LLMStreamEvent]:
+    messages: list[LLMMessage] = [
+        SystemMessage(content="system"),
+        UserMessage(content="hello"),
+    ]
+    return [
+        event
+        async for event, _ in service.process_message_stream(
+            db_context=MagicMock(spec=DatabaseContext),
+            messages=messages,
+            interface_type="test",
+            conversation_id="conv",
+            user_name="user",
+            turn_id="turn",
+            chat_interface=None,
+        )
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_side_effect_free_tool_starts_while_streaming() -> None:
+    llm = _ToolCallThenWaitLLM("read_state")
+
+    async def read_state(exec_context: ToolExecutionContext) -> str:
+        # Only reachable before the stream ends if started speculatively
+        llm.release.set()
+        return "state"
+
+    service = _service(llm, {"read_state": read_state}, speculative=True)
+
+    events = await _run(service)
+
+    assert [event.type for event in events] == [
+        "tool_call",
+        "done",
+        "tool_result",
+        "content",
+        "done",
+    ]
+    assert events[2].tool_result == "state"
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_tools_with_side_effects_wait_for_the_stream() -> None:
+    llm = _ToolCallThenWaitLLM("change_state")
+    started_during_stream = False
+
+    async def change_state(exec_context: ToolExecutionContext) -> str:
+        nonlocal started_during_stream
+        started_during_stream = not llm.release.is_set()
+        return "changed"
+
+    service = _service(llm, {"change_state": change_state}, speculative=True)
+    llm.release.set()
+
+    events = await _run(service)
+
+    assert not started_during_stream
+    assert events[2].tool_result == "changed"
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_speculation_is_opt_in() -> None:
+    llm = _ToolCallThenWaitLLM("read_state")
+
+    async def read_state(exec_context: ToolExecutionContext) -> str:
+        llm.release.set()
+        return "state"
+
+    service = _service(llm, {"read_state": read_state}, speculative=False)
+
+    with pytest.raises(TimeoutError):
+        await _run(service)
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_speculative_tool_cancelled_when_consumer_stops_after_done() -> None:
+    llm = _ToolCallThenWaitLLM("read_state")
+    llm.release.set()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def read_state(exec_context: ToolExecutionContext) -> str:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "state"
+
+    service = _service(llm, {"read_state": read_state}, speculative=True)
+    # process_message_stream is an async generator, so it can be closed early
+    stream = cast(
+        # ast-grep-ignore: no-dict-any - Matches process_message_stream's messages
+        "AsyncGenerator[tuple[LLMStreamEvent, dict[str, Any]]]",
+        service.process_message_stream(
+            db_context=MagicMock(spec=DatabaseContext),
+            messages=[SystemMessage(content="system"), UserMessage(content="hello")],
+            interface_type="test",
+            conversation_id="conv",
+            user_name="user",
+            turn_id="turn",
+            chat_interface=None,
+        ),
+    )
+    async for event, _ in stream:
+        if event.type == "done":
+            break
+    await asyncio.wait_for(started.wait(), timeout=1)
+
+    # The consumer gives up before the tool results are collected; closing
+    # the stream waits for the cancelled tool to finish
+    await stream.aclose()
+
+    assert cancelled.is_set()
@@ -0,0 +1,151 @@
+"""Tests for the attachment derivative cache."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from family_assistant.services.attachment_derivatives import AttachmentDerivativeCache
+
+
+async def test_cached_derivative_is_computed_once() -> None:
+    """A second lookup for the same key is served from the cache."""
+    cache = AttachmentDerivativeCache(max_bytes=1024)
+    calls = 0
+
+    def _compute() -> str:
+        nonlocal calls
+        calls += 1
+        return "data:image/png;base64,AAAA"
+
+    try:
+        first = await cache.get_or_compute("hash-a", "data_uri", _compute)
+        second = await cache.get_or_compute("hash-a", "data_uri", _compute)
+    finally:
+        cache.shutdown()
+
+    assert first == second == "data:image/png;base64,AAAA"
+    assert calls == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+async def test_compute_runs_off_event_loop() -> None:
+    """Derivatives are computed in the worker pool, not on the loop thread."""
+    cache = AttachmentDerivativeCache()
+    loop_thread = threading.get_ident()
+
+    try:
+        compute_thread = await cache.get_or_compute(
+            "hash-a", "thread", threading.get_ident
+        )
+    finally:
+        cache.shutdown()
+
+    assert compute_thread != loop_thread
+
+
+async def test_concurrent_misses_share_one_computation() -> None:
+    """Concurrent requests for a missing entry wait on the same computation."""
+    cache = AttachmentDerivativeCache()
+    calls = 0
+    release = threading.Event()
+
+    def _compute() -> bytes:
+        nonlocal calls
+        calls += 1
+        release.wait(timeout=5)
+        return b"resized"
+
+    try:
+        first = asyncio.create_task(cache.get_or_compute("id-1", "resize", _compute))
+        second = asyncio.create_task(cache.get_or_compute("id-1", "resize", _compute))
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(first, second)
+    finally:
+        cache.shutdown()
+
+    assert results == [b"resized", b"resized"]
+    assert calls == 1
+
+
+async def test_least_recently_used_entries_evicted_over_budget() -> None:
+    """Entries beyond the byte budget are evicted oldest-first."""
+    cache = AttachmentDerivativeCache(max_bytes=10)
+
+    try:
+        await cache.get_or_compute("a", "t", lambda: b"12345")
+        await cache.get_or_compute("b", "t", lambda: b"12345")
+        # Touch "a" so "b" becomes least recently used
+        await cache.get_or_compute("a", "t", lambda: b"unused")
+        await cache.get_or_compute("c", "t", lambda: b"12345")
+    finally:
+        cache.shutdown()
+
+    assert len(cache) == 2
+    assert cache.current_bytes == 10
+    assert _peek(cache, "a") == b"12345"
+    assert _peek(cache, "b") is None
+
+
+def _peek(cache: AttachmentDerivativeCache, source_key: str) -> bytes | None:
+    """Peek at a cached entry without recording a hit."""
+    entry = cache._entries.get((source_key, "t"))
+    return entry[0] if entry else None
+
+
+async def test_invalidate_drops_all_transforms_for_source() -> None:
+    """Invalidating a source removes every derivative built from it."""
+    cache = AttachmentDerivativeCache()
+
+    try:
+        await cache.get_or_compute("hash-a", "data_uri", lambda: "uri")
+        await cache.get_or_compute("hash-a", "thumb", lambda: b"thumb")
+        await cache.get_or_compute("hash-b", "data_uri", lambda: "other")
+        cache.invalidate("hash-a")
+    finally:
+        cache.shutdown()
+
+    assert len(cache) == 1
+    assert cache.current_bytes == len("other")
+
+
+async def test_records_queue_and_compute_time() -> None:
+    """Computations waiting for a busy worker are reflected in queue metrics."""
+    cache = AttachmentDerivativeCache(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def _blocking() -> bytes:
+        started.set()
+        release.wait(timeout=5)
+        return b"first"
+
+    try:
+        first = asyncio.create_task(cache.get_or_compute("a", "t", _blocking))
+        second = asyncio.create_task(cache.get_or_compute("b", "t", lambda: b"next"))
+        # Both computations are submitted once the first is running
+        assert await asyncio.to_thread(started.wait, 5)
+        await asyncio.sleep(0.05)
+        release.set()
+        await asyncio.gather(first, second)
+    finally:
+        cache.shutdown()
+
+    assert cache.queue_seconds_max >= 0.04
+    assert cache.queue_seconds_total >= cache.queue_seconds_max
+    assert cache.compute_seconds_total >= 0.04
+
+
+async def test_cache_is_usable_after_shutdown() -> None:
+    """A miss after shutdown starts a fresh worker pool."""
+    cache = AttachmentDerivativeCache()
+    cache.shutdown()
+
+    try:
+        value = await cache.get_or_compute("hash-a", "upper", "abc".upper)
+    finally:
+        cache.shutdown()
+
+    assert value == "ABC"
@@ -1,11 +1,12 @@
 """Unit tests for the PushNotificationService."""
 
-import json
+import base64
 import logging
-from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
-from pywebpush import WebPushException
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from family_assistant.services.push_notification import PushNotificationService
@@ -16,6 +17,39 @@ TEST_PRIVATE_KEY = "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
 TEST_CONTACT_EMAIL = "tester@example.com"
 
 
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def _vapid_private_key() -> str:
+    """A real VAPID key, since sends are signed rather than mocked."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    return _b64(key.private_numbers().private_value.to_bytes(32, "big"))
+
+
+# ast-grep-ignore: no-dict-any - Mirrors the browser PushSubscription JSON
+def _subscription(endpoint: str) -> dict:
+    """Subscription JSON with real client keys, as a browser would send."""
+    client_key = ec.generate_private_key(ec.SECP256R1())
+    p256dh = client_key.public_key().public_bytes(
+        serialization.Encoding.X962, serialization.PublicFormat.UncompressedPoint
+    )
+    return {
+        "endpoint": endpoint,
+        "keys": {"p256dh": _b64(p256dh), "auth": _b64(b"0123456789abcdef")},
+    }
+
+
+def _service_with_transport(
+    handler: "httpx.MockTransport",
+) -> PushNotificationService:
+    return PushNotificationService(
+        vapid_private_key=_vapid_private_key(),
+        vapid_contact_email=TEST_CONTACT_EMAIL,
+        http_client=httpx.AsyncClient(transport=handler),
+    )
+
+
 def test_service_disabled_with_no_key() -> None:
     """Test that the service is disabled when no private key is provided."""
     service = PushNotificationService(
@@ -45,60 +79,82 @@ async def test_send_notification_disabled(
 
 
 @pytest.mark.asyncio
-@patch("family_assistant.services.push_notification.webpush", autospec=True)
-async def test_send_notification_success(
-    mock_webpush: MagicMock, db_engine: AsyncEngine
-) -> None:
-    """Test a successful push notification send."""
-    sub_json = json.dumps({
-        "endpoint": "https://example.com/push",
-        "keys": {"p256dh": "key", "auth": "auth_key"},
-    })
+async def test_send_notification_success(db_engine: AsyncEngine) -> None:
+    """A send posts an encrypted payload with VAPID headers to the endpoint."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(201)
+
+    service = _service_with_transport(httpx.MockTransport(handler))
 
     async with DatabaseContext(engine=db_engine) as db_context:
-        # Create subscription in database
         await db_context.push_subscriptions.add(
             user_identifier="user1",
-            subscription_json=json.loads(sub_json),
-        )
-
-        service = PushNotificationService(
-            vapid_private_key=TEST_PRIVATE_KEY, vapid_contact_email=TEST_CONTACT_EMAIL
+            subscription_json=_subscription("https://push.example.com/send/abc"),
         )
         await service.send_notification("user1", "Test Title", "Test Body", db_context)
 
-        mock_webpush.assert_called_once()
-        call_args = mock_webpush.call_args
-        assert call_args.kwargs["subscription_info"] == json.loads(sub_json)
-        assert call_args.kwargs["vapid_private_key"] == TEST_PRIVATE_KEY
-        assert call_args.kwargs["vapid_claims"] == {
-            "sub": f"mailto:{TEST_CONTACT_EMAIL}"
-        }
-        sent_payload = json.loads(call_args.kwargs["data"])
-        assert sent_payload["title"] == "Test Title"
-        assert sent_payload["body"] == "Test Body"
+    assert len(requests) == 1
+    request = requests[0]
+    assert str(request.url) == "https://push.example.com/send/abc"
+    assert request.headers["content-encoding"] == "aes128gcm"
+    assert request.headers["authorization"].startswith("vapid t=")
+    assert request.content
+    assert b"Test Title" not in request.content
 
 
 @pytest.mark.asyncio
-@patch("family_assistant.services.push_notification.webpush", autospec=True)
-async def test_handle_stale_subscription_410_gone(
-    mock_webpush: MagicMock, db_engine: AsyncEngine, caplog: pytest.LogCaptureFixture
-) -> None:
-    """Test that a 410 Gone response deletes the subscription."""
-    mock_response = MagicMock()
-    mock_response.status_code = 410
-    mock_webpush.side_effect = WebPushException("Gone", response=mock_response)
+async def test_vapid_headers_reused_per_push_service(db_engine: AsyncEngine) -> None:
+    """Sends to one push service share a signed VAPID token until it nears expiry."""
+    authorizations: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        authorizations.append(request.headers["authorization"])
+        return httpx.Response(201)
+
+    service = _service_with_transport(httpx.MockTransport(handler))
 
     async with DatabaseContext(engine=db_engine) as db_context:
-        # Create subscription in database
+        for i in range(3):
+            await db_context.push_subscriptions.add(
+                user_identifier="user1",
+                subscription_json=_subscription(f"https://push.example.com/send/{i}"),
+            )
         await db_context.push_subscriptions.add(
             user_identifier="user1",
-            subscription_json={"endpoint": "stale"},
+            subscription_json=_subscription("https://other.example.net/send/x"),
         )
+        await service.send_notification("user1", "title", "body", db_context)
+        await service.send_notification("user1", "title", "body", db_context)
+
+    assert len(authorizations) == 8
+    assert len(set(authorizations)) == 2
+    assert set(service._vapid_headers) == {
+        "https://push.example.com",
+        "https://other.example.net",
+    }
+
 
-        service = PushNotificationService(
-            vapid_private_key=TEST_PRIVATE_KEY, vapid_contact_email=TEST_CONTACT_EMAIL
+@pytest.mark.asyncio
+async def test_handle_stale_subscription_410_gone(
+    db_engine: AsyncEngine, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that a 410 Gone response deletes the subscription."""
+    service = _service_with_transport(
+        httpx.MockTransport(
+            lambda request: httpx.Response(410 if "stale" in request.url.path else 201)
         )
+    )
+
+    async with DatabaseContext(engine=db_engine) as db_context:
+        for endpoint in ("stale-1", "stale-2", "live"):
+            await db_context.push_subscriptions.add(
+                user_identifier="user1",
+                subscription_json=_subscription(f"https://push.example.com/{endpoint}"),
+            )
+
         with caplog.at_level(logging.INFO):
             await service.send_notification("user1", "title", "body", db_context)
             assert (
@@ -106,39 +162,32 @@ async def test_handle_stale_subscription_410_gone(
                 in caplog.text
             )
 
-        mock_webpush.assert_called_once()
-
-        # Verify subscription was deleted
+        # Only the live subscription remains
         subscriptions = await db_context.push_subscriptions.get_by_user("user1")
-        assert len(subscriptions) == 0
+        assert [sub.subscription_json["endpoint"] for sub in subscriptions] == [
+            "https://push.example.com/live"
+        ]
 
 
 @pytest.mark.asyncio
-@patch("family_assistant.services.push_notification.webpush", autospec=True)
 async def test_handle_other_web_push_exception(
-    mock_webpush: MagicMock, db_engine: AsyncEngine, caplog: pytest.LogCaptureFixture
+    db_engine: AsyncEngine, caplog: pytest.LogCaptureFixture
 ) -> None:
-    """Test that other WebPushExceptions are logged but do not delete the subscription."""
-    mock_response = MagicMock()
-    mock_response.status_code = 404
-    mock_webpush.side_effect = WebPushException("Not Found", response=mock_response)
+    """Test that other push service errors are logged but do not delete the subscription."""
+    service = _service_with_transport(
+        httpx.MockTransport(lambda request: httpx.Response(404))
+    )
 
     async with DatabaseContext(engine=db_engine) as db_context:
-        # Create subscription in database
         await db_context.push_subscriptions.add(
             user_identifier="user1",
-            subscription_json={"endpoint": "not-found"},
+            subscription_json=_subscription("https://push.example.com/not-found"),
         )
 
-        service = PushNotificationService(
-            vapid_private_key=TEST_PRIVATE_KEY, vapid_contact_email=TEST_CONTACT_EMAIL
-        )
         with caplog.at_level(logging.WARNING):
             await service.send_notification("user1", "title", "body", db_context)
             assert "Failed to send push notification" in caplog.text
 
-        mock_webpush.assert_called_once()
-
         # Verify subscription was NOT deleted
         subscriptions = await db_context.push_subscriptions.get_by_user("user1")
         assert len(subscriptions) == 1
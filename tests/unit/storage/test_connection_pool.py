@@ -0,0 +1,132 @@
+"""Unit tests for the event-loop-owned database connection pool."""
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from family_assistant.storage.connection_pool import (
+    LoopOwnedQueuePool,
+    get_connection_pool_stats,
+)
+
+
+async def _select_one(engine: AsyncEngine, hold: float = 0.0) -> int:
+    async with engine.connect() as conn:
+        result = await conn.execute(text("SELECT 1"))
+        if hold:
+            # ast-grep-ignore: no-asyncio-sleep-in-tests - Keep the connection checked out
+            await asyncio.sleep(hold)
+        return result.scalar_one()
+
+
+def _select_one_on_new_loop(engine: AsyncEngine) -> None:
+    """Runs a query from a separate thread with its own event loop."""
+    thread = threading.Thread(target=lambda: asyncio.run(_select_one(engine)))
+    thread.start()
+    thread.join()
+
+
+@pytest_asyncio.fixture
+async def pooled_engine(tmp_path: Path) -> AsyncGenerator[AsyncEngine]:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=LoopOwnedQueuePool,
+        pool_size=2,
+        max_overflow=0,
+    )
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_connections_are_reused_and_checkouts_wait(
+    pooled_engine: AsyncEngine,
+) -> None:
+    """Repeated checkouts reuse connections; waits beyond pool_size are timed."""
+    for _ in range(5):
+        assert await _select_one(pooled_engine) == 1
+
+    stats = get_connection_pool_stats(pooled_engine)
+    assert stats is not None
+    assert (stats.checkouts, stats.connects, stats.idle) == (5, 1, 1)
+
+    await asyncio.gather(*(_select_one(pooled_engine, hold=0.1) for _ in range(3)))
+
+    stats = get_connection_pool_stats(pooled_engine)
+    assert stats is not None
+    assert (stats.connects, stats.idle, stats.checked_out) == (2, 2, 0)
+    # The third query waited for one of the two connections to come back
+    assert stats.checkout_seconds_max >= 0.09
+    assert stats.connect_seconds_total > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_other_event_loops_get_unpooled_connections(
+    pooled_engine: AsyncEngine,
+) -> None:
+    """A foreign loop's connection is closed on return, not pooled."""
+    await _select_one(pooled_engine)
+
+    _select_one_on_new_loop(pooled_engine)
+
+    stats = get_connection_pool_stats(pooled_engine)
+    assert stats is not None
+    assert (stats.foreign_loop_connections, stats.connects) == (1, 2)
+    assert stats.idle == 1
+    # The owning loop still uses its pooled connection
+    await _select_one(pooled_engine)
+    stats = get_connection_pool_stats(pooled_engine)
+    assert stats is not None
+    assert (stats.connects, stats.checkouts) == (2, 2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_foreign_loop_connections_are_bounded_by_the_pool_limit(
+    pooled_engine: AsyncEngine,
+) -> None:
+    """A foreign loop waits for a slot once pool_size + max_overflow are open."""
+    await _select_one(pooled_engine)
+    elapsed: list[float] = []
+
+    async def _three_held_queries() -> None:
+        started = time.monotonic()
+        await asyncio.gather(*(_select_one(pooled_engine, hold=0.1) for _ in range(3)))
+        elapsed.append(time.monotonic() - started)
+
+    thread = threading.Thread(target=lambda: asyncio.run(_three_held_queries()))
+    thread.start()
+    thread.join()
+
+    stats = get_connection_pool_stats(pooled_engine)
+    assert stats is not None
+    assert stats.foreign_loop_connections == 3
+    # Only two connections were allowed at once, so the third query waited
+    assert elapsed[0] >= 0.19
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_pool_moves_to_a_new_loop_when_its_owner_closes(
+    pooled_engine: AsyncEngine,
+) -> None:
+    """Connections from a closed loop are discarded and the pool is re-owned."""
+    _select_one_on_new_loop(pooled_engine)
+
+    await _select_one(pooled_engine)
+    await _select_one(pooled_engine)
+
+    stats = get_connection_pool_stats(pooled_engine)
+    assert stats is not None
+    assert (stats.connects, stats.foreign_loop_connections, stats.idle) == (2, 0, 1)
@@ -0,0 +1,222 @@
+"""Unit tests for the pooled Playwright browser used by PlaywrightScraper."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from family_assistant.utils import scraping
+from family_assistant.utils.scraping import BrowserPool, PlaywrightScraper
+
+
+@dataclass
+class FakeRequest:
+    resource_type: str
+
+
+@dataclass
+class FakeRoute:
+    request: FakeRequest
+    outcome: str | None = None
+
+    async def abort(self) -> None:
+        self.outcome = "aborted"
+
+    async def continue_(self) -> None:
+        self.outcome = "continued"
+
+
+@dataclass
+class FakeBrowserState:
+    """Records everything the fake Playwright objects are asked to do."""
+
+    launches: int = 0
+    contexts: list["FakeContext"] = field(default_factory=list)
+    routes: list[FakeRoute] = field(default_factory=list)
+    active_pages: int = 0
+    peak_active_pages: int = 0
+    heap_bytes: int = 0
+    playwright_stopped: int = 0
+
+
+class FakePage:
+    def __init__(self, state: FakeBrowserState, context: "FakeContext") -> None:
+        self.state = state
+        self.context = context
+        self.url = "about:blank"
+
+    async def goto(self, url: str, **kwargs: Any) -> None:  # noqa: ANN401
+        self.url = url
+        if url == "about:blank":
+            return
+        self.state.active_pages += 1
+        self.state.peak_active_pages = max(
+            self.state.peak_active_pages, self.state.active_pages
+        )
+        try:
+            for resource_type in ("document", "script", "image", "font", "media"):
+                route = FakeRoute(FakeRequest(resource_type))
+                if self.context.route_handler is not None:
+                    await self.context.route_handler(route)
+                self.state.routes.append(route)
+            # ast-grep-ignore: no-asyncio-sleep-in-tests - Simulated render time
+            await asyncio.sleep(0.02)
+        finally:
+            self.state.active_pages -= 1
+
+    async def content(self) -> str:
+        return f"<html><body>{self.url}</body></html>"
+
+    async def title(self) -> str:
+        return self.url
+
+    async def evaluate(self, script: str) -> int:
+        return self.state.heap_bytes
+
+    def is_closed(self) -> bool:
+        return self.context.closed
+
+
+class FakeContext:
+    def __init__(self, state: FakeBrowserState) -> None:
+        self.state = state
+        self.closed = False
+        self.route_handler: Any = None
+
+    async def route(self, pattern: str, handler: Any) -> None:  # noqa: ANN401
+        self.route_handler = handler
+
+    async def new_page(self) -> FakePage:
+        return FakePage(self.state, self)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.connected = True
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def close(self) -> None:
+        self.connected = False
+
+
+@pytest.fixture
+def browser_state(monkeypatch: pytest.MonkeyPatch) -> FakeBrowserState:
+    """Replaces Playwright in the scraping module with in-memory fakes."""
+    state = FakeBrowserState()
+    browsers: list[FakeBrowser] = []
+
+    class FakePlaywright:
+        async def stop(self) -> None:
+            state.playwright_stopped += 1
+
+    class FakeManager:
+        async def start(self) -> FakePlaywright:
+            return FakePlaywright()
+
+    async def launch(playwright: FakePlaywright, **kwargs: Any) -> FakeBrowser:  # noqa: ANN401
+        state.launches += 1
+        browsers.append(FakeBrowser())
+        return browsers[-1]
+
+    async def create_context(browser: FakeBrowser, **kwargs: Any) -> FakeContext:  # noqa: ANN401
+        context = FakeContext(state)
+        state.contexts.append(context)
+        return context
+
+    monkeypatch.setattr(scraping, "async_playwright", FakeManager)
+    monkeypatch.setattr(scraping, "launch_stealth_browser", launch)
+    monkeypatch.setattr(scraping, "create_stealth_context", create_context)
+    return state
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_scrapes_reuse_one_browser_and_recycle_contexts(
+    browser_state: FakeBrowserState,
+) -> None:
+    """Sequential scrapes share a browser; contexts are replaced after N uses."""
+    scraper = PlaywrightScraper(context_max_uses=3)
+    try:
+        for i in range(7):
+            html, _, title = await scraper._fetch_with_playwright(
+                f"https://recipes.example/{i}"
+            )
+            assert title == f"https://recipes.example/{i}"
+            assert html is not None
+
+        assert browser_state.launches == 1
+        assert len(browser_state.contexts) == 3
+        assert [c.closed for c in browser_state.contexts] == [True, True, False]
+        # Images, fonts and media are aborted; the document and scripts load
+        assert {
+            r.request.resource_type
+            for r in browser_state.routes
+            if r.outcome == "aborted"
+        } == {"image", "font", "media"}
+        assert {
+            r.request.resource_type
+            for r in browser_state.routes
+            if r.outcome == "continued"
+        } == {"document", "script"}
+        stats = scraper.browser_pool.stats()
+        assert (stats.pages_served, stats.contexts_recycled, stats.idle_contexts) == (
+            7,
+            2,
+            1,
+        )
+        assert stats.blocked_requests == 21
+    finally:
+        await scraper.aclose()
+
+    assert browser_state.contexts[-1].closed
+    assert browser_state.playwright_stopped == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_pool_limits_pages_and_recovers_from_crashes(
+    browser_state: FakeBrowserState,
+) -> None:
+    """Concurrent pages are capped; bloated contexts and dead browsers are replaced."""
+    pool = BrowserPool(
+        max_concurrent_pages=2, context_max_heap_mb=1, blocked_resource_types=()
+    )
+
+    async def visit(url: str) -> None:
+        async with pool.page() as page:
+            await page.goto(url)
+
+    try:
+        await asyncio.gather(*(visit(f"https://example.com/{i}") for i in range(6)))
+        assert browser_state.peak_active_pages == 2
+        assert len(browser_state.contexts) == 2
+        assert all(r.outcome is None for r in browser_state.routes)
+
+        # A context whose JS heap grew past the limit is not reused
+        browser_state.heap_bytes = 2 * 1024 * 1024
+        await visit("https://example.com/heavy")
+        assert pool.stats().contexts_recycled == 1
+        browser_state.heap_bytes = 0
+
+        # The browser dies: the next page relaunches it with a fresh context
+        assert pool._browser is not None
+        pool._browser.connected = False  # type: ignore[attr-defined]
+        await visit("https://example.com/after-crash")
+        stats = pool.stats()
+        assert (browser_state.launches, stats.browser_restarts) == (2, 1)
+        assert browser_state.contexts[-1].closed is False
+        assert len(browser_state.contexts) == 3
+
+        # An error inside the block discards the context
+        with pytest.raises(ValueError):
+            async with pool.page():
+                raise ValueError("extraction failed")
+        assert pool.stats().idle_contexts == 0
+    finally:
+        await pool.aclose()
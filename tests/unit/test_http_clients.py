@@ -0,0 +1,207 @@
+"""Unit tests for the pooled HTTP client registry."""
+
+import asyncio
+import threading
+from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING
+
+import pytest
+import pytest_asyncio
+
+from family_assistant.utils.http_clients import HttpClientRegistry
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class _KeepAliveServer:
+    """Minimal HTTP/1.1 server that counts connections and concurrent requests."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.connections = 0
+        self.active = 0
+        self.peak_active = 0
+        self.request_heads: list[bytes] = []
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            while head := await reader.readuntil(b"\r\n\r\n"):
+                self.request_heads.append(head)
+                self.active += 1
+                self.peak_active = max(self.peak_active, self.active)
+                # ast-grep-ignore: no-asyncio-sleep-in-tests - Simulated server latency
+                await asyncio.sleep(self.delay)
+                self.active -= 1
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n"
+                    b"Set-Cookie: session=secret; Path=/\r\n"
+                    b"Connection: keep-alive\r\n\r\nok"
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest_asyncio.fixture
+async def server() -> AsyncGenerator[tuple[_KeepAliveServer, str]]:
+    state = _KeepAliveServer(delay=0.05)
+    tcp_server = await asyncio.start_server(state.handle, "127.0.0.1", 0)
+    port = tcp_server.sockets[0].getsockname()[1]
+    async with tcp_server:
+        yield state, f"http://localhost:{port}/feed.ics"
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_requests_reuse_kept_alive_connections(
+    server: tuple[_KeepAliveServer, str],
+) -> None:
+    """Sequential requests to one host share a single connection."""
+    state, url = server
+    registry = HttpClientRegistry()
+    try:
+        client = registry.get_client()
+        for _ in range(5):
+            response = await client.get(url)
+            assert response.text == "ok"
+
+        assert registry.get_client() is client
+        assert state.connections == 1
+        stats = registry.stats()
+        assert stats.dns_cache_entries == 1
+        [client_stats] = stats.clients
+        assert client_stats.requests == 5
+        assert client_stats.connections == 1
+        assert client_stats.idle_connections == 1
+        [host_stats] = client_stats.hosts
+        assert (host_stats.requests, host_stats.in_flight) == (5, 0)
+    finally:
+        await registry.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_concurrent_requests_are_limited_per_host(
+    server: tuple[_KeepAliveServer, str],
+) -> None:
+    """Requests beyond the per-host limit wait for a slot instead of connecting."""
+    state, url = server
+    registry = HttpClientRegistry(max_connections_per_host=2)
+    try:
+        client = registry.get_client()
+        responses = await asyncio.gather(*(client.get(url) for _ in range(6)))
+
+        assert all(r.status_code == 200 for r in responses)
+        assert state.peak_active == 2
+        assert state.connections == 2
+        [host_stats] = registry.stats().clients[0].hosts
+        assert host_stats.waited_for_slot == 4
+        assert host_stats.in_flight == 0
+    finally:
+        await registry.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_shared_client_does_not_keep_cookies(
+    server: tuple[_KeepAliveServer, str],
+) -> None:
+    """Cookies set by one site are not replayed on later requests."""
+    state, url = server
+    registry = HttpClientRegistry()
+    try:
+        client = registry.get_client()
+        await client.get(url)
+        await client.get(url)
+
+        assert not client.cookies
+        assert all(b"cookie:" not in head.lower() for head in state.request_heads)
+    finally:
+        await registry.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_environment_proxy_is_honoured(
+    server: tuple[_KeepAliveServer, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """HTTP_PROXY routes requests through the proxy despite the custom transport."""
+    state, url = server
+    monkeypatch.setenv("HTTP_PROXY", url.removesuffix("/feed.ics"))
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    monkeypatch.delenv("no_proxy", raising=False)
+    registry = HttpClientRegistry()
+    try:
+        response = await registry.get_client().get("http://calendar.invalid/feed.ics")
+
+        assert response.text == "ok"
+        # A forward proxy receives the absolute URL in the request line
+        assert state.request_heads[0].startswith(
+            b"GET http://calendar.invalid/feed.ics HTTP/1.1"
+        )
+    finally:
+        await registry.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_clients_are_kept_per_event_loop() -> None:
+    """Each loop gets its own client, and aclose closes it on that loop."""
+    registry = HttpClientRegistry()
+    client = registry.get_client()
+    other: list[tuple[httpx.AsyncClient, asyncio.AbstractEventLoop, asyncio.Event]] = []
+    client_created = threading.Event()
+
+    async def _use_registry_on_other_loop() -> None:
+        stop = asyncio.Event()
+        other.append((registry.get_client(), asyncio.get_running_loop(), stop))
+        client_created.set()
+        await stop.wait()
+
+    thread = threading.Thread(target=lambda: asyncio.run(_use_registry_on_other_loop()))
+    thread.start()
+    try:
+        assert await asyncio.to_thread(client_created.wait, 5)
+        other_client = other[0][0]
+        assert other_client is not client
+        # The other loop's client did not replace this loop's
+        assert registry.get_client() is client
+
+        await registry.aclose()
+
+        assert client.is_closed
+        assert other_client.is_closed
+    finally:
+        if other:
+            _, other_loop, stop = other[0]
+            other_loop.call_soon_threadsafe(stop.set)
+        await asyncio.to_thread(thread.join)
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_dav_clients_are_not_shared_between_threads() -> None:
+    """Worker threads each get their own cached CalDAV client."""
+    registry = HttpClientRegistry()
+
+    def _get_dav_client() -> object:
+        return registry.get_dav_client("https://dav.invalid/", "user", "secret")
+
+    try:
+        first = await asyncio.to_thread(lambda: (_get_dav_client(), _get_dav_client()))
+        results: list[object] = []
+        thread = threading.Thread(target=lambda: results.append(_get_dav_client()))
+        thread.start()
+        thread.join()
+
+        assert first[0] is first[1]
+        assert results[0] is not first[0]
+        assert registry.stats().dav_clients == 2
+    finally:
+        await registry.aclose()
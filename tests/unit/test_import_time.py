@@ -0,0 +1,34 @@
+"""Importing the core packages must not eagerly load heavy optional SDKs."""
+
+import subprocess
+import sys
+
+import pytest
+
+DEFERRED_MODULES = ["litellm", "mcp", "alembic", "google.genai", "yt_dlp"]
+
+
+@pytest.mark.no_db
+@pytest.mark.parametrize("module", ["family_assistant.llm", "family_assistant.tools"])
+def test_import_defers_heavy_dependencies(module: str) -> None:
+    probe = (
+        f"import sys, {module}; "
+        f"print('deferred:', *[m for m in {DEFERRED_MODULES!r} if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+    deferred_line = next(
+        line for line in result.stdout.splitlines() if line.startswith("deferred:")
+    )
+    assert deferred_line.split()[1:] == []
+
+
+@pytest.mark.no_db
+def test_litellm_client_still_importable_from_llm() -> None:
+    from family_assistant.llm import LiteLLMClient  # noqa: PLC0415
+    from family_assistant.llm.providers import (  # noqa: PLC0415
+        LiteLLMClient as ProviderLiteLLMClient,
+    )
+
+    assert LiteLLMClient is ProviderLiteLLMClient
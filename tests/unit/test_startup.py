@@ -0,0 +1,123 @@
+"""Unit tests for Assistant startup: timing report and cached Playwright check."""
+
+import importlib.metadata
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from family_assistant.assistant import Assistant
+from family_assistant.config_models import AppConfig
+from family_assistant.utils.startup_timing import StartupTimings
+from family_assistant.web.routers.health import health_router
+
+
+def _config() -> AppConfig:
+    return AppConfig.model_validate({
+        "telegram_enabled": False,
+        "model": "test-model",
+        "embedding_model": "mock-deterministic-embedder",
+        "embedding_dimensions": 384,
+        "database_url": "sqlite+aiosqlite:///:memory:",
+        "service_profiles": [
+            {"id": "first", "processing_config": {"prompts": {}}},
+            {"id": "second", "processing_config": {"prompts": {}}},
+        ],
+    })
+
+
+@pytest.mark.no_db
+def test_startup_timings_report() -> None:
+    timings = StartupTimings()
+    with timings.phase("database"):
+        pass
+    with pytest.raises(RuntimeError), timings.phase("failing"):
+        raise RuntimeError("boom")
+
+    assert timings.as_dict()["complete"] is False
+    timings.finish()
+
+    report = timings.as_dict()
+    assert report["complete"] is True
+    assert set(report["phases"]) == {"database", "failing"}  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_setup_dependencies_records_phases() -> None:
+    assistant = Assistant(_config())
+    with patch.object(
+        Assistant, "_ensure_playwright_browsers_installed", AsyncMock()
+    ) as ensure_browsers:
+        await assistant.setup_dependencies()
+    try:
+        ensure_browsers.assert_awaited_once()
+        assert list(assistant.processing_services_registry) == ["first", "second"]
+        report = assistant.startup_timings.as_dict()
+        assert report["complete"] is True
+        assert {
+            "playwright_check",
+            "database",
+            "tool_discovery",
+            "service_profiles",
+            "profile:first",
+            "profile:second",
+        } <= set(report["phases"])  # type: ignore[arg-type]
+    finally:
+        await assistant.stop_services()
+
+
+@pytest.mark.no_db
+def test_health_includes_startup_report() -> None:
+    app = FastAPI()
+    app.include_router(health_router)
+    app.state.telegram_service = None
+    timings = StartupTimings()
+    with timings.phase("database"):
+        pass
+    timings.finish()
+    app.state.startup_timings = timings
+
+    response = TestClient(app).get("/health")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "healthy"
+    assert body["startup"]["complete"] is True
+    assert "database" in body["startup"]["phases"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_playwright_check_is_cached_per_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PLAYWRIGHT_BROWSERS_PATH", str(tmp_path))
+
+    def fake_version(distribution: str) -> str:
+        # Production installs only have rebrowser-playwright
+        if distribution != "rebrowser-playwright":
+            raise importlib.metadata.PackageNotFoundError(distribution)
+        return "1.52.0"
+
+    monkeypatch.setattr(
+        "family_assistant.assistant.importlib.metadata.version", fake_version
+    )
+    marker = tmp_path / ".family-assistant-chromium-1.52.0"
+    dry_run = AsyncMock()
+    dry_run.communicate.return_value = (b"", b"")
+    dry_run.returncode = 0
+    assistant = Assistant(_config())
+
+    with patch(
+        "family_assistant.assistant.asyncio.create_subprocess_exec",
+        AsyncMock(return_value=dry_run),
+    ) as create_subprocess:
+        await assistant._ensure_playwright_browsers_installed()
+        assert create_subprocess.await_count == 1
+        assert marker.exists()
+
+        await assistant._ensure_playwright_browsers_installed()
+        assert create_subprocess.await_count == 1
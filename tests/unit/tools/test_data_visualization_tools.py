@@ -2,7 +2,7 @@
 
 import io
 import json
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from PIL import Image
@@ -197,6 +197,29 @@ March,200"""
         # Width/height should be roughly 1.5x the default
         assert img.width > 300  # Rough check
 
+    @pytest.mark.asyncio
+    async def test_identical_chart_served_from_render_cache(
+        self, mock_exec_context: Mock, simple_vega_lite_spec: str
+    ) -> None:
+        """Re-rendering the same spec and scale reuses the cached PNG."""
+        with patch(
+            "vl_convert.vegalite_to_png",
+            return_value=b"\x89PNG cached",
+        ) as render:
+            first = await create_vega_chart_tool(
+                mock_exec_context, spec=simple_vega_lite_spec, scale=1.25
+            )
+            second = await create_vega_chart_tool(
+                mock_exec_context, spec=simple_vega_lite_spec, scale=1.25
+            )
+            other_scale = await create_vega_chart_tool(
+                mock_exec_context, spec=simple_vega_lite_spec, scale=1.5
+            )
+
+        assert first.attachments and second.attachments and other_scale.attachments
+        assert first.attachments[0].content == second.attachments[0].content
+        assert render.call_count == 2
+
     @pytest.mark.asyncio
     async def test_invalid_json_spec(self, mock_exec_context: Mock) -> None:
         """Test handling of invalid JSON in spec."""
@@ -0,0 +1,121 @@
+"""Unit tests for MCP session pooling and idempotent result caching."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from mcp.types import TextContent
+
+from family_assistant.tools import MCPServerConfig, MCPToolsProvider
+from family_assistant.tools.mcp import _PooledSession  # noqa: PLC2701
+from family_assistant.tools.types import ToolExecutionContext
+
+
+class _FakeSession:
+    """Answers call_tool once `release` is set, recording the calls it served."""
+
+    def __init__(self, release: asyncio.Event) -> None:
+        self.release = release
+        # ast-grep-ignore: no-dict-any - Tool arguments are dynamic JSON
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    # ast-grep-ignore: no-dict-any - Tool arguments are dynamic JSON
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> SimpleNamespace:
+        self.calls.append((name, arguments))
+        await self.release.wait()
+        return SimpleNamespace(
+            content=[TextContent(type="text", text=f"{name}:{len(self.calls)}")],
+            isError=False,
+        )
+
+
+def _provider(
+    config: MCPServerConfig, session_count: int
+) -> tuple[MCPToolsProvider, list[_FakeSession], asyncio.Event]:
+    provider = MCPToolsProvider({"server": config})
+    release = asyncio.Event()
+    sessions = [_FakeSession(release) for _ in range(session_count)]
+    provider._sessions["server"] = [
+        _PooledSession(session)  # type: ignore[arg-type]
+        for session in sessions
+    ]
+    provider._tool_map = {"lookup": "server", "search": "server"}
+    provider._initialized = True
+    return provider, sessions, release
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_concurrent_calls_are_spread_across_the_pool() -> None:
+    provider, sessions, release = _provider(
+        {"transport": "stdio", "command": "echo", "pool_size": 3}, session_count=3
+    )
+    context = MagicMock(spec=ToolExecutionContext)
+
+    calls = [
+        asyncio.create_task(provider.execute_tool("lookup", {"q": i}, context))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0)
+    assert [len(session.calls) for session in sessions] == [1, 1, 1]
+    assert provider.get_server_metrics()["server"].in_flight == 3
+
+    release.set()
+    await asyncio.gather(*calls)
+
+    metrics = provider.get_server_metrics()["server"]
+    assert metrics.sessions == 3
+    assert metrics.in_flight == 0
+    assert metrics.calls == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_idempotent_results_are_cached_by_canonical_arguments() -> None:
+    provider, sessions, release = _provider(
+        {
+            "transport": "stdio",
+            "command": "echo",
+            "idempotent_tools": ["lookup"],
+            "result_cache_ttl_seconds": 60,
+        },
+        session_count=1,
+    )
+    release.set()
+    context = MagicMock(spec=ToolExecutionContext)
+
+    first = await provider.execute_tool("lookup", {"a": 1, "b": [2]}, context)
+    second = await provider.execute_tool("lookup", {"b": [2], "a": 1}, context)
+    assert first == second == "lookup:1"
+    await provider.execute_tool("lookup", {"a": 2}, context)
+    # Tools not marked idempotent always run
+    await provider.execute_tool("search", {"a": 1}, context)
+    await provider.execute_tool("search", {"a": 1}, context)
+
+    assert len(sessions[0].calls) == 4
+    metrics = provider.get_server_metrics()["server"]
+    assert metrics.cache_hits == 1
+    assert metrics.calls == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_cached_results_expire() -> None:
+    provider, sessions, release = _provider(
+        {
+            "transport": "stdio",
+            "command": "echo",
+            "idempotent_tools": ["lookup"],
+            "result_cache_ttl_seconds": 0,
+        },
+        session_count=1,
+    )
+    release.set()
+    context = MagicMock(spec=ToolExecutionContext)
+
+    await provider.execute_tool("lookup", {}, context)
+    await provider.execute_tool("lookup", {}, context)
+
+    assert len(sessions[0].calls) == 2
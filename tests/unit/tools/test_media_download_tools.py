@@ -32,9 +32,9 @@ def mock_exec_context() -> MagicMock:
 @pytest.fixture
 def mock_yt_dlp() -> Generator[MagicMock]:
     """Mock yt_dlp for testing without actual downloads."""
-    with patch("family_assistant.tools.media_download.yt_dlp") as mock_yt_dlp_module:
+    with patch("yt_dlp.YoutubeDL") as mock_youtube_dl:
         mock_ydl = MagicMock()
-        mock_yt_dlp_module.YoutubeDL.return_value.__enter__.return_value = mock_ydl
+        mock_youtube_dl.return_value.__enter__.return_value = mock_ydl
 
         yield mock_ydl
 
@@ -150,9 +150,9 @@ async def test_download_media_video_success(
     test_content = b"fake video content"
     test_file.write_bytes(test_content)
 
-    with patch("family_assistant.tools.media_download.yt_dlp") as mock_yt_dlp_module:
+    with patch("yt_dlp.YoutubeDL") as mock_youtube_dl:
         mock_ydl = MagicMock()
-        mock_yt_dlp_module.YoutubeDL.return_value.__enter__.return_value = mock_ydl
+        mock_youtube_dl.return_value.__enter__.return_value = mock_ydl
         mock_ydl.extract_info.return_value = {
             "title": "Test Video",
             "duration": 60,
@@ -198,9 +198,9 @@ async def test_download_media_audio_only(
     test_content = b"fake audio content"
     test_file.write_bytes(test_content)
 
-    with patch("family_assistant.tools.media_download.yt_dlp") as mock_yt_dlp_module:
+    with patch("yt_dlp.YoutubeDL") as mock_youtube_dl:
         mock_ydl = MagicMock()
-        mock_yt_dlp_module.YoutubeDL.return_value.__enter__.return_value = mock_ydl
+        mock_youtube_dl.return_value.__enter__.return_value = mock_ydl
         mock_ydl.extract_info.return_value = {
             "title": "Test Audio",
             "duration": 180,
@@ -246,14 +246,14 @@ async def test_download_media_file_too_large(
     test_file.write_bytes(b"x" * 100)
 
     with (
-        patch("family_assistant.tools.media_download.yt_dlp") as mock_yt_dlp_module,
+        patch("yt_dlp.YoutubeDL") as mock_youtube_dl,
         patch(
             "family_assistant.tools.media_download.get_attachment_limits",
             return_value=(50, 20),  # 50 bytes max
         ),
     ):
         mock_ydl = MagicMock()
-        mock_yt_dlp_module.YoutubeDL.return_value.__enter__.return_value = mock_ydl
+        mock_youtube_dl.return_value.__enter__.return_value = mock_ydl
         mock_ydl.extract_info.return_value = {
             "title": "Large Video",
             "duration": 3600,
@@ -279,9 +279,9 @@ async def test_download_media_download_error(
     mock_exec_context: MagicMock,
 ) -> None:
     """Test handling of yt-dlp download errors."""
-    with patch("family_assistant.tools.media_download.yt_dlp") as mock_yt_dlp_module:
-        mock_yt_dlp_module.YoutubeDL.return_value.__enter__.return_value.extract_info.side_effect = DownloadError(
-            "Video unavailable"
+    with patch("yt_dlp.YoutubeDL") as mock_youtube_dl:
+        mock_youtube_dl.return_value.__enter__.return_value.extract_info.side_effect = (
+            DownloadError("Video unavailable")
         )
 
         result = await download_media_tool(
@@ -307,9 +307,9 @@ async def test_download_media_fallback_file_search(
     test_content = b"video content"
     test_file.write_bytes(test_content)
 
-    with patch("family_assistant.tools.media_download.yt_dlp") as mock_yt_dlp_module:
+    with patch("yt_dlp.YoutubeDL") as mock_youtube_dl:
         mock_ydl = MagicMock()
-        mock_yt_dlp_module.YoutubeDL.return_value.__enter__.return_value = mock_ydl
+        mock_youtube_dl.return_value.__enter__.return_value = mock_ydl
         # No requested_downloads, force fallback path
         mock_ydl.extract_info.return_value = {
             "title": "Test Video",
@@ -351,11 +351,9 @@ async def test_download_media_various_formats(
         test_file = tmp_path / f"test{ext}"
         test_file.write_bytes(b"content")
 
-        with patch(
-            "family_assistant.tools.media_download.yt_dlp"
-        ) as mock_yt_dlp_module:
+        with patch("yt_dlp.YoutubeDL") as mock_youtube_dl:
             mock_ydl = MagicMock()
-            mock_yt_dlp_module.YoutubeDL.return_value.__enter__.return_value = mock_ydl
+            mock_youtube_dl.return_value.__enter__.return_value = mock_ydl
             mock_ydl.extract_info.return_value = {
                 "title": "Test",
                 "duration": 60,
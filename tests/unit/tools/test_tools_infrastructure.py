@@ -12,7 +12,7 @@ import pytest
 
 from family_assistant.storage.context import DatabaseContext
 from family_assistant.tools.infrastructure import LocalToolsProvider
-from family_assistant.tools.types import ToolExecutionContext
+from family_assistant.tools.types import ToolDefinition, ToolExecutionContext
 
 
 class TestLocalToolsProvider:
@@ -579,3 +579,123 @@ class TestLocalToolsProvider:
             assert received_db[0] is mock_db_context
         finally:
             del sys.modules["fake_tool_module"]
+
+    @pytest.mark.asyncio
+    async def test_tool_metadata_is_compiled_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Signatures and schemas are processed at construction, not per call."""
+        from family_assistant.tools import infrastructure  # noqa: PLC0415
+
+        async def echo(text: str, exec_context: ToolExecutionContext) -> str:
+            return f"{text} from {exec_context.conversation_id}"
+
+        async def shout(text: str) -> str:
+            return text.upper()
+
+        provider = LocalToolsProvider(
+            definitions=[
+                {
+                    "type": "function",
+                    "function": {
+                        "name": "echo",
+                        "description": "Echo text",
+                        "parameters": {
+                            "type": "object",
+                            "properties": {
+                                "text": {"type": "string"},
+                                "image": {
+                                    "type": "attachment",
+                                    "description": "Image attachment",
+                                },
+                            },
+                        },
+                    },
+                }
+            ],
+            implementations={"echo": echo},
+        )
+        context = ToolExecutionContext(
+            conversation_id="test-conv-compiled",
+            user_name="test-user",
+            interface_type="test",
+            timezone_str="UTC",
+            turn_id=None,
+            db_context=MagicMock(spec=DatabaseContext),
+            processing_service=None,
+            clock=None,
+            home_assistant_client=None,
+            event_sources=None,
+            attachment_registry=None,
+            camera_backend=None,
+        )
+        hint_calls: list[str] = []
+        real_get_type_hints = infrastructure.get_type_hints
+
+        def counting_get_type_hints(func: Any, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+            hint_calls.append(func.__name__)
+            return real_get_type_hints(func, **kwargs)
+
+        monkeypatch.setattr(infrastructure, "get_type_hints", counting_get_type_hints)
+
+        for _ in range(3):
+            result = await provider.execute_tool("echo", {"text": "hi"}, context)
+            assert result == "hi from test-conv-compiled"
+        assert hint_calls == []
+
+        first = await provider.get_tool_definitions()
+        second = await provider.get_tool_definitions()
+        assert first is not second
+        assert first[0] is second[0]
+        image = first[0]["function"]["parameters"].get("properties", {}).get("image")
+        assert image is not None
+        assert image.get("type") == "string"
+        # The raw definition keeps its internal attachment type
+        raw = provider.get_raw_tool_definitions()[0]
+        raw_image = raw["function"]["parameters"].get("properties", {}).get("image")
+        assert raw_image is not None
+        assert raw_image.get("type") == "attachment"
+
+        # Swapping an implementation recompiles its dispatch entry
+        provider._implementations["echo"] = shout
+        assert await provider.execute_tool("echo", {"text": "hi"}, context) == "HI"
+        assert hint_calls == ["shout"]
+
+    @pytest.mark.asyncio
+    async def test_side_effect_free_flag_is_reported_but_not_sent_to_llm(
+        self,
+    ) -> None:
+        """The flag is collected through wrappers and stripped from LLM schemas."""
+        from family_assistant.tools.infrastructure import (  # noqa: PLC0415
+            CompositeToolsProvider,
+            FilteredToolsProvider,
+            get_side_effect_free_tools,
+        )
+
+        def definition(name: str) -> ToolDefinition:
+            return {
+                "type": "function",
+                "function": {
+                    "name": name,
+                    "description": name,
+                    "parameters": {"type": "object", "properties": {}},
+                },
+            }
+
+        read_only = definition("read_only")
+        read_only["side_effect_free"] = True
+        local = LocalToolsProvider(
+            definitions=[read_only, definition("writes")],
+            implementations={},
+        )
+
+        assert local.get_side_effect_free_tools() == frozenset({"read_only"})
+        provider = FilteredToolsProvider(
+            CompositeToolsProvider([local]), allowed_tool_names=None
+        )
+        assert get_side_effect_free_tools(provider) == frozenset({"read_only"})
+        assert all(
+            "side_effect_free" not in tool
+            for tool in await local.get_tool_definitions()
+        )
+        assert local.get_raw_tool_definitions()[0].get("side_effect_free") is True
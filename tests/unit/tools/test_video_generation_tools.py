@@ -26,9 +26,7 @@ def mock_exec_context() -> MagicMock:
 @pytest.fixture
 def mock_genai_client() -> Generator[MagicMock]:
     """Mock the genai.Client."""
-    with patch(
-        "family_assistant.tools.video_generation.genai.Client"
-    ) as mock_client_cls:
+    with patch("google.genai.Client") as mock_client_cls:
         mock_client = MagicMock()
         mock_client_cls.return_value = mock_client
 
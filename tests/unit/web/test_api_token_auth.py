@@ -0,0 +1,111 @@
+"""Tests for API token verification caching in AuthService."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import Request
+
+from family_assistant.storage import api_tokens as api_tokens_storage
+from family_assistant.storage.context import DatabaseContext
+from family_assistant.web.auth import AuthService, pwd_context
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+TOKEN_PREFIX = "abcd1234"
+TOKEN_SECRET = "s3cret-part-of-the-token"
+
+
+async def _add_token(db_engine: AsyncEngine) -> int:
+    async with DatabaseContext(db_engine) as db_context:
+        return await api_tokens_storage.add_api_token(
+            db_context=db_context,
+            user_identifier="user@example.com",
+            name="script",
+            hashed_token=pwd_context.hash(TOKEN_SECRET),
+            prefix=TOKEN_PREFIX,
+            created_at=datetime.now(UTC),
+        )
+
+
+@pytest.fixture
+def mock_request() -> MagicMock:
+    return MagicMock(spec=Request)
+
+
+async def test_verified_token_is_cached(
+    db_engine: AsyncEngine, mock_request: MagicMock
+) -> None:
+    """A second request with the same token skips bcrypt verification."""
+    token_id = await _add_token(db_engine)
+    auth_service = AuthService(db_engine)
+
+    with patch.object(pwd_context, "verify", wraps=pwd_context.verify) as verify:
+        first = await auth_service.get_user_from_api_token(
+            f"Bearer {TOKEN_PREFIX}{TOKEN_SECRET}", mock_request
+        )
+        second = await auth_service.get_user_from_api_token(
+            f"Bearer {TOKEN_PREFIX}{TOKEN_SECRET}", mock_request
+        )
+
+    assert first is not None
+    assert first == second
+    assert first["token_id"] == token_id
+    assert verify.call_count == 1
+
+
+async def test_wrong_secret_not_served_from_cache(
+    db_engine: AsyncEngine, mock_request: MagicMock
+) -> None:
+    """A cached prefix does not authenticate a different secret."""
+    await _add_token(db_engine)
+    auth_service = AuthService(db_engine)
+
+    assert await auth_service.get_user_from_api_token(
+        f"Bearer {TOKEN_PREFIX}{TOKEN_SECRET}", mock_request
+    )
+    assert (
+        await auth_service.get_user_from_api_token(
+            f"Bearer {TOKEN_PREFIX}not-the-secret", mock_request
+        )
+        is None
+    )
+
+
+async def test_revoked_token_rejected_after_invalidation(
+    db_engine: AsyncEngine, mock_request: MagicMock
+) -> None:
+    """Revoking a token and invalidating the cache rejects it immediately."""
+    token_id = await _add_token(db_engine)
+    auth_service = AuthService(db_engine)
+    header = f"Bearer {TOKEN_PREFIX}{TOKEN_SECRET}"
+
+    assert await auth_service.get_user_from_api_token(header, mock_request)
+
+    async with DatabaseContext(db_engine) as db_context:
+        assert await api_tokens_storage.revoke_api_token(
+            db_context, token_id, "user@example.com"
+        )
+    auth_service.invalidate_api_token(token_id)
+
+    assert await auth_service.get_user_from_api_token(header, mock_request) is None
+
+
+async def test_cache_disabled_with_zero_ttl(
+    db_engine: AsyncEngine, mock_request: MagicMock
+) -> None:
+    """With a zero TTL every request is verified against the database."""
+    await _add_token(db_engine)
+    auth_service = AuthService(db_engine, api_token_cache_ttl=0)
+
+    with patch.object(pwd_context, "verify", wraps=pwd_context.verify) as verify:
+        for _ in range(2):
+            assert await auth_service.get_user_from_api_token(
+                f"Bearer {TOKEN_PREFIX}{TOKEN_SECRET}", mock_request
+            )
+
+    assert verify.call_count == 2
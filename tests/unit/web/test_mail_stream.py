@@ -0,0 +1,114 @@
+"""Unit tests for the streaming mail webhook parser."""
+
+import gzip
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from family_assistant.web.mail_stream import (
+    MailFormError,
+    RawArchiveWriter,
+    receive_mail_form,
+)
+
+FIELDS = {
+    "subject": "Agenda",
+    "stripped-text": "Please find the agenda attached.",
+    "Message-Id": "<agenda@example.com>",
+    "attachment-count": "2",
+}
+
+
+def _encode(
+    data: dict[str, str], files: dict[str, tuple[str, bytes, str]] | None = None
+) -> tuple[bytes, str]:
+    request = httpx.Request("POST", "http://test/webhook/mail", data=data, files=files)
+    return request.read(), request.headers["content-type"]
+
+
+def _listing(path: Path) -> dict[str, bytes]:
+    return {p.name: p.read_bytes() for p in path.iterdir()} if path.exists() else {}
+
+
+async def _chunks(body: bytes, size: int) -> AsyncIterator[bytes]:
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_multipart_attachments_are_spooled_and_archived(tmp_path: Path) -> None:
+    """Fields and attachments survive being split across arbitrary chunk boundaries."""
+    pdf = b"%PDF-1.4 " + bytes(range(256)) * 64
+    body, content_type = _encode(
+        FIELDS,
+        files={
+            "attachment-2": ("notes.txt", b"second", "text/plain"),
+            "attachment-1": ("../agenda.pdf", pdf, "application/pdf"),
+            "attachment-3": ("extra.txt", b"beyond count", "text/plain"),
+        },
+    )
+    archive = RawArchiveWriter(str(tmp_path / "raw" / "req.raw.gz"), compress=True)
+
+    form = await receive_mail_form(
+        _chunks(body, 7),
+        content_type,
+        attachment_dir=str(tmp_path / "attachments"),
+        raw_archive=archive,
+    )
+
+    assert form.fields == FIELDS
+    assert [(a.filename, a.content_type, a.size) for a in form.attachments] == [
+        ("agenda.pdf", "application/pdf", len(pdf)),
+        ("notes.txt", "text/plain", 6),
+    ]
+    assert form.attachments[0].storage_path == str(
+        tmp_path / "attachments" / "agenda.pdf"
+    )
+    # Attachments past attachment-count are not kept
+    assert _listing(tmp_path / "attachments") == {
+        "agenda.pdf": pdf,
+        "notes.txt": b"second",
+    }
+    assert gzip.decompress(_listing(tmp_path / "raw")["req.raw.gz"]) == body
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_urlencoded_body_without_attachments(tmp_path: Path) -> None:
+    """Emails without attachments may arrive urlencoded; no attachment dir is created."""
+    body, content_type = _encode({**FIELDS, "attachment-count": "0"})
+    archive = RawArchiveWriter(str(tmp_path / "req.raw"))
+
+    form = await receive_mail_form(
+        _chunks(body, 16),
+        content_type,
+        attachment_dir=str(tmp_path / "attachments"),
+        raw_archive=archive,
+    )
+
+    assert form.fields["stripped-text"] == FIELDS["stripped-text"]
+    assert form.attachments == []
+    assert _listing(tmp_path) == {"req.raw": body}
+
+
+@pytest.mark.asyncio
+@pytest.mark.no_db
+async def test_truncated_multipart_removes_partial_attachments(
+    tmp_path: Path,
+) -> None:
+    """A request cut off mid-attachment fails without leaving files behind."""
+    body, content_type = _encode(
+        FIELDS, files={"attachment-1": ("big.bin", b"x" * 4096, "application/pdf")}
+    )
+
+    with pytest.raises(MailFormError):
+        await receive_mail_form(
+            _chunks(body[: len(body) // 2], 512),
+            content_type,
+            attachment_dir=str(tmp_path / "attachments"),
+        )
+
+    assert _listing(tmp_path / "attachments") == {}